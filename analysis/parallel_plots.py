@@ -12,10 +12,14 @@ import statsmodels.tsa.seasonal as seasonal
 
 import dataclasses   as dclass
 import pandas        as pd
-import sqlalchemy    as sql
 
 import source.hint as hint
 
+import source.data.downsample as downsample
+
+import source.data.reader     as data_reader
+import source.data.statistics as statistics
+
 
 start_point = 200
 
@@ -26,6 +30,9 @@ colors = palettes.Set1[3]
 
 frequency_range = [62, 63, 64]
 
+# most points drawn for each series
+point_budget = downsample.point_budget
+
 
 save_file = 'parallel_timeseries_decomp.html'
 # source_name = 'long_sim_25_gen_no_im_bt_10_no_hetero.sqlite'
@@ -41,6 +48,25 @@ tables      = ['(0,)_egg',
 plt.output_file(save_file)
 
 
+def plot_source(dataframe: hint.dataframe,
+                x:         str  = 'index',
+                columns:   list = None) -> mdl.ColumnDataSource:
+    """
+    Create a Bokeh data source holding only the points needed to draw
+
+    Args:
+        dataframe: the data to plot
+        x:         the x column
+        columns:   the y columns, all numeric columns if None
+
+    Returns:
+        the downsampled data source
+    """
+
+    return mdl.ColumnDataSource(downsample.decimate(dataframe, x, columns,
+                                                    point_budget))
+
+
 @dclass.dataclass
 class ReadData(object):
     """
@@ -50,194 +76,21 @@ class ReadData(object):
     base_name:   str
     base_path:   str
     table_names: list
-    file_names:  dict = dclass.field(default=dict)
-
-    def __post_init__(self):
-        """Get the file names"""
-
-        self.file_names = self.get_file_names()
-
-
-    def get_file_list(self) -> list:
-        """
-        Get a list of all the files with base name
-
-        Returns:
-            list of all the files in base_path which use the base_name
-        """
-
-        files = os.listdir(self.base_path)
-        files = [f for f in files if self.base_name in f]
-
-        return files
-
-    def get_run_file_lists(self) -> dict:
-        """
-        Get dictionary of file name lists by run tag
-
-        Returns:
-            the dictionary of names
-        """
-
-        files = self.get_file_list()
-
-        file_dict = {}
-        for file in files:
-            end_tag    = file.split('_')[-1]
-            end_number = int(end_tag.split('.')[0])
-
-            if end_number in file_dict:
-                file_dict[end_number].append(file)
-            else:
-                file_dict[end_number] = [file]
-
-        return file_dict
-
-    @staticmethod
-    def _sort_file_names(files: list) -> list:
-        """
-        Sort the files in file list by number
-
-        Args:
-            files: list of files to sort for a run
-
-        Returns:
-            the files in order
-        """
-
-        file_dict = {}
-        for file in files:
-            f_num = int(file.split('_')[0])
-            if f_num in file_dict:
-                raise RuntimeError('bad run number found')
-            else:
-                file_dict[f_num] = file
-
-        file_nums = list(file_dict.keys())
-        file_nums.sort()
-
-        return [file_dict[f_num] for f_num in file_nums]
-
-    def get_sorted_file_lists(self) -> dict:
-        """
-        Get dictionary of file name lists by run tag with file lists in order
-
-        Returns:
-            the dictionary of names
-        """
-
-        files_dict = self.get_run_file_lists()
-
-        return {run_num: self._sort_file_names(files)
-                    for run_num, files in files_dict.items()}
-
-
-    def get_file_names(self) -> dict:
-        """
-        Get dictionary of file name lists by run tag with file lists in order
-
-        Returns:
-            the dictionary of names in order by call
-        """
-
-        file_dict = self.get_sorted_file_lists()
-
-        run_nums = list(file_dict.keys())
-        run_nums.sort()
-
-        return {run_num: file_dict[run_num] for run_num in run_nums}
-
-    def sql_filename(self, file_name: str) -> str:
-        """
-        Return the sql filename for sql alchemy
-
-        Args:
-            file_name: name of the file
-
-        Returns:
-            argument for sql alchemy
-        """
-
-        dialect = 'sqlite:///'
-
-        return '{}{}{}'.format(dialect, self.base_path, file_name)
-
-    def read(self, table_name: str,
-                   file_name: str) -> hint.dataframe:
-        """
-        Read the table from the sql file
-        Args:
-            table_name: name of the sql table
-            file_name:  name of the sql file
-
-        Returns:
-            a pandas dataframe
-        """
-
-        sql_filename = self.sql_filename(file_name)
-        engine       = sql.create_engine(sql_filename)
-
-        return pd.read_sql(table_name, engine)
-
-    def dataframe(self, files:      list,
-                        table_name: str) -> hint.dataframe:
-        """
-        Merge data into single dataframe
-
-        Args:
-            files:      list of files to combine into single dataframe
-            table_name: name of the sql table
-
-        Returns:
-            table merge across the files
-        """
-
-        dataframe0 = self.read(table_name, files[0])
-        dataframes = [dataframe0]
-
-        for file_name in files[1:]:
-            dataframe1 = self.read(table_name, file_name)
-            dataframe1 = dataframe1.iloc[1:]
-
-            dataframes.append(dataframe1)
 
-        dataframe = pd.concat(dataframes)
-        dataframe.reset_index(inplace=True, drop=True)
-        dataframe['index'] = range(len(dataframe.index))
-
-        return dataframe
-
-    def dataframes(self, files: list) -> hint.dataframes:
-        """
-        Get all of the dataframes that we wish to use
-
-        Args:
-            files: list of files to combine the read on
-
-        Returns:
-            dictionary of all the dataframes we want
-        """
-
-        dataframes = {}
-
-        for table_name in self.table_names:
-            dataframes[table_name] = self.dataframe(files, table_name)
-
-        return dataframes
-
-    def run_dataframes(self) -> dict:
+    def run_dataframes(self) -> hint.run_stream:
         """
-        Get a dictionary of all the run data in single dataframe format
+        Get the run data one run at a time in single dataframe format
 
-        Returns:
-            all the run data frames
+        Yields:
+            (run number, the run's data frames)
         """
 
-        data = {}
-        for run_num, files in self.file_names.items():
-            data[run_num] = self.dataframes(files)
+        read = data_reader.Reader(self.base_path,
+                                  self.base_name,
+                                  self.table_names,
+                                  workers=os.cpu_count())
 
-        return data
+        return read.runs()
 
     @staticmethod
     def cut_dataframe(dataframe: hint.dataframe,
@@ -279,206 +132,39 @@ class ReadData(object):
 
         return new
 
-    def cut_run_dataframes(self, start: int) -> dict:
+    def summarize(self, start: int) -> statistics.Aggregator:
         """
-        Get cut all the dataframes at same start
+        Summarize the cut runs, streaming one run at a time
 
         Args:
             start: the correct starting point
 
         Returns:
-            all the data frames cut down
+            the running summaries of every table
         """
 
-        raw_data = self.run_dataframes()
+        aggregator = statistics.Aggregator()
+        for _, dataframes in self.run_dataframes():
+            aggregator.add(self.cut_single_dataframes(dataframes, start))
 
-        data = {}
-        for run_num, dataframes in raw_data.items():
-            data[run_num] = self.cut_single_dataframes(dataframes, start)
-
-        return data
-
-    def mean_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a mean dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the mean data
-        """
+        return aggregator
 
-        means = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat     = pd.concat(data_list)
-            row_concat = concat.groupby(concat.index)
-            mean_data  = row_concat.mean()
-            mean_data['index'] = range(len(mean_data.index))
-
-            means[table_name] = mean_data
-
-        return means
-
-    def median_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a median dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the median data
-        """
-
-        medians = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat      = pd.concat(data_list)
-            row_concat  = concat.groupby(concat.index)
-            median_data = row_concat.median()
-            median_data['index'] = range(len(median_data.index))
-
-            medians[table_name] = median_data
-
-        return medians
-
-    def std_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a std dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the std data
-        """
-
-        stds = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat     = pd.concat(data_list)
-            row_concat = concat.groupby(concat.index)
-            std_data   = row_concat.std()
-            std_data['index'] = range(len(std_data.index))
-
-            stds[table_name] = std_data
-
-        return stds
-
-    def q_lower_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a q_lower dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the q_lower data
-        """
-
-        q_lowers = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat       = pd.concat(data_list)
-            row_concat   = concat.groupby(concat.index)
-            q_lower_data = row_concat.quantile(2.5)
-            q_lower_data['index'] = range(len(q_lower_data.index))
-
-            q_lowers[table_name] = q_lower_data
-
-        return q_lowers
-
-    def q_upper_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a q_upper dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the q_upper data
-        """
-
-        q_uppers = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat       = pd.concat(data_list)
-            row_concat   = concat.groupby(concat.index)
-            q_upper_data = row_concat.quantile(97.5)
-            q_upper_data['index'] = range(len(q_upper_data.index))
-
-            q_uppers[table_name] = q_upper_data
-
-        return q_uppers
-
-    def min_dataframe(self, raw_data: dict) -> hint.dataframes:
-        """
-        Generate a min dataframe for all of the data
-
-        Args:
-            raw_data: data by run for the system
-
-        Returns:
-            dataframes of all the min data
-        """
-
-        mins = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat     = pd.concat(data_list)
-            row_concat = concat.groupby(concat.index)
-            min_data   = row_concat.min()
-            min_data['index'] = range(len(min_data.index))
-
-            mins[table_name] = min_data
-
-        return mins
-
-    def max_dataframe(self, raw_data: dict) -> hint.dataframes:
+    @staticmethod
+    def number_dataframes(dataframes: hint.dataframes) -> hint.dataframes:
         """
-        Generate a max dataframe for all of the data
+        Number the rows of summary tables by time-step
 
         Args:
-            raw_data: data by run for the system
+            dataframes: the summary tables
 
         Returns:
-            dataframes of all the max data
+            the summary tables with their index column renumbered
         """
 
-        maxs = {}
-        for table_name in self.table_names:
-            data_list = []
-            for data in raw_data.values():
-                data_list.append(data[table_name])
-
-            concat     = pd.concat(data_list)
-            row_concat = concat.groupby(concat.index)
-            max_data   = row_concat.max()
-            max_data['index'] = range(len(max_data.index))
+        for dataframe in dataframes.values():
+            dataframe['index'] = range(len(dataframe.index))
 
-            maxs[table_name] = max_data
-
-        return maxs
+        return dataframes
 
     def process_dataframes(self, start: int) -> tuple:
         """
@@ -488,21 +174,24 @@ class ReadData(object):
             start: the correct starting point
 
         Returns:
-            all the data frames cut down
+            the summary data frames, number of runs
         """
 
-        data     = self.cut_run_dataframes(start)
-        num_runs = len(data)
+        aggregator = self.summarize(start)
 
-        data['mean']    = self.mean_dataframe(data)
-        data['median']  = self.median_dataframe(data)
-        # data['std']     = self.std_dataframe(data)
-        # data['q_lower'] = self.q_lower_dataframe(data)
-        # data['q_upper'] = self.q_upper_dataframe(data)
-        # data['min']     = self.min_dataframe(data)
-        # data['max']     = self.max_dataframe(data)
+        data = {
+            'mean':    aggregator.mean(),
+            'median':  aggregator.median(),
+            'std':     aggregator.std(),
+            'q_lower': aggregator.quantile(0.025),
+            'q_upper': aggregator.quantile(0.975),
+            'min':     aggregator.min(),
+            'max':     aggregator.max()
+        }
+        for dataframes in data.values():
+            self.number_dataframes(dataframes)
 
-        return data, num_runs
+        return data, aggregator.runs
 
     @staticmethod
     def _seasonal_decompose(dataframe: hint.dataframe,
@@ -619,15 +308,15 @@ larva_median_decomp  = reader.seasonal_decompose(larva_median)
 pupa_median_decomp   = reader.seasonal_decompose(pupa_median)
 female_median_decomp = reader.seasonal_decompose(female_median)
 
-egg_mean_source    = mdl.ColumnDataSource(egg_mean)
-larva_mean_source  = mdl.ColumnDataSource(larva_mean)
-pupa_mean_source   = mdl.ColumnDataSource(pupa_mean)
-female_mean_source = mdl.ColumnDataSource(female_mean)
+egg_mean_source    = plot_source(egg_mean)
+larva_mean_source  = plot_source(larva_mean)
+pupa_mean_source   = plot_source(pupa_mean)
+female_mean_source = plot_source(female_mean)
 
-egg_median_source    = mdl.ColumnDataSource(egg_median)
-larva_median_source  = mdl.ColumnDataSource(larva_median)
-pupa_median_source   = mdl.ColumnDataSource(pupa_median)
-female_median_source = mdl.ColumnDataSource(female_median)
+egg_median_source    = plot_source(egg_median)
+larva_median_source  = plot_source(larva_median)
+pupa_median_source   = plot_source(pupa_median)
+female_median_source = plot_source(female_median)
 
 
 def periodogram_data_source(periodogram_dataframe: dict) -> dict:
@@ -642,7 +331,8 @@ def periodogram_data_source(periodogram_dataframe: dict) -> dict:
 
     data_sources = {}
     for column_name, data_source in periodogram_dataframe.items():
-        data_sources[column_name] = mdl.ColumnDataSource(data_source)
+        data_sources[column_name] = plot_source(data_source, 'frequency',
+                                                ['power'])
 
     return data_sources
 
@@ -679,9 +369,9 @@ def seasonal_data_source(decomp_data: dict) -> dict:
 
     data_sources = {}
     for frequency, data_source in decomp_data.items():
-        data_sources[frequency] = (mdl.ColumnDataSource(data_source.trend),
-                                   mdl.ColumnDataSource(data_source.seasonal),
-                                   mdl.ColumnDataSource(data_source.resid))
+        data_sources[frequency] = (plot_source(data_source.trend),
+                                   plot_source(data_source.seasonal),
+                                   plot_source(data_source.resid))
 
     return data_sources
 
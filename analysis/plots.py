@@ -16,6 +16,8 @@ import sqlalchemy    as sql
 
 import source.hint as hint
 
+import source.data.downsample as downsample
+
 
 # source_name = 'long_sim_25_gen_no_im_bt_10_no_hetero.sqlite'
 source_name = 'parallel_sim_25_gen_no_bt_only_sus_0.sqlite'
@@ -32,9 +34,31 @@ frequency       = 62
 sample_interval = 62
 sample_length   = 1
 
+# most points drawn for each series
+point_budget = downsample.point_budget
+
 plt.output_file(save_file)
 
 
+def plot_source(dataframe: hint.dataframe,
+                x:         str  = 'index',
+                columns:   list = None) -> mdl.ColumnDataSource:
+    """
+    Create a Bokeh data source holding only the points needed to draw
+
+    Args:
+        dataframe: the data to plot
+        x:         the x column
+        columns:   the y columns, all numeric columns if None
+
+    Returns:
+        the downsampled data source
+    """
+
+    return mdl.ColumnDataSource(downsample.decimate(dataframe, x, columns,
+                                                    point_budget))
+
+
 @dclass.dataclass
 class ReadData(object):
     """
@@ -201,10 +225,10 @@ larva  = data[tables[1]]
 pupa   = data[tables[2]]
 female = data[tables[3]]
 
-egg_source    = mdl.ColumnDataSource(egg)
-larva_source  = mdl.ColumnDataSource(larva)
-pupa_source   = mdl.ColumnDataSource(pupa)
-female_source = mdl.ColumnDataSource(female)
+egg_source    = plot_source(egg)
+larva_source  = plot_source(larva)
+pupa_source   = plot_source(pupa)
+female_source = plot_source(female)
 
 larva_susceptible_peaks, _ = \
     signal.find_peaks(larva['genotype_susceptible'])
@@ -255,9 +279,12 @@ egg_susceptible_spec = \
                             'power':     egg_susceptible_power,
                             'period':    np.array(egg_susceptible_period)})
 egg_susceptible_spec['genotype'] = 'Susceptible'
-egg_resistant_periodogram    = mdl.ColumnDataSource(egg_resistant_spec)
-egg_heterozygous_periodogram = mdl.ColumnDataSource(egg_heterozygous_spec)
-egg_susceptible_periodogram  = mdl.ColumnDataSource(egg_susceptible_spec)
+egg_resistant_periodogram    = plot_source(egg_resistant_spec,
+                                           'frequency', ['power'])
+egg_heterozygous_periodogram = plot_source(egg_heterozygous_spec,
+                                           'frequency', ['power'])
+egg_susceptible_periodogram  = plot_source(egg_susceptible_spec,
+                                           'frequency', ['power'])
 
 larva_resistant_freq, larva_resistant_power = \
     signal.periodogram(larva['genotype_resistant'])
@@ -286,9 +313,12 @@ larva_susceptible_spec = \
                             'power':     larva_susceptible_power,
                             'period':    np.array(larva_susceptible_period)})
 larva_susceptible_spec['genotype'] = 'Susceptible'
-larva_resistant_periodogram    = mdl.ColumnDataSource(larva_resistant_spec)
-larva_heterozygous_periodogram = mdl.ColumnDataSource(larva_heterozygous_spec)
-larva_susceptible_periodogram  = mdl.ColumnDataSource(larva_susceptible_spec)
+larva_resistant_periodogram    = plot_source(larva_resistant_spec,
+                                             'frequency', ['power'])
+larva_heterozygous_periodogram = plot_source(larva_heterozygous_spec,
+                                             'frequency', ['power'])
+larva_susceptible_periodogram  = plot_source(larva_susceptible_spec,
+                                             'frequency', ['power'])
 
 pupa_resistant_freq, pupa_resistant_power = \
     signal.periodogram(pupa['genotype_resistant'])
@@ -317,9 +347,12 @@ pupa_susceptible_spec = \
                             'power':     pupa_susceptible_power,
                             'period':    np.array(pupa_susceptible_period)})
 pupa_susceptible_spec['genotype'] = 'Susceptible'
-pupa_resistant_periodogram    = mdl.ColumnDataSource(pupa_resistant_spec)
-pupa_heterozygous_periodogram = mdl.ColumnDataSource(pupa_heterozygous_spec)
-pupa_susceptible_periodogram  = mdl.ColumnDataSource(pupa_susceptible_spec)
+pupa_resistant_periodogram    = plot_source(pupa_resistant_spec,
+                                            'frequency', ['power'])
+pupa_heterozygous_periodogram = plot_source(pupa_heterozygous_spec,
+                                            'frequency', ['power'])
+pupa_susceptible_periodogram  = plot_source(pupa_susceptible_spec,
+                                            'frequency', ['power'])
 
 female_resistant_freq, female_resistant_power = \
     signal.periodogram(female['genotype_resistant'])
@@ -348,9 +381,12 @@ female_susceptible_spec = \
                             'power':     female_susceptible_power,
                             'period':    np.array(female_susceptible_period)})
 female_susceptible_spec['genotype'] = 'Susceptible'
-female_resistant_periodogram    = mdl.ColumnDataSource(female_resistant_spec)
-female_heterozygous_periodogram = mdl.ColumnDataSource(female_heterozygous_spec)
-female_susceptible_periodogram  = mdl.ColumnDataSource(female_susceptible_spec)
+female_resistant_periodogram    = plot_source(female_resistant_spec,
+                                              'frequency', ['power'])
+female_heterozygous_periodogram = plot_source(female_heterozygous_spec,
+                                              'frequency', ['power'])
+female_susceptible_periodogram  = plot_source(female_susceptible_spec,
+                                              'frequency', ['power'])
 
 egg_decomp    = seasonal.seasonal_decompose(egg,
                                             model='additive', freq=frequency)
@@ -374,20 +410,20 @@ female_decomp.seasonal['index'] = range(len(female_decomp.seasonal))
 female_decomp.resid[   'index'] = range(len(female_decomp.resid))
 
 
-egg_trend_source    = mdl.ColumnDataSource(egg_decomp.trend)
-larva_trend_source  = mdl.ColumnDataSource(larva_decomp.trend)
-pupa_trend_source   = mdl.ColumnDataSource(pupa_decomp.trend)
-female_trend_source = mdl.ColumnDataSource(female_decomp.trend)
+egg_trend_source    = plot_source(egg_decomp.trend)
+larva_trend_source  = plot_source(larva_decomp.trend)
+pupa_trend_source   = plot_source(pupa_decomp.trend)
+female_trend_source = plot_source(female_decomp.trend)
 
-egg_seasonal_source    = mdl.ColumnDataSource(egg_decomp.seasonal)
-larva_seasonal_source  = mdl.ColumnDataSource(larva_decomp.seasonal)
-pupa_seasonal_source   = mdl.ColumnDataSource(pupa_decomp.seasonal)
-female_seasonal_source = mdl.ColumnDataSource(female_decomp.seasonal)
+egg_seasonal_source    = plot_source(egg_decomp.seasonal)
+larva_seasonal_source  = plot_source(larva_decomp.seasonal)
+pupa_seasonal_source   = plot_source(pupa_decomp.seasonal)
+female_seasonal_source = plot_source(female_decomp.seasonal)
 
-egg_resid_source    = mdl.ColumnDataSource(egg_decomp.resid)
-larva_resid_source  = mdl.ColumnDataSource(larva_decomp.resid)
-pupa_resid_source   = mdl.ColumnDataSource(pupa_decomp.resid)
-female_resid_source = mdl.ColumnDataSource(female_decomp.resid)
+egg_resid_source    = plot_source(egg_decomp.resid)
+larva_resid_source  = plot_source(larva_decomp.resid)
+pupa_resid_source   = plot_source(pupa_decomp.resid)
+female_resid_source = plot_source(female_decomp.resid)
 
 egg_sample    = egg.   iloc[::sample_interval, :].copy()
 larva_sample  = larva. iloc[::sample_interval, :].copy()
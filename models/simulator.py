@@ -94,6 +94,8 @@ class Simulator(object):
     def execute(self) -> None:
         """
         Run the simulation
+            - the steps are split across domain workers when the input
+              variables set keyword.domain_workers above 1
 
         """
 
@@ -101,15 +103,18 @@ class Simulator(object):
         times     = list(range(self.timesteps))
         run_times = times[self.step:].copy()
 
+        runner = self.simulation.runner()
         for time in run_times:
             self.step = time
             print('     {} Simulation {}, Running step: {}'.
                   format(datetime.datetime.now(), self.run_number, time))
-            self.simulation.step()
+            runner.step()
+        runner.close()
 
         print('     {} Simulation {}, Complete Starting save'.
               format(datetime.datetime.now(), self.run_number))
         self.simulation.database.dump(self.simulation)
+        self.simulation.database.flush()
         end_time = datetime.datetime.now()
         print('Total elapsed time: {}'.format(end_time - start_time))
 
@@ -1,5 +1,5 @@
 import datetime
-import pickle
+import os
 
 import bokeh.plotting     as plt
 import bokeh.layouts      as lay
@@ -7,11 +7,8 @@ import bokeh.models       as mdl
 import bokeh.palettes     as palettes
 
 import dataclasses   as dclass
-import pandas        as pd
 
-import numpy as np
-
-import source.hint as hint
+import source.data.convergence as convergence
 
 import multi_gen.runs as runs
 
@@ -45,293 +42,35 @@ axis_tick_font_size = '10pt'
 class ProcessData(object):
     """
     Class to read data
+        - runs are read one at a time from the simulation's window files,
+          or its columnar run store when it wrote one, into running means,
+          so memory does not grow with the number of runs
     """
-    base_name:  str
-    dataframes: dict = dclass.field(default=dict)
-    cut_frames: dict = dclass.field(default=dict)
-
-    def __post_init__(self):
-        """read the data frames"""
-
-        data_file = '{}.data'.format(self.base_name)
-
-        with open(data_file, 'rb') as read_file:
-            self.dataframes = pickle.load(read_file)
-
-        self.cut_frames = self.cut_dataframes()
-        # self.percent_dataframes()
-
-    @staticmethod
-    def _cut_dataframe(dataframe: hint.dataframe) -> hint.dataframe:
-        """
-        Cut the dataframe to start at the new point
-
-        Args:
-            dataframe: dataframe to cut
-
-        Returns:
-            the cut dataframe
-        """
-
-        new = dataframe.copy()
-        new = new.iloc[start_point:]
-        new.reset_index(inplace=True, drop=True)
-
-        return new
+    base_name: str
+    file_path: str = './data'
+    workers:   int = os.cpu_count()
 
-    def _cut_dataframes(self, dataframes: hint.dataframes) -> hint.dataframes:
+    def convergence(self) -> convergence.Convergence:
         """
-        Cut the dataframes in a given run
-
-        Args:
-            dataframes: all the dataframes for a given run
+        Fold all the runs into the running means and errors
 
         Returns:
-            the cut dataframes
-        """
-
-        new = {}
-        for table_name, dataframe in dataframes.items():
-            print('        {} Cutting table: {}'.
-                  format(datetime.datetime.now(), table_name))
-            new[table_name] = self._cut_dataframe(dataframe)
-
-        return new
-
-    def cut_dataframes(self) -> dict:
-        """
-        Cut all the runs to the new start point
-
-        Returns:
-            dictionary of cut runs
-        """
-
-        data = {}
-        for run_num, dataframes in self.dataframes.items():
-            print('    {} Cutting Run: {}'.
-                  format(datetime.datetime.now(), run_num))
-            data[run_num] = self._cut_dataframes(dataframes)
-
-        return data
-
-    @staticmethod
-    def _percent_dataframe(dataframe: hint.dataframe) -> None:
-        """
-        Add percent resist column
-
-        Args:
-            dataframe: dataframe to process
-
-        Effects:
-            add percent column
-        """
-
-        def resist(row) -> float:
-            """
-            Percent resistant of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row[columns[2]]
-            sr = row[columns[1]]
-            rr = row[columns[0]]
-
-            total = 2*(ss + sr + rr)
-
-            if total == 0:
-                return np.nan
-            else:
-                r = 2*rr + sr
-
-                return r / total
-
-        dataframe[columns[3]] = dataframe.apply(lambda row: resist(row), axis=1)
-
-    def _percent_dataframes(self, dataframes: hint.dataframes) -> None:
-        """
-        Add percent resist column to all dataframes in a run
-
-        Args:
-            dataframes: run's dataframes
-
-        Effects:
-            add percent columns
+            the convergence of the runs' means
         """
 
-        for table_name, dataframe in dataframes.items():
-            print('        {} Calculating Percent for: {}'.
-                  format(datetime.datetime.now(), table_name))
-            self._percent_dataframe(dataframe)
-
-    def percent_dataframes(self) -> None:
-        """
-        Add percent resist column to all cut dataframes
+        number, run_stream = convergence.simulation_runs(self.file_path,
+                                                         self.base_name,
+                                                         tables,
+                                                         start_point,
+                                                         self.workers)
+        converge = convergence.Convergence.setup(number)
 
-        Effects:
-            add percent columns
-        """
-
-        for run_num, dataframes in self.cut_frames.items():
-            print('    {} Calculating Percent for: {}'.
+        for run_num, dataframes in run_stream:
+            print('    {} Adding Run: {}'.
                   format(datetime.datetime.now(), run_num))
-            self._percent_dataframes(dataframes)
-
-    def _mean_dataframe(self, sims:       list,
-                              table_name: str) -> hint.dataframe:
-        """
-        Get the mean of the given table over all runs
-
-        Args:
-            sims:       list of simulations to combine
-            table_name: name of the table to compute
-
-        Returns:
-            a mean dataframe table
-        """
-
-        data_list = []
-        for sim in sims:
-            data = self.cut_frames[sim]
-            data_list.append(data[table_name])
-
-        concat     = pd.concat(data_list)
-        row_concat = concat.groupby(concat.index)
-
-        return row_concat.mean()
-
-    def mean_dataframes(self, sims: list) -> hint.dataframes:
-        """
-        Get the mean of all the different tables
-
-        Args:
-            sims: list of simulations to compute the mean over
-
-        Returns:
-            tables of mean values
-        """
-
-        means = {}
-        for table_name in tables:
-            print('    {} Mean for: {}'.
-                  format(datetime.datetime.now(), table_name))
-            means[table_name] = self._mean_dataframe(sims, table_name)
-
-        return means
-
-    def all_sims(self) -> dict:
-        """
-        Get all the sets of sims to average over
-
-        Returns:
-            dictionary of lists of sims
-        """
-
-        sims = list(self.cut_frames.keys())
-
-        return {
-            1:          sims[:1],
-            2:          sims[:2],
-            4:          sims[:4],
-            8:          sims[:8],
-            16:         sims[:16],
-            32:         sims[:32],
-            64:         sims[:64],
-            128:        sims[:128],
-            len(sims):  sims
-        }
-
-    def means(self) -> dict:
-        """
-        Calculate all of the means
-
-        Returns:
-            dictionary of all mean tables
-        """
-
-        all_sims = self.all_sims()
-
-        means = {}
-        for num, sims in all_sims.items():
-            means[num] = self.mean_dataframes(sims)
-
-        return means
-
-    @staticmethod
-    def _diffs(means_0: hint.dataframes,
-               means_1: hint.dataframes) -> dict:
-        """
-        Find the squared difference
-        Args:
-            means_0: data set 0
-            means_1: data set 1
+            converge.add(dataframes)
 
-        Returns:
-            dictionary of square diff
-        """
-
-        diffs = {}
-
-        for table_name, mean_0 in means_0.items():
-            mean_1 = means_1[table_name]
-
-            diff = mean_0 - mean_1
-            diff = diff.pow(2)
-            diff = diff.pow(0.5)
-
-            diffs[table_name] = diff
-
-        return diffs
-
-
-    def diffs(self) -> dict:
-        """
-        Compute the differences pairwise
-
-        Returns:
-            difference dictionary
-        """
-
-        means = self.means()
-        sims  = list(means.keys())
-
-        diffs = {}
-        for index in range(len(means) - 1):
-            sim_0 = sims[index]
-            sim_1 = sims[index + 1]
-
-            means_0 = means[sim_0]
-            means_1 = means[sim_1]
-
-            diffs[sim_0] = self._diffs(means_0,
-                                       means_1)
-
-        return diffs
-
-    @staticmethod
-    def _integral(diffs: hint.dataframes,
-                  total: hint.dataframes) -> dict:
-        """
-        Find the root of the column sums
-        Args:
-            diffs: difference data
-            total: the final data
-
-        Returns:
-            dict of data points
-        """
-
-        values = {}
-        for table_name, diff in diffs.items():
-            actual   = total[table_name].sum()
-            integral = diff.sum()
-            values[table_name] = integral.div(actual)
-
-        return values
+        return converge
 
     def integral(self) -> dict:
         """
@@ -341,15 +80,7 @@ class ProcessData(object):
             dict of data points
         """
 
-        difference = self.diffs()
-        sims       = list(difference.keys())
-        total      = self.mean_dataframes(sims)
-
-        integral = {}
-        for num, diffs in difference.items():
-            integral[num] = self._integral(diffs, total)
-
-        return integral
+        return self.convergence().integral()
 
     def series(self) -> dict:
         """
@@ -12,6 +12,8 @@ import multi_gen.runs   as runs
 
 import source.hint as hint
 
+import source.data.metrics as metrics
+
 colors    = palettes.Colorblind[8]
 save_file = 'mix_sim_90_bt_0_D_high_save.html'
 plt.output_file(save_file)
@@ -43,32 +45,7 @@ def percent_dataframe(dataframe: hint.dataframe) -> None:
         add percent column
     """
 
-    def resist(row) -> float:
-        """
-        Percent resistant of row value
-
-        Args:
-            row: row of dataframe
-
-        Returns:
-            percent resistant
-        """
-
-        ss = row[runs.columns[2]]
-        sr = row[runs.columns[1]]
-        rr = row[runs.columns[0]]
-
-        total = 2 * (ss + sr + rr)
-
-        if total == 0:
-            return np.nan
-        else:
-            r = 2 * rr + sr
-
-            return r / total
-
-    dataframe['new'] \
-        = dataframe.apply(lambda row: resist(row), axis=1)
+    metrics.add_percent(dataframe, 'new', runs.columns[:3])
 
 
 sim_0_file = '{}_summary.data'.format(runs.low_70[0])
@@ -7,13 +7,14 @@ import bokeh.palettes     as palettes
 import bokeh.models.tools as tools
 
 import dataclasses   as dclass
-import pandas        as pd
 
-import numpy        as np
-import scipy.signal as signal
+import numpy as np
 
 import source.hint as hint
 
+import source.data.downsample as downsample
+import source.data.series     as series
+
 import parameters.model_parameters as param
 
 import multi_gen.runs as runs
@@ -40,6 +41,9 @@ legend_font_size    = '12pt'
 axis_font_size      = '12pt'
 axis_tick_font_size = '10pt'
 
+# most points drawn for each series
+point_budget = downsample.point_budget
+
 
 @dclass.dataclass
 class Periodogram(object):
@@ -58,70 +62,40 @@ class Periodogram(object):
             self.dataframes = pickle.load(read_file)
 
     @staticmethod
-    def _make_periodogram(dataframe: hint.dataframe,
-                          column:    str,
-                          label:     str) -> hint.dataframe:
+    def _make_periodogram(periodogram: series.Periodogram,
+                          index:       int,
+                          column:      str,
+                          label:       str) -> hint.dataframe:
         """
-        Create a periodogram from a data table
+        Create a periodogram table for one series of a computed stack
         Args:
-            dataframe: the data source
-            column:    column of the source
-            label:     type of data
+            periodogram: periodograms of the stacked series
+            index:       index of the series in the stack
+            column:      column of the source
+            label:       type of data
 
         Returns:
             dictionary of periodogram data
         """
 
-        freq, power = signal.periodogram(dataframe[column])
-
-        period = (1 / freq[1:]).tolist()
-        period.insert(0, np.inf)
-
-        primary_index = np.argmax(power)
-        primary       = period[primary_index]
-
-        data = {
-            runs.freq:   freq,
-            runs.power:  power,
-            runs.period: period,
-        }
-
         if runs.genotype in column:
             genotype = column.split('_')[1]
         else:
             genotype = 'R allele'
 
-        periodogram = pd.DataFrame.from_dict(data)
-        periodogram[runs.primary]  = primary
+        periodogram = periodogram.dataframe(index, [runs.freq,
+                                                    runs.power,
+                                                    runs.period,
+                                                    runs.primary])
         periodogram[runs.genotype] = genotype
         periodogram[runs.comb]     = label
 
         return periodogram
 
-    def _make_periodograms(self, dataframe: hint.dataframe,
-                                 label:     str) -> hint.dataframes:
-        """
-        Create all of the periodograms
-
-        Args:
-            dataframe: the dataframe to decompose
-            label:     the type of data
-
-        Returns:
-            dictionary of all the periodograms by column
-        """
-
-        data = {}
-        for column in runs.columns:
-            print('           {} Creating column {} periodograms'.
-                  format(datetime.datetime.now(), column))
-            data[column] = self._make_periodogram(dataframe, column, label)
-
-        return data
-
     def make_periodograms(self, label: str) -> dict:
         """
         Create all of the periodograms for the data type
+            - every column of every table is computed in one call
 
         Args:
             label:  the data type
@@ -132,11 +106,21 @@ class Periodogram(object):
 
         dataframes: hint.dataframes = self.dataframes[label]
 
-        data = {}
-        for table_name, dataframe in dataframes.items():
-            print('       {} Creating table {} periodograms'.
-                  format(datetime.datetime.now(), table_name))
-            data[table_name] = self._make_periodograms(dataframe, label)
+        keys  = [(table_name, column)
+                 for table_name in dataframes
+                 for column in runs.columns]
+        stack = np.stack([dataframes[table_name][column].
+                          to_numpy(dtype=float)
+                          for table_name, column in keys])
+
+        print('       {} Creating {} periodograms'.
+              format(datetime.datetime.now(), len(keys)))
+        periodogram = series.Periodogram.setup(stack)
+
+        data = {table_name: {} for table_name in dataframes}
+        for index, (table_name, column) in enumerate(keys):
+            data[table_name][column] = \
+                self._make_periodogram(periodogram, index, column, label)
 
         return data
 
@@ -194,7 +178,9 @@ class PlotData(object):
             a dictionary of Bokeh plots
         """
 
-        source = mdl.ColumnDataSource(dataframe)
+        source = mdl.ColumnDataSource(
+            downsample.decimate(dataframe, runs.freq, [runs.power],
+                                point_budget))
 
         base_title = 'Main period: {}'.\
             format(np.round(dataframe[runs.primary].iloc[0], 3))
@@ -370,8 +356,12 @@ class PlotLowHighData(object):
             a dictionary of Bokeh plots
         """
 
-        source_low  = mdl.ColumnDataSource(dataframe_low)
-        source_high = mdl.ColumnDataSource(dataframe_high)
+        source_low  = mdl.ColumnDataSource(
+            downsample.decimate(dataframe_low, runs.freq, [runs.power],
+                                point_budget))
+        source_high = mdl.ColumnDataSource(
+            downsample.decimate(dataframe_high, runs.freq, [runs.power],
+                                point_budget))
 
         base_title = 'Main period: Low: {} or High: {}'. \
             format(np.round(dataframe_low[runs.primary].iloc[0], 3),
@@ -1,13 +1,15 @@
 import datetime
+import os
 import pickle
 
 import dataclasses   as dclass
-import pandas        as pd
-
-import numpy as np
 
 import source.hint as hint
 
+import source.data.reader     as reader
+import source.data.metrics    as metrics
+import source.data.statistics as statistics
+
 import multi_gen.runs as runs
 
 start_point     = runs.start_point
@@ -20,28 +22,23 @@ simulation_runs = runs.runs
 class ProcessData(object):
     """
     Class to read data
+        - runs are streamed one at a time into running summaries, so memory
+          does not grow with the number of runs
     """
-    base_name:  str
-    dataframes: dict = dclass.field(default=dict)
-    cut_frames: dict = dclass.field(default=dict)
-    means:      dict = dclass.field(default=dict)
-    medians:    dict = dclass.field(default=dict)
-    stds:       dict = dclass.field(default=dict)
+    base_name: str
+    workers:   int  = os.cpu_count()
+    means:     dict = dclass.field(default_factory=dict)
+    medians:   dict = dclass.field(default_factory=dict)
+    stds:      dict = dclass.field(default_factory=dict)
 
     def __post_init__(self):
-        """read the data frames"""
-
-        data_file = '{}.data'.format(self.base_name)
+        """summarize the data frames"""
 
-        with open(data_file, 'rb') as read_file:
-            self.dataframes = pickle.load(read_file)
+        aggregator = self.aggregate()
 
-        self.cut_frames = self.cut_dataframes()
-        self.percent_dataframes()
-
-        self.means   = self.mean_dataframes()
-        self.medians = self.median_dataframes()
-        self.stds    = self.std_dataframes()
+        self.means   = aggregator.mean()
+        self.medians = aggregator.median()
+        self.stds    = aggregator.std()
 
     @staticmethod
     def _cut_dataframe(dataframe: hint.dataframe) -> hint.dataframe:
@@ -80,22 +77,6 @@ class ProcessData(object):
 
         return new
 
-    def cut_dataframes(self) -> dict:
-        """
-        Cut all the runs to the new start point
-
-        Returns:
-            dictionary of cut runs
-        """
-
-        data = {}
-        for run_num, dataframes in self.dataframes.items():
-            print('    {} Cutting Run: {}'.
-                  format(datetime.datetime.now(), run_num))
-            data[run_num] = self._cut_dataframes(dataframes)
-
-        return data
-
     @staticmethod
     def _percent_dataframe(dataframe: hint.dataframe) -> None:
         """
@@ -108,31 +89,7 @@ class ProcessData(object):
             add percent column
         """
 
-        def resist(row) -> float:
-            """
-            Percent resistant of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row[columns[2]]
-            sr = row[columns[1]]
-            rr = row[columns[0]]
-
-            total = 2*(ss + sr + rr)
-
-            if total == 0:
-                return np.nan
-            else:
-                r = 2*rr + sr
-
-                return r / total
-
-        dataframe[columns[3]] = dataframe.apply(lambda row: resist(row), axis=1)
+        metrics.add_percent(dataframe, columns[3], columns[:3])
 
     def _percent_dataframes(self, dataframes: hint.dataframes) -> None:
         """
@@ -150,126 +107,43 @@ class ProcessData(object):
                   format(datetime.datetime.now(), table_name))
             self._percent_dataframe(dataframe)
 
-    def percent_dataframes(self) -> None:
+    def run_dataframes(self) -> hint.run_stream:
         """
-        Add percent resist column to all cut dataframes
+        Read the runs one at a time, cut and with percent resist columns
 
-        Effects:
-            add percent columns
+        Yields:
+            (run number, the run's processed dataframes)
         """
 
-        for run_num, dataframes in self.cut_frames.items():
-            print('    {} Calculating Percent for: {}'.
+        read = reader.Reader('./data/{}'.format(self.base_name),
+                             self.base_name,
+                             tables,
+                             workers=self.workers)
+
+        for run_num, dataframes in read.runs():
+            print('    {} Processing Run: {}'.
                   format(datetime.datetime.now(), run_num))
+            dataframes = self._cut_dataframes(dataframes)
             self._percent_dataframes(dataframes)
 
-    def _mean_dataframe(self, table_name: str) -> hint.dataframe:
-        """
-        Get the mean of the given table over all runs
-
-        Args:
-            table_name: name of the table to compute
+            yield run_num, dataframes
 
-        Returns:
-            a mean dataframe table
+    def aggregate(self) -> statistics.Aggregator:
         """
-
-        data_list = []
-        for data in self.cut_frames.values():
-            data_list.append(data[table_name])
-
-        concat     = pd.concat(data_list)
-        row_concat = concat.groupby(concat.index)
-
-        return row_concat.mean()
-
-    def mean_dataframes(self) -> hint.dataframes:
-        """
-        Get the mean of all the different tables
+        Summarize all the runs
 
         Returns:
-            tables of mean values
+            the running summaries of every table
         """
 
-        means = {}
-        for table_name in tables:
-            print('    {} Mean for: {}'.
-                  format(datetime.datetime.now(), table_name))
-            means[table_name] = self._mean_dataframe(table_name)
-
-        return means
+        aggregator = statistics.Aggregator()
+        for _, dataframes in self.run_dataframes():
+            aggregator.add(dataframes)
 
-    def _median_dataframe(self, table_name: str) -> hint.dataframe:
-        """
-        Get the median of the given table over all runs
-
-        Args:
-            table_name: name of the table to compute
-
-        Returns:
-            a median dataframe table
-        """
-
-        data_list = []
-        for data in self.cut_frames.values():
-            data_list.append(data[table_name])
-
-        concat     = pd.concat(data_list)
-        row_concat = concat.groupby(concat.index)
-
-        return row_concat.median()
-
-    def median_dataframes(self) -> hint.dataframes:
-        """
-        Get the median of all the different tables
-
-        Returns:
-            tables of median values
-        """
-
-        medians = {}
-        for table_name in tables:
-            print('    {} Median for: {}'.
-                  format(datetime.datetime.now(), table_name))
-            medians[table_name] = self._median_dataframe(table_name)
-
-        return medians
-
-    def _std_dataframe(self, table_name: str) -> hint.dataframe:
-        """
-        Get the std of the given table over all runs
-
-        Args:
-            table_name: name of the table to compute
-
-        Returns:
-            a std dataframe table
-        """
-
-        data_list = []
-        for data in self.cut_frames.values():
-            data_list.append(data[table_name])
-
-        concat     = pd.concat(data_list)
-        row_concat = concat.groupby(concat.index)
-
-        return row_concat.std()
-
-    def std_dataframes(self) -> hint.dataframes:
-        """
-        Get the std of all the different tables
-
-        Returns:
-            tables of std values
-        """
-
-        stds = {}
-        for table_name in tables:
-            print('    {} Stds for: {}'.
-                  format(datetime.datetime.now(), table_name))
-            stds[table_name] = self._std_dataframe(table_name)
+        print('        {} Number of runs is {}'.
+              format(datetime.datetime.now(), aggregator.runs))
 
-        return stds
+        return aggregator
 
     @classmethod
     def process_data(cls, base_name: str) -> None:
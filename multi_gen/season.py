@@ -8,13 +8,14 @@ import bokeh.palettes     as palettes
 import bokeh.models.tools as tools
 
 import dataclasses   as dclass
-import pandas        as pd
 
-import numpy                    as np
-import statsmodels.tsa.seasonal as seasonal
+import numpy as np
 
 import source.hint as hint
 
+import source.data.downsample as downsample
+import source.data.series     as series
+
 import multi_gen.runs as runs
 
 simulation_runs = runs.runs
@@ -39,6 +40,9 @@ legend_font_size    = '12pt'
 axis_font_size      = '12pt'
 axis_tick_font_size = '10pt'
 
+# most points drawn for each series
+point_budget = downsample.point_budget
+
 
 @dclass.dataclass
 class Seasonal(object):
@@ -57,31 +61,10 @@ class Seasonal(object):
         with open(data_file, 'rb') as read_file:
             self.dataframes = pickle.load(read_file)
 
-    def _make_seasonal(self, dataframe: hint.dataframe) -> dict:
-        """
-        Create a seasonal decomposition from a data table
-
-        Args:
-            dataframe: the data source
-
-        Returns:
-            dictionary of seasonal data
-        """
-
-        decomp = seasonal.seasonal_decompose(dataframe,
-                                             model='additive',
-                                             freq=self.frequency)
-
-        return {
-            runs.observed: decomp.observed,
-            runs.trend:    decomp.trend,
-            runs.season:   decomp.seasonal,
-            runs.resid:    decomp.resid
-        }
-
     def make_seasonal(self, dataframes: hint.dataframes) -> dict:
         """
         Create seasonal decomposition for a collection of dataframes
+            - every column of every table is decomposed as one stack
 
         Args:
             dataframes:  the dataframes
@@ -90,11 +73,27 @@ class Seasonal(object):
             all of the seasonal decomposes
         """
 
+        keys  = [(table_name, column)
+                 for table_name, dataframe in dataframes.items()
+                 for column in dataframe.columns]
+        stack = np.stack([dataframes[table_name][column].
+                          to_numpy(dtype=float)
+                          for table_name, column in keys])
+
+        print('        {} Creating {} decompositions'.
+              format(datetime.datetime.now(), len(keys)))
+        decomposition = series.Decomposition.setup(stack, self.frequency)
+
+        names  = [runs.observed, runs.trend, runs.season, runs.resid]
         decomp = {}
         for table_name, dataframe in dataframes.items():
-            print('        {} Creating {} table decomposition'.
-                  format(datetime.datetime.now(), table_name))
-            decomp[table_name] = self._make_seasonal(dataframe)
+            rows = [index for index, key in enumerate(keys)
+                    if key[0] == table_name]
+            decomp[table_name] = \
+                decomposition.dataframes(rows,
+                                         list(dataframe.columns),
+                                         names,
+                                         dataframe.index)
 
         return decomp
 
@@ -163,6 +162,9 @@ class PlotData(object):
         reg_plot.xaxis.axis_label = 'time (days)'
         reg_plot.yaxis.axis_label = 'population'
 
+        dataframe = downsample.decimate(dataframe,
+                                        columns=columns,
+                                        budget=point_budget)
         for index, column in enumerate(columns):
             reg_plot.line(dataframe.index, dataframe[column],
                           line_width=line_width,
@@ -307,6 +309,12 @@ class PlotLowHighData(object):
         reg_plot.xaxis.axis_label = 'time (days)'
         reg_plot.yaxis.axis_label = 'population'
 
+        dataframe_low  = downsample.decimate(dataframe_low,
+                                             columns=columns,
+                                             budget=point_budget)
+        dataframe_high = downsample.decimate(dataframe_high,
+                                             columns=columns,
+                                             budget=point_budget)
         for index, column in enumerate(columns):
             reg_plot.line(dataframe_low.index, dataframe_low[column],
                           line_width=line_width,
@@ -146,6 +146,7 @@ class Simulator(object):
             self.simulation.step()
 
         self.simulation.database.dump(self.simulation)
+        self.simulation.database.flush()
         end_time = datetime.datetime.now()
 
         return end_time - start_time
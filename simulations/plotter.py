@@ -2,12 +2,13 @@ import os
 
 import dataclasses       as dclass
 import matplotlib.pyplot as plt
-import numpy             as np
 import pandas            as pd
 import sqlalchemy        as sql
 
 import source.hint as hint
 
+import source.data.metrics as metrics
+
 
 save_fig   = True
 save_name  = 'long_sim_25_gen_no_im_bt_10_no_hetero.sqlite'
@@ -178,26 +179,6 @@ class ReadData(object):
 
         return new
 
-    @staticmethod
-    def resistant_prop(row: pd.Series) -> float:
-        """
-        Function to compute the resistant allele proportion for a given step
-
-        Args:
-            row: row of the series
-
-        Returns:
-            resistant allele proportion
-        """
-
-        total  = 2 * (row[resistant] + row[heterozygous] + row[susceptible])
-        allele = 2 * row[resistant] + row[heterozygous]
-
-        if total == 0:
-            return np.nan
-        else:
-            return allele / total
-
     def add_resistant_prop(self, dataframe: hint.dataframe) -> None:
         """
         Add the resistant prop row to the dataframe
@@ -209,8 +190,8 @@ class ReadData(object):
             a dataframe with the a new column
         """
 
-        dataframe[proportion] = dataframe.\
-            apply(lambda row: self.resistant_prop(row), axis=1)
+        metrics.add_percent(dataframe, proportion,
+                            [resistant, heterozygous, susceptible])
 
     def create_prop(self, dataframes: hint.dataframes) -> None:
         """
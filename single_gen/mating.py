@@ -20,6 +20,8 @@ import models.reproduction as repro
 import source.hint    as hint
 import source.keyword as keyword
 
+import source.data.metrics as metrics
+
 import source.simulation.simulation as main_simulation
 
 
@@ -166,31 +168,7 @@ class Simulator(object):
             add percent column
         """
 
-        def resist(row) -> float:
-            """
-            Percent resistant of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row['genotype_susceptible']
-            sr = row['genotype_heterozygous']
-            rr = row['genotype_resistant']
-
-            total = 2*(ss + sr + rr)
-
-            if total == 0:
-                return np.nan
-            else:
-                r = 2*rr + sr
-
-                return r / total
-
-        dataframe['percent'] = dataframe.apply(lambda row: resist(row), axis=1)
+        metrics.add_percent(dataframe)
 
     @staticmethod
     def ratios(dataframe: hint.dataframe) -> None:
@@ -204,80 +182,14 @@ class Simulator(object):
             add ratio columns
         """
 
-        def resist(row) -> float:
-            """
-            Percent resistant of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row['genotype_susceptible']
-            sr = row['genotype_heterozygous']
-            rr = row['genotype_resistant']
-
-            total = ss + sr + rr
-
-            if total == 0:
-                return 0
-            else:
-                return rr / total
-
-        def suscept(row) -> float:
-            """
-            Percent susceptible of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row['genotype_susceptible']
-            sr = row['genotype_heterozygous']
-            rr = row['genotype_resistant']
-
-            total = ss + sr + rr
-
-            if total == 0:
-                return 0
-            else:
-                return ss / total
-
-        def hetero(row) -> float:
-            """
-            Percent hetero of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row['genotype_susceptible']
-            sr = row['genotype_heterozygous']
-            rr = row['genotype_resistant']
-
-            total = ss + sr + rr
-
-            if total == 0:
-                return 0
-            else:
-                return sr / total
-
-        dataframe['percent_resist'] = \
-            dataframe.apply(lambda row: resist(row), axis=1)
-
-        dataframe['percent_suscept'] = \
-            dataframe.apply(lambda row: suscept(row), axis=1)
+        rr, sr, ss = metrics.genotypes(dataframe)
+        resist, hetero, suscept = [np.nan_to_num(proportion)
+                                   for proportion in
+                                   metrics.genotype_proportions(rr, sr, ss)]
 
-        dataframe['percent_hetero'] = \
-            dataframe.apply(lambda row: hetero(row), axis=1)
+        dataframe['percent_resist']  = resist
+        dataframe['percent_suscept'] = suscept
+        dataframe['percent_hetero']  = hetero
 
     def run(self, times: list) -> hint.dataframe:
         """
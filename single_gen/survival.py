@@ -21,6 +21,8 @@ import models.survival     as sur
 import source.hint    as hint
 import source.keyword as keyword
 
+import source.data.metrics as metrics
+
 import source.simulation.simulation as main_simulation
 
 
@@ -180,31 +182,7 @@ class Simulator(object):
             add percent column
         """
 
-        def resist(row) -> float:
-            """
-            Percent resistant of row value
-
-            Args:
-                row: row of dataframe
-
-            Returns:
-                percent resistant
-            """
-
-            ss = row['genotype_susceptible']
-            sr = row['genotype_heterozygous']
-            rr = row['genotype_resistant']
-
-            total = 2*(ss + sr + rr)
-
-            if total == 0:
-                return np.nan
-            else:
-                r = 2*rr + sr
-
-                return r / total
-
-        dataframe['percent'] = dataframe.apply(lambda row: resist(row), axis=1)
+        metrics.add_percent(dataframe)
 
     def run(self, times: list) -> hint.dataframe:
         """
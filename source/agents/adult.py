@@ -4,7 +4,8 @@ import itertools   as i_tools
 import source.hint    as hint
 import source.keyword as keyword
 
-import source.agents.insect as insect
+import source.agents.egg_mass as egg_mass
+import source.agents.insect   as insect
 
 
 @dclass.dataclass
@@ -22,8 +23,10 @@ class Adult(insect.Insect):
         mate:     adult mating system
 
     Methods:
-        survive: have the adult survive
-        move:    have the larva move
+        survive:    have the adult survive
+        move:       have the larva move
+        batch_move: have a population of adults move
+        fusible:    if repeats of an action can be performed at once
     """
 
     num_eggs: int
@@ -55,10 +58,13 @@ class Adult(insect.Insect):
 
         return []
 
-    def move(self) -> hint.agent_list:
+    def move(self, number: int = 1) -> hint.agent_list:
         """
         Run the move behavior
 
+        Args:
+            number: number of sequential moves
+
         Effects:
             run behavior to move
 
@@ -67,10 +73,67 @@ class Adult(insect.Insect):
         """
 
         if self.alive:
-            self.movement.move(self)
+            self.movement.move(self, number)
 
         return []
 
+    @staticmethod
+    def batch_move(agents: hint.agent_list,
+                   sink:   hint.agent_list) -> None:
+        """
+        Have a population of adults move
+
+        Args:
+            agents: the agents to move
+            sink:   list of agents to add to simulation
+
+        Effects:
+            run behavior to move
+        """
+
+        movers = [agent for agent in agents if agent.alive]
+        if len(movers) > 0:
+            movers[0].movement.batch_move(movers)
+
+    def fusible(self, action: str) -> bool:
+        """
+        Determine if repeats of the action can be performed all at once,
+            moving only interacts through mating
+
+        Args:
+            action: the action key
+
+        Returns:
+            if the action can be fused
+        """
+
+        if action == keyword.move:
+            return not self.mating.interacts
+        else:
+            return False
+
+    def reads(self, action: str) -> hint.agent_keys:
+        """
+        Get the agent types whose locations the action reads,
+            laying depends on the eggs and larvae on the plant and mating
+            on the males nearby
+
+        Args:
+            action: the action key
+
+        Returns:
+            the agent types read
+        """
+
+        if action == keyword.reproduce:
+            agent_keys = [keyword.egg_mass, keyword.larva]
+            if self.mating.interacts:
+                agent_keys.append(keyword.male)
+
+            return agent_keys
+        else:
+            return []
+
     def new_unique_id(self) -> str:
         """
         Create a new unique_id
@@ -109,8 +172,8 @@ class Adult(insect.Insect):
         location_key = self.location.location_key
         agent_bin    = self.simulation.agents[location_key]
 
-        num_eggs   = len(agent_bin[keyword.egg_mass].agents)
-        num_larvae = len(agent_bin[keyword.larva].   agents)
+        num_eggs   = len(agent_bin[keyword.egg_mass])
+        num_larvae = len(agent_bin[keyword.larva])
 
         return num_eggs + num_larvae
 
@@ -174,6 +237,35 @@ class Adult(insect.Insect):
 
         return mates
 
+    def mate_bins(self, **kwargs) -> hint.bin_list:
+        """
+        Get the bins of males within the space bounds given
+            - only bins occupied by males are found
+
+        Args:
+            **kwargs: bounds for the range
+
+        Returns:
+            list of male bins
+        """
+
+        vertices = self.vertices(**kwargs)
+        agents   = self.simulation.agents
+        level    = keyword.adult_level
+        prefix   = self.location.location_key[:level]
+        occupied = agents.occupants(level, keyword.male)
+
+        if len(occupied) < len(vertices):
+            location_keys = [location_key for location_key in occupied
+                             if (location_key[level] in vertices) and
+                                (location_key[:level] == prefix)]
+        else:
+            location_keys = [prefix + (vertex,) for vertex in vertices
+                             if prefix + (vertex,) in occupied]
+
+        return [agents[location_key][keyword.male]
+                for location_key in location_keys]
+
     def reproduce(self) -> hint.agent_list:
         """
         Runs reproduction system:
@@ -215,16 +307,23 @@ class Adult(insect.Insect):
 
         return []
 
-    def _set_sex(self) -> None:
+    def _set_sex(self, female: bool = None) -> None:
         """
         Get the agent_key for the adult:
 
+        Args:
+            female: if the adult is female (drawn when not given)
+
         Returns:
             the proper agent key for the sex
         """
 
         if self.mate is None:
-            if self.simulation.models[keyword.init_sex](self.genotype):
+            if female is None:
+                model  = self.simulation.models[keyword.init_sex]
+                female = model(self.genotype)
+
+            if female:
                 self.agent_key = keyword.female
             else:
                 self.agent_key = keyword.male
@@ -233,14 +332,14 @@ class Adult(insect.Insect):
             self.num_eggs  = self.lay.reset(self)
 
     @classmethod
-    def initialize(cls, unique_id:  str,
-                        simulation: hint.simulation,
-                        location:   hint.location,
-                        mass:       float,
-                        genotype:   str,
-                        mate:       hint.adult_mate = None) -> 'Adult':
+    def _initialize(cls, unique_id:  str,
+                         simulation: hint.simulation,
+                         location:   hint.location,
+                         mass:       float,
+                         genotype:   str,
+                         mate:       hint.adult_mate = None) -> 'Adult':
         """
-        Initialize a new adult agent
+        Initialize a new adult agent without a sex
 
         Args:
             unique_id:  the agent's unique_id
@@ -251,7 +350,7 @@ class Adult(insect.Insect):
             mate:       the agent's mate
 
         Returns:
-            A fully initialized agent
+            An agent needing only its sex
         """
 
         alive    = True
@@ -264,13 +363,79 @@ class Adult(insect.Insect):
         lay      = simulation.behaviors.lay
         mating   = simulation.behaviors.mate
 
-        new = cls('', unique_id, simulation, location,
-                  alive, mass, genotype, age, death, num_eggs, mate,
-                  survival, movement, lay, mating)
+        return cls('', unique_id, simulation, location,
+                   alive, mass, genotype, age, death, num_eggs, mate,
+                   survival, movement, lay, mating)
+
+    @classmethod
+    def initialize(cls, unique_id:  str,
+                        simulation: hint.simulation,
+                        location:   hint.location,
+                        mass:       float,
+                        genotype:   str,
+                        mate:       hint.adult_mate = None) -> 'Adult':
+        """
+        Initialize a new adult agent
+
+        Args:
+            unique_id:  the agent's unique_id
+            simulation: the master simulation
+            location:   the agent's location
+            mass:       the agent's mass
+            genotype:   the agent's genotype
+            mate:       the agent's mate
+
+        Returns:
+            A fully initialized agent
+        """
+
+        new = cls._initialize(unique_id, simulation, location,
+                              mass, genotype, mate)
         new._set_sex()
 
         return new
 
+    @classmethod
+    def batch_initialize(cls, unique_ids: hint.unique_ids,
+                              simulation: hint.simulation,
+                              locations:  hint.locations,
+                              masses:     hint.masses,
+                              genotype:   str,
+                              mate:       hint.adult_mate = None) \
+            -> hint.adults:
+        """
+        Initialize a number of new adult agents at once
+
+        Args:
+            unique_ids: the agents' unique_ids
+            simulation: the master simulation
+            locations:  the agents' locations
+            masses:     the agents' masses
+            genotype:   the agents' genotype
+            mate:       the agents' mate
+
+        Returns:
+            list of fully initialized agents
+        """
+
+        number = len(unique_ids)
+        if mate is None:
+            females = simulation.models[keyword.init_sex].batch(genotype,
+                                                                number)
+        else:
+            females = [True]*number
+
+        adults = []
+        for unique_id, location, mass, female in zip(unique_ids, locations,
+                                                     masses, females):
+            new = cls._initialize(unique_id, simulation, location,
+                                  float(mass), genotype, mate)
+            new._set_sex(bool(female))
+
+            adults.append(new)
+
+        return adults
+
     @classmethod
     def setup(cls, unique_id_num: int,
                    initial_key:   str,
@@ -300,6 +465,73 @@ class Adult(insect.Insect):
         return cls.initialize(unique_id, simulation, location,
                               mass, genotype, mate)
 
+    @classmethod
+    def batch_setup(cls, unique_id_nums: hint.unique_id_nums,
+                         initial_key:    str,
+                         simulation:     hint.simulation,
+                         genotype:       str,
+                         mate:           hint.adult_mate = None) \
+            -> hint.adults:
+        """
+        Setup a number of initial population adults at once
+
+        Args:
+            unique_id_nums: unique_id numbers
+            initial_key:    key for where agents were initialized
+            simulation:     the master simulation
+            genotype:       the agents' genotype
+            mate:           the agents' mate
+
+        Returns:
+            list of adults initialized by a population
+        """
+
+        number = len(unique_id_nums)
+        model  = simulation.models[keyword.init_mature]
+
+        unique_ids = ['{}{}{}'.format(initial_key,
+                                      unique_id_num,
+                                      keyword.adult)
+                      for unique_id_num in unique_id_nums]
+        locations  = simulation.space.new_locations(keyword.adult_depth,
+                                                    number)
+        masses     = model.batch(genotype, number)
+
+        return cls.batch_initialize(unique_ids, simulation, locations,
+                                    masses, genotype, mate)
+
+    @classmethod
+    def batch_pregnant(cls, unique_id_nums: hint.unique_id_nums,
+                            initial_key:    str,
+                            simulation:     hint.simulation,
+                            genotype:       str) -> hint.adults:
+        """
+        Setup a number of pregnant adults carrying eggs of a genotype
+
+        Args:
+            unique_id_nums: unique_id numbers
+            initial_key:    key for where agents were initialized
+            simulation:     the master simulation
+            genotype:       the effective genotype of the eggs carried
+
+        Returns:
+            list of pregnant adults, mothers mated to fathers
+        """
+
+        new   = []
+        start = 0
+        for mother, father, number in \
+                egg_mass.EggMass.batch_parents(genotype,
+                                               len(unique_id_nums)):
+            stop = start + number
+            new.extend(cls.batch_setup(unique_id_nums[start:stop],
+                                       initial_key,
+                                       simulation,
+                                       mother, father))
+            start = stop
+
+        return new
+
     @classmethod
     def advance(cls, pupa: hint.pupa) -> 'Adult':
         """
@@ -16,10 +16,13 @@ class Agent(object):
         alive:      determine of the agent is alive
 
     Methods:
-        activate:   activate   the agent
-        deactivate: deactivate the agent
-        transfer:   transfer   the agent
-        die:        have agent die
+        activate:       activate   the agent
+        batch_activate: activate   a collection of agents
+        deactivate:     deactivate the agent
+        transfer:       transfer   the agent
+        die:            have agent die
+        fusible:        if repeats of an action can be performed at once
+        reads:          the agent types whose locations an action reads
     """
 
     agent_key:  str
@@ -38,6 +41,21 @@ class Agent(object):
 
         self.simulation.agents.activate(self)
 
+    @classmethod
+    def batch_activate(cls, agents: hint.agent_list) -> None:
+        """
+        Activate a collection of agents at once
+
+        Args:
+            agents: the agents to activate
+
+        Effects:
+            activates the agents in the system
+        """
+
+        if len(agents) > 0:
+            agents[0].simulation.agents.batch_activate(agents)
+
     def deactivate(self) -> None:
         """
         Activate the agent
@@ -122,6 +140,33 @@ class Agent(object):
         self.alive = False
         self.deactivate()
 
+    def fusible(self, action: str) -> bool:
+        """
+        Determine if repeats of the action can be performed all at once,
+            i.e. the action does not interact with other agents
+
+        Args:
+            action: the action key
+
+        Returns:
+            if the action can be fused
+        """
+
+        return False
+
+    def reads(self, action: str) -> hint.agent_keys:
+        """
+        Get the agent types whose locations the action reads
+
+        Args:
+            action: the action key
+
+        Returns:
+            the agent types read
+        """
+
+        return []
+
     def reset(self) -> hint.agent_list:
         """
         Reset the agent
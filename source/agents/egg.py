@@ -18,14 +18,46 @@ class Egg(insect.Insect):
         development: development system
 
     Methods:
-        survive: have the egg survive
-        develop: have the egg develop
+        survive:        have the egg survive
+        develop:        have the egg develop
+        event:          sample the next event for the egg
+        fire:           have the egg's event happen
+        batch_activate: activate a collection of eggs
     """
 
     egg_mass:    hint.egg_mass
     survival:    hint.egg_survival
     development: hint.egg_development
 
+    def activate(self) -> None:
+        """
+        Activate the agent
+
+        Effects:
+            activates the agent in the system
+            schedules the agent's next event (if calendar in use)
+        """
+
+        super().activate()
+        self.simulation.schedule.register(self)
+
+    @classmethod
+    def batch_activate(cls, agents: hint.agent_list) -> None:
+        """
+        Activate a collection of agents at once
+
+        Args:
+            agents: the agents to activate
+
+        Effects:
+            activates the agents in the system
+            schedules the agents' next events (if calendar in use)
+        """
+
+        super().batch_activate(agents)
+        for agent in agents:
+            agent.simulation.schedule.register(agent)
+
     def deactivate(self) -> None:
         """
         Deactivate the agent
@@ -70,6 +102,44 @@ class Egg(insect.Insect):
 
         return []
 
+    def event(self) -> hint.event:
+        """
+        Sample the next event for the egg
+            - survival is checked before development on the same day
+
+        Returns:
+            (days until event, event_key)
+        """
+
+        lifetime = self.survival.lifetime(self)
+        duration = self.development.duration(self)
+
+        if lifetime <= duration:
+            return lifetime, keyword.survive
+        else:
+            return duration, keyword.develop
+
+    def fire(self, days:      int,
+                   event_key: str) -> None:
+        """
+        Have the event happen to the egg
+
+        Args:
+            days:      days since the event was scheduled
+            event_key: the type of event
+
+        Effects:
+            if egg is alive: age it and have it die or develop
+        """
+
+        if self.alive:
+            self.age += days
+
+            if event_key == keyword.survive:
+                self.die(keyword.survival)
+            else:
+                self.development.transform(self)
+
     @classmethod
     def initialize(cls, unique_id:  str,
                         simulation: hint.simulation,
@@ -149,6 +149,27 @@ class EggMass(agent.Agent):
         self.eggs.activate()
         self.alive = True
 
+    @classmethod
+    def batch_activate(cls, agents: hint.agent_list) -> None:
+        """
+        Activate a collection of egg_masses and all their eggs at once
+
+        Args:
+            agents: the egg_masses to activate
+
+        Effects:
+            activates the egg_masses and eggs
+        """
+
+        eggs = []
+        for egg_mass in agents:
+            eggs.extend(egg_mass.eggs.values())
+
+        super().batch_activate(agents)
+        agent_egg.Egg.batch_activate(eggs)
+        for egg_mass in agents:
+            egg_mass.alive = True
+
     def deactivate(self) -> None:
         """
         Deactivate this egg_mass and all its eggs in the simulation
@@ -310,6 +331,57 @@ class EggMass(agent.Agent):
 
         return genotypes
 
+    @staticmethod
+    def batch_parents(genotype: str,
+                      number:   int) -> hint.parent_counts:
+        """
+        Get the parents of a number of initial egg_masses of a genotype
+            - heterozygous egg_masses have their parents in random order
+
+        Args:
+            genotype: the effective genotype of the eggs
+            number:   number of egg_masses
+
+        Returns:
+            list of (mother, father, number of egg_masses)
+        """
+
+        if genotype == keyword.hetero:
+            resistant = int(rnd.binomial(number, 0.5))
+
+            return [(keyword.homo_r, keyword.homo_s, resistant),
+                    (keyword.homo_s, keyword.homo_r, number - resistant)]
+        else:
+            return [(genotype, genotype, number)]
+
+    @classmethod
+    def batch_genotypes(cls, number: int,
+                             mother: str,
+                             father: str) -> hint.genotypes:
+        """
+        Generate a list of genotypes from the mother and father all at once
+
+        Args:
+            number: number to make
+            mother: mother's genotype_key
+            father: father's genotype_key
+
+        Returns:
+            list of genotypes
+        """
+
+        mother_alleles = np.array(cls._alleles(mother))
+        father_alleles = np.array(cls._alleles(father))
+
+        allele_keys = mother_alleles[rnd.randint(2, size=number)] + \
+                      father_alleles[rnd.randint(2, size=number)]
+
+        genotype_keys = {keyword.homo_r_value: keyword.homo_r,
+                         keyword.hetero_value: keyword.hetero,
+                         keyword.homo_s_value: keyword.homo_s}
+
+        return [genotype_keys[allele_key] for allele_key in allele_keys]
+
     @classmethod
     def empty(cls, unique_id:  str,
                    simulation: hint.simulation,
@@ -413,3 +485,99 @@ class EggMass(agent.Agent):
         father     = adult.mate
 
         return cls.initialize(unique_id, simulation, location, mother, father)
+
+    @classmethod
+    def batch_initialize(cls, unique_ids: hint.unique_ids,
+                              simulation: hint.simulation,
+                              locations:  hint.locations,
+                              mother:     str,
+                              father:     str) -> hint.egg_masses:
+        """
+        Initialize a number of new egg_mass agents at once
+
+        Args:
+            unique_ids: the agents' unique_ids
+            simulation: the master simulation
+            locations:  the agents' locations
+            mother:     mother's genotype_key
+            father:     father's genotype_key
+
+        Returns:
+            list of fully initialized egg_masses
+        """
+
+        number = len(unique_ids)
+
+        nums      = simulation.models[keyword.init_num]. batch(mother, number)
+        masses    = simulation.models[keyword.init_mass].batch(mother, number)
+        genotypes = cls.batch_genotypes(int(np.sum(nums)), mother, father)
+
+        egg_masses = []
+        start      = 0
+        for unique_id, location, num, mass in zip(unique_ids, locations,
+                                                  nums, masses):
+            new = cls.empty(unique_id, simulation, location)
+            new.eggs = Eggs.initialize(new, genotypes[start:start + num], mass)
+
+            egg_masses.append(new)
+            start += num
+
+        return egg_masses
+
+    @classmethod
+    def batch_setup(cls, unique_id_nums: hint.unique_id_nums,
+                         initial_key:    str,
+                         simulation:     hint.simulation,
+                         genotype:       str) -> hint.egg_masses:
+        """
+        Setup a number of initial population egg_masses at once
+
+        Args:
+            unique_id_nums: unique_id numbers
+            initial_key:    key for where agents were initialized
+            simulation:     the master simulation
+            genotype:       the effective genotypes of eggs
+
+        Returns:
+            list of egg_masses initialized by a population
+        """
+
+        unique_ids = ['{}{}{}'.format(initial_key,
+                                      unique_id_num,
+                                      keyword.egg_mass)
+                      for unique_id_num in unique_id_nums]
+        locations  = simulation.space.new_locations(keyword.egg_depth,
+                                                    len(unique_ids))
+
+        egg_masses = []
+        start      = 0
+        for mother, father, number in cls.batch_parents(genotype,
+                                                        len(unique_ids)):
+            stop = start + number
+            egg_masses.extend(cls.batch_initialize(unique_ids[start:stop],
+                                                   simulation,
+                                                   locations[start:stop],
+                                                   mother, father))
+            start = stop
+
+        return egg_masses
+
+    @classmethod
+    def births(cls, adult:  hint.adult,
+                    number: int) -> hint.egg_masses:
+        """
+        Create several egg_masses from this adult at once
+
+        Args:
+            adult:  the adult in question
+            number: the number of egg_masses to create
+
+        Returns:
+            list of brand new egg_masses
+        """
+
+        unique_ids = [adult.new_unique_id()    for _ in range(number)]
+        locations  = [adult.new_egg_location() for _ in range(number)]
+
+        return cls.batch_initialize(unique_ids, adult.simulation, locations,
+                                    adult.genotype, adult.mate)
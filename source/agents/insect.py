@@ -20,7 +20,9 @@ class Insect(agent.Agent):
         death:    agent's death state
 
     Methods:
-        advance_age: have the insect advance it's age
+        transfer:          transfer the insect
+        advance_age:       have the insect advance it's age
+        batch_advance_age: have a population of insects advance their ages
     """
 
     mass:     float
@@ -32,22 +34,48 @@ class Insect(agent.Agent):
         """Setup some helper systems"""
 
         self._age_count = i_tools.count(self.age + 1)
+        self._plant_id  = None
+
+    @property
+    def plant_id(self) -> int:
+        """Get the id of the plant the insect is on (cached until moved)"""
+
+        if self._plant_id is None:
+            environment    = self.simulation.agents.environment
+            self._plant_id = environment.plant_id(self.location)
+
+        return self._plant_id
 
     @property
     def bt(self) -> str:
         """Get the bt state of the plant"""
 
-        loc = self.location[:keyword.bt_depth]
-
-        return self.simulation.agents[loc.location_key].environment.bt
+        return self.simulation.agents.environment.bt_state(self.plant_id)
 
     @property
     def plant(self) -> float:
         """Get the mass of the plant"""
 
-        loc = self.location[:keyword.plant_depth]
+        return float(self.simulation.agents.environment.plant[self.plant_id])
 
-        return self.simulation.agents[loc.location_key].environment.plant
+    def transfer(self, vertex: int,
+                       level:  int) -> None:
+        """
+        Transfer the insect to a new vertex
+
+        Args:
+            vertex: vertex
+            level:  level of vertex
+
+        Effects:
+            moves the insect
+            clears the cached plant id if the insect changed plants
+        """
+
+        super().transfer(vertex, level)
+
+        if level <= keyword.plant_level:
+            self._plant_id = None
 
     def advance_age(self) -> hint.agent_list:
         """
@@ -64,6 +92,25 @@ class Insect(agent.Agent):
 
         return []
 
+    @staticmethod
+    def batch_advance_age(agents: hint.agent_list,
+                          sink:   hint.agent_list) -> None:
+        """
+        Advance the age of a population of agents as a behavior
+            - same as advance_age on each agent, in one call for the bin
+              (agents are objects, so this is still a loop over them)
+
+        Args:
+            agents: the agents to advance
+            sink:   list of agents to add to simulation
+
+        Effects:
+            advances age of the agents by 1
+        """
+
+        for agent in agents:
+            agent.age = next(agent._age_count)
+
     def die(self, death: str = '') -> None:
         """
         Have agent die
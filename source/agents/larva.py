@@ -38,8 +38,14 @@ class Larva(insect.Insect):
         move:          have the larva move
         consume_egg:   consume egg material
         consume_larva: consume larva material
+        target_bins:   get bins of cannibalism targets
         targets:       get cannibalism targets
         consume:       have larva consume mass
+        batch_move:    have a population of larvae move
+        batch_consume: have a population of larvae consume
+        fusible:       if repeats of an action can be performed at once
+        reset:         reset the larva
+        batch_reset:   reset a population of larvae
     """
 
     plant_gut:    float
@@ -199,10 +205,13 @@ class Larva(insect.Insect):
 
         return []
 
-    def move(self) -> hint.agent_list:
+    def move(self, number: int = 1) -> hint.agent_list:
         """
         Run the move behavior
 
+        Args:
+            number: number of sequential moves
+
         Effects:
             run behavior to move
 
@@ -211,20 +220,23 @@ class Larva(insect.Insect):
         """
 
         if self._can_consume and (not self._has_target):
-            self.movement.move(self)
+            self.movement.move(self, number)
 
         return []
 
-    def _consume_plant(self) -> None:
+    def _consume_plant(self, number: int = 1) -> None:
         """
         Run consume plant behavior
 
+        Args:
+            number: number of sequential bites
+
         Effects:
             consume the plant
         """
 
         if self._can_consume:
-            self.forage_plant.consume(self)
+            self.forage_plant.consume(self, number)
 
     def consume_egg(self, egg_mass: hint.egg_mass) -> None:
         """
@@ -286,33 +298,53 @@ class Larva(insect.Insect):
 
         return location_keys
 
-    def targets(self, **kwargs) -> hint.targets:
+    def target_bins(self, **kwargs) -> hint.bin_list:
         """
-        Get a list of egg_masses within the space bounds given
+        Get the bins of egg_masses and larvae within the space bounds given
 
         Args:
             **kwargs: bounds for the range
 
         Returns:
-            list of target larvae and eggs
+            list of egg_mass and larva bins
         """
 
         location_keys = self._location_keys(**kwargs)
 
-        targets = []
+        bins = []
         for location_key in location_keys:
             agent_bin = self.simulation.agents[location_key]
-            targets  += agent_bin[keyword.egg_mass].agents
-            targets  += agent_bin[keyword.larva].agents
+            bins.append(agent_bin[keyword.egg_mass])
+            bins.append(agent_bin[keyword.larva])
+
+        return bins
+
+    def targets(self, **kwargs) -> hint.targets:
+        """
+        Get a list of egg_masses within the space bounds given
+
+        Args:
+            **kwargs: bounds for the range
+
+        Returns:
+            list of target larvae and eggs
+        """
+
+        targets = []
+        for agent_bin in self.target_bins(**kwargs):
+            targets += agent_bin.agents
 
         targets.remove(self)
 
         return targets
 
-    def consume(self) -> hint.agent_list:
+    def consume(self, number: int = 1) -> hint.agent_list:
         """
         Run the full consume behavior
 
+        Args:
+            number: number of sequential bites of plant
+
         Effects:
             consumes other agents and mass
 
@@ -322,10 +354,95 @@ class Larva(insect.Insect):
 
         self._consume_target()
         self.cannibalism.cannibalism(self)
-        self._consume_plant()
+        self._consume_plant(number)
 
         return []
 
+    @staticmethod
+    def batch_move(agents: hint.agent_list,
+                   sink:   hint.agent_list) -> None:
+        """
+        Have a population of larvae move
+
+        Args:
+            agents: the agents to move
+            sink:   list of agents to add to simulation
+
+        Effects:
+            run behavior to move
+        """
+
+        movers = [agent for agent in agents
+                  if agent._can_consume and (not agent._has_target)]
+        if len(movers) > 0:
+            movers[0].movement.batch_move(movers)
+
+    @staticmethod
+    def batch_consume(agents: hint.agent_list,
+                      sink:   hint.agent_list) -> None:
+        """
+        Have a population of larvae consume
+            - the encounters of larvae on the same plant are drawn together
+            - each part of consume runs for every larva before the next part,
+              rather than larva by larva
+
+        Args:
+            agents: the agents to consume
+            sink:   list of agents to add to simulation
+
+        Effects:
+            consumes other agents and mass
+        """
+
+        targeted = [agent for agent in agents
+                    if agent._has_target and agent.alive]
+        if len(targeted) > 0:
+            targeted[0].loss.batch_consume(targeted)
+
+        agents[0].cannibalism.batch_cannibalism(agents)
+
+        eaters = [agent for agent in agents if agent._can_consume]
+        if len(eaters) > 0:
+            eaters[0].forage_plant.batch_consume(eaters)
+
+    def fusible(self, action: str) -> bool:
+        """
+        Determine if repeats of the action can be performed all at once,
+            moving and consuming only interact through cannibalism and
+            plants depleted by the other larvae
+            - without depletion the bites taken do not change the plant,
+              so they can be taken before the moves
+
+        Args:
+            action: the action key
+
+        Returns:
+            if the action can be fused
+        """
+
+        if action in (keyword.move, keyword.consume):
+            return not (self.cannibalism.interacts or
+                        self.forage_plant.deplete)
+        else:
+            return False
+
+    def reads(self, action: str) -> hint.agent_keys:
+        """
+        Get the agent types whose locations the action reads,
+            consuming reads the eggs and larvae it can cannibalize
+
+        Args:
+            action: the action key
+
+        Returns:
+            the agent types read
+        """
+
+        if action == keyword.consume and self.cannibalism.interacts:
+            return [keyword.egg_mass, keyword.larva]
+        else:
+            return []
+
     def reset(self) -> hint.agent_list:
         """
         Reset the agent
@@ -343,6 +460,29 @@ class Larva(insect.Insect):
 
         return []
 
+    @staticmethod
+    def batch_reset(agents: hint.agent_list,
+                    sink:   hint.agent_list) -> None:
+        """
+        Reset a population of agents
+            - same as reset on each agent, in one call for the bin
+
+        Args:
+            agents: the agents to reset
+            sink:   list of agents to add to simulation
+
+        Effects:
+            sets gut volumes to zero
+            sets full to false
+        """
+
+        for agent in agents:
+            agent.plant_gut = 0
+            agent.egg_gut   = 0
+            agent.larva_gut = 0
+
+            agent.full = False
+
     @classmethod
     def initialize(cls, unique_id:  str,
                         simulation: hint.simulation,
@@ -417,6 +557,43 @@ class Larva(insect.Insect):
 
         return cls.initialize(unique_id, simulation, location, mass, genotype)
 
+    @classmethod
+    def batch_setup(cls, unique_id_nums: hint.unique_id_nums,
+                         initial_key:    str,
+                         simulation:     hint.simulation,
+                         genotype:       str) -> hint.larvae:
+        """
+        Setup a number of initial population larvae at once
+
+        Args:
+            unique_id_nums: unique_id numbers
+            initial_key:    key for where agents were initialized
+            simulation:     the master simulation
+            genotype:       the agents' genotype
+
+        Returns:
+            list of larvae initialized by a population
+        """
+
+        number = len(unique_id_nums)
+        model  = simulation.models[keyword.init_juvenile]
+
+        locations = simulation.space.new_locations(keyword.larva_depth,
+                                                   number)
+        masses    = model.batch(genotype, number)
+
+        new = []
+        for unique_id_num, location, mass in zip(unique_id_nums,
+                                                 locations,
+                                                 masses):
+            unique_id = '{}{}{}'.format(initial_key,
+                                        unique_id_num,
+                                        keyword.larva)
+            new.append(cls.initialize(unique_id, simulation, location,
+                                      float(mass), genotype))
+
+        return new
+
     @classmethod
     def advance(cls, egg: hint.egg) -> 'Larva':
         """
@@ -17,13 +17,45 @@ class Pupa(insect.Insect):
         development: development system
 
     Methods:
-        survive:   have the pupa survive
-        develop:   have the pupa develop
+        survive:        have the pupa survive
+        develop:        have the pupa develop
+        event:          sample the next event for the pupa
+        fire:           have the pupa's event happen
+        batch_activate: activate a collection of pupae
     """
 
     survival:    hint.pupa_survival
     development: hint.pupa_development
 
+    def activate(self) -> None:
+        """
+        Activate the agent
+
+        Effects:
+            activates the agent in the system
+            schedules the agent's next event (if calendar in use)
+        """
+
+        super().activate()
+        self.simulation.schedule.register(self)
+
+    @classmethod
+    def batch_activate(cls, agents: hint.agent_list) -> None:
+        """
+        Activate a collection of agents at once
+
+        Args:
+            agents: the agents to activate
+
+        Effects:
+            activates the agents in the system
+            schedules the agents' next events (if calendar in use)
+        """
+
+        super().batch_activate(agents)
+        for agent in agents:
+            agent.simulation.schedule.register(agent)
+
     def survive(self) -> hint.agent_list:
         """
         Run the survive behavior
@@ -56,6 +88,44 @@ class Pupa(insect.Insect):
 
         return []
 
+    def event(self) -> hint.event:
+        """
+        Sample the next event for the pupa
+            - survival is checked before development on the same day
+
+        Returns:
+            (days until event, event_key)
+        """
+
+        lifetime = self.survival.lifetime(self)
+        duration = self.development.duration(self)
+
+        if lifetime <= duration:
+            return lifetime, keyword.survive
+        else:
+            return duration, keyword.develop
+
+    def fire(self, days:      int,
+                   event_key: str) -> None:
+        """
+        Have the event happen to the pupa
+
+        Args:
+            days:      days since the event was scheduled
+            event_key: the type of event
+
+        Effects:
+            if pupa is alive: age it and have it die or develop
+        """
+
+        if self.alive:
+            self.age += days
+
+            if event_key == keyword.survive:
+                self.die(keyword.survival)
+            else:
+                self.development.transform(self)
+
     @classmethod
     def initialize(cls, unique_id:  str,
                         simulation: hint.simulation,
@@ -114,6 +184,43 @@ class Pupa(insect.Insect):
 
         return cls.initialize(unique_id, simulation, location, mass, genotype)
 
+    @classmethod
+    def batch_setup(cls, unique_id_nums: hint.unique_id_nums,
+                         initial_key:    str,
+                         simulation:     hint.simulation,
+                         genotype:       str) -> hint.pupae:
+        """
+        Setup a number of initial population pupae at once
+
+        Args:
+            unique_id_nums: unique_id numbers
+            initial_key:    key for where agents were initialized
+            simulation:     the master simulation
+            genotype:       the agents' genotype
+
+        Returns:
+            list of pupae initialized by a population
+        """
+
+        number = len(unique_id_nums)
+        model  = simulation.models[keyword.init_mature]
+
+        locations = simulation.space.new_locations(keyword.pupa_depth,
+                                                   number)
+        masses    = model.batch(genotype, number)
+
+        new = []
+        for unique_id_num, location, mass in zip(unique_id_nums,
+                                                 locations,
+                                                 masses):
+            unique_id = '{}{}{}'.format(initial_key,
+                                        unique_id_num,
+                                        keyword.pupa)
+            new.append(cls.initialize(unique_id, simulation, location,
+                                      float(mass), genotype))
+
+        return new
+
     @classmethod
     def advance(cls, larva: hint.larva) -> 'Pupa':
         """
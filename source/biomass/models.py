@@ -93,6 +93,7 @@ class InitNum(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for several egg_masses
     """
 
     model_key = keyword.init_num
@@ -110,6 +111,21 @@ class InitNum(models.Model):
 
         return int(stats.poisson.rvs(self.lam))
 
+    def batch(self, genotype: str,
+                    number:   int) -> np.ndarray:
+        """
+        Get the number of eggs of several egg_masses
+
+        Args:
+            genotype: the genotype of the mother
+            number:   number of egg_masses
+
+        Returns:
+            number of eggs for each egg_mass
+        """
+
+        return stats.poisson.rvs(self.lam, size=number).astype(int)
+
 
 @dclass.dataclass
 class InitMass(models.Model):
@@ -130,6 +146,7 @@ class InitMass(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for several egg_masses
     """
 
     model_key = keyword.init_mass
@@ -154,6 +171,25 @@ class InitMass(models.Model):
         return float(stats.truncnorm.rvs(0, np.inf,
                                          loc=mu, scale=sigma))
 
+    def batch(self, genotype: str,
+                    number:   int) -> np.ndarray:
+        """
+        Get the total masses of several egg_masses
+
+        Args:
+            genotype: insect genotype
+            number:   number of egg_masses
+
+        Returns:
+            mass of each egg_mass
+        """
+
+        mu    = self.mu[genotype]
+        sigma = self.sigma[genotype]
+
+        return stats.truncnorm.rvs(0, np.inf, loc=mu, scale=sigma,
+                                   size=number)
+
 
 @dclass.dataclass
 class InitJuvenile(models.Model):
@@ -173,6 +209,7 @@ class InitJuvenile(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for several larvae
     """
 
     model_key = keyword.init_juvenile
@@ -197,6 +234,25 @@ class InitJuvenile(models.Model):
         return float(stats.truncnorm.rvs(0, np.inf,
                                          loc=mu, scale=sigma))
 
+    def batch(self, genotype: str,
+                    number:   int) -> np.ndarray:
+        """
+        Get the masses of several new larvae
+
+        Args:
+            genotype: insect genotype
+            number:   number of larvae
+
+        Returns:
+            mass of each larva
+        """
+
+        mu    = self.mu[genotype]
+        sigma = self.sigma[genotype]
+
+        return stats.truncnorm.rvs(0, np.inf, loc=mu, scale=sigma,
+                                   size=number)
+
 
 @dclass.dataclass
 class InitMature(models.Model):
@@ -217,6 +273,7 @@ class InitMature(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for several insects
 
     Constructors:
         setup: setup the mathematical model
@@ -244,6 +301,25 @@ class InitMature(models.Model):
         return float(stats.truncnorm.rvs(0, np.inf,
                                          loc=mu, scale=sigma))
 
+    def batch(self, genotype: str,
+                    number:   int) -> np.ndarray:
+        """
+        Get the masses of several new insects
+
+        Args:
+            genotype: insect genotype
+            number:   number of insects
+
+        Returns:
+            mass of each insect
+        """
+
+        mu    = self.mu[genotype]
+        sigma = self.sigma[genotype]
+
+        return stats.truncnorm.rvs(0, np.inf, loc=mu, scale=sigma,
+                                   size=number)
+
 
 @dclass.dataclass
 class InitPlant(models.Model):
@@ -0,0 +1,303 @@
+import dataclasses as dclass
+import numpy       as np
+import os
+import pandas      as pd
+
+import source.hint    as hint
+import source.keyword as keyword
+
+import source.data.database   as database
+import source.data.metrics    as metrics
+import source.data.reader     as reader
+import source.data.statistics as statistics
+
+
+largest = 128
+
+
+def checkpoints(number: int) -> list:
+    """
+    Get the numbers of runs to compare the means at
+        - the powers of two up to 128 below the number of runs, then all the
+          runs
+
+    Args:
+        number: the number of runs
+
+    Returns:
+        the numbers of runs in order
+    """
+
+    points = []
+    point  = 1
+    while point < number and point <= largest:
+        points.append(point)
+        point *= 2
+    points.append(number)
+
+    return points
+
+
+def store_runs(file_path:   str,
+               name:        str,
+               table_names: list,
+               start:       int = 0,
+               steps:       int = None) -> hint.run_stream:
+    """
+    Read the genotype tables of a simulation's runs from the columnar store
+        - one run is read at a time, each table as one filtered read of the
+          run's column chunks
+        - tables are named {location_key}_{agent_key}
+
+    Args:
+        file_path:   directory of all the simulations
+        name:        name of the simulation
+        table_names: names of the tables to read
+        start:       first step to keep
+        steps:       number of steps of every run, defaults to each run's
+                     own last stored step
+
+    Yields:
+        (run number, the run's tables of genotype counts and metrics)
+    """
+
+    for run_num in database.ColumnStore.runs(file_path, name):
+        store = database.ColumnStore(1, '{}_{}'.format(name, run_num),
+                                     file_path)
+        codes = store.read_codes()
+        if steps is None:
+            run_steps = store.steps()
+        else:
+            run_steps = steps
+
+        dataframes = {}
+        for table_name in table_names:
+            location, agent = table_name.rsplit('_', 1)
+            counts = store.read_long(location, agent, keyword.genotype)
+
+            dataframe = metrics.long_metrics(counts, codes, run_steps)
+            dataframes[table_name] = \
+                dataframe.iloc[start:].reset_index(drop=True)
+
+        yield run_num, dataframes
+
+
+def window_runs(file_path:   str,
+                name:        str,
+                table_names: list,
+                start:       int = 0,
+                workers:     int = 1) -> hint.run_stream:
+    """
+    Read the genotype tables of a simulation's runs from its window files
+        - the window files are what every simulation writes by default
+        - one run at a time is read through the run caches
+
+    Args:
+        file_path:   directory of all the simulations
+        name:        name of the simulation
+        table_names: names of the tables to read
+        start:       first step to keep
+        workers:     number of processes to read the runs with
+
+    Yields:
+        (run number, the run's tables of genotype counts and metrics)
+    """
+
+    read = reader.Reader(os.path.join(file_path, name), name, table_names,
+                         workers=workers)
+
+    for run_num, dataframes in read.runs():
+        tables = {}
+        for table_name, dataframe in dataframes.items():
+            dataframe = dataframe.reindex(columns=metrics.genotype_columns,
+                                          fill_value=0).\
+                iloc[start:].reset_index(drop=True)
+            metrics.add_metrics(dataframe)
+            tables[table_name] = dataframe
+
+        yield run_num, tables
+
+
+def simulation_runs(file_path:   str,
+                    name:        str,
+                    table_names: list,
+                    start:       int = 0,
+                    workers:     int = 1) -> tuple:
+    """
+    Get the runs of a simulation from wherever they were written
+        - the columnar store when the simulation wrote one, otherwise the
+          window files
+
+    Args:
+        file_path:   directory of all the simulations
+        name:        name of the simulation
+        table_names: names of the tables to read
+        start:       first step to keep
+        workers:     number of processes to read window files with
+
+    Returns:
+        (number of runs, stream of the runs)
+    """
+
+    directory = os.path.join(file_path, name)
+
+    if os.path.isdir(directory):
+        number = len(database.ColumnStore.runs(file_path, name))
+        if number > 0:
+            return number, store_runs(file_path, name, table_names, start)
+
+    number = len(reader.Manifest.setup(directory, name).complete())
+
+    return number, window_runs(file_path, name, table_names, start, workers)
+
+
+@dclass.dataclass
+class Convergence(object):
+    """
+    Class to measure how the mean of the runs settles as runs are added
+        - runs are added one at a time into running means
+        - at each checkpoint the mean is compared with the mean at the
+          previous checkpoint and only the summed absolute difference of
+          each column is kept
+
+    Variables:
+        checkpoints: numbers of runs to compare the means at
+        moments:     running moments of each table
+        columns:     names of the columns of each table
+        previous:    mean of each table at the previous checkpoint
+        errors:      summed difference of each table's columns, by the
+                     checkpoint it was measured from
+        runs:        number of runs added
+
+    Methods:
+        add:      add a run's tables
+        mean:     get the current mean of a table
+        integral: get the relative error integral at each checkpoint
+
+    Constructors:
+        setup: setup class
+    """
+
+    checkpoints: list
+    moments:     dict = dclass.field(default_factory=dict)
+    columns:     dict = dclass.field(default_factory=dict)
+    previous:    dict = dclass.field(default_factory=dict)
+    errors:      dict = dclass.field(default_factory=dict)
+    runs:        int  = 0
+
+    def _mean(self, table_name: str) -> np.ndarray:
+        """
+        Get the current mean of a table as an array
+
+        Args:
+            table_name: name of the table
+
+        Returns:
+            mean of each step and column
+        """
+
+        moments = self.moments[table_name]
+
+        return np.where(moments.count > 0, moments.mean, np.nan)
+
+    def _check(self) -> None:
+        """
+        Compare the means with the means at the previous checkpoint
+
+        Effects:
+            records the summed differences and keeps the new means
+        """
+
+        if len(self.previous) > 0:
+            point  = self.checkpoints[self.checkpoints.index(self.runs) - 1]
+            errors = {}
+            for table_name in self.moments:
+                mean = self._mean(table_name)
+                errors[table_name] = \
+                    np.nansum(np.abs(mean - self.previous[table_name]),
+                              axis=0)
+            self.errors[point] = errors
+
+        self.previous = {table_name: self._mean(table_name)
+                         for table_name in self.moments}
+
+    def add(self, dataframes: hint.dataframes) -> None:
+        """
+        Add a run's tables
+
+        Args:
+            dataframes: the run's tables
+
+        Effects:
+            updates the running means and the errors at a checkpoint
+        """
+
+        for table_name, dataframe in dataframes.items():
+            if table_name not in self.moments:
+                self.moments[table_name] = \
+                    statistics.Moments.setup(dataframe.shape)
+                self.columns[table_name] = list(dataframe.columns)
+
+            if list(dataframe.columns) != self.columns[table_name] or \
+                    dataframe.shape != self.moments[table_name].count.shape:
+                raise ValueError('Run table does not match: {}'.
+                                 format(table_name))
+
+            self.moments[table_name].add(dataframe.to_numpy(dtype=float))
+
+        self.runs += 1
+        if self.runs in self.checkpoints:
+            self._check()
+
+    def mean(self, table_name: str) -> hint.dataframe:
+        """
+        Get the current mean of a table
+
+        Args:
+            table_name: name of the table
+
+        Returns:
+            mean of each step and column
+        """
+
+        return pd.DataFrame(self._mean(table_name),
+                            columns=self.columns[table_name])
+
+    def integral(self) -> dict:
+        """
+        Get the relative error integral at each checkpoint
+            - the summed difference to the next checkpoint's mean over the
+              summed mean of all the runs
+            - the mean of all the runs is the converged estimate, so every
+              checkpoint's error is relative to the same reference
+
+        Returns:
+            dictionary of the errors of each table's columns by checkpoint
+        """
+
+        totals = {table_name: np.nansum(self._mean(table_name), axis=0)
+                  for table_name in self.moments}
+
+        integral = {}
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for point, errors in self.errors.items():
+                integral[point] = {
+                    table_name: pd.Series(error / totals[table_name],
+                                          index=self.columns[table_name])
+                    for table_name, error in errors.items()}
+
+        return integral
+
+    @classmethod
+    def setup(cls, number: int) -> 'Convergence':
+        """
+        Setup the convergence for a number of runs
+
+        Args:
+            number: the number of runs that will be added
+
+        Returns:
+            empty convergence
+        """
+
+        return cls(checkpoints(number))
@@ -18,6 +18,7 @@ class DataColumn(collect.UserList):
 
     Methods:
         record: record the value
+        merge:  merge in another column
 
     Constructors:
         empty: setup the list
@@ -42,6 +43,23 @@ class DataColumn(collect.UserList):
 
         self.append(count[self.attr_value])
 
+    def merge(self, other: 'DataColumn',
+                    start: int = 0) -> None:
+        """
+        Merge the counts of another column into this one
+
+        Args:
+            other: column of the same attribute value
+            start: first time-step to merge
+
+        Effects:
+            adds the other column's counts to this one
+        """
+
+        merged = [mine + theirs for mine, theirs in zip(self.data[start:],
+                                                         other.data[start:])]
+        self.data = self.data[:start] + merged
+
     @classmethod
     def empty(cls, attr_value: str) -> 'DataColumn':
         """
@@ -71,9 +89,13 @@ class DataColumns(collect.UserDict):
     Methods:
         record:   record the value
         refresh:  reset the columns
+        merge:    merge in another set of columns
         columns:  create a dict
             key:   attr_attr_value
             value: DataColumn
+        long_columns: create a dict
+            key:   (attr, attr_value)
+            value: DataColumn
 
     Constructors:
         empty: setup the list
@@ -111,6 +133,22 @@ class DataColumns(collect.UserDict):
         for column in self.values():
             column.clear()
 
+    def merge(self, other: 'DataColumns',
+                    start: int = 0) -> None:
+        """
+        Merge the columns of another set into this one
+
+        Args:
+            other: columns for the same attribute
+            start: first time-step to merge
+
+        Effects:
+            adds the other columns' counts to these
+        """
+
+        for attr_value, column in self.items():
+            column.merge(other[attr_value], start)
+
     def columns(self) -> hint.data_column_dict:
         """
         Create a dictionary of data_columns
@@ -127,6 +165,17 @@ class DataColumns(collect.UserDict):
 
         return data
 
+    def long_columns(self) -> hint.long_column_dict:
+        """
+        Create a dictionary of data_columns keyed by attribute and value
+
+        Returns:
+            dictionary of data columns
+        """
+
+        return {(self.attr, attr_value): data_column
+                for attr_value, data_column in self.items()}
+
     @classmethod
     def empty(cls, attr:       str,
                    attr_values: hint.attr_values) -> 'DataColumns':
@@ -162,10 +211,13 @@ class BaseCount(collect.UserDict):
     Methods:
         add:     add agent to count
         sub:     subtract agent from count
+        release: subtract agent from count without counting a removal
         record:  record the count in the data columns
         refresh: refresh the stored values in data columns
+        merge:   merge in another counter
 
         get_data_columns: get the data columns to output
+        get_long_columns: get the data columns keyed by attribute and value
     """
 
     def __init__(self, counts: hint.counts_dict,
@@ -200,6 +252,19 @@ class BaseCount(collect.UserDict):
 
         pass
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Subtracts agent leaving the system without being removed
+
+        Args:
+            agent: agent to count
+
+        Effects:
+            remove count of attribute (without counting a removal)
+        """
+
+        pass
+
     def record(self) -> None:
         """
         Record the current count
@@ -221,6 +286,21 @@ class BaseCount(collect.UserDict):
 
         pass
 
+    def merge(self, other: 'BaseCount',
+                    start: int = 0) -> None:
+        """
+        Merge another counter into this one
+
+        Args:
+            other: counter for the same attribute
+            start: first time-step of data to merge
+
+        Effects:
+            adds the other counts to these
+        """
+
+        pass
+
     def get_data_columns(self) -> hint.data_column_dict:
         """
         Get the data_columns for class
@@ -231,6 +311,16 @@ class BaseCount(collect.UserDict):
 
         pass
 
+    def get_long_columns(self) -> hint.long_column_dict:
+        """
+        Get the data_columns for class keyed by attribute and value
+
+        Returns:
+            the data columns
+        """
+
+        pass
+
 
 class Count(BaseCount):
     """
@@ -249,8 +339,10 @@ class Count(BaseCount):
     Methods:
         add:     add agent to count
         sub:     subtract agent from count
+        release: subtract agent from count without counting a removal
         record:  record the count in the data columns
         refresh: refresh the stored values in data columns
+        merge:   merge in another counter
 
     Constructors:
         setup: create a counter
@@ -300,6 +392,21 @@ class Count(BaseCount):
         else:
             self[value] -= 1
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Subtracts agent leaving the system without being removed
+
+        Args:
+            agent: agent to count
+
+        Effects:
+            remove count of attribute (without counting a removal)
+        """
+
+        if not self.removal:
+            value = getattr(agent, self.attr)
+            self[value] -= 1
+
     def _reset(self) -> None:
         """
         Reset the counts of the system
@@ -336,6 +443,24 @@ class Count(BaseCount):
         self.data_columns.refresh()
         self.data_columns.record(self)
 
+    def merge(self, other: 'Count',
+                    start: int = 0) -> None:
+        """
+        Merge another counter into this one
+
+        Args:
+            other: counter for the same attribute
+            start: first time-step of data to merge
+
+        Effects:
+            adds the other counts to these
+        """
+
+        for key in self:
+            self[key] += other[key]
+
+        self.data_columns.merge(other.data_columns, start)
+
     def get_data_columns(self) -> hint.data_column_dict:
         """
         Get the data_columns for class
@@ -346,6 +471,16 @@ class Count(BaseCount):
 
         return self.data_columns.columns()
 
+    def get_long_columns(self) -> hint.long_column_dict:
+        """
+        Get the data_columns for class keyed by attribute and value
+
+        Returns:
+            the data columns
+        """
+
+        return self.data_columns.long_columns()
+
     @classmethod
     def empty(cls, attr:    str,
                    values:  hint.attr_values,
@@ -382,10 +517,13 @@ class CountFilter(BaseCount):
     Methods:
         add:     add agent to count
         sub:     subtract agent from count
+        release: subtract agent from count without counting a removal
         record:  record the count in the data columns
         refresh: refresh the stored values in data columns
+        merge:   merge in another counter
 
         get_data_columns: get the data columns to output
+        get_long_columns: get the data columns keyed by attribute and value
     """
 
     def add(self, agent: hint.agent) -> None:
@@ -416,6 +554,20 @@ class CountFilter(BaseCount):
         value = getattr(agent, self.attr)
         self[value].sub(agent)
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Subtracts agent leaving the system without being removed
+
+        Args:
+            agent: agent to count
+
+        Effects:
+            remove count of attribute (without counting a removal)
+        """
+
+        value = getattr(agent, self.attr)
+        self[value].release(agent)
+
     def record(self) -> None:
         """
         Record the current count
@@ -439,6 +591,22 @@ class CountFilter(BaseCount):
         for count in self.values():
             count.refresh()
 
+    def merge(self, other: 'CountFilter',
+                    start: int = 0) -> None:
+        """
+        Merge another counter into this one
+
+        Args:
+            other: counter for the same attribute
+            start: first time-step of data to merge
+
+        Effects:
+            adds the other counts to these
+        """
+
+        for attr_value, count in self.items():
+            count.merge(other[attr_value], start)
+
     def get_data_columns(self) -> hint.data_column_dict:
         """
         Get the data_columns for class
@@ -459,6 +627,26 @@ class CountFilter(BaseCount):
 
         return data
 
+    def get_long_columns(self) -> hint.long_column_dict:
+        """
+        Get the data_columns for class keyed by attribute and value
+            - the attribute joins the filter to the attribute filtered
+
+        Returns:
+            the data columns
+        """
+
+        data = {}
+
+        for attr_value, count in self.items():
+            long_columns = count.get_long_columns()
+
+            for (attr, value), column in long_columns.items():
+                key = ('{}_{}_{}'.format(self.attr, attr_value, attr), value)
+                data[key] = column
+
+        return data
+
     @classmethod
     def empty(cls, attr:    str,
                    values:  hint.attr_values,
@@ -510,11 +698,15 @@ class Counts(collect.UserDict):
     Methods:
         add:     add agent to count
         sub:     subtract agent from count
+        release: subtract agent from count without counting a removal
         record:  record the count in the data columns
         refresh: refresh the stored values in data columns
+        merge:   merge in another set of counts
         columns: create the data columns for this set of counts
 
-        dataframe: create a dataframe for storage
+        long_columns: create the data columns keyed by attribute and value
+        snapshot:     copy the recorded data of the data columns
+        dataframe:    create a dataframe for storage
 
     Constructors:
         setup: create a counter
@@ -551,6 +743,20 @@ class Counts(collect.UserDict):
         for counter in self.values():
             counter.sub(agent)
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Subtracts agent leaving the system without being removed
+
+        Args:
+            agent: agent to count
+
+        Effects:
+            remove count of attribute (without counting a removal)
+        """
+
+        for counter in self.values():
+            counter.release(agent)
+
     def record(self) -> None:
         """
         Record the current counts
@@ -573,6 +779,22 @@ class Counts(collect.UserDict):
         for counter in self.values():
             counter.refresh()
 
+    def merge(self, other: 'Counts',
+                    start: int = 0) -> None:
+        """
+        Merge another set of counts into this one
+
+        Args:
+            other: counts of the same attributes
+            start: first time-step of data to merge
+
+        Effects:
+            adds the other counts to these
+        """
+
+        for attr_key, counter in self.items():
+            counter.merge(other[attr_key], start)
+
     def columns(self) -> hint.data_column_dict:
         """
         Create a dictionary of all data_columns
@@ -587,6 +809,33 @@ class Counts(collect.UserDict):
 
         return columns
 
+    def long_columns(self) -> hint.long_column_dict:
+        """
+        Create a dictionary of all data_columns keyed by attribute and value
+
+        Returns:
+            dictionary of data columns
+        """
+
+        columns = {}
+        for count in self.values():
+            columns.update(count.get_long_columns())
+
+        return columns
+
+    def snapshot(self) -> hint.data_lists:
+        """
+        Copy the recorded data of all the data_columns
+            - the columns are cleared in place on refresh, so the data is
+              copied
+
+        Returns:
+            dictionary of the recorded data lists
+        """
+
+        return {key: column.data.copy()
+                for key, column in self.columns().items()}
+
     def dataframe(self) -> hint.dataframe:
         """
         Create a dataframe of the recorded data
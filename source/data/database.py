@@ -1,7 +1,125 @@
 import dataclasses as dclass
+import json
+import numpy       as np
+import os
+import pandas      as pd
+import queue
 import sqlalchemy  as sql
+import sqlite3
+import threading
 
-import source.hint as hint
+import source.hint    as hint
+import source.keyword as keyword
+
+
+long_dtypes = {keyword.database_step:      np.int32,
+               keyword.database_location:  np.int32,
+               keyword.database_agent:     np.int8,
+               keyword.database_attribute: np.int16,
+               keyword.database_value:     np.int16,
+               keyword.database_count:     np.int32}
+long_names  = [keyword.database_location,
+               keyword.database_agent,
+               keyword.database_attribute,
+               keyword.database_value]
+
+
+class Writer(object):
+    """
+    Class to write the dump windows of a database in a background thread
+        - the queue is bounded so the simulation waits on a slow writer
+
+    Variables:
+        database: the database writing the windows
+        queue:    windows waiting to be written
+        errors:   errors raised by the writes
+        thread:   the writing thread
+
+    Methods:
+        put:   hand a window to the writer
+        check: raise any error from the writes
+        flush: wait for all the windows to be written
+        close: flush the windows and stop the thread
+    """
+
+    def __init__(self, database: hint.database,
+                       size:     int):
+        self.database = database
+        self.queue    = queue.Queue(size)
+        self.errors   = []
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self) -> None:
+        """
+        Write the windows until told to stop
+
+        Effects:
+            writes the windows in the queue
+        """
+
+        window = self.queue.get()
+        while window is not None:
+            try:
+                self.database._write(window)
+            except Exception as error:
+                self.errors.append(error)
+            finally:
+                self.queue.task_done()
+
+            window = self.queue.get()
+
+        self.queue.task_done()
+
+    def check(self) -> None:
+        """
+        Raise any error from the writes
+
+        Effects:
+            raises the first error of the writes
+        """
+
+        if len(self.errors) > 0:
+            raise self.errors[0]
+
+    def put(self, window: hint.data_window) -> None:
+        """
+        Hand a window to the writer
+
+        Args:
+            window: the window to write
+
+        Effects:
+            queues the window, waiting if the queue is full
+        """
+
+        self.check()
+        self.queue.put(window)
+
+    def flush(self) -> None:
+        """
+        Wait for all the windows to be written
+
+        Effects:
+            blocks until the queue is written
+        """
+
+        self.queue.join()
+        self.check()
+
+    def close(self) -> None:
+        """
+        Flush the windows and stop the thread
+
+        Effects:
+            writes all the windows
+            stops the thread
+        """
+
+        self.queue.put(None)
+        self.thread.join()
+        self.check()
 
 
 @dclass.dataclass
@@ -10,22 +128,43 @@ class Database(object):
     Class to handle saving data
 
     Variables:
-        spacing:   number of steps between saves
-        file_name: base name for the save file
-        next_dump: next dump step
-        prev_dump: last dump step
+        spacing:    number of steps between saves
+        file_name:  base name for the save file
+        next_dump:  next dump step
+        prev_dump:  last dump step
+        queue_size: windows the background writer holds (0 to write inline)
+
+    Methods:
+        sql_file_name: create the sql file name
+        dataframes:    create the dataframes of a window
+        dump:          dump the data to a file
+        save:          save if correct time
+        flush:         write all the windows held by the writer
+
+    Constructors:
+        setup: setup the class
     """
 
-    spacing:   int
-    file_name: str = ':memory:'
-    file_path: str = ''
-    prev_dump: int = 0
-    next_dump: int = 0
+    spacing:    int
+    file_name:  str = ':memory:'
+    file_path:  str = ''
+    prev_dump:  int = 0
+    next_dump:  int = 0
+    queue_size: int = 0
+
+    _writer: Writer = dclass.field(default=None, init=False, repr=False,
+                                   compare=False)
 
     def __post_init__(self):
         if self.next_dump == 0:
             self.next_dump = self.prev_dump + self.spacing
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_writer'] = None
+
+        return state
+
     def sql_file_name(self, simulation: hint.simulation) -> str:
         """
         Create the sql file name
@@ -44,24 +183,92 @@ class Database(object):
 
         return '{}{}{}'.format(dialect, time, self.file_name)
 
-    def _save(self, simulation: hint.simulation) -> None:
+    @staticmethod
+    def dataframes(snapshot: hint.snapshot) -> hint.dataframes:
         """
-        Save the data to a file
+        Create the dataframes of a window
+            - done by the writer, so the simulation only copies the counts
+
+        Args:
+            snapshot: the recorded data keyed by table name
+
+        Returns:
+            the non-empty dataframes keyed by table name
+        """
+
+        dataframes = {}
+        for table_name, columns in snapshot.items():
+            dataframe = pd.DataFrame.from_dict(columns)
+            if not dataframe.empty:
+                dataframes[table_name] = dataframe
+
+        return dataframes
+
+    def _window(self, simulation: hint.simulation) -> hint.data_window:
+        """
+        Take the data of the current window
 
         Args:
             simulation: the master simulation
 
+        Returns:
+            a copy of the current counts and where to write them
+        """
+
+        return simulation.agents.snapshot(), self.sql_file_name(simulation)
+
+    def _write(self, window: hint.data_window) -> None:
+        """
+        Write a window to a file
+
+        Args:
+            window: the copied counts and where to write them
+
         Effects:
-            save current data to a file
+            save the window's data to a file
         """
 
-        dataframes = simulation.agents.dataframes()
-        file_name  = self.sql_file_name(simulation)
-        engine     = sql.create_engine(file_name)
+        snapshot, file_name = window
+        dataframes          = self.dataframes(snapshot)
+        engine              = sql.create_engine(file_name)
 
         for table_name, dataframe in dataframes.items():
             dataframe.to_sql(table_name, engine)
 
+    def _save(self, simulation: hint.simulation) -> None:
+        """
+        Save the data to a file
+
+        Args:
+            simulation: the master simulation
+
+        Effects:
+            save current data to a file or hand it to the writer
+        """
+
+        window = self._window(simulation)
+
+        if self.queue_size > 0:
+            if self._writer is None:
+                self._writer = Writer(self, self.queue_size)
+            self._writer.put(window)
+        else:
+            self._write(window)
+
+    def flush(self) -> None:
+        """
+        Write all the windows held by the writer
+
+        Effects:
+            writes the held windows
+            stops the writer
+        """
+
+        if self._writer is not None:
+            writer       = self._writer
+            self._writer = None
+            writer.close()
+
     def dump(self, simulation: hint.simulation) -> None:
         """
         Dump the data to a file
@@ -97,6 +304,8 @@ class Database(object):
     def setup(cls, data_tuple: hint.data_tuple) -> 'Database':
         """
         Setup the class
+            - an optional fourth argument picks the backend
+            - an optional fifth argument sizes the background writer
 
         Args:
             data_tuple: database arguments
@@ -105,4 +314,667 @@ class Database(object):
             a setup class
         """
 
-        return cls(*data_tuple)
+        if len(data_tuple) > 4:
+            queue_size = data_tuple[4]
+        else:
+            queue_size = 0
+
+        if len(data_tuple) > 3:
+            backend    = data_tuple[3]
+            data_tuple = data_tuple[:3]
+        else:
+            backend = keyword.database_window
+
+        if backend == keyword.database_window:
+            return cls(*data_tuple, queue_size=queue_size)
+        elif backend == keyword.database_store:
+            return Store(*data_tuple, queue_size=queue_size)
+        elif backend == keyword.database_long:
+            return LongStore(*data_tuple, queue_size=queue_size)
+        elif backend == keyword.database_columnar:
+            return ColumnStore(*data_tuple, queue_size=queue_size)
+        else:
+            raise TypeError('Invalid type of database')
+
+
+@dclass.dataclass
+class Store(Database):
+    """
+    Class to handle saving data to a single append-only store for the run
+        - each table is indexed by the time-step of its rows
+
+    Variables:
+        spacing:    number of steps between saves
+        file_name:  name of the store file
+        file_path:  directory of the store file
+        next_dump:  next dump step
+        prev_dump:  last dump step
+        queue_size: windows the background writer holds (0 to write inline)
+
+    Methods:
+        store_name: get the name of the store file
+        read:       read a table from the store
+    """
+
+    def store_name(self) -> str:
+        """
+        Get the name of the store file
+
+        Returns:
+            the path to the store file
+        """
+
+        if self.file_path:
+            return '{}/{}'.format(self.file_path, self.file_name)
+        else:
+            return self.file_name
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Connect to the store in write-ahead logging mode
+
+        Returns:
+            a connection to the store
+        """
+
+        connection = sqlite3.connect(self.store_name())
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+
+        return connection
+
+    def _append(self, connection: sqlite3.Connection,
+                      table_name: str,
+                      dataframe:  hint.dataframe,
+                      prev_dump:  int) -> None:
+        """
+        Append the new rows of a table to the store
+
+        Args:
+            connection: connection to the store
+            table_name: name of the table
+            dataframe:  rows recorded since the last dump
+            prev_dump:  step of the first row
+
+        Effects:
+            writes the new rows to the table
+        """
+
+        # Every window after the first starts with the last row written
+        if prev_dump > 0:
+            start = 1
+        else:
+            start = 0
+
+        number  = len(dataframe) - start
+        columns = ['"{}"'.format(column) for column in dataframe.columns]
+
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS "{}" ("{}" INTEGER PRIMARY KEY, {})'.
+            format(table_name, keyword.database_step, ', '.join(columns)))
+
+        if number > 0:
+            steps  = range(prev_dump + start, prev_dump + start + number)
+            values = [dataframe[column].to_numpy()[start:].tolist()
+                      for column in dataframe.columns]
+
+            connection.executemany(
+                'INSERT OR REPLACE INTO "{}" VALUES ({})'.
+                format(table_name, ', '.join('?' * (len(columns) + 1))),
+                zip(steps, *values))
+
+    def _window(self, simulation: hint.simulation) -> hint.data_window:
+        """
+        Take the data of the current window
+
+        Args:
+            simulation: the master simulation
+
+        Returns:
+            a copy of the current counts and the step of their first row
+        """
+
+        return simulation.agents.snapshot(), self.prev_dump
+
+    def _write(self, window: hint.data_window) -> None:
+        """
+        Append a window to the store
+
+        Args:
+            window: the copied counts and the step of their first row
+
+        Effects:
+            append the window's data to the store
+        """
+
+        snapshot, prev_dump = window
+        dataframes          = self.dataframes(snapshot)
+        connection          = self._connect()
+
+        with connection:
+            for table_name, dataframe in dataframes.items():
+                self._append(connection, table_name, dataframe, prev_dump)
+
+        connection.close()
+
+    def read(self, table_name: str) -> hint.dataframe:
+        """
+        Read a table from the store
+
+        Args:
+            table_name: name of the table
+
+        Returns:
+            the table indexed by time-step
+        """
+
+        connection = self._connect()
+        dataframe  = pd.read_sql_query('SELECT * FROM "{}" ORDER BY "{}"'.
+                                       format(table_name,
+                                              keyword.database_step),
+                                       connection,
+                                       index_col=keyword.database_step)
+        connection.close()
+
+        return dataframe
+
+
+@dclass.dataclass
+class LongStore(Store):
+    """
+    Class to handle saving data to a single long-format table for the run
+        - each row is the count of one attribute value of one agent type
+          at one location and time-step
+        - the names are stored as integer codes, the codes in their own
+          table
+        - zero counts are not stored
+
+    Variables:
+        spacing:    number of steps between saves
+        file_name:  name of the store file
+        file_path:  directory of the store file
+        next_dump:  next dump step
+        prev_dump:  last dump step
+        queue_size: windows the background writer holds (0 to write inline)
+        codes:      integer code of each name, by coded column
+
+    Methods:
+        read_codes: read the codes of the names from the store
+        read_long:  read the counts from the store
+    """
+
+    codes: hint.long_codes = dclass.field(default_factory=dict)
+
+    def _code(self, column: str,
+                    name,
+                    new:    list) -> int:
+        """
+        Get the integer code of a name
+
+        Args:
+            column: coded column the name is for
+            name:   the name to code
+            new:    list to add any new code to
+
+        Returns:
+            the code of the name
+        """
+
+        if column not in self.codes:
+            self.codes[column] = {}
+        codes = self.codes[column]
+
+        name = str(name)
+        if name not in codes:
+            codes[name] = len(codes)
+            new.append((column, codes[name], name))
+
+        return codes[name]
+
+    def _window(self, simulation: hint.simulation) -> hint.data_window:
+        """
+        Take the data of the current window
+
+        Args:
+            simulation: the master simulation
+
+        Returns:
+            a copy of the current data columns and the step of their first
+            row
+        """
+
+        columns = simulation.agents.long_columns()
+
+        return {key: column.data.copy()
+                for key, column in columns.items()}, self.prev_dump
+
+    def _rows(self, window: hint.data_window,
+                    new:    list) -> np.ndarray:
+        """
+        Create the long-format rows of a window
+
+        Args:
+            window: the data columns and the step of their first row
+            new:    list to add any new codes to
+
+        Returns:
+            array of rows, one per non-zero count
+        """
+
+        columns, prev_dump = window
+
+        # Every window after the first starts with the last row written
+        if prev_dump > 0:
+            start = 1
+        else:
+            start = 0
+
+        blocks = []
+        for names, column in columns.items():
+            counts = np.asarray(column)[start:]
+            steps  = np.flatnonzero(counts)
+
+            if len(steps) > 0:
+                block = np.empty((len(steps), len(long_dtypes)),
+                                 dtype=np.int64)
+                block[:, 0]  = steps + prev_dump + start
+                block[:, -1] = counts[steps]
+                for index, name in enumerate(names):
+                    block[:, index + 1] = self._code(long_names[index],
+                                                     name, new)
+                blocks.append(block)
+
+        if len(blocks) > 0:
+            return np.concatenate(blocks)
+        else:
+            return np.empty((0, len(long_dtypes)), dtype=np.int64)
+
+    def _write(self, window: hint.data_window) -> None:
+        """
+        Append a window to the store
+
+        Args:
+            window: the data columns and the step of their first row
+
+        Effects:
+            append the window's counts and new codes to the store
+        """
+
+        new  = []
+        rows = self._rows(window, new)
+
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS "{}" '
+                '("{}" TEXT, "{}" INTEGER, "{}" TEXT)'.
+                format(keyword.database_codes,
+                       keyword.database_column,
+                       keyword.database_code,
+                       keyword.database_name))
+            key = ', '.join('"{}"'.format(name) for name in
+                            [keyword.database_attribute,
+                             keyword.database_location,
+                             keyword.database_agent,
+                             keyword.database_value,
+                             keyword.database_step])
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS "{}" ({}, PRIMARY KEY ({})) '
+                'WITHOUT ROWID'.
+                format(keyword.database_counts,
+                       ', '.join('"{}" INTEGER'.format(name)
+                                 for name in long_dtypes),
+                       key))
+            connection.execute(
+                'CREATE INDEX IF NOT EXISTS "{0}_{1}" ON "{0}" ("{1}")'.
+                format(keyword.database_counts, keyword.database_location))
+
+            connection.executemany(
+                'INSERT INTO "{}" VALUES (?, ?, ?)'.
+                format(keyword.database_codes), new)
+            connection.executemany(
+                'INSERT OR REPLACE INTO "{}" VALUES ({})'.
+                format(keyword.database_counts,
+                       ', '.join('?' * len(long_dtypes))),
+                rows.tolist())
+        connection.close()
+
+    def read_codes(self) -> hint.long_codes:
+        """
+        Read the codes of the names from the store
+
+        Returns:
+            integer code of each name, by coded column
+        """
+
+        connection = self._connect()
+        rows       = connection.execute(
+            'SELECT "{}", "{}", "{}" FROM "{}"'.
+            format(keyword.database_column,
+                   keyword.database_code,
+                   keyword.database_name,
+                   keyword.database_codes)).fetchall()
+        connection.close()
+
+        codes = {}
+        for column, code, name in rows:
+            if column not in codes:
+                codes[column] = {}
+            codes[column][name] = code
+
+        return codes
+
+    def read_long(self, location=None,
+                        agent:     str = None,
+                        attribute: str = None) -> hint.dataframe:
+        """
+        Read the counts from the store
+            - filters on names are done by the store using the codes
+
+        Args:
+            location:  only read this location_key
+            agent:     only read this agent_key
+            attribute: only read this attribute
+
+        Returns:
+            the counts with small integer columns
+        """
+
+        codes   = self.read_codes()
+        filters = []
+        values  = []
+        for column, name in [(keyword.database_location,  location),
+                             (keyword.database_agent,     agent),
+                             (keyword.database_attribute, attribute)]:
+            if name is not None:
+                filters.append('"{}" = ?'.format(column))
+                if column in codes and str(name) in codes[column]:
+                    values.append(codes[column][str(name)])
+                else:
+                    values.append(-1)
+
+        query = 'SELECT {} FROM "{}"'.format(
+            ', '.join('"{}"'.format(name) for name in long_dtypes),
+            keyword.database_counts)
+        if len(filters) > 0:
+            query = '{} WHERE {}'.format(query, ' AND '.join(filters))
+
+        connection = self._connect()
+        rows       = connection.execute(query, values).fetchall()
+        connection.close()
+
+        data = np.array(rows, dtype=np.int64).reshape(-1, len(long_dtypes))
+
+        return pd.DataFrame({name: data[:, index].astype(dtype)
+                             for index, (name, dtype)
+                             in enumerate(long_dtypes.items())})
+
+
+@dclass.dataclass
+class ColumnStore(LongStore):
+    """
+    Class to handle saving the long-format counts as columnar files
+        - the files are partitioned by simulation name and run number
+          taken from the file name: {name}_{run}
+        - each window writes one chunk file per column
+        - chunks are uncompressed .npy files, kept small by the narrow
+          integer types and dropped zero counts, so they can be
+          memory-mapped and read without copying
+
+    Variables:
+        spacing:    number of steps between saves
+        file_name:  name of the run, {name}_{run}
+        file_path:  directory of all the simulations
+        next_dump:  next dump step
+        prev_dump:  last dump step
+        queue_size: windows the background writer holds (0 to write inline)
+        codes:      integer code of each name, by coded column
+
+    Methods:
+        partition:  get the simulation name and run number
+        store_name: get the directory of the run
+        read_codes: read the codes of the names from the store
+        read_long:  read the counts from the store
+        steps:      get the number of steps stored for the run
+        runs:       get the run numbers stored for a simulation
+
+    Constructors:
+        read_runs: read a column for every run of a simulation
+    """
+
+    def partition(self) -> tuple:
+        """
+        Get the simulation name and run number from the file name
+
+        Returns:
+            (simulation name, run number)
+        """
+
+        base = os.path.splitext(self.file_name)[0]
+        name, _, run = base.rpartition('_')
+
+        if name and run.isdigit():
+            return name, int(run)
+        else:
+            return base, 0
+
+    def store_name(self) -> str:
+        """
+        Get the directory of the run
+
+        Returns:
+            the path to the run's directory
+        """
+
+        name, run = self.partition()
+
+        return os.path.join(self.file_path, name, str(run))
+
+    @staticmethod
+    def _save_array(file_name: str,
+                    array:     np.ndarray) -> None:
+        """
+        Save an array so readers never see a partial file
+
+        Args:
+            file_name: name of the file
+            array:     array to save
+
+        Effects:
+            writes the array to the file
+        """
+
+        temp_name = '{}.tmp'.format(file_name)
+        with open(temp_name, 'wb') as file:
+            np.save(file, array)
+        os.replace(temp_name, file_name)
+
+    def _write(self, window: hint.data_window) -> None:
+        """
+        Write a window as a chunk of each column
+
+        Args:
+            window: the data columns and the step of their first row
+
+        Effects:
+            writes the window's counts and the codes to the run's directory
+        """
+
+        new       = []
+        rows      = self._rows(window, new)
+        directory = self.store_name()
+        os.makedirs(directory, exist_ok=True)
+
+        if len(rows) > 0:
+            chunk = '{}.npy'.format(window[1])
+            for index, (column, dtype) in enumerate(long_dtypes.items()):
+                column_path = os.path.join(directory, column)
+                os.makedirs(column_path, exist_ok=True)
+                self._save_array(os.path.join(column_path, chunk),
+                                 rows[:, index].astype(dtype))
+
+        if len(new) > 0:
+            codes_name = os.path.join(directory,
+                                      '{}.json'.format(keyword.database_codes))
+            with open('{}.tmp'.format(codes_name), 'w') as file:
+                json.dump(self.codes, file)
+            os.replace('{}.tmp'.format(codes_name), codes_name)
+
+    @staticmethod
+    def _read_chunks(directory: str,
+                     column:    str) -> hint.chunks:
+        """
+        Open the chunks of a column of a run
+            - the chunks are memory-mapped, nothing is read until used
+
+        Args:
+            directory: directory of the run
+            column:    name of the column
+
+        Returns:
+            the chunk of each window, in step order
+        """
+
+        column_path = os.path.join(directory, column)
+        if not os.path.isdir(column_path):
+            return []
+
+        chunks = [file_name for file_name in os.listdir(column_path)
+                  if file_name.endswith('.npy')]
+        chunks.sort(key=lambda file_name: int(file_name.split('.')[0]))
+
+        return [np.load(os.path.join(column_path, chunk), mmap_mode='r')
+                for chunk in chunks]
+
+    def read_codes(self) -> hint.long_codes:
+        """
+        Read the codes of the names from the store
+
+        Returns:
+            integer code of each name, by coded column
+        """
+
+        codes_name = os.path.join(self.store_name(),
+                                  '{}.json'.format(keyword.database_codes))
+        if os.path.exists(codes_name):
+            with open(codes_name) as file:
+                return json.load(file)
+        else:
+            return {}
+
+    def read_long(self, location=None,
+                        agent:     str = None,
+                        attribute: str = None) -> hint.dataframe:
+        """
+        Read the counts from the store
+            - each chunk is filtered on its own, so only the kept rows are
+              copied out of the memory-mapped chunks
+
+        Args:
+            location:  only read this location_key
+            agent:     only read this agent_key
+            attribute: only read this attribute
+
+        Returns:
+            the counts with small integer columns
+        """
+
+        directory = self.store_name()
+        codes     = self.read_codes()
+
+        filters = []
+        for column, name in [(keyword.database_location,  location),
+                             (keyword.database_agent,     agent),
+                             (keyword.database_attribute, attribute)]:
+            if name is not None:
+                if column in codes and str(name) in codes[column]:
+                    filters.append((column, codes[column][str(name)]))
+                else:
+                    filters = None
+                    break
+
+        pieces = {column: [] for column in long_dtypes}
+        if filters is not None:
+            chunks = {column: self._read_chunks(directory, column)
+                      for column in long_dtypes}
+
+            for index in range(len(chunks[keyword.database_step])):
+                keep = None
+                for column, code in filters:
+                    match = chunks[column][index] == code
+                    if keep is None:
+                        keep = match
+                    else:
+                        keep &= match
+
+                for column in long_dtypes:
+                    values = chunks[column][index]
+                    if keep is None:
+                        pieces[column].append(values)
+                    else:
+                        pieces[column].append(values[keep])
+
+        data = {}
+        for column, dtype in long_dtypes.items():
+            if len(pieces[column]) > 0:
+                data[column] = np.concatenate(pieces[column])
+            else:
+                data[column] = np.empty(0, dtype=dtype)
+
+        return pd.DataFrame(data)
+
+    def steps(self) -> int:
+        """
+        Get the number of steps stored for the run
+
+        Returns:
+            one past the last stored step
+        """
+
+        chunks = self._read_chunks(self.store_name(), keyword.database_step)
+
+        return max((int(chunk.max()) + 1 for chunk in chunks
+                    if len(chunk) > 0), default=0)
+
+    @staticmethod
+    def runs(file_path: str,
+             name:      str) -> list:
+        """
+        Get the run numbers stored for a simulation
+
+        Args:
+            file_path: directory of all the simulations
+            name:      name of the simulation
+
+        Returns:
+            the run numbers in order
+        """
+
+        directory = os.path.join(file_path, name)
+
+        return sorted(int(run) for run in os.listdir(directory)
+                      if run.isdigit())
+
+    @classmethod
+    def read_runs(cls, file_path: str,
+                       name:      str,
+                       column:    str) -> hint.run_columns:
+        """
+        Read one column for every run of a simulation
+            - each run is its list of memory-mapped chunks, nothing is
+              copied
+
+        Args:
+            file_path: directory of all the simulations
+            name:      name of the simulation
+            column:    name of the column
+
+        Returns:
+            dictionary of the column's chunks by run number
+        """
+
+        directory = os.path.join(file_path, name)
+
+        return {run: cls._read_chunks(os.path.join(directory, str(run)),
+                                      column)
+                for run in cls.runs(file_path, name)}
@@ -0,0 +1,144 @@
+import numpy as np
+
+import source.hint    as hint
+import source.keyword as keyword
+
+
+point_budget = 2000
+least_share  = 4
+
+
+def min_max(x:      np.ndarray,
+            y:      np.ndarray,
+            budget: int) -> np.ndarray:
+    """
+    Choose the points of a series keeping the extremes of each bucket
+        - the series is split into equal buckets and the lowest and
+          highest point of each is kept, with the first and last points
+
+    Args:
+        x:      x values of the series
+        y:      y values of the series
+        budget: most points to keep
+
+    Returns:
+        indices of the points kept, in order
+    """
+
+    number = len(y)
+    if number <= budget:
+        return np.arange(number)
+
+    buckets = max((budget - 2) // 2, 1)
+    size    = -(-number // buckets)
+    length  = -(-number // size) * size
+
+    y = np.asarray(y, dtype=float)
+    low  = np.full(length, np.inf)
+    high = np.full(length, -np.inf)
+    low[:number]  = np.where(np.isnan(y), np.inf,  y)
+    high[:number] = np.where(np.isnan(y), -np.inf, y)
+
+    starts = np.arange(0, length, size)
+    kept   = np.concatenate([[0, number - 1],
+                             starts + low.reshape(-1, size).argmin(axis=1),
+                             starts + high.reshape(-1, size).argmax(axis=1)])
+
+    return np.unique(np.minimum(kept, number - 1))
+
+
+def lttb(x:      np.ndarray,
+         y:      np.ndarray,
+         budget: int) -> np.ndarray:
+    """
+    Choose the points of a series by largest triangle three buckets
+        - each bucket keeps the point making the largest triangle with the
+          point kept before it and the average of the next bucket
+
+    Args:
+        x:      x values of the series
+        y:      y values of the series
+        budget: most points to keep
+
+    Returns:
+        indices of the points kept, in order
+    """
+
+    number = len(y)
+    if number <= budget or budget < 3:
+        return np.arange(number)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, number - 1, budget - 1).astype(int)
+
+    kept = [0]
+    for bucket in range(budget - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        if bucket < budget - 3:
+            next_x = np.nanmean(x[end:edges[bucket + 2]])
+            next_y = np.nanmean(y[end:edges[bucket + 2]])
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        point = kept[-1]
+        area  = np.abs((x[point] - next_x) * (y[start:end] - y[point]) -
+                       (x[point] - x[start:end]) * (next_y - y[point]))
+        area  = np.where(np.isnan(area), -1.0, area)
+        kept.append(start + int(np.argmax(area)))
+    kept.append(number - 1)
+
+    return np.array(kept)
+
+
+methods = {keyword.downsample_min_max: min_max,
+           keyword.downsample_lttb:    lttb}
+
+
+def decimate(dataframe: hint.dataframe,
+             x:         str  = None,
+             columns:   list = None,
+             budget:    int  = point_budget,
+             method:    str  = keyword.downsample_min_max) -> hint.dataframe:
+    """
+    Reduce a table of series to the points needed to draw them
+        - the columns split the budget evenly and the table keeps the rows
+          chosen by any column, so the columns can share a source of at
+          most budget rows
+        - each column keeps at least its end points and extremes, so the
+          budget is only exceeded by more columns than a quarter of it
+
+    Args:
+        dataframe: table of series
+        x:         the x column, the index if None
+        columns:   the y columns, all the other numeric columns if None
+        budget:    most rows to keep
+        method:    the downsampling method
+
+    Returns:
+        the rows of the table needed to draw the series
+    """
+
+    if method not in methods:
+        raise TypeError('Unknown downsample method: {}'.format(method))
+    choose = methods[method]
+
+    if x is None:
+        x_values = dataframe.index.to_numpy(dtype=float)
+    else:
+        x_values = dataframe[x].to_numpy(dtype=float)
+
+    if columns is None:
+        columns = [column
+                   for column in dataframe.select_dtypes('number').columns
+                   if column != x]
+
+    share = max(budget // max(len(columns), 1), least_share)
+
+    kept = [np.arange(0)]
+    for column in columns:
+        kept.append(choose(x_values,
+                           dataframe[column].to_numpy(dtype=float),
+                           share))
+
+    return dataframe.iloc[np.unique(np.concatenate(kept))]
@@ -0,0 +1,230 @@
+import numpy  as np
+import pandas as pd
+
+import source.hint    as hint
+import source.keyword as keyword
+
+
+genotype_columns = ['{}_{}'.format(keyword.genotype, genotype)
+                    for genotype in keyword.genotype_keys]
+
+
+def _fraction(part:  np.ndarray,
+              total: np.ndarray) -> np.ndarray:
+    """
+    Divide element-wise, nan where the total is zero
+
+    Args:
+        part:  the numerators
+        total: the denominators
+
+    Returns:
+        part / total, nan where total is zero
+    """
+
+    part  = np.asarray(part,  dtype=float)
+    total = np.asarray(total, dtype=float)
+
+    fraction = np.full(np.broadcast(part, total).shape, np.nan)
+    np.divide(part, total, out=fraction, where=total != 0)
+
+    return fraction
+
+
+def total_population(rr: np.ndarray,
+                     sr: np.ndarray,
+                     ss: np.ndarray) -> np.ndarray:
+    """
+    Get the total population
+
+    Args:
+        rr: resistant counts
+        sr: heterozygous counts
+        ss: susceptible counts
+
+    Returns:
+        total of the counts
+    """
+
+    return np.add(np.add(rr, sr, dtype=float), ss, dtype=float)
+
+
+def allele_frequency(rr: np.ndarray,
+                     sr: np.ndarray,
+                     ss: np.ndarray) -> np.ndarray:
+    """
+    Get the resistance allele frequency
+
+    Args:
+        rr: resistant counts
+        sr: heterozygous counts
+        ss: susceptible counts
+
+    Returns:
+        (2*rr + sr) / (2*total), nan where the population is empty
+    """
+
+    return _fraction(np.add(2*np.asarray(rr), sr, dtype=float),
+                     2*total_population(rr, sr, ss))
+
+
+def heterozygote_fraction(rr: np.ndarray,
+                          sr: np.ndarray,
+                          ss: np.ndarray) -> np.ndarray:
+    """
+    Get the fraction of heterozygotes
+
+    Args:
+        rr: resistant counts
+        sr: heterozygous counts
+        ss: susceptible counts
+
+    Returns:
+        sr / total, nan where the population is empty
+    """
+
+    return _fraction(sr, total_population(rr, sr, ss))
+
+
+def genotype_proportions(rr: np.ndarray,
+                         sr: np.ndarray,
+                         ss: np.ndarray) -> tuple:
+    """
+    Get the proportion of each genotype
+
+    Args:
+        rr: resistant counts
+        sr: heterozygous counts
+        ss: susceptible counts
+
+    Returns:
+        (rr, sr, ss) proportions, nan where the population is empty
+    """
+
+    total = total_population(rr, sr, ss)
+
+    return _fraction(rr, total), _fraction(sr, total), _fraction(ss, total)
+
+
+def genotypes(dataframe: hint.dataframe,
+              names:     list = None) -> tuple:
+    """
+    Get the genotype count columns of a table as arrays
+
+    Args:
+        dataframe: table of counts
+        names:     names of the resistant, heterozygous, susceptible columns
+
+    Returns:
+        (rr, sr, ss) count arrays
+    """
+
+    if names is None:
+        names = genotype_columns
+
+    return tuple(dataframe[name].to_numpy(dtype=float) for name in names)
+
+
+def add_percent(dataframe: hint.dataframe,
+                column:    str  = keyword.metric_percent,
+                names:     list = None) -> None:
+    """
+    Add the resistance allele frequency column to a table
+
+    Args:
+        dataframe: table of counts
+        column:    name of the new column
+        names:     names of the resistant, heterozygous, susceptible columns
+
+    Effects:
+        adds the allele frequency column
+    """
+
+    dataframe[column] = allele_frequency(*genotypes(dataframe, names))
+
+
+def add_metrics(dataframe: hint.dataframe,
+                names:     list = None) -> None:
+    """
+    Add all of the derived genotype metric columns to a table
+
+    Args:
+        dataframe: table of counts
+        names:     names of the resistant, heterozygous, susceptible columns
+
+    Effects:
+        adds the total, allele frequency, heterozygote fraction and
+        genotype proportion columns
+    """
+
+    rr, sr, ss = genotypes(dataframe, names)
+
+    dataframe[keyword.metric_total]   = total_population(rr, sr, ss)
+    dataframe[keyword.metric_percent] = allele_frequency(rr, sr, ss)
+    dataframe[keyword.metric_hetero]  = heterozygote_fraction(rr, sr, ss)
+    for genotype, proportion in zip(keyword.genotype_keys,
+                                    genotype_proportions(rr, sr, ss)):
+        dataframe[keyword.metric_proportion.format(genotype)] = proportion
+
+
+def long_genotypes(dataframe: hint.dataframe,
+                   codes:     hint.long_codes,
+                   steps:     int = None) -> tuple:
+    """
+    Get the genotype counts by step from stored long-format counts
+        - the counts should be read for one location, agent and the
+          genotype attribute
+        - steps without a stored count have a count of zero
+
+    Args:
+        dataframe: long-format counts read from a store
+        codes:     the store's codes
+        steps:     number of steps, defaults to one past the last step
+
+    Returns:
+        (rr, sr, ss) count arrays by step
+    """
+
+    step  = dataframe[keyword.database_step].to_numpy(dtype=np.int64)
+    value = dataframe[keyword.database_value].to_numpy(dtype=np.int64)
+    count = dataframe[keyword.database_count].to_numpy(dtype=float)
+
+    if steps is None:
+        steps = int(step.max()) + 1 if len(step) > 0 else 0
+
+    value_codes = codes.get(keyword.database_value, {})
+
+    counts = []
+    for genotype in keyword.genotype_keys:
+        if genotype in value_codes:
+            keep = value == value_codes[genotype]
+            counts.append(np.bincount(step[keep], weights=count[keep],
+                                      minlength=steps))
+        else:
+            counts.append(np.zeros(steps))
+
+    return tuple(counts)
+
+
+def long_metrics(dataframe: hint.dataframe,
+                 codes:     hint.long_codes,
+                 steps:     int = None) -> hint.dataframe:
+    """
+    Get the derived genotype metrics by step from stored long-format counts
+
+    Args:
+        dataframe: long-format counts of one location, agent and the
+                   genotype attribute
+        codes:     the store's codes
+        steps:     number of steps, defaults to one past the last step
+
+    Returns:
+        table of the genotype counts and their metrics by step
+    """
+
+    metrics = pd.DataFrame(dict(zip(genotype_columns,
+                                    long_genotypes(dataframe, codes,
+                                                   steps))))
+    add_metrics(metrics)
+
+    return metrics
@@ -0,0 +1,337 @@
+import collections     as collect
+import dataclasses     as dclass
+import multiprocessing as multi
+import os
+import pandas          as pd
+import pickle          as pk
+import re
+import sqlalchemy      as sql
+
+import source.hint as hint
+
+
+file_pattern = r'^(\d+)_to_(\d+)_{}_(\d+)\.sqlite$'
+
+
+class Manifest(collect.UserDict):
+    """
+    Class to list the window files of every run of a simulation
+        - each entry is (file name, size, modification time)
+
+    Variables:
+        dict:
+            key:   run number
+            value: entries of the run's window files in step order
+
+    Methods:
+        complete: get the runs with every window written
+
+    Constructors:
+        setup: build the manifest from a directory
+    """
+
+    def __init__(self, runs: hint.manifest_dict):
+        super().__init__(runs)
+
+    def complete(self) -> 'Manifest':
+        """
+        Get the runs with every window written
+
+        Returns:
+            manifest of the runs with the most windows
+        """
+
+        if len(self) == 0:
+            return Manifest({})
+
+        run_length = max(len(entries) for entries in self.values())
+
+        return Manifest({run_num: entries
+                         for run_num, entries in self.items()
+                         if len(entries) == run_length})
+
+    @classmethod
+    def setup(cls, directory: str,
+                   base_name: str) -> 'Manifest':
+        """
+        Build the manifest of a simulation's files
+
+        Args:
+            directory: directory of the files
+            base_name: simulation base name
+
+        Returns:
+            a manifest of the runs in run order
+        """
+
+        pattern = re.compile(file_pattern.format(re.escape(base_name)))
+
+        runs = {}
+        for file_name in os.listdir(directory):
+            match = pattern.match(file_name)
+            if match is not None:
+                start   = int(match.group(1))
+                run_num = int(match.group(3))
+                stat    = os.stat(os.path.join(directory, file_name))
+
+                if run_num not in runs:
+                    runs[run_num] = []
+                runs[run_num].append((start, (file_name,
+                                              stat.st_size,
+                                              stat.st_mtime_ns)))
+
+        manifest = {}
+        for run_num in sorted(runs):
+            entries = sorted(runs[run_num])
+            starts  = [start for start, _ in entries]
+            if len(set(starts)) < len(starts):
+                raise RuntimeError('Repeated run time frame')
+
+            manifest[run_num] = [entry for _, entry in entries]
+
+        return cls(manifest)
+
+
+@dclass.dataclass
+class Reader(object):
+    """
+    Class to read the runs of a simulation with a cache per run
+        - a run's cache is reused while its window files are unchanged
+        - a run whose files only gained new windows reads just those
+
+    Variables:
+        directory: directory of the simulation's files
+        base_name: simulation base name
+        tables:    names of the tables to read
+        cache_dir: directory of the run caches
+        workers:   number of processes to read the runs with
+
+    Methods:
+        manifest: build the manifest of the simulation's files
+        runs:     read the complete runs one at a time
+        read:     read all of the complete runs
+    """
+
+    directory: str
+    base_name: str
+    tables:    list
+    cache_dir: str = None
+    workers:   int = 1
+
+    def __post_init__(self):
+        if self.cache_dir is None:
+            self.cache_dir = os.path.join(self.directory, 'cache')
+
+    def manifest(self) -> Manifest:
+        """
+        Build the manifest of the simulation's files
+
+        Returns:
+            the manifest of the simulation
+        """
+
+        return Manifest.setup(self.directory, self.base_name)
+
+    def _cache_name(self, run_num: int) -> str:
+        """
+        Get the name of a run's cache file
+
+        Args:
+            run_num: the run number
+
+        Returns:
+            path to the cache file
+        """
+
+        return os.path.join(self.cache_dir,
+                            '{}_{}.cache'.format(self.base_name, run_num))
+
+    def _load_cache(self, run_num: int) -> tuple:
+        """
+        Load the cache of a run
+
+        Args:
+            run_num: the run number
+
+        Returns:
+            (cached manifest entries, cached dataframes), or None
+        """
+
+        cache_name = self._cache_name(run_num)
+        if os.path.exists(cache_name):
+            with open(cache_name, 'rb') as cache_file:
+                entries, dataframes = pk.load(cache_file)
+
+            if all(table_name in dataframes for table_name in self.tables):
+                return entries, dataframes
+
+        return None
+
+    def _save_cache(self, run_num:    int,
+                          entries:    hint.manifest_entries,
+                          dataframes: hint.dataframes) -> None:
+        """
+        Save the cache of a run
+
+        Args:
+            run_num:    the run number
+            entries:    manifest entries read
+            dataframes: the run's dataframes
+
+        Effects:
+            writes the run's cache file
+        """
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        cache_name = self._cache_name(run_num)
+        with open('{}.tmp'.format(cache_name), 'wb') as cache_file:
+            pk.dump((entries, dataframes), cache_file,
+                    protocol=pk.HIGHEST_PROTOCOL)
+        os.replace('{}.tmp'.format(cache_name), cache_name)
+
+    @staticmethod
+    def _read_files(directory:  str,
+                    file_names: list,
+                    tables:     list,
+                    overlap:    bool) -> hint.dataframes:
+        """
+        Read the tables from window files and join them in order
+
+        Args:
+            directory:  directory of the files
+            file_names: window files in step order
+            tables:     names of the tables to read
+            overlap:    if the first file repeats an already read row
+
+        Returns:
+            dictionary of the joined tables
+        """
+
+        engines = [sql.create_engine('sqlite:///{}'.
+                                     format(os.path.join(directory,
+                                                         file_name)))
+                   for file_name in file_names]
+
+        dataframes = {}
+        for table_name in tables:
+            parts = []
+            for index, engine in enumerate(engines):
+                dataframe = pd.read_sql(table_name, engine)
+                if index > 0 or overlap:
+                    dataframe = dataframe.iloc[1:]
+                parts.append(dataframe)
+
+            dataframes[table_name] = pd.concat(parts, ignore_index=True)
+
+        for engine in engines:
+            engine.dispose()
+
+        return dataframes
+
+    @staticmethod
+    def _number(dataframes: hint.dataframes) -> hint.dataframes:
+        """
+        Number the rows of the tables by time-step
+
+        Args:
+            dataframes: the tables
+
+        Returns:
+            the tables with their index column renumbered
+        """
+
+        for dataframe in dataframes.values():
+            dataframe['index'] = range(len(dataframe.index))
+
+        return dataframes
+
+    def _read_run(self, run_num: int,
+                        entries: hint.manifest_entries) -> hint.dataframes:
+        """
+        Read a run using its cache where possible
+
+        Args:
+            run_num: the run number
+            entries: manifest entries of the run
+
+        Effects:
+            updates the run's cache
+
+        Returns:
+            dictionary of the run's tables
+        """
+
+        cache = self._load_cache(run_num)
+        if cache is not None:
+            cached_entries, cached = cache
+            cached = {table_name: cached[table_name]
+                      for table_name in self.tables}
+
+            if cached_entries == entries:
+                return cached
+
+            number = len(cached_entries)
+            if cached_entries == entries[:number]:
+                file_names = [file_name for file_name, _, _
+                              in entries[number:]]
+                new        = self._read_files(self.directory, file_names,
+                                              self.tables, True)
+                dataframes = self._number(
+                    {table_name: pd.concat([dataframe, new[table_name]],
+                                           ignore_index=True)
+                     for table_name, dataframe in cached.items()})
+                self._save_cache(run_num, entries, dataframes)
+
+                return dataframes
+
+        file_names = [file_name for file_name, _, _ in entries]
+        dataframes = self._number(self._read_files(self.directory,
+                                                   file_names,
+                                                   self.tables,
+                                                   False))
+        self._save_cache(run_num, entries, dataframes)
+
+        return dataframes
+
+    def _read_task(self, task: tuple) -> tuple:
+        """
+        Read a run for the process pool
+
+        Args:
+            task: (run number, manifest entries)
+
+        Returns:
+            (run number, dictionary of the run's tables)
+        """
+
+        run_num, entries = task
+
+        return run_num, self._read_run(run_num, entries)
+
+    def runs(self) -> hint.run_stream:
+        """
+        Read the complete runs one at a time
+
+        Yields:
+            (run number, dictionary of the run's tables) in run order
+        """
+
+        tasks = list(self.manifest().complete().items())
+
+        if self.workers > 1 and len(tasks) > 1:
+            with multi.Pool(min(self.workers, len(tasks))) as pool:
+                yield from pool.imap(self._read_task, tasks)
+        else:
+            for task in tasks:
+                yield self._read_task(task)
+
+    def read(self) -> dict:
+        """
+        Read all of the complete runs
+
+        Returns:
+            dictionary of the run's tables by run number
+        """
+
+        return dict(self.runs())
@@ -0,0 +1,166 @@
+import dataclasses              as dclass
+import numpy                    as np
+import pandas                   as pd
+import scipy.signal             as signal
+import statsmodels.tsa.seasonal as seasonal
+
+import source.hint as hint
+
+
+def stack(dataframes: hint.dataframe_list,
+          column:     str) -> np.ndarray:
+    """
+    Stack a column of several tables into one array
+        - the tables are cut to the shortest
+
+    Args:
+        dataframes: the tables, e.g. one per run
+        column:     the column to stack
+
+    Returns:
+        array with one row per table
+    """
+
+    length = min(len(dataframe.index) for dataframe in dataframes)
+
+    return np.stack([dataframe[column].to_numpy(dtype=float)[:length]
+                     for dataframe in dataframes])
+
+
+@dclass.dataclass
+class Periodogram(object):
+    """
+    Class to hold the periodograms of a stack of series
+
+    Variables:
+        frequency: frequencies of the periodograms
+        power:     power of each series at each frequency
+        period:    period of each frequency, inf for zero frequency
+        primary:   period of the most powerful frequency of each series
+
+    Methods:
+        dataframe: get the periodogram of one series as a table
+
+    Constructors:
+        setup: compute the periodograms
+    """
+
+    frequency: np.ndarray
+    power:     np.ndarray
+    period:    np.ndarray
+    primary:   np.ndarray
+
+    def dataframe(self, index: int,
+                        names: list) -> hint.dataframe:
+        """
+        Get the periodogram of one series as a table
+
+        Args:
+            index: index of the series in the stack
+            names: names of the frequency, power, period and primary
+                   columns
+
+        Returns:
+            table of the series' periodogram
+        """
+
+        return pd.DataFrame({names[0]: self.frequency,
+                             names[1]: self.power[index],
+                             names[2]: self.period,
+                             names[3]: self.primary[index]})
+
+    @classmethod
+    def setup(cls, series: np.ndarray) -> 'Periodogram':
+        """
+        Compute the periodograms of a stack of series in one call
+
+        Args:
+            series: array with one series per row
+
+        Returns:
+            the periodograms
+        """
+
+        frequency, power = signal.periodogram(series, axis=-1)
+
+        period = np.full(len(frequency), np.inf)
+        period[1:] = 1 / frequency[1:]
+
+        return cls(frequency,
+                   power,
+                   period,
+                   period[np.argmax(power, axis=-1)])
+
+
+@dclass.dataclass
+class Decomposition(object):
+    """
+    Class to hold the additive seasonal decompositions of a stack of series
+        - statsmodels' seasonal_decompose treats each column of a 2d array
+          as a series, so the whole stack is decomposed in one call
+
+    Variables:
+        observed: the series
+        trend:    trend of each series
+        seasonal: seasonal part of each series
+        resid:    residual of each series
+
+    Methods:
+        dataframes: get the decomposition of several series as tables
+
+    Constructors:
+        setup: compute the decompositions
+    """
+
+    observed: np.ndarray
+    trend:    np.ndarray
+    seasonal: np.ndarray
+    resid:    np.ndarray
+
+    def dataframes(self, rows:    list,
+                         columns: list,
+                         names:   list,
+                         index:   list = None) -> hint.dataframes:
+        """
+        Get the decomposition of several series as tables
+
+        Args:
+            rows:    indices of the series in the stack
+            columns: column name of each series
+            names:   names of the observed, trend, seasonal and residual
+                     tables
+            index:   index of the tables
+
+        Returns:
+            table of each part of the decomposition
+        """
+
+        parts = [self.observed, self.trend, self.seasonal, self.resid]
+
+        return {name: pd.DataFrame(dict(zip(columns, part[rows])),
+                                   index=index)
+                for name, part in zip(names, parts)}
+
+    @classmethod
+    def setup(cls, series: np.ndarray,
+                   period: int) -> 'Decomposition':
+        """
+        Compute the decompositions of a stack of series
+
+        Args:
+            series: array with one series per row
+            period: length of a season
+
+        Returns:
+            the decompositions
+        """
+
+        series = np.asarray(series, dtype=float)
+        decomp = seasonal.seasonal_decompose(series.T,
+                                             model='additive',
+                                             period=period)
+
+        return cls(series,
+                   decomp.trend.T,
+                   decomp.seasonal.T,
+                   decomp.resid.T)
@@ -0,0 +1,501 @@
+import collections as collect
+import dataclasses as dclass
+import numpy       as np
+import pandas      as pd
+
+import source.hint as hint
+
+
+@dclass.dataclass
+class Moments(object):
+    """
+    Class to keep running moments of a stream of equally shaped arrays
+        - the mean and variance are updated by Welford's method
+        - nan values are skipped element-wise
+
+    Variables:
+        count:   number of values seen for each element
+        mean:    running mean of each element
+        m2:      running sum of squared deviations of each element
+        minimum: running minimum of each element
+        maximum: running maximum of each element
+
+    Methods:
+        add:      add an array to the moments
+        variance: get the sample variance of each element
+        std:      get the sample standard deviation of each element
+
+    Constructors:
+        setup: setup class
+    """
+
+    count:   np.ndarray
+    mean:    np.ndarray
+    m2:      np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Add an array to the moments
+
+        Args:
+            values: the array to add
+
+        Effects:
+            updates the moments
+        """
+
+        seen = ~np.isnan(values)
+        self.count += seen
+
+        delta = np.where(seen, values - self.mean, 0.0)
+        self.mean += delta / np.maximum(self.count, 1)
+        self.m2   += delta * np.where(seen, values - self.mean, 0.0)
+
+        self.minimum = np.fmin(self.minimum, values)
+        self.maximum = np.fmax(self.maximum, values)
+
+    def variance(self) -> np.ndarray:
+        """
+        Get the sample variance of each element
+
+        Returns:
+            variance, nan where fewer than two values were seen
+        """
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count > 1,
+                            self.m2 / (self.count - 1), np.nan)
+
+    def std(self) -> np.ndarray:
+        """
+        Get the sample standard deviation of each element
+
+        Returns:
+            standard deviation, nan where fewer than two values were seen
+        """
+
+        return np.sqrt(self.variance())
+
+    @classmethod
+    def setup(cls, shape: tuple) -> 'Moments':
+        """
+        Setup the moments
+
+        Args:
+            shape: shape of the arrays
+
+        Returns:
+            empty moments
+        """
+
+        empty = np.full(shape, np.nan)
+
+        return cls(np.zeros(shape, dtype=int),
+                   np.zeros(shape),
+                   np.zeros(shape),
+                   empty,
+                   empty.copy())
+
+
+@dclass.dataclass
+class Sketch(object):
+    """
+    Class to keep a quantile sketch of a stream of equally shaped arrays
+        - a full buffer of 2*size arrays is sorted element-wise and
+          compacted into a level by keeping every other value, so memory
+          grows only with the log of the number of arrays
+        - the quantiles are exact until the first compaction
+        - a single estimator is used throughout: linear interpolation
+          between the ranks, with each value repeated by its weight
+
+    Variables:
+        size:   number of arrays held by each level
+        shape:  shape of the arrays
+        buffer: arrays not yet compacted
+        levels: compacted buffers by level, each value has weight 2**level
+        flip:   offset of the next compaction
+
+    Methods:
+        add:      add an array to the sketch
+        quantile: get a quantile of each element
+    """
+
+    size:   int
+    shape:  tuple = ()
+    buffer: list  = dclass.field(default_factory=list)
+    levels: list  = dclass.field(default_factory=list)
+    flip:   int   = 0
+
+    def _compact(self, values: np.ndarray,
+                       level:  int) -> None:
+        """
+        Compact a full sorted buffer into a level
+
+        Args:
+            values: sorted buffer of the level below
+            level:  level to compact into
+
+        Effects:
+            merges the buffer into the levels
+        """
+
+        while True:
+            values    = values[self.flip::2]
+            self.flip = 1 - self.flip
+
+            if level == len(self.levels):
+                self.levels.append(values)
+                return
+            if self.levels[level] is None:
+                self.levels[level] = values
+                return
+
+            values = np.sort(np.concatenate([self.levels[level], values]),
+                             axis=0)
+            self.levels[level] = None
+            level += 1
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Add an array to the sketch
+
+        Args:
+            values: the array to add
+
+        Effects:
+            updates the sketch
+        """
+
+        self.buffer.append(np.asarray(values, dtype=float))
+
+        if len(self.buffer) == 2*self.size:
+            self._compact(np.sort(np.stack(self.buffer), axis=0), 0)
+            self.buffer = []
+
+    def quantile(self, q: float) -> np.ndarray:
+        """
+        Get a quantile of each element
+            - nan values are skipped element-wise
+            - with all weights one this is numpy's default (linear) quantile
+
+        Args:
+            q: the quantile between 0 and 1
+
+        Returns:
+            the quantile of each element (nan if there are no values)
+        """
+
+        parts   = []
+        weights = []
+        if len(self.buffer) > 0:
+            parts.  append(np.stack(self.buffer))
+            weights.append(np.ones(len(self.buffer)))
+        for level, values in enumerate(self.levels):
+            if values is not None:
+                parts.  append(values)
+                weights.append(np.full(len(values), 2.0**level))
+
+        if len(parts) == 0:
+            return np.full(self.shape, np.nan)
+
+        values  = np.concatenate(parts)
+        weights = np.concatenate(weights)
+
+        # nan values are sorted last and carry no weight
+        order   = np.argsort(values, axis=0)
+        values  = np.take_along_axis(values, order, axis=0)
+        weights = weights.reshape((-1,) + (1,)*(values.ndim - 1))
+        weights = np.take_along_axis(np.broadcast_to(weights, values.shape),
+                                     order, axis=0)
+        weights = np.where(np.isnan(values), 0.0, weights)
+        cumsum  = np.cumsum(weights, axis=0)
+        total   = cumsum[-1]
+
+        rank  = np.maximum(total - 1, 0)*q
+        lower = np.floor(rank)
+        upper = np.minimum(lower + 1, np.maximum(total - 1, 0))
+
+        def value(at: np.ndarray) -> np.ndarray:
+            """
+            Get the value at a rank of each element
+
+            Args:
+                at: rank of each element, counting each value by its weight
+
+            Returns:
+                the value holding the rank
+            """
+
+            index = np.argmax(cumsum > at, axis=0)
+            return np.take_along_axis(values, index[np.newaxis], axis=0)[0]
+
+        low    = value(lower)
+        result = low + (rank - lower)*(value(upper) - low)
+
+        return np.where(total > 0, result, np.nan)
+
+
+@dclass.dataclass
+class Statistics(object):
+    """
+    Class to keep the statistics of one table over a stream of runs
+
+    Variables:
+        columns: names of the table's columns
+        steps:   number of time-steps in the table
+        moments: running moments of each step and column
+        sketch:  quantile sketch of each step and column
+
+    Methods:
+        add:      add a run's table
+        mean:     get the mean table
+        std:      get the standard deviation table
+        min:      get the minimum table
+        max:      get the maximum table
+        quantile: get a quantile table
+        median:   get the median table
+
+    Constructors:
+        setup: setup class
+    """
+
+    columns: list
+    steps:   int
+    moments: Moments
+    sketch:  Sketch
+
+    def add(self, dataframe: hint.dataframe) -> None:
+        """
+        Add a run's table
+
+        Args:
+            dataframe: the run's table
+
+        Effects:
+            updates the statistics
+        """
+
+        if list(dataframe.columns) != self.columns or \
+                len(dataframe.index) != self.steps:
+            raise ValueError('Run table does not match: {}, {}'.
+                             format(list(dataframe.columns),
+                                    len(dataframe.index)))
+
+        values = dataframe.to_numpy(dtype=float)
+        self.moments.add(values)
+        self.sketch.add(values)
+
+    def _frame(self, values: np.ndarray) -> hint.dataframe:
+        """
+        Make a table of values
+
+        Args:
+            values: array of values by step and column
+
+        Returns:
+            the table
+        """
+
+        return pd.DataFrame(values, columns=self.columns)
+
+    def mean(self) -> hint.dataframe:
+        """
+        Get the mean table
+
+        Returns:
+            mean of each step and column
+        """
+
+        return self._frame(np.where(self.moments.count > 0,
+                                    self.moments.mean, np.nan))
+
+    def std(self) -> hint.dataframe:
+        """
+        Get the standard deviation table
+
+        Returns:
+            standard deviation of each step and column
+        """
+
+        return self._frame(self.moments.std())
+
+    def min(self) -> hint.dataframe:
+        """
+        Get the minimum table
+
+        Returns:
+            minimum of each step and column
+        """
+
+        return self._frame(self.moments.minimum)
+
+    def max(self) -> hint.dataframe:
+        """
+        Get the maximum table
+
+        Returns:
+            maximum of each step and column
+        """
+
+        return self._frame(self.moments.maximum)
+
+    def quantile(self, q: float) -> hint.dataframe:
+        """
+        Get a quantile table
+
+        Args:
+            q: the quantile between 0 and 1
+
+        Returns:
+            quantile of each step and column
+        """
+
+        return self._frame(self.sketch.quantile(q))
+
+    def median(self) -> hint.dataframe:
+        """
+        Get the median table
+
+        Returns:
+            median of each step and column
+        """
+
+        return self.quantile(0.5)
+
+    @classmethod
+    def setup(cls, dataframe: hint.dataframe,
+                   size:      int) -> 'Statistics':
+        """
+        Setup the statistics from a run's table
+
+        Args:
+            dataframe: the first run's table
+            size:      buffer size of the quantile sketch
+
+        Returns:
+            empty statistics for tables of the same shape
+        """
+
+        return cls(list(dataframe.columns),
+                   len(dataframe.index),
+                   Moments.setup(dataframe.shape),
+                   Sketch(size, dataframe.shape))
+
+
+class Aggregator(collect.UserDict):
+    """
+    Class to summarize the tables of runs streamed one at a time
+        - memory does not grow with the number of runs, beyond the log
+          growth of the quantile sketches
+
+    Variables:
+        size:  buffer size of the quantile sketches
+        runs:  number of runs added
+        dict:
+            key:   table name
+            value: statistics of the table
+
+    Methods:
+        add:      add a run's tables
+        mean:     get the mean tables
+        std:      get the standard deviation tables
+        min:      get the minimum tables
+        max:      get the maximum tables
+        quantile: get the quantile tables
+        median:   get the median tables
+    """
+
+    def __init__(self, size: int = 64):
+        super().__init__()
+
+        self.size = size
+        self.runs = 0
+
+    def add(self, dataframes: hint.dataframes) -> None:
+        """
+        Add a run's tables
+
+        Args:
+            dataframes: the run's tables
+
+        Effects:
+            updates the statistics of each table
+        """
+
+        for table_name, dataframe in dataframes.items():
+            if table_name not in self.data:
+                self.data[table_name] = Statistics.setup(dataframe,
+                                                         self.size)
+            self.data[table_name].add(dataframe)
+
+        self.runs += 1
+
+    def mean(self) -> hint.dataframes:
+        """
+        Get the mean tables
+
+        Returns:
+            mean table of each table
+        """
+
+        return {table_name: statistics.mean()
+                for table_name, statistics in self.items()}
+
+    def std(self) -> hint.dataframes:
+        """
+        Get the standard deviation tables
+
+        Returns:
+            standard deviation table of each table
+        """
+
+        return {table_name: statistics.std()
+                for table_name, statistics in self.items()}
+
+    def min(self) -> hint.dataframes:
+        """
+        Get the minimum tables
+
+        Returns:
+            minimum table of each table
+        """
+
+        return {table_name: statistics.min()
+                for table_name, statistics in self.items()}
+
+    def max(self) -> hint.dataframes:
+        """
+        Get the maximum tables
+
+        Returns:
+            maximum table of each table
+        """
+
+        return {table_name: statistics.max()
+                for table_name, statistics in self.items()}
+
+    def quantile(self, q: float) -> hint.dataframes:
+        """
+        Get the quantile tables
+
+        Args:
+            q: the quantile between 0 and 1
+
+        Returns:
+            quantile table of each table
+        """
+
+        return {table_name: statistics.quantile(q)
+                for table_name, statistics in self.items()}
+
+    def median(self) -> hint.dataframes:
+        """
+        Get the median tables
+
+        Returns:
+            median table of each table
+        """
+
+        return self.quantile(0.5)
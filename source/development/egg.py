@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -15,7 +16,9 @@ class Egg(object):
         development: mathematical function for if egg develops
 
     Methods:
-        develop: run the behavior
+        develop:   run the behavior
+        duration:  sample the days until development
+        transform: replace with next stage
 
     Constructors:
         setup: setup class
@@ -60,6 +63,38 @@ class Egg(object):
         new = larva.Larva.advance(egg)
         new.activate()
 
+    def duration(self, egg: hint.egg) -> float:
+        """
+        Sample the number of days until the egg develops
+
+        Args:
+            egg: the egg in question
+
+        Returns:
+            number of days until development (inf if egg cannot develop)
+        """
+
+        if self._use_development:
+            return self.development.duration(egg.mass,
+                                             egg.age,
+                                             egg.genotype)
+        else:
+            return np.inf
+
+    def transform(self, egg: hint.egg) -> None:
+        """
+        Replace the egg with a larva
+
+        Args:
+            egg: the egg in question
+
+        Effects:
+            replaces the egg with a larva
+        """
+
+        egg.deactivate()
+        self._make_larva(egg)
+
     def develop(self, egg: hint.egg) -> None:
         """
         Run development on the egg
@@ -73,8 +108,7 @@ class Egg(object):
         """
 
         if self._develop(egg):
-            egg.deactivate()
-            self._make_larva(egg)
+            self.transform(egg)
 
     @classmethod
     def setup(cls, **kwargs) -> 'Egg':
@@ -42,6 +42,32 @@ class BaseTime(models.Model):
         return rnd.random() <= stats.norm.cdf(age,
                                               loc=self.mu, scale=self.sigma)
 
+    def duration(self, mass:     float,
+                       age:      int,
+                       genotype: str) -> int:
+        """
+        Sample the number of days until an agent develops
+            - inverts the distribution of daily calls using a single draw
+
+        Args:
+            mass:     mass of agent
+            age:      time agent has existed
+            genotype: genotype of the agent
+
+        Returns:
+            number of days until agent develops
+        """
+
+        draw   = rnd.random()
+        remain = 1.0
+        days   = 0
+        while True:
+            remain *= 1 - stats.norm.cdf(age + days,
+                                         loc=self.mu, scale=self.sigma)
+            if draw >= remain:
+                return days
+            days += 1
+
 
 @dclass.dataclass
 class Egg(BaseTime):
@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -15,7 +16,9 @@ class Pupa(object):
         development: mathematical function for if pupa develops
 
     Methods:
-        develop: run the behavior
+        develop:   run the behavior
+        duration:  sample the days until development
+        transform: replace with next stage
 
     Constructors:
         setup: setup class
@@ -48,7 +51,7 @@ class Pupa(object):
     @staticmethod
     def _make_adult(pupa: hint.pupa) -> None:
         """
-        Create a adult from the pupa
+        Create an adult from the pupa
 
         Args:
             pupa: the pupa in question
@@ -60,6 +63,38 @@ class Pupa(object):
         new = adult.Adult.advance(pupa)
         new.activate()
 
+    def duration(self, pupa: hint.pupa) -> float:
+        """
+        Sample the number of days until the pupa develops
+
+        Args:
+            pupa: the pupa in question
+
+        Returns:
+            number of days until development (inf if pupa cannot develop)
+        """
+
+        if self._use_development:
+            return self.development.duration(pupa.mass,
+                                             pupa.age,
+                                             pupa.genotype)
+        else:
+            return np.inf
+
+    def transform(self, pupa: hint.pupa) -> None:
+        """
+        Replace the pupa with an adult
+
+        Args:
+            pupa: the pupa in question
+
+        Effects:
+            replaces the pupa with an adult
+        """
+
+        pupa.deactivate()
+        self._make_adult(pupa)
+
     def develop(self, pupa: hint.pupa) -> None:
         """
         Run development on the pupa
@@ -68,13 +103,12 @@ class Pupa(object):
             pupa: the pupa in question
 
         Effects:
-            if pupa develops, replace it with a adult
+            if pupa develops, replace it with an adult
             else do nothing
         """
 
         if self._develop(pupa):
-            pupa.deactivate()
-            self._make_adult(pupa)
+            self.transform(pupa)
 
     @classmethod
     def setup(cls, **kwargs) -> 'Pupa':
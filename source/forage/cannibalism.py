@@ -1,10 +1,95 @@
 import dataclasses  as dclass
+import numpy        as np
 import numpy.random as rnd
 
 import source.hint    as hint
 import source.keyword as keyword
 
 
+@dclass.dataclass
+class Candidates(object):
+    """
+    Class to hold the potential targets of a larva
+        - the count comes from the bin sizes, the list of targets is only
+          built once a target is drawn
+
+    Variables:
+        larva:   the larva looking for targets
+        bins:    the agent bins holding the potential targets
+        count:   number of potential targets remaining
+        targets: list of potential targets (None until first draw)
+
+    Methods:
+        draw: draw a target without replacement
+
+    Constructors:
+        setup: setup class
+    """
+
+    larva:   hint.larva
+    bins:    hint.bin_list
+    count:   int
+    targets: hint.targets = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _materialize(self) -> None:
+        """
+        Build the list of potential targets
+
+        Effects:
+            sets the list of targets, if it does not exist yet
+        """
+
+        if self.targets is None:
+            self.targets = [agent
+                            for agent_bin in self.bins
+                            for agent     in agent_bin.values()
+                            if  agent is not self.larva]
+            self.count   = len(self.targets)
+
+    def draw(self) -> hint.target:
+        """
+        Draw a target without replacement
+
+        Returns:
+            target to encounter
+
+        Effects:
+            removes target from the potential targets
+        """
+
+        self._materialize()
+
+        index  = rnd.randint(self.count)
+        target = self.targets[index]
+
+        self.targets[index] = self.targets[-1]
+        self.targets.pop()
+        self.count -= 1
+
+        return target
+
+    @classmethod
+    def setup(cls, larva: hint.larva,
+                   bins:  hint.bin_list) -> 'Candidates':
+        """
+        Setup the class
+
+        Args:
+            larva: the larva looking for targets
+            bins:  the agent bins holding the potential targets
+
+        Returns:
+            setup class
+        """
+
+        count = sum(len(agent_bin) for agent_bin in bins) - 1
+
+        return cls(larva, bins, count)
+
+
 @dclass.dataclass
 class Cannibalism(object):
     """
@@ -16,8 +101,12 @@ class Cannibalism(object):
         radius:    mathematical function for determining how far encounters
                                                                         reach
 
+    Properties:
+        interacts: if the behavior couples larvae together
+
     Methods:
-        cannibalism: run the behavior
+        cannibalism:       run the behavior
+        batch_cannibalism: run the behavior for a population of larvae
 
     Constructors:
         setup: setup class
@@ -27,6 +116,12 @@ class Cannibalism(object):
     encounter: hint.encounter = None
     radius:    hint.radius    = None
 
+    @property
+    def interacts(self) -> bool:
+        """Determine if cannibalism couples larvae together"""
+
+        return self.encounter is not None
+
     @property
     def _use_fight(self) -> bool:
         """Determine if we use the fight model"""
@@ -109,38 +204,35 @@ class Cannibalism(object):
         return {keyword.upper: radius,
                 keyword.lower: 0}
 
-    def _targets(self, larva: hint.larva) -> hint.targets:
+    def _targets(self, larva: hint.larva) -> hint.candidates:
         """
-        Get a list of targets for cannibalism
+        Get the potential targets for cannibalism
 
         Args:
             larva: the larva in question
 
         Returns:
-            list of targets
+            potential targets
         """
 
-        return larva.targets(**self._bounds(larva))
+        return Candidates.setup(larva, larva.target_bins(**self._bounds(larva)))
 
     @staticmethod
-    def _get_target(targets: hint.targets) -> hint.target:
+    def _get_target(targets: hint.candidates) -> hint.target:
         """
         Get insect to encounter
 
         Args:
-            targets: get list of potential targets
+            targets: get potential targets
 
         Returns:
             target to encounter
 
         Effects:
-            remove target from list
+            remove target from potential targets
         """
 
-        target = rnd.choice(targets)
-        targets.remove(target)
-
-        return target
+        return targets.draw()
 
     def _can_encounter(self, larva: hint.larva) -> bool:
         """
@@ -156,13 +248,13 @@ class Cannibalism(object):
         return (self.encounter is not None) and larva.alive and (not larva.full)
 
     def _encounter(self, larva: hint.larva,
-                         targets: hint.targets) -> bool:
+                         targets: hint.candidates) -> bool:
         """
         Determine if an encounter occurs
 
         Args:
             larva:   the larva in question
-            targets: get list of potential targets
+            targets: get potential targets
 
         Returns:
             if an encounter occurs
@@ -174,13 +266,13 @@ class Cannibalism(object):
             return False
 
     def _cannibalize(self, larva:   hint.larva,
-                           targets: hint.targets) -> None:
+                           targets: hint.candidates) -> None:
         """
         Perform cannibalism on target
 
         Args:
             larva:   the larva in question
-            targets: get list of potential targets
+            targets: get potential targets
 
         Effects:
             run cannibalism on target
@@ -194,13 +286,13 @@ class Cannibalism(object):
             self._contest(larva, target)
 
     def _cannibalism(self, larva:    hint.larva,
-                           targets: hint.targets) -> bool:
+                           targets: hint.candidates) -> bool:
         """
         Run single cannibalism step:
 
         Args:
             larva:   the larva in question
-            targets: get list of potential targets
+            targets: get potential targets
 
         Returns:
             if their was an encounter
@@ -244,6 +336,290 @@ class Cannibalism(object):
         if self._can_encounter(larva):
             self._run_cannibalism(larva)
 
+    def _local(self, larvae: hint.agent_list) -> bool:
+        """
+        Determine if the larvae can only encounter targets on their own plant
+
+        Args:
+            larvae: the larvae in question
+
+        Returns:
+            if all the encounter radii are zero
+        """
+
+        if self._use_radius:
+            for larva in larvae:
+                if self._bounds(larva)[keyword.upper] > 0:
+                    return False
+
+        return True
+
+    @staticmethod
+    def _plants(larvae: hint.agent_list) -> hint.plants:
+        """
+        Group the larvae by their plant
+
+        Args:
+            larvae: the larvae in question
+
+        Returns:
+            dict:
+                key:   location_key of plant
+                value: larvae on the plant
+        """
+
+        plants = {}
+        for larva in larvae:
+            location_key = larva.location.location_key
+
+            if location_key not in plants:
+                plants[location_key] = []
+            plants[location_key].append(larva)
+
+        return plants
+
+    @staticmethod
+    def _excluded(order:   hint.agent_list,
+                  drawn:   hint.drawn,
+                  active:  hint.indices,
+                  targets: hint.targets) -> hint.drawn:
+        """
+        Get the targets each larva cannot draw
+
+        Args:
+            order:   the larvae on the plant in order of performance
+            drawn:   ids of the targets already drawn by each larva
+            active:  the larvae drawing targets
+            targets: the potential targets on the plant
+
+        Returns:
+            indices of the excluded targets for each active larva
+        """
+
+        position = {id(target): index for index, target in enumerate(targets)}
+
+        excluded = []
+        for index in active:
+            keys = drawn[index] | {id(order[index])}
+            excluded.append({position[key] for key in keys if key in position})
+
+        return excluded
+
+    @staticmethod
+    def _batch_targets(excluded: hint.drawn,
+                       number:   int) -> np.ndarray:
+        """
+        Draw a target for each larva without replacement
+
+        Args:
+            excluded: indices of the targets excluded for each larva
+            number:   number of targets on the plant
+
+        Returns:
+            indices of the drawn targets
+        """
+
+        picks = rnd.randint(number, size=len(excluded))
+
+        for place, exclude in enumerate(excluded):
+            while picks[place] in exclude:
+                picks[place] = rnd.randint(number)
+
+        return picks
+
+    @staticmethod
+    def _redraw(larva:   hint.larva,
+                drawn:   set,
+                targets: hint.targets) -> hint.target:
+        """
+        Draw a new target, when the drawn target was killed earlier in the
+            round
+
+        Args:
+            larva:   the larva in question
+            drawn:   ids of the targets already drawn by the larva
+            targets: the potential targets on the plant
+
+        Returns:
+            a living target (None if there are none left)
+        """
+
+        remaining = [target for target in targets
+                     if target.alive and
+                     (target is not larva) and
+                     (id(target) not in drawn)]
+
+        if len(remaining) > 0:
+            return remaining[rnd.randint(len(remaining))]
+        else:
+            return None
+
+    def _batch_winners(self, pairs: hint.pairs) -> np.ndarray:
+        """
+        Determine the winner of the fight for each pair
+
+        Args:
+            pairs: the (larva, target) pairs
+
+        Returns:
+            if each larva is the winner
+        """
+
+        if self._use_fight:
+            mass0 = np.array([larva. mass for larva, target in pairs])
+            mass1 = np.array([target.mass for larva, target in pairs])
+
+            return self.fight.batch(mass0, mass1)
+        else:
+            return np.zeros(len(pairs), dtype=bool)
+
+    def _batch_cannibalize(self, larva:  hint.larva,
+                                 target: hint.target,
+                                 winner: bool) -> None:
+        """
+        Perform cannibalism on target with a drawn fight outcome
+
+        Args:
+            larva:  the larva in question
+            target: the larva's target
+            winner: if the larva wins a fight
+
+        Effects:
+            run cannibalism on target
+        """
+
+        if target.agent_key == keyword.egg_mass:
+            larva.consume_egg(target)
+        elif self._use_fight:
+            if winner:
+                larva.consume_larva(target)
+            else:
+                target.consume_larva(larva)
+
+    def _batch_round(self, order:   hint.agent_list,
+                           drawn:   hint.drawn,
+                           active:  hint.indices,
+                           targets: hint.targets) -> hint.indices:
+        """
+        Run a single round of cannibalism on a plant
+
+        Args:
+            order:   the larvae on the plant in order of performance
+            drawn:   ids of the targets already drawn by each larva
+            active:  the larvae still encountering
+            targets: the living potential targets on the plant
+
+        Returns:
+            the larvae which had an encounter
+
+        Effects:
+            run cannibalism on the drawn targets in order
+        """
+
+        active = [index for index in active
+                  if self._can_encounter(order[index])]
+        if len(active) == 0:
+            return active
+
+        excluded = self._excluded(order, drawn, active, targets)
+        number   = np.array([len(targets) - len(exclude)
+                             for exclude in excluded])
+        mass     = np.array([order[index].mass     for index in active])
+        genotype = np.array([order[index].genotype for index in active])
+
+        encounters = self.encounter.batch(number, mass, genotype) & \
+                     (number > 0)
+        active     = [index   for index,   encounter
+                      in zip(active,   encounters) if encounter]
+        excluded   = [exclude for exclude, encounter
+                      in zip(excluded, encounters) if encounter]
+
+        picks   = self._batch_targets(excluded, len(targets))
+        pairs   = [(order[index], targets[pick])
+                   for index, pick in zip(active, picks)]
+        winners = self._batch_winners(pairs)
+
+        for index, (larva, target), winner in zip(active, pairs, winners):
+            if not self._can_encounter(larva):
+                continue
+
+            if not target.alive:
+                target = self._redraw(larva, drawn[index], targets)
+                if target is None:
+                    continue
+                winner = self._use_fight and self._winner(larva, target)
+
+            drawn[index].add(id(target))
+            self._batch_cannibalize(larva, target, winner)
+
+        return active
+
+    @staticmethod
+    def _living(larva: hint.larva) -> hint.targets:
+        """
+        Get the living potential targets on the larva's plant
+
+        Args:
+            larva: a larva on the plant
+
+        Returns:
+            list of the egg_masses and larvae on the plant
+        """
+
+        bounds = {keyword.upper: 0,
+                  keyword.lower: 0}
+
+        return [agent
+                for agent_bin in larva.target_bins(**bounds)
+                for agent     in agent_bin.values()]
+
+    def _batch_plant(self, larvae: hint.agent_list) -> None:
+        """
+        Run cannibalism for all the larvae on a single plant
+            - larvae act in a random order, each round every larva still
+              encountering draws its encounter, target, and fight together
+            - the larvae are interleaved round by round, rather than each
+              running to completion as in cannibalism, so the outcome is
+              only the same when it does not depend on that order
+
+        Args:
+            larvae: the larvae on the plant
+
+        Effects:
+            Run all the cannibalism on the plant
+        """
+
+        order = [larvae[index] for index in rnd.permutation(len(larvae))]
+        drawn = [set() for _ in order]
+
+        active = list(range(len(order)))
+        while len(active) > 0:
+            targets = self._living(order[0])
+            active  = self._batch_round(order, drawn, active, targets)
+
+    def batch_cannibalism(self, larvae: hint.agent_list) -> None:
+        """
+        Run full cannibalism encounters for a population of larvae
+            - only encounters on the larva's own plant (zero radius) are
+              drawn together, otherwise each larva runs cannibalism
+            - gains and kills are still applied larva by larva
+
+        Args:
+            larvae: the larvae in question
+
+        Effects:
+            Runs all the cannibalism for the larvae
+        """
+
+        larvae = [larva for larva in larvae if self._can_encounter(larva)]
+
+        if self._local(larvae):
+            for plant in self._plants(larvae).values():
+                self._batch_plant(plant)
+        else:
+            for larva in larvae:
+                self.cannibalism(larva)
+
     @classmethod
     def setup(cls, **kwargs) -> 'Cannibalism':
         """
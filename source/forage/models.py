@@ -17,6 +17,7 @@ class PlantBase(models.Model):
 
     Methods:
         __call__: call the model
+        total:    call the model for a number of sequential bites
     """
 
     model_key = keyword.plant_forage
@@ -42,6 +43,31 @@ class PlantBase(models.Model):
 
         pass
 
+    def total(self, mass:     float,
+                    plant:    float,
+                    genotype: str,
+                    bt:       str,
+                    number:   int) -> float:
+        """
+        Call the model for a number of sequential bites
+
+        Args:
+            mass:     mass of larva
+            plant:    mass of plant
+            genotype: larva genotype
+            bt:       plant type
+            number:   number of bites
+
+        Returns:
+            total biomass which can be foraged
+        """
+
+        total = 0.0
+        for _ in range(number):
+            total += self(mass, plant, genotype, bt)
+
+        return total
+
 
 @dclass.dataclass
 class PlantAdLibitum(PlantBase):
@@ -57,6 +83,7 @@ class PlantAdLibitum(PlantBase):
 
     Methods:
         __call__: call the model
+        total:    call the model for a number of sequential bites
     """
 
     max_gut: hint.max_gut
@@ -80,6 +107,27 @@ class PlantAdLibitum(PlantBase):
 
         return self.max_gut(mass) / self.steps
 
+    def total(self, mass:     float,
+                    plant:    float,
+                    genotype: str,
+                    bt:       str,
+                    number:   int) -> float:
+        """
+        Call the model for a number of sequential bites
+
+        Args:
+            mass:     mass of larva
+            plant:    mass of plant
+            genotype: larva genotype
+            bt:       plant type
+            number:   number of bites
+
+        Returns:
+            total biomass which can be foraged
+        """
+
+        return number * self(mass, plant, genotype, bt)
+
 
 @dclass.dataclass
 class PlantStarve(PlantBase):
@@ -97,6 +145,7 @@ class PlantStarve(PlantBase):
 
     Methods:
         __call__: call the model
+        total:    call the model for a number of sequential bites
     """
 
     theta:   float
@@ -138,6 +187,31 @@ class PlantStarve(PlantBase):
         return float(stats.truncnorm.rvs(0, np.inf,
                                          loc=self._mu(mass), scale=self.sigma))
 
+    def total(self, mass:     float,
+                    plant:    float,
+                    genotype: str,
+                    bt:       str,
+                    number:   int) -> float:
+        """
+        Call the model for a number of sequential bites
+
+        Args:
+            mass:     mass of larva
+            plant:    mass of plant
+            genotype: larva genotype
+            bt:       plant type
+            number:   number of bites
+
+        Returns:
+            total biomass which can be foraged
+        """
+
+        bites = stats.truncnorm.rvs(0, np.inf,
+                                    loc=self._mu(mass), scale=self.sigma,
+                                    size=number)
+
+        return float(np.sum(bites))
+
 
 @dclass.dataclass
 class Egg(models.Model):
@@ -302,6 +376,34 @@ class Loss(models.Model):
         return rnd.random() <= self._prob(mass, target_mass,
                                           genotype, target_key)
 
+    def batch(self, mass:        np.ndarray,
+                    target_mass: np.ndarray,
+                    genotype:    np.ndarray,
+                    target_key:  np.ndarray) -> np.ndarray:
+        """
+        Make the decisions for a population of larvae
+
+        Args:
+            mass:        masses of larvae
+            target_mass: masses of targets
+            genotype:    genotypes of larvae
+            target_key:  types of targets
+
+        Returns:
+            if each larva leaves its target
+        """
+
+        egg  = target_key == keyword.egg_mass
+        gut  = self.max_gut(mass)
+        food = np.where(egg,
+                        self.forage_egg(  target_mass, mass, genotype),
+                        self.forage_larva(target_mass, mass, genotype))
+        q    = np.array([self.mid[key] for key in target_key])
+
+        prob = 1 / (q * np.exp(-self.slope*(food - gut)) + 1)
+
+        return rnd.random(len(mass)) <= prob
+
 
 @dclass.dataclass
 class Fight(models.Model):
@@ -320,6 +422,7 @@ class Fight(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for a population
     """
 
     model_key = keyword.fight
@@ -359,6 +462,21 @@ class Fight(models.Model):
 
         return rnd.random() <= self.prob(mass0, mass1)
 
+    def batch(self, mass0: np.ndarray,
+                    mass1: np.ndarray) -> np.ndarray:
+        """
+        Make the decisions for a population of fights
+
+        Args:
+            mass0: masses of larvae running fights
+            mass1: masses of target larvae
+
+        Returns:
+            if each mass0 larva wins
+        """
+
+        return rnd.random(len(mass0)) <= self.prob(mass0, mass1)
+
 
 @dclass.dataclass
 class Encounter(models.Model):
@@ -374,6 +492,7 @@ class Encounter(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for a population
     """
 
     model_key = keyword.encounter
@@ -412,6 +531,23 @@ class Encounter(models.Model):
 
         return rnd.random() <= self._prob(number)
 
+    def batch(self, number:   np.ndarray,
+                    mass:     np.ndarray,
+                    genotype: np.ndarray) -> np.ndarray:
+        """
+        Make the encounter decisions for a population of larvae
+
+        Args:
+            number:   numbers of other individuals
+            mass:     masses of consumers
+            genotype: genotypes of consumers
+
+        Returns:
+            if each encounter occurs
+        """
+
+        return rnd.random(len(number)) <= self._prob(number)
+
 
 @dclass.dataclass
 class Radius(models.Model):
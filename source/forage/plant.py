@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -10,16 +11,19 @@ class Plant(object):
     Class to handle plant foraging (eating) behavior
 
     Variables:
-        forage: mathematical function for how much can be eaten
+        forage:  mathematical function for how much can be eaten
+        deplete: if eating removes mass from the plant
 
     Methods:
-        consume: run the behavior
+        consume:       run the behavior
+        batch_consume: run the behavior for a population of larvae
 
     Constructors:
         setup: setup class
     """
 
-    forage: hint.forage_plant = None
+    forage:  hint.forage_plant = None
+    deplete: bool              = False
 
     @property
     def _use_forage(self) -> bool:
@@ -27,46 +31,107 @@ class Plant(object):
 
         return self.forage is not None
 
-    def _available(self, larva: hint.larva) -> float:
+    def _available(self, larva:  hint.larva,
+                         number: int = 1) -> float:
         """
         Get the amount of mass that can be foraged
 
         Args:
-            larva: the larva foraging
+            larva:  the larva foraging
+            number: number of sequential bites
 
         Returns:
             amount of food available
         """
 
-        return self.forage(larva.mass, larva.plant, larva.genotype, larva.bt)
+        if number == 1:
+            return self.forage(larva.mass, larva.plant,
+                               larva.genotype, larva.bt)
+        else:
+            return self.forage.total(larva.mass, larva.plant,
+                                     larva.genotype, larva.bt, number)
 
-    def _consume(self, larva: hint.larva) -> None:
+    def _consume(self, larva:  hint.larva,
+                       number: int = 1) -> None:
         """
         Consume available food
 
         Args:
-            larva: the larva foraging
+            larva:  the larva foraging
+            number: number of sequential bites
 
         Effects:
             eats the available amount of food as plant
         """
 
-        available = self._available(larva)
+        available = self._available(larva, number)
+        if self.deplete:
+            available = float(self._deplete([larva], [available])[0])
+
         larva.add_plant(available)
 
-    def consume(self, larva: hint.larva) -> None:
+    @staticmethod
+    def _deplete(larvae:    hint.larvae,
+                 available: hint.amounts) -> np.ndarray:
+        """
+        Take the food the larvae will eat out of their plants
+
+        Args:
+            larvae:    the larvae foraging
+            available: amount of food each larva can forage
+
+        Effects:
+            removes the eaten mass from the plants
+
+        Returns:
+            amount of food each larva gets
+        """
+
+        demands   = np.array([larva.gut.amount(larva, amount)[0]
+                              for larva, amount in zip(larvae, available)])
+        plant_ids = np.array([larva.plant_id for larva in larvae])
+
+        environment = larvae[0].simulation.agents.environment
+
+        return environment.consume(plant_ids, demands)
+
+    def consume(self, larva:  hint.larva,
+                      number: int = 1) -> None:
         """
         Run forage/consume when possible on plant
 
         Args:
-            larva: the larva foraging
+            larva:  the larva foraging
+            number: number of sequential bites
 
         Effects:
             consumes part of leaf
         """
 
         if self._use_forage:
-            self._consume(larva)
+            self._consume(larva, number)
+
+    def batch_consume(self, larvae: hint.larvae) -> None:
+        """
+        Run forage/consume for a population of larvae
+            - when depleting, the larvae on a plant compete for it at once
+
+        Args:
+            larvae: the larvae foraging
+
+        Effects:
+            consumes part of leaves
+        """
+
+        if self._use_forage:
+            if self.deplete:
+                available = [self._available(larva) for larva in larvae]
+                eaten     = self._deplete(larvae, available)
+                for larva, amount in zip(larvae, eaten):
+                    larva.add_plant(float(amount))
+            else:
+                for larva in larvae:
+                    self._consume(larva)
 
     @classmethod
     def setup(cls, **kwargs) -> 'Plant':
@@ -80,7 +145,10 @@ class Plant(object):
             setup class
         """
 
+        deplete = (keyword.plant_deplete in kwargs) and \
+            kwargs[keyword.plant_deplete]
+
         if keyword.plant_forage in kwargs:
-            return cls(kwargs[keyword.plant_forage])
+            return cls(kwargs[keyword.plant_forage], deplete)
         else:
-            return cls()
+            return cls(deplete=deplete)
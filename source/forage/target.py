@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -13,7 +14,8 @@ class Target(object):
         loss: mathematical function for if we lose/keep the target
 
     Methods:
-        consume: run the behavior
+        consume:       run the behavior
+        batch_consume: run the behavior for a population of larvae
 
     Constructors:
         setup: setup class
@@ -83,6 +85,64 @@ class Target(object):
         else:
             larva.target = None
 
+    def _batch_keep(self, larvae: hint.agent_list) -> np.ndarray:
+        """
+        Determine if each larva keeps its target
+
+        Args:
+            larvae: the larvae in question
+
+        Returns:
+            if each larva keeps its target
+        """
+
+        if self._use_loss:
+            mass        = np.array([larva.mass   for larva in larvae])
+            genotype    = np.array([larva.genotype for larva in larvae])
+            target_mass = np.array([larva.target.mass
+                                    for larva in larvae])
+            target_key  = np.array([larva.target.agent_key
+                                    for larva in larvae])
+
+            return self.loss.batch(mass, target_mass, genotype, target_key)
+        else:
+            return np.zeros(len(larvae), dtype=bool)
+
+    def batch_consume(self, larvae: hint.agent_list) -> None:
+        """
+        Run a target consume behavior on the targets of a population of
+            larvae
+            - a larva eaten earlier in the pass, or whose target was, does
+              nothing, as it would not act larva by larva
+            - a larva or target changed by an earlier meal decides again
+              from its current mass
+
+        Args:
+            larvae: the larvae in question
+
+        Effects:
+            run target consumption
+        """
+
+        keep = self._batch_keep(larvae)
+
+        changed = set()
+        for larva, stay in zip(larvae, keep):
+            if not (larva.alive and larva._has_target and
+                    larva.target.alive):
+                continue
+
+            target = larva.target
+
+            if (id(larva) in changed) or (id(target) in changed):
+                stay = self._keep_target(larva, target)
+
+            if stay:
+                self._consume_target(larva, target)
+                changed.update((id(larva), id(target)))
+            else:
+                larva.target = None
+
     @classmethod
     def setup(cls, **kwargs) -> 'Target':
         """
@@ -1,5 +1,6 @@
 import typing
 
+import numpy  as np
 import pandas as pd
 
 if typing.TYPE_CHECKING:
@@ -53,10 +54,14 @@ if typing.TYPE_CHECKING:
     import source.movement.adult as main_adult_movement
     # noinspection PyUnresolvedReferences
     import source.movement.larva as main_larva_movement
+    # noinspection PyUnresolvedReferences
+    import source.movement.rings as main_rings
 
     # noinspection PyUnresolvedReferences
     import source.schedule.actions  as main_actions
     # noinspection PyUnresolvedReferences
+    import source.schedule.calendar as main_calendar
+    # noinspection PyUnresolvedReferences
     import source.schedule.schedule as main_schedule
     # noinspection PyUnresolvedReferences
     import source.schedule.step     as main_step
@@ -66,6 +71,8 @@ if typing.TYPE_CHECKING:
     # noinspection PyUnresolvedReferences
     import source.reproduction.mate as main_mate
 
+    # noinspection PyUnresolvedReferences
+    import source.simulation.domain     as main_domain
     # noinspection PyUnresolvedReferences
     import source.simulation.behaviors  as main_behaviors
     # noinspection PyUnresolvedReferences
@@ -116,6 +123,14 @@ egg_dict = typing.Dict[str, egg]
 
 alleles = typing.Tuple[int, int]
 
+unique_ids     = typing.List[str]
+unique_id_nums = typing.List[int]
+parent_counts  = typing.List[typing.Tuple[str, str, int]]
+masses         = np.ndarray
+larvae         = typing.List[larva]
+pupae          = typing.List[pupa]
+adults         = typing.List[adult]
+
 
 # Space hints
 #       Location hints
@@ -135,6 +150,7 @@ location_data  = typing.Tuple[locations, locations_key]
 
 #       Environment hints
 init_plant  = typing.Callable[[str], float]
+plant_ids   = typing.Dict[plant_key, int]
 environment = 'main_environment.Environment'
 
 environment_tuple = typing.Tuple[float, init_plant]
@@ -143,9 +159,13 @@ environment_tuple = typing.Tuple[float, init_plant]
 agent_keys  = typing.List[str]
 agent_bin   = 'main_agents.AgentBin'
 agent_bins  = typing.Dict[str, agent_bin]
+bin_list    = typing.List[agent_bin]
 agents_bin  = 'main_agents.AgentsBin'
 agents_dict = typing.Dict[location_key, agents_bin]
 agents      = 'main_agents.Agents'
+occupants   = typing.AbstractSet[location_key]
+occupied    = typing.Dict[int, typing.Dict[str, typing.Set[location_key]]]
+watching    = typing.Tuple[int, typing.Set[str], location_keys]
 
 #       Graph hints
 vertex_neighborhood = 'main_graph.VertexNeighborhood'
@@ -166,6 +186,10 @@ neighborhoods     = typing.Dict[int,   vertex_neighborhood]
 distance_dict = typing.Dict[int, float]
 distances     = typing.Dict[int, vertex_distance]
 
+cdf    = typing.Callable[[np.ndarray], np.ndarray]
+rings  = typing.Tuple[typing.List[typing.List[int]], np.ndarray]
+blocks = typing.List[typing.List[int]]
+
 upper_grid = typing.List[typing.List[int]]
 boundary   = typing.Tuple[typing.List[int],
                           typing.List[int],
@@ -190,15 +214,34 @@ space = 'main_space.Space'
 database   = 'main_database.Database'
 data_tuple_spacing = typing.Tuple[int]
 data_tuple_name    = typing.Tuple[int, str, str]
-data_tuple         = typing.Union[data_tuple_spacing, data_tuple_name]
+data_tuple_backend = typing.Tuple[int, str, str, str]
+data_tuple         = typing.Union[data_tuple_spacing, data_tuple_name,
+                                  data_tuple_backend]
 #       Counter Hints
 dataframe      = pd.DataFrame
 dataframes     = typing.Dict[str, dataframe]
 dataframe_list = typing.List[dataframe]
 
 data_list        = typing.List[int]
+data_lists       = typing.Dict[str, data_list]
+snapshot         = typing.Dict[str, data_lists]
 data_column      = 'main_counter.DataColumn'
 data_column_dict = typing.Dict[str, data_column]
+long_column_key  = typing.Tuple[str, typing.Any]
+long_column_dict = typing.Dict[long_column_key, data_column]
+long_key         = typing.Tuple[location_key, str, str, typing.Any]
+long_dict        = typing.Dict[long_key, data_column]
+long_lists       = typing.Dict[long_key, data_list]
+long_codes       = typing.Dict[str, typing.Dict[str, int]]
+chunks           = typing.List[np.ndarray]
+run_columns      = typing.Dict[int, chunks]
+
+manifest_entry   = typing.Tuple[str, int, int]
+manifest_entries = typing.List[manifest_entry]
+manifest_dict    = typing.Dict[int, manifest_entries]
+run_stream       = typing.Iterator[typing.Tuple[int, dataframes]]
+data_window      = typing.Tuple[typing.Union[snapshot, long_lists],
+                                typing.Union[str, int]]
 data_columns     = 'main_counter.DataColumns'
 
 counts_dict  = typing.Dict[str, any]
@@ -228,6 +271,11 @@ actions      = 'main_actions.Actions'
 actions_list = typing.List[actions]
 actions_dict = typing.Dict[str, action_keys]
 
+behavior       = typing.Callable[[agent], agent_list]
+batch_behavior = typing.Callable[[agent_list, agent_list], None]
+plan           = typing.Tuple[behavior, ...]
+batch_plan     = typing.Union[typing.Tuple[batch_behavior, ...], None]
+
 #       Step hints
 step  = 'main_step.Step'
 steps = typing.List[step]
@@ -239,16 +287,26 @@ step_tuple_shuffle_1 = typing.Tuple[actions_dict, int, bool, bool]
 step_tuple_reg       = typing.Tuple[actions_dict, int, bool, bool, bool]
 step_tuple_loc       = typing.Tuple[actions_dict, int, bool, bool, bool,
                                     bool, int]
+step_tuple_batch     = typing.Tuple[actions_dict, int, bool, bool, bool,
+                                    bool, int, bool]
 step_tuple           = typing.Union[step_tuple_basic,
                                     step_tuple_repeat,
                                     step_tuple_shuffle_0,
                                     step_tuple_shuffle_1,
                                     step_tuple_reg,
-                                    step_tuple_loc]
+                                    step_tuple_loc,
+                                    step_tuple_batch]
 step_tuples           = typing.List[step_tuple]
 
+#       Calendar hints
+event          = typing.Tuple[float, str]
+calendar_event = typing.Tuple[agent, int, str]
+events         = typing.Dict[int, typing.List[calendar_event]]
+calendar       = 'main_calendar.Calendar'
+
 #       Schedule hints
 schedule = 'main_schedule.Schedule'
+exchange = typing.Callable[[], None]
 
 
 # Simulation Hints
@@ -263,11 +321,28 @@ init_pops = typing.Tuple[init_pop, init_pop, init_pop, init_pop, init_pop]
 variable    = typing.Dict[str, float]
 bt_variable = typing.Dict[str, variable]
 
+#       Domain hints
+domain   = 'main_domain.Domain'
+block    = 'main_domain.Block'
+ghost    = 'main_domain.Ghost'
+runner   = typing.Union[simulation, domain]
+ghosts   = typing.List[ghost]
+owner    = typing.List[int]
+halos    = typing.Dict[int, vertices]
+queues   = typing.List[typing.Any]
+workers  = typing.List[typing.Any]
+links    = typing.Dict[int, str]
+mated    = typing.Dict[int, typing.List[str]]
+parcel   = typing.Tuple[agent_list, typing.List[str], ghosts]
+parcels  = typing.Dict[int, parcel]
+gathered = typing.Tuple[typing.Dict[typing.Any, typing.Any], events, int]
+
 
 # Biomass Hints
 #       Gut Hints
 max_gut      = typing.Callable[[float], float]
 amount_tuple = typing.Tuple[float, bool]
+amounts      = typing.List[float]
 gut          = 'main_gut.Gut'
 #       Mass Hints
 growth = typing.Callable[[float, float, str], float]
@@ -303,6 +378,9 @@ movement_adult = typing.Callable[[float, str], float]
 larva_movement = 'main_larva_movement.Larva'
 adult_movement = 'main_adult_movement.Adult'
 
+alias_table  = 'main_rings.AliasTable'
+ring_sampler = 'main_rings.RingSampler'
+
 
 # Forage Hints
 #       Foraging Hints
@@ -324,7 +402,13 @@ fight     = typing.Callable[[float, float], bool]
 encounter = typing.Callable[[int, float, str], bool]
 radius    = typing.Callable[[float, str], bool]
 
+plants  = typing.Dict[location_key, typing.List[larva]]
+indices = typing.List[int]
+drawn   = typing.List[typing.Set[int]]
+pairs   = typing.List[typing.Tuple[larva, target]]
+
 cannibalism = 'main_cannibalism.Cannibalism'
+candidates  = 'main_cannibalism.Candidates'
 
 
 # Reproduction Hints
@@ -332,8 +416,6 @@ cannibalism = 'main_cannibalism.Cannibalism'
 fecundity = typing.Callable[[float, int, str], int]
 density   = typing.Callable[[int, float, str], bool]
 
-egg_lay = typing.Tuple[egg_masses, int, bool]
-
 lay = 'main_lay.Lay'
 
 #       Mate Hints
@@ -344,7 +426,8 @@ mate_radius = typing.Callable[[float, str], bool]
 
 adult_mate = typing.Union[str, None]
 
-mate = 'main_mate.Mate'
+mate      = 'main_mate.Mate'
+mate_pool = 'main_mate.Mates'
 
 
 # Migration Hints
@@ -353,6 +436,7 @@ emigration_list   = typing.List[emigration]
 emigrations       = 'main_emigration.Emigrations'
 emigration_tuple  = typing.Tuple[float, float, agent_keys]
 emigration_tuples = typing.List[emigration_tuple]
+decisions         = typing.List[bool]
 
 immigration        = 'main_immigration.Immigration'
 immigration_list   = typing.List[immigration]
@@ -9,6 +9,7 @@ mated    = 'mated'
 
 agent_keys = [egg, egg_mass, larva, pupa, female, male, mated]
 insect_keys = [egg, larva, pupa, female, male, mated]
+calendar_keys = [egg, pupa]
 
 adult    = 'adult'
 pregnant = 'pregnant'
@@ -37,6 +38,8 @@ move        = 'move'
 consume     = 'consume'
 reproduce   = 'reproduce'
 
+batch = 'batch_'
+
 
 # Genotype Keywords
 homo_r = 'resistant'
@@ -139,6 +142,46 @@ lifetime_male   = 'lifetime_male'
 lifetime_female = 'lifetime_female'
 limited         = 'limited'
 
+calendar       = 'calendar'
+plant_deplete  = 'plant_deplete'
+domain_workers = 'domain_workers'
+
+# domain command keys
+domain_step    = 'domain_step'
+domain_gather  = 'domain_gather'
+domain_refresh = 'domain_refresh'
+domain_stop    = 'domain_stop'
+
+domain_simulation = 'domain_simulation'
+
+# database backend keys
+database_window   = 'database_window'
+database_store    = 'database_store'
+database_long     = 'database_long'
+database_columnar = 'database_columnar'
+database_step     = 'step'
+
+database_counts    = 'counts'
+database_codes     = 'codes'
+database_location  = 'location_id'
+database_agent     = 'agent_code'
+database_attribute = 'attribute_code'
+database_value     = 'value_code'
+database_count     = 'count'
+database_column    = 'column'
+database_code      = 'code'
+database_name      = 'name'
+
+# derived genotype metric columns
+metric_total      = 'total'
+metric_percent    = 'percent'
+metric_hetero     = 'hetero'
+metric_proportion = 'proportion_{}'
+
+# plot downsampling methods
+downsample_min_max = 'min_max'
+downsample_lttb    = 'lttb'
+
 required_inputs = [max_gut, growth, init_num, init_mass, init_juvenile,
                    init_mature, init_plant, init_sex,
                    lifetime_female, lifetime_male, limited]
@@ -1,5 +1,6 @@
 import dataclasses  as dclass
 import collections  as collect
+import numpy        as np
 import numpy.random as rnd
 import scipy.stats  as stats
 
@@ -23,6 +24,9 @@ class Emigration(object):
         agent_keys: agent_keys for the population
 
     Methods:
+        population: get the population size
+        decisions:  decide which agents emigrate
+        remove:     emigrate agents using decisions
         emigration: run emigration
     """
 
@@ -32,42 +36,40 @@ class Emigration(object):
     sigma:      float
     agent_keys: hint.agent_keys
 
-    def _remove(self, population: int) -> bool:
+    def _probabilities(self, population: int) -> np.ndarray:
         """
-        Determine if the agent emigrates
+        Get the probability an agent emigrates for every population level
 
         Args:
             population: the current population of agents
 
         Returns:
-            if the agent migrates
+            array of probabilities indexed by the population level
         """
 
-        return rnd.random() <= stats.norm.cdf(population,
-                                              loc=self.mu, scale=self.sigma)
+        levels = np.arange(population + 1)
 
-    def _emigrate(self, agent:      hint.agent,
-                        population: int) -> int:
+        return stats.norm.cdf(levels, loc=self.mu, scale=self.sigma)
+
+    @staticmethod
+    def _die(population: hint.agent_list,
+             decisions:  hint.decisions) -> None:
         """
-        Determine if the adult agent emigrates
+        Emigrate the agents decided on
 
         Args:
-            agent:      the agent in question
-            population: the current population
+            population: the agents in the population
+            decisions:  if each agent in population emigrates
 
         Effects:
-            emigrates the agent or not
-
-        Returns:
-            new population
+            emigrates the agents decided on
         """
 
-        if self._remove(population):
-            agent.die(keyword.emigrate)
+        emigrants = [agent for agent, remove in zip(population, decisions)
+                     if remove]
 
-            return population - 1
-        else:
-            return population
+        for agent in emigrants:
+            agent.die(keyword.emigrate)
 
     def _agents(self, agents: hint.agents) -> hint.agent_list:
         """
@@ -86,6 +88,62 @@ class Emigration(object):
 
         return population
 
+    def population(self, agents: hint.agents) -> int:
+        """
+        Get the size of the current population
+
+        Args:
+            agents: the agents system
+
+        Returns:
+            the number of agents in the population
+        """
+
+        agent_bins = agents[self.location]
+
+        return sum(len(agent_bins[agent_key])
+                   for agent_key in self.agent_keys)
+
+    def decisions(self, population: int) -> hint.decisions:
+        """
+        Decide in turn if each agent of a population emigrates
+            - each emigration lowers the population for the next agent
+
+        Args:
+            population: the current population of agents
+
+        Returns:
+            list of if each agent emigrates
+        """
+
+        probabilities = self._probabilities(population).tolist()
+        draws         = rnd.random(population).tolist()
+
+        decisions = []
+        for draw in draws:
+            remove = draw <= probabilities[population]
+            decisions.append(remove)
+
+            if remove:
+                population -= 1
+
+        return decisions
+
+    def remove(self, agents:    hint.agents,
+                     decisions: hint.decisions) -> None:
+        """
+        Emigrate agents out of system using decisions made elsewhere
+
+        Args:
+            agents:    the space agents system
+            decisions: if each agent in population emigrates
+
+        Effects:
+            removes the agents which emigrate
+        """
+
+        self._die(self._agents(agents), decisions)
+
     def emigration(self, agents: hint.agents) -> None:
         """
         Emigrate agents out of system
@@ -98,10 +156,8 @@ class Emigration(object):
         """
 
         population = self._agents(agents)
-        pop        = len(population)
 
-        for agent in population:
-            pop = self._emigrate(agent, pop)
+        self._die(population, self.decisions(len(population)))
 
 
 class Emigrations(collect.UserList):
@@ -1,6 +1,5 @@
 import dataclasses  as dclass
 import collections  as collect
-import numpy.random as rnd
 import scipy.stats  as stats
 
 import source.hint    as hint
@@ -54,14 +53,12 @@ class Immigration(object):
             adds the egg_masses
         """
 
-        number = self._number()
-        for _ in range(number):
-            unique_id = simulation.new_unique_id()
-            new       = egg_mass.EggMass.setup(unique_id,
-                                               keyword.immigrant,
-                                               simulation,
-                                               self.genotype)
-            new.activate()
+        unique_id_nums = simulation.new_unique_ids(self._number())
+        new            = egg_mass.EggMass.batch_setup(unique_id_nums,
+                                                      keyword.immigrant,
+                                                      simulation,
+                                                      self.genotype)
+        egg_mass.EggMass.batch_activate(new)
 
     def _immigrate_larvae(self, simulation: hint.simulation) -> None:
         """
@@ -74,14 +71,12 @@ class Immigration(object):
             adds the larvae
         """
 
-        number = self._number()
-        for _ in range(number):
-            unique_id = simulation.new_unique_id()
-            new       = larva.Larva.setup(unique_id,
-                                          keyword.immigrant,
-                                          simulation,
-                                          self.genotype)
-            new.activate()
+        unique_id_nums = simulation.new_unique_ids(self._number())
+        new            = larva.Larva.batch_setup(unique_id_nums,
+                                                 keyword.immigrant,
+                                                 simulation,
+                                                 self.genotype)
+        larva.Larva.batch_activate(new)
 
     def _immigrate_pupae(self, simulation: hint.simulation) -> None:
         """
@@ -94,14 +89,12 @@ class Immigration(object):
             adds the pupae
         """
 
-        number = self._number()
-        for _ in range(number):
-            unique_id = simulation.new_unique_id()
-            new       = pupa.Pupa.setup(unique_id,
-                                        keyword.immigrant,
-                                        simulation,
-                                        self.genotype)
-            new.activate()
+        unique_id_nums = simulation.new_unique_ids(self._number())
+        new            = pupa.Pupa.batch_setup(unique_id_nums,
+                                               keyword.immigrant,
+                                               simulation,
+                                               self.genotype)
+        pupa.Pupa.batch_activate(new)
 
     def _immigrate_adults(self, simulation: hint.simulation) -> None:
         """
@@ -114,14 +107,12 @@ class Immigration(object):
             adds the adults
         """
 
-        number = self._number()
-        for _ in range(number):
-            unique_id = simulation.new_unique_id()
-            new       = adult.Adult.setup(unique_id,
-                                          keyword.immigrant,
-                                          simulation,
-                                          self.genotype)
-            new.activate()
+        unique_id_nums = simulation.new_unique_ids(self._number())
+        new            = adult.Adult.batch_setup(unique_id_nums,
+                                                 keyword.immigrant,
+                                                 simulation,
+                                                 self.genotype)
+        adult.Adult.batch_activate(new)
 
     def _immigrate_pregnant(self, simulation: hint.simulation) -> None:
         """
@@ -134,20 +125,12 @@ class Immigration(object):
             adds the pregnant
         """
 
-        if self.genotype == keyword.hetero:
-            parents = [keyword.homo_r, keyword.homo_s]
-        else:
-            parents = [self.genotype, self.genotype]
-
-        number = self._number()
-        for _ in range(number):
-            rnd.shuffle(parents)
-            unique_id = simulation.new_unique_id()
-            new       = adult.Adult.setup(unique_id,
-                                          keyword.immigrant,
-                                          simulation,
-                                          parents[0], parents[1])
-            new.activate()
+        unique_id_nums = simulation.new_unique_ids(self._number())
+        new            = adult.Adult.batch_pregnant(unique_id_nums,
+                                                    keyword.immigrant,
+                                                    simulation,
+                                                    self.genotype)
+        adult.Adult.batch_activate(new)
 
     def immigration(self, simulation: hint.simulation) -> None:
         """
@@ -1,9 +1,10 @@
-import dataclasses  as dclass
-import numpy.random as rnd
+import dataclasses as dclass
 
 import source.hint    as hint
 import source.keyword as keyword
 
+import source.movement.rings as rings
+
 
 @dclass.dataclass
 class Adult(object):
@@ -14,7 +15,8 @@ class Adult(object):
         movement: mathematical function for how far adult moves
 
     Methods:
-        move: run the behavior
+        move:       run the behavior (number of sequential moves at once)
+        batch_move: run the behavior for a population
 
     Constructors:
         setup: setup class
@@ -28,18 +30,31 @@ class Adult(object):
 
         return self.movement is not None
 
-    def _distance(self, adult: hint.adult) -> float:
+    def __post_init__(self):
+        """Setup the move cache"""
+
+        self._samplers = {}
+
+    def _sampler(self, adult:  hint.adult,
+                       vertex: int) -> hint.ring_sampler:
         """
-        Get the distance the adult will move
+        Get the sampler of single moves from a vertex
 
         Args:
-            adult: the adult in question
+            adult:  the adult in question
+            vertex: the vertex moving from
 
         Returns:
-            the distance the adult can move
+            the ring sampler for the vertex
         """
 
-        return self.movement(adult.mass, adult.genotype)
+        if vertex not in self._samplers:
+            graph = adult.simulation.space[keyword.adult_level]
+            self._samplers[vertex] = \
+                rings.RingSampler.setup(graph.neighborhood[vertex],
+                                        self.movement.cdf)
+
+        return self._samplers[vertex]
 
     def _vertex(self, adult: hint.adult) -> int:
         """
@@ -52,28 +67,77 @@ class Adult(object):
             the vertex to move to
         """
 
-        distance = self._distance(adult)
-        kwargs = {keyword.upper: distance,
-                  keyword.lower: distance}
-        vertices = adult.vertices(**kwargs)
+        vertex = adult.location[keyword.adult_level]
 
-        return rnd.choice(list(vertices))
+        return int(self._sampler(adult, vertex).draw(1)[0])
 
-    def move(self, adult: hint.adult) -> None:
+    def _composite_vertex(self, adult:  hint.adult,
+                                number: int) -> int:
+        """
+        Get the vertex for adult to end at after a number of moves
+            - each move is drawn from the ring sampler of the vertex reached
+              by the moves before it
+
+        Args:
+            adult:  the adult in question
+            number: the number of moves
+
+        Returns:
+            the vertex to move to
+        """
+
+        vertex = adult.location[keyword.adult_level]
+        for _ in range(number):
+            vertex = int(self._sampler(adult, vertex).draw(1)[0])
+
+        return vertex
+
+    def move(self, adult:  hint.adult,
+                   number: int = 1) -> None:
         """
         Move the adult
 
         Args:
-            adult: the adult in question
+            adult:  the adult in question
+            number: the number of sequential moves to make
 
         Effects:
             moves the adult in space
         """
 
         if self._use_movement:
-            vertex = self._vertex(adult)
+            if number == 1:
+                vertex = self._vertex(adult)
+            else:
+                vertex = self._composite_vertex(adult, number)
             adult.transfer(vertex, keyword.adult_level)
 
+    def batch_move(self, adults: hint.agent_list) -> None:
+        """
+        Move a population of adults by single moves
+            - the adults starting on the same vertex are drawn together
+
+        Args:
+            adults: the adults in question
+
+        Effects:
+            moves the adults in space
+        """
+
+        if self._use_movement:
+            groups = {}
+            for adult in adults:
+                vertex = adult.location[keyword.adult_level]
+                if vertex not in groups:
+                    groups[vertex] = []
+                groups[vertex].append(adult)
+
+            for vertex, group in groups.items():
+                sampler  = self._sampler(group[0], vertex)
+                vertices = sampler.draw(len(group))
+                for adult, new in zip(group, vertices):
+                    adult.transfer(int(new), keyword.adult_level)
+
     @classmethod
     def setup(cls, **kwargs) -> 'Adult':
         """
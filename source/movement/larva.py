@@ -1,9 +1,10 @@
-import dataclasses  as dclass
-import numpy.random as rnd
+import dataclasses as dclass
 
 import source.hint    as hint
 import source.keyword as keyword
 
+import source.movement.rings as rings
+
 
 @dclass.dataclass
 class Larva(object):
@@ -14,7 +15,8 @@ class Larva(object):
         movement: mathematical function for how far larva moves
 
     Methods:
-        move: run the behavior
+        move:       run the behavior (number of sequential moves at once)
+        batch_move: run the behavior for a population
 
     Constructors:
         setup: setup class
@@ -28,18 +30,31 @@ class Larva(object):
 
         return self.movement is not None
 
-    def _distance(self, larva: hint.larva) -> float:
+    def __post_init__(self):
+        """Setup the move cache"""
+
+        self._samplers = {}
+
+    def _sampler(self, larva:  hint.larva,
+                       vertex: int) -> hint.ring_sampler:
         """
-        Get the distance the larva will move
+        Get the sampler of single moves from a vertex
 
         Args:
-            larva: the larva in question
+            larva:  the larva in question
+            vertex: the vertex moving from
 
         Returns:
-            the distance the larva can move
+            the ring sampler for the vertex
         """
 
-        return self.movement(larva.mass, larva.genotype)
+        if vertex not in self._samplers:
+            graph = larva.simulation.space[keyword.larva_level]
+            self._samplers[vertex] = \
+                rings.RingSampler.setup(graph.neighborhood[vertex],
+                                        self.movement.cdf)
+
+        return self._samplers[vertex]
 
     def _vertex(self, larva: hint.larva) -> int:
         """
@@ -52,28 +67,77 @@ class Larva(object):
             the vertex to move to
         """
 
-        distance = self._distance(larva)
-        kwargs = {keyword.upper: distance,
-                  keyword.lower: distance}
-        vertices = larva.vertices(**kwargs)
+        vertex = larva.location[keyword.larva_level]
 
-        return rnd.choice(list(vertices))
+        return int(self._sampler(larva, vertex).draw(1)[0])
 
-    def move(self, larva: hint.larva) -> None:
+    def _composite_vertex(self, larva:  hint.larva,
+                                number: int) -> int:
+        """
+        Get the vertex for larva to end at after a number of moves
+            - each move is drawn from the ring sampler of the vertex reached
+              by the moves before it
+
+        Args:
+            larva:  the larva in question
+            number: the number of moves
+
+        Returns:
+            the vertex to move to
+        """
+
+        vertex = larva.location[keyword.larva_level]
+        for _ in range(number):
+            vertex = int(self._sampler(larva, vertex).draw(1)[0])
+
+        return vertex
+
+    def move(self, larva:  hint.larva,
+                   number: int = 1) -> None:
         """
         Move the larva
 
         Args:
-            larva: the larva in question
+            larva:  the larva in question
+            number: the number of sequential moves to make
 
         Effects:
             moves the larva in space
         """
 
         if self._use_movement:
-            vertex = self._vertex(larva)
+            if number == 1:
+                vertex = self._vertex(larva)
+            else:
+                vertex = self._composite_vertex(larva, number)
             larva.transfer(vertex, keyword.larva_level)
 
+    def batch_move(self, larvae: hint.agent_list) -> None:
+        """
+        Move a population of larvae by single moves
+            - the larvae starting on the same vertex are drawn together
+
+        Args:
+            larvae: the larvae in question
+
+        Effects:
+            moves the larvae in space
+        """
+
+        if self._use_movement:
+            groups = {}
+            for larva in larvae:
+                vertex = larva.location[keyword.larva_level]
+                if vertex not in groups:
+                    groups[vertex] = []
+                groups[vertex].append(larva)
+
+            for vertex, group in groups.items():
+                sampler  = self._sampler(group[0], vertex)
+                vertices = sampler.draw(len(group))
+                for larva, new in zip(group, vertices):
+                    larva.transfer(int(new), keyword.larva_level)
+
     @classmethod
     def setup(cls, **kwargs) -> 'Larva':
         """
@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 import scipy.stats as stats
 
 import source.keyword as keyword
@@ -18,6 +19,7 @@ class Levy(models.Model):
 
     Methods:
         __call__: call the model
+        cdf:      cumulative distribution of the travel distance
 
     Constructors:
         setup: setup the model
@@ -41,6 +43,19 @@ class Levy(models.Model):
 
         return float(stats.pareto.rvs(self.shape, self.scale))
 
+    def cdf(self, distance: np.ndarray) -> np.ndarray:
+        """
+        Get the cumulative probability of the travel distances
+
+        Args:
+            distance: the travel distances
+
+        Returns:
+            probability of traveling at most the distances
+        """
+
+        return stats.pareto.cdf(distance, self.shape, self.scale)
+
 
 @dclass.dataclass
 class Larva(Levy):
@@ -0,0 +1,145 @@
+import dataclasses  as dclass
+import numpy        as np
+import numpy.random as rnd
+
+import source.hint as hint
+
+
+@dclass.dataclass
+class AliasTable(object):
+    """
+    Class to sample a discrete distribution in constant time (alias method)
+
+    Variables:
+        accept: probability of keeping the drawn column
+        alias:  the column to use when the drawn column is rejected
+
+    Methods:
+        draw: draw a number of samples
+
+    Constructors:
+        setup: setup class
+    """
+
+    accept: np.ndarray
+    alias:  np.ndarray
+
+    def __len__(self) -> int:
+        """Get the number of outcomes"""
+
+        return len(self.accept)
+
+    def draw(self, number: int) -> np.ndarray:
+        """
+        Draw a number of samples from the distribution
+
+        Args:
+            number: the number of samples
+
+        Returns:
+            array of outcome indices
+        """
+
+        columns = rnd.randint(len(self), size=number)
+        keep    = rnd.random(number) < self.accept[columns]
+
+        return np.where(keep, columns, self.alias[columns])
+
+    @classmethod
+    def setup(cls, weights: np.ndarray) -> 'AliasTable':
+        """
+        Setup the class
+
+        Args:
+            weights: the (unnormalized) weight of each outcome
+
+        Returns:
+            setup class
+        """
+
+        number = len(weights)
+        scaled = np.asarray(weights, dtype=float) * number/np.sum(weights)
+
+        accept = np.ones(number)
+        alias  = np.arange(number)
+
+        small = [index for index in range(number) if scaled[index] <  1.0]
+        large = [index for index in range(number) if scaled[index] >= 1.0]
+        while (len(small) > 0) and (len(large) > 0):
+            less = small.pop()
+            more = large.pop()
+
+            accept[less] = scaled[less]
+            alias[less]  = more
+
+            scaled[more] += scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+
+        return cls(accept, alias)
+
+
+@dclass.dataclass
+class RingSampler(object):
+    """
+    Class to sample the vertex reached by a random move from a vertex:
+        the move distance snaps to the closest ring around the vertex, so
+        a ring is drawn from its probability and then one of its vertices
+
+    Variables:
+        table:   alias table for the rings
+        members: the vertices of all the rings, ring after ring
+        starts:  index of the first vertex of each ring in members
+        sizes:   number of vertices in each ring
+
+    Methods:
+        draw: draw the vertices moved to
+
+    Constructors:
+        setup: setup class
+    """
+
+    table:   hint.alias_table
+    members: np.ndarray
+    starts:  np.ndarray
+    sizes:   np.ndarray
+
+    def draw(self, number: int) -> np.ndarray:
+        """
+        Draw the vertices reached by a number of moves
+
+        Args:
+            number: the number of moves
+
+        Returns:
+            array of vertices
+        """
+
+        rings   = self.table.draw(number)
+        offsets = (rnd.random(number) * self.sizes[rings]).astype(int)
+
+        return self.members[self.starts[rings] + offsets]
+
+    @classmethod
+    def setup(cls, neighborhood: hint.vertex_neighborhood,
+                   cdf:          hint.cdf) -> 'RingSampler':
+        """
+        Setup the class
+
+        Args:
+            neighborhood: the neighborhood of the start vertex
+            cdf:          cumulative distribution function of the distance
+
+        Returns:
+            setup class
+        """
+
+        rings, weights = neighborhood.rings(cdf)
+
+        sizes   = np.array([len(ring) for ring in rings])
+        starts  = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        members = np.array([vertex for ring in rings for vertex in ring])
+
+        return cls(AliasTable.setup(weights), members, starts, sizes)
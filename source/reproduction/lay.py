@@ -57,46 +57,30 @@ class Lay(object):
             return 0
 
 
-    def _check_density(self, adult:  hint.adult,
-                             number: int) -> bool:
+    def _number_laid(self, adult:  hint.adult,
+                           number: int) -> int:
         """
-        Check if density is low enough
+        Get the number of egg_masses successfully laid
 
         Args:
             adult:  the adult in question
             number: the local number of insects
 
         Returns:
-            the result of the model test
+            number of egg_masses laid before the density check first fails
         """
 
         if self._use_density:
-            return self.density(number, adult.mass, adult.genotype)
+            return self.density.chain(number,
+                                      adult.num_eggs,
+                                      adult.mass,
+                                      adult.genotype)
         else:
-            return True
-
-    def _lay_egg_mass(self, adult:  hint.adult,
-                            number: int) -> hint.egg_lay:
-        """
-        Try to lay an egg mass
-
-        Args:
-            adult:  the adult in question
-            number: the local number of insects
-
-        Returns:
-            eggs to lay
-        """
-
-        if self._check_density(adult, number):
-            adult.num_eggs -= 1
-            return [agent_egg_mass.EggMass.birth(adult)], number + 1, False
-        else:
-            return [], number, True
+            return adult.num_eggs
 
     def lay(self, adult: hint.adult) -> hint.egg_masses:
         """
-        Run loop to create egg_masses
+        Create the egg_masses
 
         Args:
             adult: the adult in question
@@ -105,19 +89,11 @@ class Lay(object):
             list of egg_masses
         """
 
-        number   = adult.population()
-        num_eggs = adult.num_eggs
-        stop_lay = False
+        number = self._number_laid(adult, adult.population())
 
-        egg_masses = []
-        for num in range(num_eggs):
-            if stop_lay:
-                break
-            else:
-                new, number, stop_lay = self._lay_egg_mass(adult, number)
-                egg_masses.extend(new)
+        adult.num_eggs -= number
 
-        return egg_masses
+        return agent_egg_mass.EggMass.births(adult, number)
 
     @classmethod
     def setup(cls, **kwargs) -> 'Lay':
@@ -1,10 +1,70 @@
 import dataclasses  as dclass
+import numpy        as np
 import numpy.random as rnd
 
 import source.hint    as hint
 import source.keyword as keyword
 
 
+@dclass.dataclass
+class Mates(object):
+    """
+    Class to hold the possible mates of an adult
+        - a mate is drawn by picking a bin weighted by its number of males,
+          then picking a male within the bin
+
+    Variables:
+        bins:   the male bins in range
+        counts: number of males in each bin
+        total:  number of males in range
+
+    Methods:
+        draw: draw a mate
+
+    Constructors:
+        setup: setup class
+    """
+
+    bins:   hint.bin_list
+    counts: np.ndarray
+    total:  int
+
+    def __len__(self) -> int:
+        return self.total
+
+    def draw(self) -> hint.adult:
+        """
+        Draw a mate
+
+        Returns:
+            a male in range
+        """
+
+        cumulative = np.cumsum(self.counts)
+
+        pick   = rnd.randint(self.total)
+        index  = int(np.searchsorted(cumulative, pick, side='right'))
+        member = pick - (cumulative[index] - self.counts[index])
+
+        return self.bins[index].agents[member]
+
+    @classmethod
+    def setup(cls, bins: hint.bin_list) -> 'Mates':
+        """
+        Setup the class
+
+        Args:
+            bins: the male bins in range
+
+        Returns:
+            setup class
+        """
+
+        counts = np.array([len(agent_bin) for agent_bin in bins], dtype=int)
+
+        return cls(bins, counts, int(np.sum(counts)))
+
+
 @dclass.dataclass
 class Mate(object):
     """
@@ -14,6 +74,9 @@ class Mate(object):
         mating: mathematical function for the encounter of mates
         radius: mathematical function for the radius mates can be found
 
+    Properties:
+        interacts: if the behavior couples adults together
+
     Methods:
         mate: run the behavior
 
@@ -24,6 +87,12 @@ class Mate(object):
     mating: hint.mating      = None
     radius: hint.mate_radius = None
 
+    @property
+    def interacts(self) -> bool:
+        """Determine if mating couples adults together"""
+
+        return self._use_mating
+
     @property
     def _use_mating(self) -> bool:
         """Determine if we can use mating"""
@@ -74,27 +143,27 @@ class Mate(object):
         return {keyword.upper: radius,
                 keyword.lower: 0}
 
-    def _mates(self, adult: hint.adult) -> hint.mates:
+    def _mates(self, adult: hint.adult) -> hint.mate_pool:
         """
-        Get a list of mates for cannibalism
+        Get the possible mates
 
         Args:
             adult: the adult in question
 
         Returns:
-            list of mates
+            possible mates
         """
 
-        return adult.mates(**self._bounds(adult))
+        return Mates.setup(adult.mate_bins(**self._bounds(adult)))
 
     def _encounter(self, adult: hint.adult,
-                         mates: hint.mates) -> bool:
+                         mates: hint.mate_pool) -> bool:
         """
         Determine if this adult mates
 
         Args:
             adult: the adult in question
-            mates: the list of possible mates
+            mates: the possible mates
 
         Returns:
             if this adult mates
@@ -116,7 +185,7 @@ class Mate(object):
         mates = self._mates(adult)
 
         if self._encounter(adult, mates):
-            mate = rnd.choice(mates)
+            mate = mates.draw()
             self._mate_with(adult, mate)
 
     def mate(self, adult: hint.adult) -> None:
@@ -19,6 +19,7 @@ class InitSex(models.Model):
 
     Methods:
         __call__: call the model
+        batch:    call the model for several adults
 
     Constructors:
         setup: setup the mathematical model
@@ -41,6 +42,21 @@ class InitSex(models.Model):
 
         return rnd.random() <= self.prob
 
+    def batch(self, genotype: str,
+                    number:   int) -> np.ndarray:
+        """
+        Call model to determine if each of several adults is female
+
+        Args:
+            genotype: the adults' genotype
+            number:   number of adults
+
+        Returns:
+            array of if each is female
+        """
+
+        return rnd.random(number) <= self.prob
+
 
 @dclass.dataclass
 class Mating(models.Model):
@@ -201,6 +217,7 @@ class Density(models.Model):
 
     Methods:
         __call__: call the model
+        chain:    call the model for a sequence of lays
     """
 
     model_key = keyword.density
@@ -237,3 +254,26 @@ class Density(models.Model):
         """
 
         return rnd.random() <= self._prob(number)
+
+    def chain(self, number:   int,
+                    tries:    int,
+                    mass:     float,
+                    genotype: str) -> int:
+        """
+        Determine how many sequential lays succeed, where each success adds
+            one to the number and the first failure stops laying:
+                P(at least k successes) = P(n)*P(n + 1)*...*P(n + k - 1)
+
+        Args:
+            number:   number of eggs and larvae
+            tries:    the maximum number of lays
+            mass:     mass of the adult
+            genotype: genotype of adult
+
+        Returns:
+            the number of successful lays
+        """
+
+        survival = np.cumprod(self._prob(number + np.arange(tries)))
+
+        return int(np.count_nonzero(survival >= rnd.random()))
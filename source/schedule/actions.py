@@ -1,7 +1,8 @@
 import collections as collect
 import dataclasses as dclass
 
-import source.hint as hint
+import source.hint    as hint
+import source.keyword as keyword
 
 
 @dclass.dataclass
@@ -13,7 +14,9 @@ class Action(object):
         action_key: string for method to perform
 
     Methods:
-        perform: run the action
+        perform:       run the action
+        compile:       get the behavior for a type of agent
+        compile_batch: get the whole population behavior for a type of agent
     """
 
     action: str
@@ -31,6 +34,35 @@ class Action(object):
 
         return getattr(agent, self.action)()
 
+    def compile(self, agent_type: type) -> hint.behavior:
+        """
+        Compile the action into a behavior for the type of agent
+
+        Args:
+            agent_type: the class of the agents performing the action
+
+        Returns:
+            the unbound method of the agent class
+        """
+
+        return getattr(agent_type, self.action)
+
+    def compile_batch(self, agent_type: type) -> hint.batch_behavior:
+        """
+        Compile the action into a whole population behavior for the type of
+            agent
+
+        Args:
+            agent_type: the class of the agents performing the action
+
+        Returns:
+            the population method of the agent class (None if not supported)
+        """
+
+        batch_key = '{}{}'.format(keyword.batch, self.action)
+
+        return getattr(agent_type, batch_key, None)
+
     
 class Actions(collect.UserList):
     """
@@ -41,10 +73,17 @@ class Actions(collect.UserList):
             index: index of action
             value: action to perform
 
-        agent_key: key for agent that will do the actions
+        agent_key:    key for agent that will do the actions
+        plans:        compiled behaviors by type of agent
+        batch_plans:  compiled population behaviors by type of agent
 
     Methods:
-        perform: run the actions
+        plan:       get the compiled behaviors
+        batch_plan: get the compiled population behaviors
+        fusible:    if repeats of the actions can be performed at once
+        reads:      the agent types whose locations the actions read
+        perform:    run the actions
+        run:        run the actions on a list of agents
 
     Constructors:
         setup: setup the actions
@@ -56,6 +95,86 @@ class Actions(collect.UserList):
 
         self.agent_key = agent_key
 
+        self.plans       = {}
+        self.batch_plans = {}
+
+    def plan(self, agent_type: type) -> hint.plan:
+        """
+        Get the behaviors of the actions compiled for the type of agent
+
+        Args:
+            agent_type: the class of the agents performing the actions
+
+        Returns:
+            tuple of behaviors in order of performance
+        """
+
+        if agent_type not in self.plans:
+            self.plans[agent_type] = tuple(action.compile(agent_type)
+                                           for action in self)
+
+        return self.plans[agent_type]
+
+    def batch_plan(self, agent_type: type) -> hint.batch_plan:
+        """
+        Get the population behaviors of the actions compiled for the type
+            of agent
+
+        Args:
+            agent_type: the class of the agents performing the actions
+
+        Returns:
+            tuple of behaviors in order of performance
+                (None if any action lacks a population behavior)
+        """
+
+        if agent_type not in self.batch_plans:
+            behaviors = tuple(action.compile_batch(agent_type)
+                              for action in self)
+
+            if None in behaviors:
+                self.batch_plans[agent_type] = None
+            else:
+                self.batch_plans[agent_type] = behaviors
+
+        return self.batch_plans[agent_type]
+
+    def fusible(self, agent: hint.agent) -> bool:
+        """
+        Determine if repeats of all the actions can be performed at once
+            for agents like this one
+
+        Args:
+            agent: a representative agent performing the actions
+
+        Returns:
+            if all the actions can be fused
+        """
+
+        for action in self:
+            if not agent.fusible(action.action):
+                return False
+
+        return True
+
+    def reads(self, agent: hint.agent) -> set:
+        """
+        Get the agent types whose locations the actions read
+            for agents like this one
+
+        Args:
+            agent: a representative agent performing the actions
+
+        Returns:
+            the agent types read
+        """
+
+        agent_keys = set()
+        for action in self:
+            agent_keys.update(agent.reads(action.action))
+
+        return agent_keys
+
     def perform(self, agent: hint.agent) -> hint.agent_list:
         """
         Perform the all the actions on the agent
@@ -73,6 +192,52 @@ class Actions(collect.UserList):
 
         return results
 
+    def run(self, agents: hint.agent_list,
+                  sink:   hint.agent_list,
+                  batch:  bool = False,
+                  number: int  = 1) -> None:
+        """
+        Perform all the actions on the agents
+            - agents of a single agent_key share a type
+
+        Args:
+            agents: the agents to perform the actions
+            sink:   list of agents to add to simulation
+            batch:  if we use the population behaviors when available
+            number: number of repeats fused into each action
+
+        Effects:
+            performs the actions
+            extends sink by agents to add to simulation
+        """
+
+        if not agents:
+            return
+
+        agent_type = type(agents[0])
+
+        if number > 1:
+            behaviors = self.plan(agent_type)
+            for agent in agents:
+                for behavior in behaviors:
+                    sink.extend(behavior(agent, number))
+
+            return
+
+        if batch:
+            behaviors = self.batch_plan(agent_type)
+
+            if behaviors is not None:
+                for behavior in behaviors:
+                    behavior(agents, sink)
+
+                return
+
+        behaviors = self.plan(agent_type)
+        for agent in agents:
+            for behavior in behaviors:
+                sink.extend(behavior(agent))
+
     @classmethod
     def setup(cls, agent_key: str,
                    actions:   hint.action_keys) -> 'Actions':
@@ -0,0 +1,95 @@
+import collections as collect
+import numpy       as np
+
+import source.hint as hint
+
+
+class Calendar(collect.UserDict):
+    """
+    Class to contain the queue of events for the immobile agents
+        - each agent has its next event sampled once when scheduled
+
+    Variables:
+        - dict:
+            key:   day of the event
+            value: list of (agent, days, event_key) for that day
+
+        day: the current day of the calendar
+
+    Methods:
+        schedule: schedule the next event for the agent
+        perform:  have all the events for the current day happen
+        merge:    add the events of another calendar
+
+    Constructors:
+        empty: create an empty calendar
+    """
+
+    def __init__(self, events: hint.events,
+                       day:    int = 0):
+        super().__init__(events)
+
+        self.day = day
+
+    def schedule(self, agent: hint.agent) -> None:
+        """
+        Schedule the next event for the agent
+
+        Args:
+            agent: the agent to schedule
+
+        Effects:
+            adds the agent's event to the calendar (if it has one)
+        """
+
+        days, event_key = agent.event()
+
+        if np.isfinite(days):
+            days = int(days)
+            day  = self.day + days
+
+            if day not in self.data:
+                self.data[day] = []
+            self.data[day].append((agent, days, event_key))
+
+    def perform(self) -> None:
+        """
+        Have all the events for the current day happen
+
+        Effects:
+            fires the events for the current day
+            advances the day of the calendar
+        """
+
+        events = self.data.pop(self.day, [])
+        for agent, days, event_key in events:
+            agent.fire(days, event_key)
+
+        self.day += 1
+
+    def merge(self, events: hint.events) -> None:
+        """
+        Add the events of another calendar to this one
+
+        Args:
+            events: the events of the other calendar
+
+        Effects:
+            adds the events to the calendar
+        """
+
+        for day, day_events in events.items():
+            if day not in self.data:
+                self.data[day] = []
+            self.data[day].extend(day_events)
+
+    @classmethod
+    def empty(cls) -> 'Calendar':
+        """
+        Create an empty calendar
+
+        Returns:
+            an empty calendar
+        """
+
+        return cls({})
@@ -1,8 +1,10 @@
 import collections as collect
 
-import source.hint as hint
+import source.hint    as hint
+import source.keyword as keyword
 
-import source.schedule.step as agent_step
+import source.schedule.calendar as agent_calendar
+import source.schedule.step     as agent_step
 
 
 class Schedule(collect.UserList):
@@ -12,11 +14,33 @@ class Schedule(collect.UserList):
     Variables:
         - list:
             list in order of the steps needed
+
+        calendar: event calendar for immobile agents (None if not in use)
+        exchange: called after each repeat of a step (None if not in use)
     """
 
-    def __init__(self, steps: hint.steps):
+    def __init__(self, steps:    hint.steps,
+                       calendar: hint.calendar = None,
+                       exchange: hint.exchange = None):
         super().__init__(steps)
 
+        self.calendar = calendar
+        self.exchange = exchange
+
+    def register(self, agent: hint.agent) -> None:
+        """
+        Register an agent with the event calendar
+
+        Args:
+            agent: the agent to register
+
+        Effects:
+            schedules the agent's next event (if calendar in use)
+        """
+
+        if self.calendar is not None:
+            self.calendar.schedule(agent)
+
     def _perform(self, space:  hint.space,
                        agents: hint.agents) -> hint.agent_list:
         """
@@ -32,7 +56,7 @@ class Schedule(collect.UserList):
 
         results = []
         for step in self:
-            results += step.perform(space, agents)
+            step.perform(space, agents, results, self.exchange)
 
         return results
 
@@ -62,19 +86,26 @@ class Schedule(collect.UserList):
 
         Effects:
             run a new step
+            fire the calendar events (if calendar in use)
             add the new agents
         """
 
         results = self._perform(space, agents)
+
+        if self.calendar is not None:
+            self.calendar.perform()
+
         self._activate(results)
 
     @classmethod
-    def setup(cls, step_tuples: hint.step_tuples) -> 'Schedule':
+    def setup(cls, step_tuples: hint.step_tuples,
+                   calendar:    bool = False) -> 'Schedule':
         """
         Create a schedule of steps
 
         Args:
             step_tuples: list in order of the steps to schedule
+            calendar:    if immobile agents use the event calendar
 
         Returns:
             a setup schedule
@@ -83,6 +114,11 @@ class Schedule(collect.UserList):
         steps = []
         for step_tuple in step_tuples:
             new_step = agent_step.Step.setup(*step_tuple)
+            if calendar:
+                new_step.exclude(keyword.calendar_keys)
             steps.append(new_step)
 
-        return cls(steps)
+        if calendar:
+            return cls(steps, agent_calendar.Calendar.empty())
+        else:
+            return cls(steps)
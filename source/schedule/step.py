@@ -1,5 +1,5 @@
 import collections  as collect
-import itertools    as i_tools
+import heapq
 import numpy.random as rnd
 
 import joblib          as para
@@ -27,6 +27,7 @@ class Step(collect.UserList):
         parallel_reg:    if we perform actions in parallel by agents
         parallel_loc:    if we perform actions in parallel via locations
         level:           level we group agents by
+        batch:           if we use population behaviors when available
     """
 
     def __init__(self, actions:         hint.actions_list,
@@ -35,7 +36,8 @@ class Step(collect.UserList):
                        shuffle_actions: bool = False,
                        parallel_reg:    bool = False,
                        parallel_loc:    bool = False,
-                       level:           int  = 0):
+                       level:           int  = 0,
+                       batch:           bool = False):
         super().__init__(actions)
 
         self.number = number
@@ -47,204 +49,359 @@ class Step(collect.UserList):
         self.parallel_loc = parallel_loc
 
         self.level = level
+        self.batch = batch
 
-    @staticmethod
-    def _perform_agent_action_regular(action: hint.actions,
-                                      agents: hint.agent_list) \
-            -> hint.agent_list:
+    def exclude(self, agent_keys: hint.agent_keys) -> None:
+        """
+        Exclude the actions for the agent types from the step
+
+        Args:
+            agent_keys: the agent types to exclude
+
+        Effects:
+            removes the actions for those agent types
+        """
+
+        self.data = [action for action in self
+                     if action.agent_key not in agent_keys]
+
+    def _perform_agent_action_regular(self, action: hint.actions,
+                                            agents: hint.agent_list,
+                                            sink:   hint.agent_list,
+                                            number: int = 1) -> None:
         """
         Perform the specific action on the agents
 
         Args:
             action: action to perform
             agents: list of agents to use
+            sink:   list of agents to add in
+            number: number of repeats fused into the action
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the action on the agents
+            extends sink by agents to add in
         """
 
-        results = []
-        for agent in agents:
-            results += action.perform(agent)
-
-        return results
+        action.run(agents, sink, self.batch, number)
 
     def _perform_agent_action_parallel(self, action: hint.actions,
-                                             agents: hint.agent_list) \
-            -> hint.agent_list:
+                                             agents: hint.agent_list,
+                                             sink:   hint.agent_list,
+                                             number: int = 1) -> None:
         """
         Perform the specific action on the agents in parallel by agent
 
         Args:
             action: action to perform
             agents: list of agents to use
+            sink:   list of agents to add in
+            number: number of repeats fused into the action
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the action on the agents
+            extends sink by agents to add in
         """
 
-        def step(agent: hint.agent_list) -> hint.agent_list:
+        def step(agent: hint.agent_list) -> None:
             """
             Create a loop function to parallelize actions
 
             Args:
                 agent: sub_list of agents
 
-            Returns:
-                list of agents to add in
+            Effects:
+                performs the action on the sub_list of agents
             """
 
-            return self._perform_agent_action_regular(action, agent)
+            self._perform_agent_action_regular(action, agent, sink, number)
 
         n      = num_cpu
         splits = [agents[i::n] for i in range(n)]
-        # values = para.Parallel(n_jobs=n, require='sharedmem')(
-        values = para.Parallel(n_jobs=n, prefer='threads')(
+        # para.Parallel(n_jobs=n, require='sharedmem')(
+        para.Parallel(n_jobs=n, prefer='threads')(
                 para.delayed(step)(ags) for ags in splits)
 
-        return list(i_tools.chain.from_iterable(values))
+    def _reads(self, agents: hint.agents) -> set:
+        """
+        Get the agent types whose locations the actions of the step read
+            - decided once for the step from any agent of each type
+
+        Args:
+            agents: the agent storage system
+
+        Returns:
+            the agent types read
+        """
+
+        agent_keys = set()
+        for action in self:
+            population = agents.agents(action.agent_key)
+            if len(population) > 0:
+                agent_keys.update(action.reads(population[0]))
+
+        return agent_keys
+
+    def _fused(self, action: hint.actions,
+                     agents: hint.agents,
+                     read:   set) -> bool:
+        """
+        Determine if the repeats of the action are fused
+            - decided once for the step from any agent of the type
+            - never if the step reads the locations of the type, as the
+              fused repeats move all of them before the other actions run
+
+        Args:
+            action: action to perform
+            agents: the agent storage system
+            read:   the agent types whose locations the step reads
+
+        Returns:
+            if the action is performed for all repeats at once
+        """
+
+        if self.number > 1 and action.agent_key not in read:
+            population = agents.agents(action.agent_key)
+
+            return (len(population) > 0) and action.fusible(population[0])
+        else:
+            return False
 
     def _perform_agent_action(self, action:    hint.actions,
-                                    agent_bin: hint.agents_bin) \
-            -> hint.agent_list:
+                                    agent_bin: hint.agents_bin,
+                                    sink:      hint.agent_list,
+                                    number:    int = 1) -> None:
         """
         Perform the specific action on the agent_bin
 
         Args:
             action:    action to perform
             agent_bin: agent bin to use
+            sink:      list of agents to add in
+            number:    number of repeats fused into the action
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the action on the agents in the bin
+            extends sink by agents to add in
         """
 
-        agents: hint.agent_list = agent_bin[action.agent_key].agents.copy()
+        agents: hint.agent_list = agent_bin[action.agent_key].agents
 
         if self.shuffle_agents:
             rnd.shuffle(agents)
 
         if self.parallel_reg:
-            return self._perform_agent_action_parallel(action, agents)
+            self._perform_agent_action_parallel(action, agents, sink, number)
         else:
-            return self._perform_agent_action_regular( action, agents)
+            self._perform_agent_action_regular( action, agents, sink, number)
 
     def _perform_actions_step(self, location_key: hint.location_key,
-                                    agents:       hint.agents) \
-            -> hint.agent_list:
+                                    agents:       hint.agents,
+                                    sink:         hint.agent_list,
+                                    actions:      hint.actions_list,
+                                    number:       int = 1) -> None:
         """
         Perform all the actions at the specific location
 
         Args:
             location_key: the location to do step
             agents:       the agent storage system
+            sink:         list of agents to add in
+            actions:      the actions to perform
+            number:       number of repeats fused into the actions
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the actions at the location
+            extends sink by agents to add in
         """
 
         agent_bin = agents[location_key]
 
-        results = []
-        for action in self:
-            results += self._perform_agent_action(action, agent_bin)
-
-        return results
+        for action in actions:
+            self._perform_agent_action(action, agent_bin, sink, number)
 
     def _perform_regular_step(self, location_keys: hint.location_keys,
-                                    agents:        hint.agents) \
-            -> hint.agent_list:
+                                    agents:        hint.agents,
+                                    sink:          hint.agent_list,
+                                    actions:       hint.actions_list) -> None:
         """
         Perform a single step on the agents divided by each location_key
+            - the locations are visited in space order, and occupancy is
+              checked when each location is reached
+            - a location an agent moves into ahead of the current one is
+              added to the locations to visit
 
         Args:
-            location_keys: the list of location keys
+            location_keys: the occupied location keys in space order
             agents:        the agent storage system
+            sink:          list of agents to add in
+            actions:       the actions to perform
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the actions at each occupied location
+            extends sink by agents to add in
         """
 
-        results = []
-        for location_key in location_keys:
-            results += self._perform_actions_step(location_key, agents)
+        agent_keys = [action.agent_key for action in actions]
+
+        worklist = list(location_keys)
+        queued   = set(worklist)
+        heapq.heapify(worklist)
+
+        entered = agents.watch(self.level, agent_keys)
+        while len(worklist) > 0:
+            location_key = heapq.heappop(worklist)
+            if agents.occupies(self.level, agent_keys, location_key):
+                self._perform_actions_step(location_key, agents, sink,
+                                           actions)
 
-        return results
+            for key in entered:
+                if (key > location_key) and (key not in queued):
+                    queued.add(key)
+                    heapq.heappush(worklist, key)
+            entered.clear()
+        agents.unwatch()
 
     def _perform_parallel_step(self, location_keys: hint.location_keys,
-                                     agents:        hint.agents) \
-            -> hint.agent_list:
+                                     agents:        hint.agents,
+                                     sink:          hint.agent_list,
+                                     actions:       hint.actions_list) -> None:
         """
         Perform a single step on the agents if in parallel
+            - the locations have no order across the processes, so the
+              locations agents moved into are visited in further rounds
 
         Args:
-            location_keys: the list of location keys
+            location_keys: the occupied location keys in space order
             agents:        the agent storage system
+            sink:          list of agents to add in
+            actions:       the actions to perform
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs the actions at each occupied location
+            extends sink by agents to add in
         """
 
-        def step(keys: hint.location_keys) -> hint.agent_list:
+        agent_keys = [action.agent_key for action in actions]
+
+        def step(keys: hint.location_keys) -> None:
             """
             Create a loop function to parallelize actions
 
             Args:
                 keys: sub_list of location keys
 
-            Returns:
-                list of agents to add in
+            Effects:
+                performs the actions at the sub_list of locations
             """
 
-            return self._perform_regular_step(keys, agents)
-
-        n      = num_cpu
-        splits = [location_keys[i::n].copy() for i in range(n)]
-        values = para.Parallel(n_jobs=n, require='sharedmem')(
-            para.delayed(step)(loc_keys) for loc_keys in splits)
-
-        return list(i_tools.chain.from_iterable(values))
-
-    def _perform_step(self, space:  hint.space,
-                            agents: hint.agents) -> hint.agent_list:
+            for location_key in keys:
+                if agents.occupies(self.level, agent_keys, location_key):
+                    self._perform_actions_step(location_key, agents, sink,
+                                               actions)
+
+        n       = num_cpu
+        visited = set()
+        entered = agents.watch(self.level, agent_keys)
+        while len(location_keys) > 0:
+            visited.update(location_keys)
+
+            splits = [location_keys[i::n] for i in range(n)]
+            para.Parallel(n_jobs=n, require='sharedmem')(
+                para.delayed(step)(loc_keys) for loc_keys in splits)
+
+            location_keys = sorted(set(entered) - visited)
+            entered.clear()
+        agents.unwatch()
+
+    def _perform_step(self, space:   hint.space,
+                            agents:  hint.agents,
+                            sink:    hint.agent_list,
+                            actions: hint.actions_list) -> None:
         """
         Perform a single repeat of actions
 
         Args:
-            space:  the space system
-            agents: the agent storage system
-
-        Returns:
-            list of agents to add in
+            space:   the space system
+            agents:  the agent storage system
+            sink:    list of agents to add in
+            actions: the actions to perform
+
+        Effects:
+            performs a repeat of the actions
+            extends sink by agents to add in
         """
 
         if self.shuffle_actions:
-            rnd.shuffle(self)
+            rnd.shuffle(actions)
 
-        location_keys = space.location_keys[self.level]
+        agent_keys    = [action.agent_key for action in actions]
+        location_keys = agents.occupied_keys(self.level, agent_keys)
 
         if self.parallel_loc:
-            return self._perform_parallel_step(location_keys, agents)
+            self._perform_parallel_step(location_keys, agents, sink, actions)
         else:
-            return self._perform_regular_step(location_keys, agents)
+            self._perform_regular_step(location_keys, agents, sink, actions)
 
-    def perform(self, space:  hint.space,
-                      agents: hint.agents) -> hint.agent_list:
+    def _perform_fused(self, agents:  hint.agents,
+                             sink:    hint.agent_list,
+                             actions: hint.actions_list) -> None:
         """
-        Perform all the steps on the agents
+        Perform all the repeats of the fused actions at once
+            - the agents do not interact and no other action reads where
+              they are, so each whole population is run from the master
+              location, before any agent has moved
 
         Args:
-            space:  the space system
-            agents: the agent storage system
+            agents:  the agent storage system
+            sink:    list of agents to add in
+            actions: the fused actions
 
-        Returns:
-            list of agents to add in
+        Effects:
+            performs all the repeats of the actions
+            extends sink by agents to add in
+        """
+
+        self._perform_actions_step((0,), agents, sink, actions, self.number)
+
+    def perform(self, space:    hint.space,
+                      agents:   hint.agents,
+                      sink:     hint.agent_list,
+                      exchange: hint.exchange = None) -> None:
         """
+        Perform all the steps on the agents
+            - actions with no interactions between agents, whose agents'
+              locations no action reads, have all their repeats fused into
+              a single aggregated action
+
+        Args:
+            space:    the space system
+            agents:   the agent storage system
+            sink:     list of agents to add in
+            exchange: called after each repeat (if given)
+
+        Effects:
+            performs all the repeats of the actions
+            extends sink by agents to add in
+        """
+
+        read    = self._reads(agents)
+        fused   = []
+        actions = []
+        for action in self:
+            if self._fused(action, agents, read):
+                fused.append(action)
+            else:
+                actions.append(action)
+
+        if len(fused) > 0:
+            self._perform_fused(agents, sink, fused)
 
-        results = []
         for _ in range(self.number):
-            results += self._perform_step(space, agents)
+            self._perform_step(space, agents, sink, actions)
 
-        return results
+            if exchange is not None:
+                exchange()
 
     @classmethod
     def setup(cls, actions:         hint.actions_dict,
@@ -253,7 +410,8 @@ class Step(collect.UserList):
                    shuffle_actions: bool = False,
                    parallel_reg:    bool = False,
                    parallel_loc:    bool = False,
-                   level:           int  = 0) -> 'Step':
+                   level:           int  = 0,
+                   batch:           bool = False) -> 'Step':
         """
         Setup the entire step
 
@@ -265,6 +423,7 @@ class Step(collect.UserList):
             parallel_reg:    if we parallelize on agents
             parallel_loc:    if we parallelize on locations
             level:           locations to split across
+            batch:           if we use population behaviors when available
 
         Returns:
             A setup simulation step
@@ -280,4 +439,4 @@ class Step(collect.UserList):
             actions_list.append(new_action)
 
         return cls(actions_list, number, shuffle_agents, shuffle_actions,
-                   parallel_reg, parallel_loc, level)
+                   parallel_reg, parallel_loc, level, batch)
@@ -0,0 +1,791 @@
+import dataclasses     as dclass
+import io
+import multiprocessing as multi
+import numpy.random    as rnd
+import pickle          as pk
+
+import source.hint    as hint
+import source.keyword as keyword
+
+import source.agents.adult as adult
+
+
+class DomainError(Exception):
+    """Error in a domain worker"""
+
+
+class Pickler(pk.Pickler):
+    """
+    Class to pickle agents for transfer between domain workers
+        - the simulation and its behaviors are shared by every worker, so
+          they are pickled by reference
+
+    Variables:
+        simulation: the simulation of the worker
+        links:      table of behavior names by id
+
+    Methods:
+        persistent_id: get the reference for a shared object
+
+    Constructors:
+        dumps: pickle an object to bytes
+    """
+
+    def __init__(self, file,
+                       simulation: hint.simulation):
+        super().__init__(file, protocol=pk.HIGHEST_PROTOCOL)
+
+        self.simulation = simulation
+        self.links      = {}
+        for field in dclass.fields(simulation.behaviors):
+            behavior = getattr(simulation.behaviors, field.name)
+            if behavior is not None:
+                self.links[id(behavior)] = field.name
+
+    def persistent_id(self, obj):
+        """
+        Get the reference for a shared object
+
+        Args:
+            obj: object being pickled
+
+        Returns:
+            the reference of the object, None if not shared
+        """
+
+        if obj is self.simulation:
+            return keyword.domain_simulation
+        else:
+            return self.links.get(id(obj))
+
+    @classmethod
+    def dumps(cls, obj,
+                   simulation: hint.simulation) -> bytes:
+        """
+        Pickle an object for transfer
+
+        Args:
+            obj:        the object to pickle
+            simulation: the simulation of the worker
+
+        Returns:
+            the pickled object
+        """
+
+        file = io.BytesIO()
+        cls(file, simulation).dump(obj)
+
+        return file.getvalue()
+
+
+class Unpickler(pk.Unpickler):
+    """
+    Class to unpickle agents transferred between domain workers
+
+    Variables:
+        simulation: the simulation of the worker
+
+    Methods:
+        persistent_load: get a shared object from its reference
+
+    Constructors:
+        loads: unpickle an object from bytes
+    """
+
+    def __init__(self, file,
+                       simulation: hint.simulation):
+        super().__init__(file)
+
+        self.simulation = simulation
+
+    def persistent_load(self, pid):
+        """
+        Get a shared object from its reference
+
+        Args:
+            pid: the reference of the object
+
+        Returns:
+            the shared object
+        """
+
+        if pid == keyword.domain_simulation:
+            return self.simulation
+        else:
+            return getattr(self.simulation.behaviors, pid)
+
+    @classmethod
+    def loads(cls, data:       bytes,
+                   simulation: hint.simulation):
+        """
+        Unpickle a transferred object
+
+        Args:
+            data:       the pickled object
+            simulation: the simulation of the worker
+
+        Returns:
+            the object
+        """
+
+        return cls(io.BytesIO(data), simulation).load()
+
+
+@dclass.dataclass
+class Ghost(adult.Adult):
+    """
+    Class to contain a copy of a male owned by another domain block
+        - inherits from adult class
+        - ghosts are only visible as mates, they never act
+
+    Variables:
+        mated: if the ghost has mated
+
+    Methods:
+        set_mate: set the mate for ghost
+        withdraw: remove the ghost from its bin
+
+    Constructors:
+        copy: copy a male into a ghost
+    """
+
+    mated: bool = False
+
+    def set_mate(self, mate: hint.adult) -> None:
+        """
+        Set the mate for ghost
+
+        Args:
+            mate: the mate for the ghost
+
+        Effects:
+            marks the ghost as mated
+            withdraws ghost if it can no longer mate
+        """
+
+        self.mated = True
+
+        if self.simulation.models[keyword.lifetime_male] or \
+                self.simulation.models[keyword.limited]:
+            self.withdraw()
+
+    def withdraw(self) -> None:
+        """
+        Remove the ghost from its bin
+
+        Effects:
+            removes the ghost without counting it
+        """
+
+        self.simulation.agents.withdraw(self)
+
+    @classmethod
+    def copy(cls, male: hint.adult) -> 'Ghost':
+        """
+        Copy a male into a ghost
+
+        Args:
+            male: the male to copy
+
+        Returns:
+            a ghost of the male
+        """
+
+        values = {field.name: getattr(male, field.name)
+                  for field in dclass.fields(adult.Adult)}
+        values['location'] = male.location.copy()
+
+        return cls(**values)
+
+
+class Block(object):
+    """
+    Class to run a block of the field in a worker process
+
+    Variables:
+        index:      index of the block
+        simulation: the worker's copy of the simulation
+        owner:      block owning each vertex
+        halos:      vertices within mating range of each other block
+        inboxes:    queue of transfers to each block
+        commands:   queue of commands from the domain
+        results:    queue of results to the domain
+        ghosts:     ghosts of the other blocks' males
+
+    Methods:
+        owns:     determine if block owns a location
+        exchange: exchange the agents with the other blocks
+        step:     advance the block forward one step
+        gather:   pickle the block's agents for the domain
+        run:      run commands from the domain
+
+    Constructors:
+        work: setup a block and run it
+    """
+
+    def __init__(self, index:      int,
+                       simulation: hint.simulation,
+                       owner:      hint.owner,
+                       halos:      hint.halos,
+                       inboxes:    hint.queues,
+                       commands,
+                       results):
+        self.index      = index
+        self.simulation = simulation
+        self.owner      = owner
+        self.halos      = halos
+        self.inboxes    = inboxes
+        self.commands   = commands
+        self.results    = results
+
+        self.ghosts: hint.ghosts = []
+
+        self._round   = 0
+        self._pending = {}
+
+    def owns(self, location_key: hint.location_key) -> bool:
+        """
+        Determine if block owns the location
+
+        Args:
+            location_key: key of the location
+
+        Returns:
+            if the block owns the location
+        """
+
+        if len(location_key) > keyword.adult_level:
+            return self.owner[location_key[keyword.adult_level]] == self.index
+        else:
+            return True
+
+    def _localize(self) -> None:
+        """
+        Reduce the simulation down to the block
+
+        Effects:
+            removes the agents outside the block
+            has the schedule exchange agents after each repeat
+        """
+
+        simulation = self.simulation
+        for agent in self._foreign():
+            simulation.agents.release(agent)
+            agent.alive = False
+
+        simulation.schedule.exchange = self.exchange
+
+    def _foreign(self) -> hint.agent_list:
+        """
+        Get the agents at locations owned by other blocks
+
+        Returns:
+            list of foreign agents
+        """
+
+        agents = []
+        for location_key, agents_bin in self.simulation.agents.items():
+            if len(location_key) == keyword.adult_depth and \
+                    not self.owns(location_key):
+                for agent_bin in agents_bin.values():
+                    agents.extend(agent_bin.agents)
+
+        return agents
+
+    def _clear(self) -> hint.mated:
+        """
+        Clear out the ghosts
+
+        Returns:
+            unique_ids of the mated ghosts for each block
+
+        Effects:
+            removes all ghosts
+        """
+
+        mated = {block: [] for block in self.halos}
+        for ghost in self.ghosts:
+            ghost.withdraw()
+            if ghost.mated:
+                block = self.owner[ghost.location[keyword.adult_level]]
+                mated[block].append(ghost.unique_id)
+
+        self.ghosts = []
+
+        return mated
+
+    def _parcels(self, mated: hint.mated) -> hint.parcels:
+        """
+        Create the parcels to send to the other blocks
+
+        Args:
+            mated: unique_ids of the mated ghosts for each block
+
+        Returns:
+            parcel of agents for each block
+
+        Effects:
+            releases the foreign agents
+        """
+
+        parcels = {block: ([], mated[block], []) for block in self.halos}
+
+        agents = self.simulation.agents
+        for agent in self._foreign():
+            agents.release(agent)
+            block = self.owner[agent.location[keyword.adult_level]]
+            parcels[block][0].append(agent)
+
+        for block, vertices in self.halos.items():
+            for vertex in vertices:
+                for male in agents[(0, vertex)][keyword.male].agents:
+                    parcels[block][2].append(Ghost.copy(male))
+
+        return parcels
+
+    def _receive(self) -> bytes:
+        """
+        Receive a transfer for the current round
+
+        Returns:
+            a pickled parcel
+        """
+
+        while not self._pending.get(self._round):
+            round_num, data = self.inboxes[self.index].get()
+            if round_num not in self._pending:
+                self._pending[round_num] = []
+            self._pending[round_num].append(data)
+
+        return self._pending[self._round].pop()
+
+    def _accept(self, parcel: hint.parcel) -> None:
+        """
+        Accept a parcel from another block
+
+        Args:
+            parcel: agents, mated ids, and ghosts from the block
+
+        Effects:
+            adds the movers into the block
+            mates the males whose ghosts mated
+            places the ghosts
+        """
+
+        movers, mated, ghosts = parcel
+        simulation            = self.simulation
+
+        for agent in movers:
+            simulation.agents.activate(agent)
+            if agent.agent_key in keyword.calendar_keys:
+                simulation.schedule.register(agent)
+
+        males = simulation.agents[(0,)][keyword.male]
+        for unique_id in mated:
+            if unique_id in males:
+                males[unique_id].set_mate(None)
+
+        for ghost in ghosts:
+            simulation.agents.place(ghost)
+            self.ghosts.append(ghost)
+
+    def exchange(self) -> None:
+        """
+        Exchange the agents with the other blocks
+            - movers go to the block owning their location
+            - males near the boundary are copied as ghosts
+
+        Effects:
+            sends and receives agents from every other block
+        """
+
+        parcels = self._parcels(self._clear())
+
+        for block, parcel in parcels.items():
+            data = Pickler.dumps(parcel, self.simulation)
+            self.inboxes[block].put((self._round, data))
+
+            for agent in parcel[0]:
+                agent.alive = False
+
+        for _ in parcels:
+            data = self._receive()
+            self._accept(Unpickler.loads(data, self.simulation))
+
+        self._pending.pop(self._round, None)
+        self._round += 1
+
+    def _emigrate(self) -> None:
+        """
+        Emigrate agents using the decisions of the domain
+
+        Effects:
+            removes the agents which emigrate
+        """
+
+        for emigration in self.simulation.emigration:
+            self.results.put(emigration.population(self.simulation.agents))
+            emigration.remove(self.simulation.agents, self.commands.get())
+
+    def step(self) -> None:
+        """
+        Advance the block forward one step
+
+        Effect:
+            advance block forward by 1
+        """
+
+        simulation = self.simulation
+        simulation.count_step()
+
+        self.exchange()
+        simulation.schedule.perform(simulation.space, simulation.agents)
+        if self.index == 0:
+            simulation.immigration.immigration(simulation)
+        self.exchange()
+        self._clear()
+
+        self._emigrate()
+        simulation.agents.record()
+
+    def gather(self) -> bytes:
+        """
+        Pickle the block's agents for the domain
+
+        Returns:
+            pickled (bins owned by block, calendar events, calendar day,
+                     masses of plants owned by block)
+        """
+
+        agents = self.simulation.agents
+        bins   = {location_key: agents_bin
+                  for location_key, agents_bin in agents.items()
+                  if self.owns(location_key)}
+
+        environment = agents.environment
+        if environment is None:
+            plants = {}
+        else:
+            plants = {plant_id: float(environment.plant[plant_id])
+                      for location_key, plant_id
+                      in environment.plant_ids.items()
+                      if self.owns(location_key)}
+
+        calendar = self.simulation.schedule.calendar
+        if calendar is None:
+            events = {}
+            day    = 0
+        else:
+            events = {}
+            for event_day, day_events in calendar.items():
+                events[event_day] = [event for event in day_events
+                                     if event[0].alive]
+            day = calendar.day
+
+        return Pickler.dumps((bins, events, day, plants), self.simulation)
+
+    def run(self) -> None:
+        """
+        Run the commands from the domain until told to stop
+
+        Effects:
+            runs the block
+        """
+
+        command = self.commands.get()
+        while command != keyword.domain_stop:
+            if command == keyword.domain_step:
+                self.step()
+                self.results.put(keyword.domain_step)
+            elif command == keyword.domain_gather:
+                self.results.put(self.gather())
+            elif command == keyword.domain_refresh:
+                self.simulation.agents.refresh()
+
+            command = self.commands.get()
+
+    @staticmethod
+    def halo(graph:  hint.graph,
+             owner:  hint.owner,
+             index:  int,
+             number: int,
+             width:  float) -> hint.halos:
+        """
+        Find the vertices of a block within range of each other block
+
+        Args:
+            graph:  the field graph
+            owner:  block owning each vertex
+            index:  index of the block
+            number: number of blocks
+            width:  the range of interactions
+
+        Returns:
+            vertices of block within range of each other block
+        """
+
+        halos = {block: set() for block in range(number) if block != index}
+        for vertex, block in enumerate(owner):
+            if block == index:
+                for near in graph.neighborhood.neighborhood(vertex,
+                                                            upper=width):
+                    if owner[near] != index:
+                        halos[owner[near]].add(vertex)
+
+        return halos
+
+    @classmethod
+    def work(cls, index:      int,
+                  simulation: hint.simulation,
+                  owner:      hint.owner,
+                  width:      float,
+                  inboxes:    hint.queues,
+                  commands,
+                  results,
+                  seed:       int) -> None:
+        """
+        Setup a block in the worker process and run it
+
+        Args:
+            index:      index of the block
+            simulation: the simulation (copied into worker)
+            owner:      block owning each vertex
+            width:      the range of interactions
+            inboxes:    queue of transfers to each block
+            commands:   queue of commands from the domain
+            results:    queue of results to the domain
+            seed:       seed of worker's random stream
+
+        Effects:
+            runs the block until told to stop
+        """
+
+        rnd.seed(seed)
+
+        try:
+            graph = simulation.space[keyword.adult_level]
+            halos = cls.halo(graph, owner, index, len(inboxes), width)
+            block = cls(index, simulation, owner, halos,
+                        inboxes, commands, results)
+            block._localize()
+            block.run()
+        except Exception as error:
+            results.put(DomainError('block {}: {!r}'.format(index, error)))
+            raise
+
+
+class Domain(object):
+    """
+    Class to run the simulation split into blocks of the field, each run in
+    its own worker process
+
+    Variables:
+        simulation: the simulation (only current after a gather)
+        workers:    the worker processes
+        commands:   queue of commands to each worker
+        results:    queue of results from each worker
+        history:    first time-step of counts recorded by workers
+
+    Methods:
+        step:   advance the simulation forward one step
+        gather: collect the agents from the workers
+        close:  gather the agents and stop the workers
+
+    Constructors:
+        setup: split the simulation and start the workers
+    """
+
+    def __init__(self, simulation: hint.simulation,
+                       workers:    hint.workers,
+                       commands:   hint.queues,
+                       results:    hint.queues,
+                       history:    int):
+        self.simulation = simulation
+        self.workers    = workers
+        self.commands   = commands
+        self.results    = results
+        self.history    = history
+
+    def _command(self, command: str) -> None:
+        """
+        Send a command to all the workers
+
+        Args:
+            command: the command
+
+        Effects:
+            puts command in each worker's queue
+        """
+
+        for commands in self.commands:
+            commands.put(command)
+
+    def _result(self, index: int):
+        """
+        Get the next result from a worker
+
+        Args:
+            index: index of the worker
+
+        Returns:
+            the result
+        """
+
+        result = self.results[index].get()
+        if isinstance(result, DomainError):
+            raise result
+
+        return result
+
+    def _emigrate(self) -> None:
+        """
+        Decide emigration for the whole population
+
+        Effects:
+            sends each worker the decisions for its agents
+        """
+
+        for emigration in self.simulation.emigration:
+            sizes     = [self._result(index)
+                         for index in range(len(self.workers))]
+            decisions = emigration.decisions(sum(sizes))
+
+            start = 0
+            for size, commands in zip(sizes, self.commands):
+                commands.put(decisions[start:start + size])
+                start += size
+
+    def step(self) -> None:
+        """
+        Advance the simulation forward one step
+
+        Effect:
+            advance simulation forward by 1
+            saves data when the database is due
+        """
+
+        simulation = self.simulation
+        simulation.count_step()
+
+        self._command(keyword.domain_step)
+        self._emigrate()
+        for index in range(len(self.workers)):
+            self._result(index)
+
+        if simulation.timestep == simulation.database.next_dump:
+            self.gather()
+            simulation.database.save(simulation)
+            self._command(keyword.domain_refresh)
+            self.history = 0
+
+    def gather(self) -> None:
+        """
+        Collect the agents from the workers into the simulation
+
+        Effects:
+            replaces the simulation's agents with the workers' agents
+            replaces the simulation's calendar events
+            replaces the plant masses with the workers' masses
+        """
+
+        simulation = self.simulation
+        agents     = simulation.agents
+        calendar   = simulation.schedule.calendar
+        if calendar is not None:
+            calendar.clear()
+
+        self._command(keyword.domain_gather)
+        for index in range(len(self.workers)):
+            data                      = self._result(index)
+            bins, events, day, plants = Unpickler.loads(data, simulation)
+
+            for location_key, agents_bin in bins.items():
+                if len(location_key) == 1 and index > 0:
+                    agents[location_key].merge(agents_bin, self.history)
+                else:
+                    agents[location_key] = agents_bin
+
+            if calendar is not None:
+                calendar.merge(events)
+                calendar.day = day
+
+            for plant_id, mass in plants.items():
+                agents.environment.plant[plant_id] = mass
+
+        agents.survey()
+
+    def close(self) -> None:
+        """
+        Gather the agents and stop the workers
+
+        Effects:
+            collects the agents
+            stops the workers
+        """
+
+        self.gather()
+        self._command(keyword.domain_stop)
+        for worker in self.workers:
+            worker.join()
+
+    @staticmethod
+    def _width(simulation: hint.simulation) -> float:
+        """
+        Get the range of mating in the field
+
+        Args:
+            simulation: the simulation
+
+        Returns:
+            the mating radius
+        """
+
+        if keyword.mate_radius in simulation.models:
+            return simulation.models[keyword.mate_radius].radius
+        else:
+            return 0
+
+    @classmethod
+    def setup(cls, simulation: hint.simulation,
+                   number:     int,
+                   width:      float = None) -> 'Domain':
+        """
+        Split the simulation into blocks and start a worker for each
+
+        Args:
+            simulation: the simulation to run
+            number:     number of blocks
+            width:      the range of interactions (default mating radius)
+
+        Returns:
+            a running domain
+        """
+
+        if width is None:
+            width = cls._width(simulation)
+
+        graph  = simulation.space[keyword.adult_level]
+        blocks = graph.partition(number)
+        owner  = [0] * graph.adjacency.num
+        for index, block in enumerate(blocks):
+            for vertex in block:
+                owner[vertex] = index
+
+        history = simulation.timestep - simulation.database.prev_dump + 1
+        seeds   = rnd.randint(0, 2**31, size=number)
+
+        context  = multi.get_context('fork')
+        inboxes  = [context.Queue() for _ in range(number)]
+        commands = [context.Queue() for _ in range(number)]
+        results  = [context.Queue() for _ in range(number)]
+        workers  = []
+        for index in range(number):
+            worker = context.Process(target=Block.work,
+                                     args=(index, simulation, owner, width,
+                                           inboxes, commands[index],
+                                           results[index], seeds[index]),
+                                     daemon=True)
+            worker.start()
+            workers.append(worker)
+
+        return cls(simulation, workers, commands, results, history)
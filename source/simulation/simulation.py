@@ -1,7 +1,6 @@
-import dataclasses  as dclass
-import itertools    as i_tools
-import numpy.random as rnd
-import pickle       as pk
+import dataclasses as dclass
+import itertools   as i_tools
+import pickle      as pk
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -19,6 +18,7 @@ import source.migration.immigration as main_immigration
 import source.schedule.schedule as main_schedule
 
 import source.simulation.behaviors as main_behaviors
+import source.simulation.domain    as main_domain
 import source.simulation.models    as main_models
 
 import source.space.agents as main_agents
@@ -69,6 +69,19 @@ class Simulation(object):
 
         return next(self._id_count)
 
+    def new_unique_ids(self, number: int) -> hint.unique_id_nums:
+        """
+        Generate a number of new unique_ids
+
+        Args:
+            number: the number of unique_ids
+
+        Returns:
+            list of new unique_ids
+        """
+
+        return [self.new_unique_id() for _ in range(number)]
+
     def populate_egg_masses(self, nums: hint.init_pop) -> None:
         """
         Create initial egg_masses
@@ -80,14 +93,14 @@ class Simulation(object):
             adds egg_masses of the different amounts to the simulation
         """
 
+        new = []
         for index, genotype in enumerate(keyword.genotype_keys):
-            for _ in range(nums[index]):
-                unique_id = self.new_unique_id()
-                new       = egg_mass.EggMass.setup(unique_id,
-                                                   keyword.init,
-                                                   self,
-                                                   genotype)
-                new.activate()
+            unique_id_nums = self.new_unique_ids(nums[index])
+            new.extend(egg_mass.EggMass.batch_setup(unique_id_nums,
+                                                    keyword.init,
+                                                    self,
+                                                    genotype))
+        egg_mass.EggMass.batch_activate(new)
 
     def populate_larvae(self, nums: hint.init_pop) -> None:
         """
@@ -100,14 +113,14 @@ class Simulation(object):
             adds larvae of the different amounts to the simulation
         """
 
+        new = []
         for index, genotype in enumerate(keyword.genotype_keys):
-            for _ in range(nums[index]):
-                unique_id = self.new_unique_id()
-                new       = larva.Larva.setup(unique_id,
-                                              keyword.init,
-                                              self,
-                                              genotype)
-                new.activate()
+            unique_id_nums = self.new_unique_ids(nums[index])
+            new.extend(larva.Larva.batch_setup(unique_id_nums,
+                                               keyword.init,
+                                               self,
+                                               genotype))
+        larva.Larva.batch_activate(new)
 
     def populate_pupae(self, nums: hint.init_pop) -> None:
         """
@@ -120,14 +133,14 @@ class Simulation(object):
             adds pupae of the different amounts to the simulation
         """
 
+        new = []
         for index, genotype in enumerate(keyword.genotype_keys):
-            for _ in range(nums[index]):
-                unique_id = self.new_unique_id()
-                new       = pupa.Pupa.setup(unique_id,
-                                            keyword.init,
-                                            self,
-                                            genotype)
-                new.activate()
+            unique_id_nums = self.new_unique_ids(nums[index])
+            new.extend(pupa.Pupa.batch_setup(unique_id_nums,
+                                             keyword.init,
+                                             self,
+                                             genotype))
+        pupa.Pupa.batch_activate(new)
 
     def populate_adults(self, nums: hint.init_pop) -> None:
         """
@@ -140,14 +153,14 @@ class Simulation(object):
             adds adults of the different amounts to the simulation
         """
 
+        new = []
         for index, genotype in enumerate(keyword.genotype_keys):
-            for _ in range(nums[index]):
-                unique_id = self.new_unique_id()
-                new       = adult.Adult.setup(unique_id,
-                                              keyword.init,
-                                              self,
-                                              genotype)
-                new.activate()
+            unique_id_nums = self.new_unique_ids(nums[index])
+            new.extend(adult.Adult.batch_setup(unique_id_nums,
+                                               keyword.init,
+                                               self,
+                                               genotype))
+        adult.Adult.batch_activate(new)
 
     def populate_pregnant(self, nums: hint.init_pop) -> None:
         """
@@ -160,21 +173,14 @@ class Simulation(object):
             adds pregnant of the different amounts to the simulation
         """
 
+        new = []
         for index, genotype in enumerate(keyword.genotype_keys):
-            for _ in range(nums[index]):
-                if genotype == keyword.hetero:
-                    parents = [keyword.homo_r, keyword.homo_s]
-                else:
-                    parents = [genotype, genotype]
-                rnd.shuffle(parents)
-
-                unique_id = self.new_unique_id()
-                new       = adult.Adult.setup(unique_id,
-                                              keyword.init,
-                                              self,
-                                              parents[0],
-                                              parents[1])
-                new.activate()
+            unique_id_nums = self.new_unique_ids(nums[index])
+            new.extend(adult.Adult.batch_pregnant(unique_id_nums,
+                                                  keyword.init,
+                                                  self,
+                                                  genotype))
+        adult.Adult.batch_activate(new)
 
     def populate(self, nums: hint.init_pops) -> None:
         """
@@ -209,6 +215,40 @@ class Simulation(object):
         self.agents.     record()
         self.database.   save(self)
 
+    @property
+    def workers(self) -> int:
+        """Get the number of domain workers to run the steps with"""
+
+        if keyword.domain_workers in self.models:
+            return self.models[keyword.domain_workers]
+        else:
+            return 1
+
+    def runner(self) -> hint.runner:
+        """
+        Get the system to run the steps with
+            - the simulation itself, or a domain of workers which each run
+              a block of the field when more than one worker is set
+
+        Returns:
+            system with step and close
+        """
+
+        if self.workers > 1:
+            return main_domain.Domain.setup(self, self.workers)
+        else:
+            return self
+
+    def close(self) -> None:
+        """
+        Finish running the steps
+
+        Effects:
+            none, the simulation is already current
+        """
+
+        pass
+
     def save(self, filename: str) -> None:
         """
         Pickle the simulation to a file for reuse
@@ -254,7 +294,8 @@ class Simulation(object):
 
         models      = main_models.Models.setup(*args, **kwargs)
         behaviors   = main_behaviors.Behaviors.setup(**models)
-        schedule    = main_schedule.Schedule.setup(step_tuples)
+        calendar    = keyword.calendar in models and models[keyword.calendar]
+        schedule    = main_schedule.Schedule.setup(step_tuples, calendar)
         database    = main_database.Database.setup(data_tuple)
         emigration  = main_emigration.Emigrations.setup(emigration_tuples)
         immigration = main_immigration.Immigrations.setup(immigration_tuples)
@@ -1,7 +1,6 @@
 import collections as collect
 
-import source.hint    as hint
-import source.keyword as keyword
+import source.hint as hint
 
 import source.data.counter as count
 
@@ -23,7 +22,9 @@ class AgentBin(collect.UserDict):
     Methods:
         activate:   add    agent to bin
         deactivate: remove agent from bin
+        release:    remove agent from bin without counting a removal
         count:      add an attribute to count
+        merge:      merge in another bin
 
     Constructors:
         empty: setup a class
@@ -71,6 +72,36 @@ class AgentBin(collect.UserDict):
         del self[agent.unique_id]
         self.counts.sub(agent)
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Release the agent to another system without removing it
+
+        Args:
+            agent: agent to release
+
+        Effects:
+            remove agent from bin without counting a removal
+        """
+
+        del self[agent.unique_id]
+        self.counts.release(agent)
+
+    def merge(self, other: 'AgentBin',
+                    start: int = 0) -> None:
+        """
+        Merge another bin of the same agents into this one
+
+        Args:
+            other: bin to merge in
+            start: first time-step of counts to merge
+
+        Effects:
+            adds the other bin's agents and counts to this bin
+        """
+
+        self.update(other)
+        self.counts.merge(other.counts, start)
+
     @classmethod
     def empty(cls, agent_key: str,
                    attrs:     hint.attrs_dict)  -> 'AgentBin':
@@ -100,7 +131,6 @@ class AgentsBin(collect.UserDict):
             value: bin of agents
 
         location_key: location for this bin
-        environment:  environment at this location
 
     Methods:
         activate:   add    agent to bin
@@ -108,16 +138,20 @@ class AgentsBin(collect.UserDict):
         count:      add an attribute to count
         record:     record the current counts
         refresh:    refresh the stored counts
+        release:    remove agent from bin without counting a removal
+        merge:      merge in another bin
+        snapshot:   copy the recorded data of all the counts
         dataframes: create dictionary of all the dataframes
+
+        long_columns: create dictionary of all the data columns keyed by
+                      location, agent, attribute and value
     """
 
     def __init__(self, agents:       hint.agent_bins,
-                       location_key: hint.location_key,
-                       environment:  hint.environment):
+                       location_key: hint.location_key):
         super().__init__(agents)
 
         self.location_key = location_key
-        self.environment  = environment
 
     def activate(self, agent: hint.agent) -> None:
         """
@@ -167,6 +201,47 @@ class AgentsBin(collect.UserDict):
         for agent_bin in self.values():
             agent_bin.counts.refresh()
 
+    def release(self, agent: hint.agent) -> None:
+        """
+        Release the agent to another system without removing it
+
+        Args:
+            agent: agent to release
+
+        Effects:
+            remove agent from bin without counting a removal
+        """
+
+        self[agent.agent_key].release(agent)
+
+    def merge(self, other: 'AgentsBin',
+                    start: int = 0) -> None:
+        """
+        Merge another bin for the same location into this one
+
+        Args:
+            other: bin to merge in
+            start: first time-step of counts to merge
+
+        Effects:
+            adds the other bin's agents and counts to this bin
+        """
+
+        for agent_key, agent_bin in self.items():
+            agent_bin.merge(other[agent_key], start)
+
+    def snapshot(self) -> hint.snapshot:
+        """
+        Copy the recorded data of all the counts for bin
+
+        Returns:
+            a dictionary of the recorded data keyed by table name
+        """
+
+        return {'{}_{}'.format(self.location_key, agent_key):
+                    agent_bin.counts.snapshot()
+                for agent_key, agent_bin in self.items()}
+
     def dataframes(self) -> hint.dataframes:
         """
         Create a dictionary of all of dataframes for bin
@@ -184,31 +259,23 @@ class AgentsBin(collect.UserDict):
 
         return dataframes
 
-    @staticmethod
-    def make_environment(location:    hint.location,
-                         environment: hint.environment_tuple) \
-            -> hint.environment:
+    def long_columns(self) -> hint.long_dict:
         """
-        Make the bin's environment
-        Args:
-            location:     location represented by bin
-            environment:  environment inputs
+        Create a dictionary of all the data columns for bin
+            key: (location_key, agent_key, attribute, attribute value)
 
         Returns:
-            an environment
+            a dictionary of data columns
         """
 
-        cutoff, init_plant = environment
+        columns = {}
+        for agent_key, agent_bin in self.items():
+            long_columns = agent_bin.counts.long_columns()
+            for (attr, attr_value), column in long_columns.items():
+                key = (self.location_key, agent_key, attr, attr_value)
+                columns[key] = column
 
-        if location.depth == keyword.bt_depth:
-            if location[-1] < cutoff:
-                return agent_environment.Environment.setup(keyword.bt,
-                                                           init_plant)
-            else:
-                return agent_environment.Environment.setup(keyword.not_bt,
-                                                           init_plant)
-        else:
-            return agent_environment.Environment()
+        return columns
 
     @staticmethod
     def make_bins(agent_keys: hint.agent_keys,
@@ -255,18 +322,16 @@ class AgentsBin(collect.UserDict):
             return {}
 
     @classmethod
-    def empty(cls, agent_keys:   hint.agent_keys,
-                   location:     hint.location,
-                   attrs:        hint.attrs_depth,
-                   environment:  hint.environment_tuple)  -> 'AgentsBin':
+    def empty(cls, agent_keys: hint.agent_keys,
+                   location:   hint.location,
+                   attrs:      hint.attrs_depth) -> 'AgentsBin':
         """
         Setup an empty agent bin
 
         Args:
-            agent_keys:   keys for the agents
-            location:     location represented by bin
-            attrs:        tracking attributes
-            environment:  environment inputs
+            agent_keys: keys for the agents
+            location:   location represented by bin
+            attrs:      tracking attributes
 
         Returns:
             a setup class
@@ -275,9 +340,8 @@ class AgentsBin(collect.UserDict):
         location_key = location.location_key
         attrs_dict   = cls.get_attrs(location, attrs)
         agents       = cls.make_bins(agent_keys, attrs_dict)
-        environ      = cls.make_environment(location, environment)
 
-        return cls(agents, location_key, environ)
+        return cls(agents, location_key)
 
 
 class Agents(collect.UserDict):
@@ -289,15 +353,41 @@ class Agents(collect.UserDict):
             key:   agent_key
             value: bin of agents
 
+        occupied:    location_keys containing agents, by level and agent_key
+        watching:    (level, agent_keys, list) the locations newly occupied
+                     by agents of the types at the level are appended to
+        environment: environmental conditions of every plant
+
     Methods:
-        activate:   add    agent to bin
-        deactivate: remove agent from bin
-        count:      add an attribute to count
+        activate:       add    agent to bin
+        batch_activate: add    a collection of agents to bins
+        deactivate:     remove agent from bin
+        release:        remove agent from bin without counting a removal
+        count:          add an attribute to count
+        place:          add    agent to its own bin only, without counting
+        withdraw:       remove agent from its own bin only, without counting
+        survey:         rebuild the occupied locations from the bins
+        occupied_keys:  get the occupied locations for agent types
+        occupies:       check if a location holds any of the agent types
+        watch:          collect the locations newly occupied by agent types
+        unwatch:        stop collecting the newly occupied locations
+        occupants:      get the occupied locations for an agent type
+        snapshot:       copy the recorded data of all the counts
+        dataframes:     create dictionary of all the dataframes
+        long_columns:   create dictionary of all the data columns keyed by
+                        location, agent, attribute and value
     """
 
-    def __init__(self, agents: hint.agents_dict):
+    def __init__(self, agents:      hint.agents_dict,
+                       environment: hint.environment = None):
         super().__init__(agents)
 
+        self.environment = environment
+
+        self.occupied: hint.occupied = {}
+        self.watching: hint.watching = None
+        self.survey()
+
     def agents(self, agent_key: str) -> hint.agent_list:
         """
         Get a list of all the agents for the given key
@@ -311,6 +401,56 @@ class Agents(collect.UserDict):
 
         return self[(0,)][agent_key].agents
 
+    def _occupy(self, location_key: hint.location_key,
+                      agent_key:    str) -> None:
+        """
+        Mark the location as occupied by the agent type
+
+        Args:
+            location_key: the location
+            agent_key:    type of agent
+
+        Effects:
+            adds location to the occupied locations
+            appends a newly occupied location to the watched locations
+        """
+
+        level = len(location_key) - 1
+
+        if level not in self.occupied:
+            self.occupied[level] = {}
+        if agent_key not in self.occupied[level]:
+            self.occupied[level][agent_key] = set()
+
+        occupied = self.occupied[level][agent_key]
+        if location_key not in occupied:
+            occupied.add(location_key)
+
+            if self.watching is not None:
+                watch_level, agent_keys, entered = self.watching
+                if (level == watch_level) and (agent_key in agent_keys):
+                    entered.append(location_key)
+
+    def _vacate(self, location_key: hint.location_key,
+                      agent_key:    str) -> None:
+        """
+        Unmark the location if it no longer has agents of the type
+
+        Args:
+            location_key: the location
+            agent_key:    type of agent
+
+        Effects:
+            removes location from the occupied locations if empty
+        """
+
+        if len(self[location_key][agent_key]) == 0:
+            level = len(location_key) - 1
+
+            if level in self.occupied and \
+                    agent_key in self.occupied[level]:
+                self.occupied[level][agent_key].discard(location_key)
+
     def activate(self, agent: hint.agent) -> None:
         """
         Activate the agent
@@ -320,6 +460,7 @@ class Agents(collect.UserDict):
 
         Effects:
             add agent to bin
+            marks bins as occupied
         """
 
         location = agent.location
@@ -327,6 +468,40 @@ class Agents(collect.UserDict):
         for index in range(1, location.depth + 1):
             location_key = location[:index].location_key
             self[location_key].activate(agent)
+            self._occupy(location_key, agent.agent_key)
+
+    def batch_activate(self, agents: hint.agent_list) -> None:
+        """
+        Activate a collection of agents at once
+            - agents are grouped by bin so each bin is marked only once
+
+        Args:
+            agents: agents to activate
+
+        Effects:
+            add agents to bins
+            marks bins as occupied
+        """
+
+        groups = {}
+        for agent in agents:
+            location = agent.location
+
+            for index in range(1, location.depth + 1):
+                location_key = location[:index].location_key
+                if location_key not in groups:
+                    groups[location_key] = []
+                groups[location_key].append(agent)
+
+        for location_key, group in groups.items():
+            agent_bins = self[location_key]
+            agent_keys = set()
+            for agent in group:
+                agent_bins.activate(agent)
+                agent_keys.add(agent.agent_key)
+
+            for agent_key in agent_keys:
+                self._occupy(location_key, agent_key)
 
     def deactivate(self, agent: hint.agent) -> None:
         """
@@ -337,6 +512,7 @@ class Agents(collect.UserDict):
 
         Effects:
             remove agent from bin
+            unmarks bins left empty
         """
 
         location = agent.location
@@ -344,6 +520,171 @@ class Agents(collect.UserDict):
         for index in range(1, location.depth + 1):
             location_key = location[:index].location_key
             self[location_key].deactivate(agent)
+            self._vacate(location_key, agent.agent_key)
+
+    def release(self, agent: hint.agent) -> None:
+        """
+        Release the agent to another system without removing it
+
+        Args:
+            agent: agent to release
+
+        Effects:
+            remove agent from bins without counting a removal
+            unmarks bins left empty
+        """
+
+        location = agent.location
+
+        for index in range(1, location.depth + 1):
+            location_key = location[:index].location_key
+            self[location_key].release(agent)
+            self._vacate(location_key, agent.agent_key)
+
+    def place(self, agent: hint.agent) -> None:
+        """
+        Place the agent in the bin of its own location only
+
+        Args:
+            agent: agent to place
+
+        Effects:
+            add agent to its bin without counting it
+            marks the bin as occupied
+        """
+
+        location_key = agent.location.location_key
+
+        self[location_key][agent.agent_key].data[agent.unique_id] = agent
+        self._occupy(location_key, agent.agent_key)
+
+    def withdraw(self, agent: hint.agent) -> None:
+        """
+        Withdraw the agent from the bin of its own location only
+
+        Args:
+            agent: agent to withdraw
+
+        Effects:
+            remove agent from its bin without counting it (if there)
+            unmarks the bin if left empty
+        """
+
+        location_key = agent.location.location_key
+
+        self[location_key][agent.agent_key].data.pop(agent.unique_id, None)
+        self._vacate(location_key, agent.agent_key)
+
+    def survey(self) -> None:
+        """
+        Rebuild the occupied locations from the bins
+
+        Effects:
+            resets the occupied locations
+        """
+
+        self.occupied = {}
+        for location_key, agents_bin in self.items():
+            for agent_key, agent_bin in agents_bin.items():
+                if len(agent_bin) > 0:
+                    self._occupy(location_key, agent_key)
+
+    def occupied_keys(self, level:      int,
+                            agent_keys: hint.agent_keys) -> hint.location_keys:
+        """
+        Get the locations at the level with agents of the types
+
+        Args:
+            level:      level of the locations
+            agent_keys: types of agents
+
+        Returns:
+            sorted list of occupied location keys, i.e. in space order
+        """
+
+        location_keys = set()
+        if level in self.occupied:
+            for agent_key in agent_keys:
+                if agent_key in self.occupied[level]:
+                    location_keys.update(self.occupied[level][agent_key])
+
+        return sorted(location_keys)
+
+    def occupies(self, level:        int,
+                       agent_keys:   hint.agent_keys,
+                       location_key: hint.location_key) -> bool:
+        """
+        Check if the location holds agents of any of the types
+
+        Args:
+            level:        level of the location
+            agent_keys:   types of agents
+            location_key: the location to check
+
+        Returns:
+            if the location is currently occupied
+        """
+
+        if level in self.occupied:
+            for agent_key in agent_keys:
+                if (agent_key in self.occupied[level]) and \
+                        (location_key in self.occupied[level][agent_key]):
+                    return True
+
+        return False
+
+    def watch(self, level:      int,
+                    agent_keys: hint.agent_keys) -> hint.location_keys:
+        """
+        Collect the locations at the level newly occupied by agents of the
+            types, until unwatched
+
+        Args:
+            level:      level of the locations
+            agent_keys: types of agents
+
+        Effects:
+            starts collecting the newly occupied locations
+
+        Returns:
+            list the newly occupied locations are appended to
+        """
+
+        entered = []
+        self.watching = (level, set(agent_keys), entered)
+
+        return entered
+
+    def unwatch(self) -> None:
+        """
+        Stop collecting the newly occupied locations
+
+        Effects:
+            stops collecting the newly occupied locations
+        """
+
+        self.watching = None
+
+    def occupants(self, level:     int,
+                        agent_key: str) -> hint.occupants:
+        """
+        Get the locations at the level with agents of the type
+            - the occupied set itself is returned without a copy, so it
+              must not be changed and follows the agents as they move;
+              finish using it before any agent moves
+
+        Args:
+            level:     level of the locations
+            agent_key: type of agent
+
+        Returns:
+            the occupied location keys, read only
+        """
+
+        if (level in self.occupied) and (agent_key in self.occupied[level]):
+            return self.occupied[level][agent_key]
+        else:
+            return frozenset()
 
     def record(self) -> None:
         """
@@ -367,6 +708,20 @@ class Agents(collect.UserDict):
         for agents_bin in self.values():
             agents_bin.refresh()
 
+    def snapshot(self) -> hint.snapshot:
+        """
+        Copy the recorded data of all the counts
+
+        Returns:
+            a dictionary of the recorded data keyed by table name
+        """
+
+        snapshot = {}
+        for agents_bin in self.values():
+            snapshot.update(agents_bin.snapshot())
+
+        return snapshot
+
     def dataframes(self) -> hint.dataframes:
         """
         Create a dictionary of all of dataframes
@@ -381,6 +736,21 @@ class Agents(collect.UserDict):
 
         return dataframes
 
+    def long_columns(self) -> hint.long_dict:
+        """
+        Create a dictionary of all of the data columns
+            key: (location_key, agent_key, attribute, attribute value)
+
+        Returns:
+            a dictionary of data columns
+        """
+
+        columns = {}
+        for agents_bin in self.values():
+            columns.update(agents_bin.long_columns())
+
+        return columns
+
     @classmethod
     def empty(cls, space:       hint.space,
                    agent_keys:  hint.agent_keys,
@@ -404,6 +774,9 @@ class Agents(collect.UserDict):
             location_key = location.location_key
 
             agents[location_key] = AgentsBin.empty(agent_keys, location,
-                                                   attrs, environment)
+                                                   attrs)
+
+        environ = agent_environment.Environment.setup(space.locations,
+                                                      environment)
 
-        return cls(agents)
+        return cls(agents, environ)
@@ -1,38 +1,126 @@
 import dataclasses as dclass
+import numpy       as np
 
-import source.hint as hint
+import source.hint    as hint
+import source.keyword as keyword
 
 
 @dclass.dataclass
 class Environment(object):
     """
-    Class to handle local environmental conditions:
+    Class to handle the environmental conditions of every plant:
+        - each plant location has an integer plant id indexing the arrays
 
     Variables:
-        bt:    bt state of local environment
-        plant: mass available to each individual to consume
+        plant_ids: plant id of each plant location_key
+        bt:        if each plant is bt
+        plant:     mass available to each individual to consume on each plant
+
+    Methods:
+        plant_id: get the plant id of a location
+        bt_state: get the bt state of a plant
+        consume:  consume plant mass for a collection of bites at once
 
     Constructors:
-        read the data
+        setup: setup class
     """
 
-    bt:    str   = None
-    plant: float = None
+    plant_ids: hint.plant_ids
+    bt:        np.ndarray
+    plant:     np.ndarray
+
+    def plant_id(self, location: hint.location) -> int:
+        """
+        Get the plant id of a location
+
+        Args:
+            location: a location at or below the plant level
+
+        Returns:
+            id of the plant containing the location
+        """
+
+        loc = location[:keyword.plant_depth]
+
+        return self.plant_ids[loc.location_key]
+
+    def bt_state(self, plant_id: int) -> str:
+        """
+        Get the bt state of a plant
+
+        Args:
+            plant_id: id of the plant
+
+        Returns:
+            bt state of the plant
+        """
+
+        if self.bt[plant_id]:
+            return keyword.bt
+        else:
+            return keyword.not_bt
+
+    def consume(self, plant_ids: np.ndarray,
+                      demands:   np.ndarray) -> np.ndarray:
+        """
+        Consume plant mass for a collection of bites at once
+            - bites on a plant asking for more than it has each get the same
+              fraction of what they asked for
+
+        Args:
+            plant_ids: id of the plant of each bite
+            demands:   amount each bite asks for
+
+        Effects:
+            removes the eaten mass from the plants
+
+        Returns:
+            amount each bite gets
+        """
+
+        number = len(self.plant)
+        demand = np.bincount(plant_ids, weights=demands, minlength=number)
+
+        share = np.ones(number)
+        short = demand > self.plant
+        share[short] = self.plant[short] / demand[short]
+
+        eaten = demands * share[plant_ids]
+        self.plant -= np.bincount(plant_ids, weights=eaten, minlength=number)
+        np.maximum(self.plant, 0.0, out=self.plant)
+
+        return eaten
 
     @classmethod
-    def setup(cls, bt:         str,
-                   init_plant: hint.init_plant) -> 'Environment':
+    def setup(cls, locations:   hint.locations,
+                   environment: hint.environment_tuple) -> 'Environment':
         """
         Setup the environment
 
         Args:
-            bt:         bt state of the local environment
-            init_plant: plant mass model
+            locations:   all the locations of the space
+            environment: environment inputs
 
         Returns:
             setup environment
         """
 
-        plant = init_plant(bt)
+        cutoff, init_plant = environment
+
+        plant_ids = {}
+        bt        = []
+        plant     = []
+        for location in locations:
+            if location.depth == keyword.plant_depth:
+                plant_ids[location.location_key] = len(bt)
+
+                is_bt = location[-1] < cutoff
+                bt.append(is_bt)
+                if is_bt:
+                    plant.append(init_plant(keyword.bt))
+                else:
+                    plant.append(init_plant(keyword.not_bt))
 
-        return cls(bt, plant)
+        return cls(plant_ids,
+                   np.array(bt,    dtype=bool),
+                   np.array(plant, dtype=float))
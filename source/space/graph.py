@@ -27,6 +27,7 @@ class VertexNeighborhood(collect.UserDict):
     Methods:
         add:          vertex at distance
         neighborhood: get vertices in a distance range
+        rings:        get probability of moving to each ring of vertices
 
     Constructors:
         empty: setup empty class
@@ -150,6 +151,30 @@ class VertexNeighborhood(collect.UserDict):
 
         return vertices
 
+    def rings(self, cdf: hint.cdf) -> hint.rings:
+        """
+        Get the probability of moving to each ring of vertices when the
+            distance is drawn from a distribution and converted to the
+            closest distance
+
+        Args:
+            cdf: cumulative distribution function of the distance
+
+        Returns:
+            tuple (list of rings by distance, probability of each ring)
+        """
+
+        distances = sorted(self.keys())
+        bounds    = [(lower + upper)/2 for lower, upper
+                     in zip(distances[:-1], distances[1:])]
+
+        cumulative = np.concatenate(([0.0], cdf(np.array(bounds)), [1.0]))
+        weights    = np.diff(cumulative)
+
+        rings = [sorted(self[distance]) for distance in distances]
+
+        return rings, weights
+
     @classmethod
     def empty(cls, vertex: int) -> 'VertexNeighborhood':
         """
@@ -704,6 +729,7 @@ class Graph(object):
 
     Methods:
         neighborhood: neighborhood finding
+        partition:    split vertices into contiguous blocks
 
     Constructors:
         setup: setup the class from a matrix
@@ -714,6 +740,27 @@ class Graph(object):
     distance:     hint.graph_distance
     adjacency:    hint.graph_adjacency
 
+    def partition(self, number: int) -> hint.blocks:
+        """
+        Partition the vertices into contiguous blocks of nearly equal size
+            - vertices are ordered by distance from the first vertex, so
+              each block is a band across the graph
+
+        Args:
+            number: number of blocks
+
+        Returns:
+            list of the vertices in each block
+        """
+
+        start = min(self.adjacency.vertices)
+        table = self.distance[start]
+        order = sorted(self.adjacency.vertices,
+                       key=lambda vertex: (table[vertex], vertex))
+
+        return [[int(vertex) for vertex in block]
+                for block in np.array_split(order, number)]
+
     def save(self, file_name: str) -> None:
         """
         Save graph to file_name for reuse
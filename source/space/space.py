@@ -1,4 +1,5 @@
 import collections  as collect
+import numpy        as np
 import numpy.random as rnd
 
 import source.hint    as hint
@@ -95,6 +96,28 @@ class Space(collect.UserList):
 
         return agent_location.Location(locs)
 
+    def new_locations(self, depth:  int,
+                            number: int) -> hint.locations:
+        """
+        Create a number of new locations at random
+
+        Args:
+            depth:  depth of locations desired
+            number: number of locations
+
+        Returns:
+            random locations of the correct depth
+        """
+
+        levels = []
+        for level in range(depth):
+            graph: hint.graph = self[level]
+            vertices          = np.array(list(graph.adjacency.vertices))
+            chosen            = rnd.randint(len(vertices), size=number)
+            levels.append(vertices[chosen].tolist())
+
+        return [agent_location.Location(list(locs)) for locs in zip(*levels)]
+
     def _make_locations(self, locations: hint.locations,
                               level:     int) -> hint.location_pairs:
         """
@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -13,7 +14,8 @@ class Egg(object):
         survival: mathematical function for if egg dies of survival
 
     Methods:
-        survive: run the behavior
+        survive:  run the behavior
+        lifetime: sample the days survived
 
     Constructors:
         setup: setup class
@@ -43,6 +45,22 @@ class Egg(object):
         else:
             return True
 
+    def lifetime(self, egg: hint.egg) -> float:
+        """
+        Sample the number of days the egg survives
+
+        Args:
+            egg: the egg in question
+
+        Returns:
+            number of days survived (inf if egg cannot die)
+        """
+
+        if self._use_survival:
+            return self.survival.lifetime(egg.mass, egg.genotype, egg.bt)
+        else:
+            return np.inf
+
     def survive(self, egg: hint.egg) -> None:
         """
         Run the survival model
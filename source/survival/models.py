@@ -129,6 +129,7 @@ class Fixed(models.Model):
 
     Methods:
         __call__: call the model
+        lifetime: sample the number of days survived
     """
 
     prob: float
@@ -147,6 +148,24 @@ class Fixed(models.Model):
 
         return rnd.random() <= self.prob
 
+    def lifetime(self, mass: float, *args) -> float:
+        """
+        Sample the number of days the agent survives
+            - number of days until the first failed survival call
+
+        Args:
+            mass:  mass of agent
+            *args: genotype and bt (possibly)
+
+        Returns:
+            number of days survived (inf if agent cannot die)
+        """
+
+        if self.prob >= 1:
+            return np.inf
+        else:
+            return rnd.geometric(1 - self.prob) - 1
+
 
 @dclass.dataclass
 class Egg(Fixed):
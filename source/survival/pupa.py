@@ -1,4 +1,5 @@
 import dataclasses as dclass
+import numpy       as np
 
 import source.hint    as hint
 import source.keyword as keyword
@@ -13,7 +14,8 @@ class Pupa(object):
         survival: mathematical function for if pupa dies of survival
 
     Methods:
-        survive: run the behavior
+        survive:  run the behavior
+        lifetime: sample the days survived
 
     Constructors:
         setup: setup class
@@ -43,6 +45,22 @@ class Pupa(object):
         else:
             return True
 
+    def lifetime(self, pupa: hint.pupa) -> float:
+        """
+        Sample the number of days the pupa survives
+
+        Args:
+            pupa: the pupa in question
+
+        Returns:
+            number of days survived (inf if pupa cannot die)
+        """
+
+        if self._use_survival:
+            return self.survival.lifetime(pupa.mass, pupa.genotype)
+        else:
+            return np.inf
+
     def survive(self, pupa: hint.pupa) -> None:
         """
         Run the survival model
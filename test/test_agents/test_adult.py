@@ -159,8 +159,71 @@ class TestAdult(ut.TestCase):
         self.Adult.alive = True
         self.assertEqual(self.Adult.move(), [])
         self.assertEqual(self.movement.move.call_args_list,
-                         [mk.call(self.Adult)])
-        
+                         [mk.call(self.Adult, 1)])
+
+        # Adult moves a number of times
+        self.movement.move.reset_mock()
+        self.assertEqual(self.Adult.move(3), [])
+        self.assertEqual(self.movement.move.call_args_list,
+                         [mk.call(self.Adult, 3)])
+
+    def test_batch_move(self):
+        """test move a population"""
+
+        movement_adult = mk.create_autospec(movement.Adult, spec_set=True)
+
+        adults = [mk.MagicMock(spec=adult.Adult) for _ in range(3)]
+        sink   = []
+        for agent in adults:
+            agent.alive    = True
+            agent.movement = movement_adult
+        adults[1].alive = False
+
+        self.assertEqual(adult.Adult.batch_move(adults, sink), None)
+        self.assertEqual(movement_adult.batch_move.call_args_list,
+                         [mk.call([adults[0], adults[2]])])
+        for agent in adults:
+            self.assertEqual(agent.move.call_args_list, [])
+        self.assertEqual(sink, [])
+
+        # No adults to move
+        movement_adult.reset_mock()
+        self.assertEqual(adult.Adult.batch_move(adults[1:2], sink), None)
+        self.assertEqual(movement_adult.batch_move.call_args_list, [])
+
+    def test_fusible(self):
+        """test determine if actions can be fused"""
+
+        # Mating interacts
+        self.mating.interacts = True
+        for action in keyword.agent_keys + [keyword.move, keyword.reproduce,
+                                            keyword.survive, keyword.reset]:
+            self.assertFalse(self.Adult.fusible(action))
+
+        # Mating does not interact
+        self.mating.interacts = False
+        self.assertTrue(self.Adult.fusible(keyword.move))
+        for action in [keyword.reproduce, keyword.survive, keyword.reset,
+                       keyword.advance_age]:
+            self.assertFalse(self.Adult.fusible(action))
+
+    def test_reads(self):
+        """test get the agent types an action reads"""
+
+        # Mating interacts
+        self.mating.interacts = True
+        self.assertEqual(self.Adult.reads(keyword.reproduce),
+                         [keyword.egg_mass, keyword.larva, keyword.male])
+        for action in [keyword.move, keyword.survive, keyword.reset]:
+            self.assertEqual(self.Adult.reads(action), [])
+
+        # Mating does not interact
+        self.mating.interacts = False
+        self.assertEqual(self.Adult.reads(keyword.reproduce),
+                         [keyword.egg_mass, keyword.larva])
+        for action in [keyword.move, keyword.survive, keyword.reset]:
+            self.assertEqual(self.Adult.reads(action), [])
+
     def test_new_unique_id(self):
         """test create a new unique_id for an egg_mass"""
 
@@ -209,8 +272,8 @@ class TestAdult(ut.TestCase):
                   for _ in range(3)]
         larvae = [mk.create_autospec(larva.Larva, spec_set=True)
                   for _ in range(3)]
-        egg_bin.  agents = eggs
-        larva_bin.agents = larvae
+        egg_bin.  __len__.return_value = len(eggs)
+        larva_bin.__len__.return_value = len(larvae)
         self.simulation.agents.__getitem__.return_value.\
             __getitem__.side_effect = [egg_bin, larva_bin,
                                        egg_bin, larva_bin]
@@ -221,7 +284,7 @@ class TestAdult(ut.TestCase):
             self.assertEqual(mkLen.return_value.__add__.call_args_list,
                              [mk.call(mkLen.return_value)])
             self.assertEqual(mkLen.call_args_list,
-                             [mk.call(eggs), mk.call(larvae)])
+                             [mk.call(egg_bin), mk.call(larva_bin)])
             self.assertEqual(self.simulation.agents.__getitem__.return_value.
                                 __getitem__.call_args_list,
                              [mk.call(keyword.egg_mass),
@@ -367,6 +430,47 @@ class TestAdult(ut.TestCase):
                 self.assertEqual(agent_bin.__getitem__.call_args_list,
                                  [mk.call(keyword.male)])
 
+    def test_mate_bins(self):
+        """test get the bins of mates"""
+
+        kwargs = {'test': mk.MagicMock()}
+
+        self.simulation.agents = mk.create_autospec(agents.Agents,
+                                                    spec_set=True)
+        self.Adult.location    = location.Location([0, 3])
+
+        agents_bins = {(0, vertex): {keyword.male: mk.MagicMock(spec=dict)}
+                       for vertex in range(6)}
+        self.simulation.agents.__getitem__.side_effect = \
+            lambda key: agents_bins[key]
+
+        with mk.patch.object(agent.Agent, 'vertices',
+                             autospec=True) as mkVertices:
+            # Fewer occupied locations than vertices
+            self.simulation.agents.occupants.return_value = {(0, 1), (0, 4),
+                                                             (1, 2)}
+            mkVertices.return_value = {1, 2, 3}
+
+            self.assertEqual(self.Adult.mate_bins(**kwargs),
+                             [agents_bins[(0, 1)][keyword.male]])
+            self.assertEqual(mkVertices.call_args_list,
+                             [mk.call(self.Adult, **kwargs)])
+            self.assertEqual(self.simulation.agents.occupants.call_args_list,
+                             [mk.call(keyword.adult_level, keyword.male)])
+
+            # More occupied locations than vertices
+            self.simulation.agents.occupants.return_value = {(0, 1), (0, 2),
+                                                             (0, 4), (0, 5)}
+            mkVertices.return_value = {2, 3, 5}
+
+            self.assertCountEqual(self.Adult.mate_bins(**kwargs),
+                                  [agents_bins[(0, 2)][keyword.male],
+                                   agents_bins[(0, 5)][keyword.male]])
+
+            # No occupied locations
+            self.simulation.agents.occupants.return_value = set()
+            self.assertEqual(self.Adult.mate_bins(**kwargs), [])
+
     def test_reproduce(self):
         """test reproduce the agents"""
 
@@ -519,6 +623,17 @@ class TestAdult(ut.TestCase):
         self.assertEqual(self.simulation.models.__getitem__.call_args_list,
                          [mk.call(keyword.init_sex)])
         self.assertEqual(self.lay.reset.call_args_list, [])
+        self.simulation.models.reset_mock()
+
+        # Sex given
+        for female, agent_key in [(True, keyword.female),
+                                  (False, keyword.male)]:
+            self.Adult._set_sex(female)
+            self.assertEqual(self.Adult.agent_key, agent_key)
+            self.assertEqual(self.Adult.num_eggs,  self.num_eggs)
+            self.assertEqual(self.simulation.models.
+                                 __getitem__.call_args_list, [])
+            self.assertEqual(self.lay.reset.call_args_list, [])
 
     def test_initialize(self):
         """test initialize the agent"""
@@ -758,6 +873,144 @@ class TestAdult(ut.TestCase):
 
             self.assertTrue(dclass.is_dataclass(self.Adult))
 
+    def test_batch_initialize(self):
+        """test initialize several new agents"""
+
+        self.simulation.models = mk.create_autospec(models.Models,
+                                                    spec_set=True)
+        batch = self.simulation.models.__getitem__.return_value.batch
+        batch.return_value = [True, False, True]
+
+        unique_ids = [mk.MagicMock(spec=str) for _ in range(3)]
+        locations  = [mk.create_autospec(location.Location, spec_set=True)
+                      for _ in range(3)]
+        masses     = [mk.MagicMock(spec=float) for _ in range(3)]
+
+        with mk.patch.object(adult.Adult, '_initialize',
+                             autospec=True) as mkInitialize:
+            with mk.patch.object(adult, 'float') as mkFloat:
+                new = [mk.MagicMock(spec=adult.Adult) for _ in range(3)]
+                mkInitialize.side_effect = new
+                mkFloat.side_effect      = masses
+
+                # Test no mate
+                self.assertEqual(adult.Adult.batch_initialize(unique_ids,
+                                                              self.simulation,
+                                                              locations,
+                                                              masses,
+                                                              self.genotype),
+                                 new)
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call(unique_ids[index], self.simulation,
+                                          locations[index], masses[index],
+                                          self.genotype, None)
+                                  for index in range(3)])
+                for index, female in enumerate([True, False, True]):
+                    self.assertEqual(new[index]._set_sex.call_args_list,
+                                     [mk.call(female)])
+                self.assertEqual(batch.call_args_list,
+                                 [mk.call(self.genotype, 3)])
+                self.assertEqual(self.simulation.models.
+                                     __getitem__.call_args_list,
+                                 [mk.call(keyword.init_sex)])
+
+                self.simulation.models.reset_mock()
+                mkInitialize.reset_mock()
+                # Test mate
+                new = [mk.MagicMock(spec=adult.Adult) for _ in range(3)]
+                mkInitialize.side_effect = new
+                mkFloat.side_effect      = masses
+
+                self.assertEqual(adult.Adult.batch_initialize(unique_ids,
+                                                              self.simulation,
+                                                              locations,
+                                                              masses,
+                                                              self.genotype,
+                                                              self.mate),
+                                 new)
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call(unique_ids[index], self.simulation,
+                                          locations[index], masses[index],
+                                          self.genotype, self.mate)
+                                  for index in range(3)])
+                for agent_new in new:
+                    self.assertEqual(agent_new._set_sex.call_args_list,
+                                     [mk.call(True)])
+                self.assertEqual(self.simulation.models.
+                                     __getitem__.call_args_list, [])
+
+    def test_batch_setup(self):
+        """test setup several initial adults"""
+
+        self.simulation.space  = mk.create_autospec(space.Space, spec_set=True)
+        self.simulation.models = mk.create_autospec(models.Models,
+                                                    spec_set=True)
+        batch = self.simulation.models.__getitem__.return_value.batch
+
+        unique_id_nums = [1, 2, 3]
+        initial_key    = 'initial'
+        unique_ids     = ['initial{}{}'.format(num, keyword.adult)
+                          for num in unique_id_nums]
+
+        with mk.patch.object(adult.Adult, 'batch_initialize',
+                             autospec=True) as mkInitialize:
+            for mate in [None, self.mate]:
+                self.assertEqual(adult.Adult.batch_setup(unique_id_nums,
+                                                         initial_key,
+                                                         self.simulation,
+                                                         self.genotype,
+                                                         mate),
+                                 mkInitialize.return_value)
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call(unique_ids, self.simulation,
+                                          self.simulation.space.
+                                              new_locations.return_value,
+                                          batch.return_value,
+                                          self.genotype, mate)])
+                self.assertEqual(self.simulation.space.
+                                     new_locations.call_args_list,
+                                 [mk.call(keyword.adult_depth, 3)])
+                self.assertEqual(batch.call_args_list,
+                                 [mk.call(self.genotype, 3)])
+                self.assertEqual(self.simulation.models.
+                                     __getitem__.call_args_list,
+                                 [mk.call(keyword.init_mature)])
+
+                mkInitialize.reset_mock()
+                self.simulation.space.reset_mock()
+                self.simulation.models.reset_mock()
+
+    def test_batch_pregnant(self):
+        """test setup several pregnant adults"""
+
+        unique_id_nums = list(range(5))
+        parents        = [(keyword.homo_r, keyword.homo_s, 2),
+                          (keyword.homo_s, keyword.homo_r, 3)]
+        new            = [[mk.MagicMock() for _ in range(2)],
+                          [mk.MagicMock() for _ in range(3)]]
+
+        with mk.patch.object(egg_mass.EggMass, 'batch_parents',
+                             autospec=True) as mkParents:
+            with mk.patch.object(adult.Adult, 'batch_setup',
+                                 autospec=True) as mkSetup:
+                mkParents.return_value = parents
+                mkSetup.side_effect    = new
+
+                self.assertEqual(adult.Adult.batch_pregnant(unique_id_nums,
+                                                            'initial',
+                                                            self.simulation,
+                                                            keyword.hetero),
+                                 new[0] + new[1])
+                self.assertEqual(mkParents.call_args_list,
+                                 [mk.call(keyword.hetero, 5)])
+                self.assertEqual(mkSetup.call_args_list,
+                                 [mk.call(unique_id_nums[:2], 'initial',
+                                          self.simulation,
+                                          keyword.homo_r, keyword.homo_s),
+                                  mk.call(unique_id_nums[2:], 'initial',
+                                          self.simulation,
+                                          keyword.homo_s, keyword.homo_r)])
+
     def test_advance(self):
         """test advance a pupa into an adult"""
 
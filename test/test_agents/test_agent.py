@@ -63,6 +63,26 @@ class TestAgent(ut.TestCase):
         self.assertEqual(self.simulation.agents.activate.call_args_list,
                          [mk.call(self.Agent)])
 
+    def test_batch_activate(self):
+        """test activate a collection of agents"""
+
+        self.simulation.agents = mk.create_autospec(agents.Agents,
+                                                    spec_set=True)
+        new = [mk.MagicMock(spec=agent.Agent) for _ in range(3)]
+        for agent_new in new:
+            agent_new.simulation = self.simulation
+
+        self.assertIsNone(agent.Agent.batch_activate(new))
+        self.assertEqual(self.simulation.agents.batch_activate.
+                            call_args_list,
+                         [mk.call(new)])
+
+        # Test no agents
+        self.simulation.agents.batch_activate.reset_mock()
+        self.assertIsNone(agent.Agent.batch_activate([]))
+        self.assertEqual(self.simulation.agents.batch_activate.
+                            call_args_list, [])
+
     def test_deactivate(self):
         """test deactivate the agent"""
 
@@ -131,6 +151,18 @@ class TestAgent(ut.TestCase):
             self.assertEqual(self.Agent.alive, False)
             self.assertEqual(mkDeactivate.call_args_list, [mk.call(self.Agent)])
 
+    def test_fusible(self):
+        """test determine if actions can be fused"""
+
+        for _ in range(3):
+            self.assertFalse(self.Agent.fusible(mk.MagicMock(spec=str)))
+
+    def test_reads(self):
+        """test get the agent types an action reads"""
+
+        for _ in range(3):
+            self.assertEqual(self.Agent.reads(mk.MagicMock(spec=str)), [])
+
     def test_reset(self):
         """test reset the agent"""
 
@@ -11,6 +11,8 @@ import source.agents.egg      as egg
 import source.agents.egg_mass as egg_mass
 import source.agents.insect   as insect
 
+import source.schedule.schedule as schedule
+
 import source.simulation.behaviors  as behaviors
 import source.simulation.models     as models
 import source.simulation.simulation as simulation
@@ -33,10 +35,11 @@ class BehaviorsTest(behaviors.Behaviors):
 class SimulationTest(simulation.Simulation):
     """Class to add dynamic values for tests"""
 
-    agents    = mk.create_autospec(agents.Agents, spec_set=True)
-    behaviors = mk.create_autospec(BehaviorsTest, spec_set=True)
-    space     = mk.create_autospec(space.Space,   spec_set=True)
-    models    = mk.create_autospec(models.Models, spec_set=True)
+    agents    = mk.create_autospec(agents.Agents,     spec_set=True)
+    behaviors = mk.create_autospec(BehaviorsTest,     spec_set=True)
+    space     = mk.create_autospec(space.Space,       spec_set=True)
+    models    = mk.create_autospec(models.Models,     spec_set=True)
+    schedule  = mk.create_autospec(schedule.Schedule, spec_set=True)
 
 
 class TestEgg(ut.TestCase):
@@ -124,6 +127,44 @@ class TestEgg(ut.TestCase):
         self.assertEqual(self.Egg.alive, False)
         self.assertEqual(self.Egg.death, keyword.cannibalism)
 
+    def test_activate(self):
+        """test activate the agent"""
+
+        self.simulation.agents   = mk.create_autospec(agents.Agents,
+                                                      spec_set=True)
+        self.simulation.schedule = mk.create_autospec(schedule.Schedule,
+                                                      spec_set=True)
+
+        master = mk.MagicMock()
+        master.attach_mock(self.simulation.agents.activate,    'activate')
+        master.attach_mock(self.simulation.schedule.register, 'register')
+
+        self.assertEqual(self.Egg.activate(), None)
+        self.assertEqual(master.mock_calls,
+                         [mk.call.activate(self.Egg),
+                          mk.call.register(self.Egg)])
+
+    def test_batch_activate(self):
+        """test activate a collection of agents"""
+
+        self.simulation.agents   = mk.create_autospec(agents.Agents,
+                                                      spec_set=True)
+        self.simulation.schedule = mk.create_autospec(schedule.Schedule,
+                                                      spec_set=True)
+        new = [self.Egg, mk.MagicMock(spec=egg.Egg)]
+        new[1].simulation = self.simulation
+
+        master = mk.MagicMock()
+        master.attach_mock(self.simulation.agents.batch_activate,
+                           'batch_activate')
+        master.attach_mock(self.simulation.schedule.register, 'register')
+
+        self.assertIsNone(egg.Egg.batch_activate(new))
+        self.assertEqual(master.mock_calls,
+                         [mk.call.batch_activate(new),
+                          mk.call.register(new[0]),
+                          mk.call.register(new[1])])
+
     def test_survive(self):
         """test run survive behavior"""
 
@@ -152,6 +193,66 @@ class TestEgg(ut.TestCase):
         self.assertEqual(self.development.develop.call_args_list,
                          [mk.call(self.Egg)])
 
+    def test_event(self):
+        """test sample the next event"""
+
+        lifetime = mk.MagicMock(spec=float)
+        duration = mk.MagicMock(spec=float)
+        self.survival.lifetime.return_value    = lifetime
+        self.development.duration.return_value = duration
+
+        # Test dies first
+        lifetime.__le__.return_value = True
+        self.assertEqual(self.Egg.event(), (lifetime, keyword.survive))
+        self.assertEqual(lifetime.__le__.call_args_list, [mk.call(duration)])
+        self.assertEqual(self.survival.lifetime.call_args_list,
+                         [mk.call(self.Egg)])
+        self.assertEqual(self.development.duration.call_args_list,
+                         [mk.call(self.Egg)])
+
+        # Test develops first
+        lifetime.__le__.return_value = False
+        self.assertEqual(self.Egg.event(), (duration, keyword.develop))
+
+        # Test with real values
+        self.survival.lifetime.return_value    = 3
+        self.development.duration.return_value = 3
+        self.assertEqual(self.Egg.event(), (3, keyword.survive))
+        self.development.duration.return_value = 2
+        self.assertEqual(self.Egg.event(), (2, keyword.develop))
+
+    def test_fire(self):
+        """test have the event happen"""
+
+        self.simulation.agents = mk.create_autospec(agents.Agents,
+                                                    spec_set=True)
+
+        # Test not alive
+        self.Egg.alive = False
+        self.Egg.age   = 2
+        self.assertEqual(self.Egg.fire(3, keyword.survive), None)
+        self.assertEqual(self.Egg.age,   2)
+        self.assertEqual(self.Egg.death, self.death)
+        self.assertEqual(self.development.transform.call_args_list, [])
+
+        # Test develop
+        self.Egg.alive = True
+        self.assertEqual(self.Egg.fire(3, keyword.develop), None)
+        self.assertEqual(self.Egg.age,   5)
+        self.assertEqual(self.Egg.alive, True)
+        self.assertEqual(self.development.transform.call_args_list,
+                         [mk.call(self.Egg)])
+
+        # Test survive
+        self.development.transform.reset_mock()
+        self.assertEqual(self.Egg.fire(1, keyword.survive), None)
+        self.assertEqual(self.Egg.age,   6)
+        self.assertEqual(self.Egg.alive, False)
+        self.assertEqual(self.Egg.death, keyword.survival)
+        self.assertEqual(self.simulation.agents.deactivate.call_args_list,
+                         [mk.call(self.Egg)])
+        self.assertEqual(self.development.transform.call_args_list, [])
+
     def test_initialize(self):
         """test initialize a egg"""
 
@@ -324,6 +324,28 @@ class TestEggMass(ut.TestCase):
             self.assertEqual(self.eggs.activate.call_args_list,
                              [mk.call()])
 
+    def test_batch_activate(self):
+        """test activate a collection of egg_masses"""
+
+        eggs = [{mk.MagicMock(spec=str): mk.MagicMock(spec=agent_egg.Egg)
+                 for _ in range(index + 1)} for index in range(2)]
+        new  = [mk.MagicMock(spec=egg_mass.EggMass) for _ in range(2)]
+        for index, agent_new in enumerate(new):
+            agent_new.eggs = eggs[index]
+            agent_new.alive = False
+
+        with mk.patch.object(agent.Agent, 'batch_activate',
+                             autospec=True) as mkAgent:
+            with mk.patch.object(agent_egg.Egg, 'batch_activate',
+                                 autospec=True) as mkEgg:
+                self.assertIsNone(egg_mass.EggMass.batch_activate(new))
+                self.assertEqual(mkAgent.call_args_list, [mk.call(new)])
+                self.assertEqual(mkEgg.call_args_list,
+                                 [mk.call(list(eggs[0].values()) +
+                                          list(eggs[1].values()))])
+        for agent_new in new:
+            self.assertTrue(agent_new.alive)
+
     def test_deactivate(self):
         """test deactivate the egg_mass"""
 
@@ -630,7 +652,63 @@ class TestEggMass(ut.TestCase):
                 self.assertEqual(len(mkGenerate.call_args_list), 3)
                 self.assertEqual(mkAlleles.call_args_list,
                                  [mk.call(mother), mk.call(father)])
-                
+
+    def test_batch_genotypes(self):
+        """test generate genotypes all at once"""
+
+        # Test homozygous parents
+        self.assertEqual(self.EggMass.batch_genotypes(4,
+                                                      keyword.homo_r,
+                                                      keyword.homo_r),
+                         [keyword.homo_r]*4)
+        self.assertEqual(self.EggMass.batch_genotypes(4,
+                                                      keyword.homo_s,
+                                                      keyword.homo_s),
+                         [keyword.homo_s]*4)
+        self.assertEqual(self.EggMass.batch_genotypes(4,
+                                                      keyword.homo_r,
+                                                      keyword.homo_s),
+                         [keyword.hetero]*4)
+        self.assertEqual(self.EggMass.batch_genotypes(0,
+                                                      keyword.hetero,
+                                                      keyword.hetero),
+                         [])
+
+        # Test heterozygous parents
+        genotypes = self.EggMass.batch_genotypes(1000,
+                                                 keyword.hetero,
+                                                 keyword.hetero)
+        self.assertEqual(len(genotypes), 1000)
+        self.assertEqual(set(genotypes),
+                         {keyword.homo_r, keyword.hetero, keyword.homo_s})
+
+        # Test bad genotype
+        with self.assertRaises(RuntimeError):
+            self.EggMass.batch_genotypes(4, keyword.homo_r,
+                                         mk.MagicMock(spec=str))
+
+    def test_batch_parents(self):
+        """test get the parents of initial egg_masses"""
+
+        # Test homozygous
+        for genotype in [keyword.homo_r, keyword.homo_s]:
+            self.assertEqual(egg_mass.EggMass.batch_parents(genotype, 7),
+                             [(genotype, genotype, 7)])
+
+        # Test heterozygous
+        with mk.patch.object(rnd, 'binomial', autospec=True) as mkBinomial:
+            mkBinomial.return_value = 3
+
+            self.assertEqual(egg_mass.EggMass.batch_parents(keyword.hetero,
+                                                            7),
+                             [(keyword.homo_r, keyword.homo_s, 3),
+                              (keyword.homo_s, keyword.homo_r, 4)])
+            self.assertEqual(mkBinomial.call_args_list, [mk.call(7, 0.5)])
+
+        # Test practical
+        parents = egg_mass.EggMass.batch_parents(keyword.hetero, 10)
+        self.assertEqual(sum(count for _, _, count in parents), 10)
+
     def test_empty(self):
         """test initialize egg_mass without eggs"""
 
@@ -825,6 +903,48 @@ class TestEggMass(ut.TestCase):
                 self.simulation.space.reset_mock()
                 self.simulation.models.reset_mock()
 
+    def test_batch_setup(self):
+        """test setup several initial egg_masses"""
+
+        self.simulation.space = mk.create_autospec(space.Space, spec_set=True)
+        locations = [mk.create_autospec(location.Location, spec_set=True)
+                     for _ in range(5)]
+        self.simulation.space.new_locations.return_value = locations
+
+        unique_id_nums = [1, 2, 3, 4, 5]
+        initial_key    = 'initial'
+        unique_ids     = ['initial{}{}'.format(num, keyword.egg_mass)
+                          for num in unique_id_nums]
+        genotype       = mk.MagicMock(spec=str)
+        parents        = [(mk.MagicMock(spec=str), mk.MagicMock(spec=str), 2),
+                          (mk.MagicMock(spec=str), mk.MagicMock(spec=str), 3)]
+        new            = [[mk.MagicMock(spec=egg_mass.EggMass)
+                           for _ in range(count)]
+                          for _, _, count in parents]
+
+        with mk.patch.object(egg_mass.EggMass, 'batch_parents',
+                             autospec=True) as mkParents:
+            with mk.patch.object(egg_mass.EggMass, 'batch_initialize',
+                                 autospec=True) as mkInitialize:
+                mkParents.return_value    = parents
+                mkInitialize.side_effect = new
+
+                self.assertEqual(egg_mass.EggMass.batch_setup(unique_id_nums,
+                                                              initial_key,
+                                                              self.simulation,
+                                                              genotype),
+                                 new[0] + new[1])
+                self.assertEqual(mkParents.call_args_list,
+                                 [mk.call(genotype, 5)])
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call(unique_ids[:2], self.simulation,
+                                          locations[:2], *parents[0][:2]),
+                                  mk.call(unique_ids[2:], self.simulation,
+                                          locations[2:], *parents[1][:2])])
+                self.assertEqual(self.simulation.space.
+                                 new_locations.call_args_list,
+                                 [mk.call(keyword.egg_depth, 5)])
+
     def test_birth(self):
         """test birth a new egg_mass"""
 
@@ -903,3 +1023,78 @@ class TestEggMass(ut.TestCase):
             self.assertEqual(mkGenotypes.call_args_list,
                              [mk.call(self.EggMass, number,
                                       adult.genotype, adult.mate)])
+
+    def test_batch_initialize(self):
+        """test initialize several new egg_masses"""
+
+        self.simulation = mk.MagicMock(spec=SimulationTest)
+        self.simulation.models = mk.create_autospec(models.Models,
+                                                    spec_set=True)
+        batch = self.simulation.models.__getitem__.return_value.batch
+        batch.side_effect = [np.array([2, 1]), np.array([0.5, 0.7])]
+
+        genotypes = [mk.MagicMock(spec=str) for _ in range(3)]
+        unique_ids = ['a', 'b']
+        locations  = [mk.create_autospec(location.Location, spec_set=True)
+                      for _ in range(2)]
+
+        mother = mk.MagicMock(spec=str)
+        father = mk.MagicMock(spec=str)
+
+        with mk.patch.object(egg_mass.EggMass, 'batch_genotypes',
+                             autospec=True) as mkGenotypes:
+            mkGenotypes.return_value = genotypes
+
+            egg_masses = egg_mass.EggMass.batch_initialize(unique_ids,
+                                                            self.simulation,
+                                                            locations,
+                                                            mother, father)
+            self.assertEqual(len(egg_masses), 2)
+            for index, new in enumerate(egg_masses):
+                self.assertIsInstance(new, egg_mass.EggMass)
+                self.assertEqual(new.agent_key,  keyword.egg_mass)
+                self.assertEqual(new.unique_id,  unique_ids[index])
+                self.assertEqual(new.simulation, self.simulation)
+                self.assertEqual(new.location,   locations[index])
+                self.assertIsInstance(new.eggs, egg_mass.Eggs)
+            self.assertEqual(egg_masses[0].eggs.mass, 0.5)
+            self.assertEqual(egg_masses[1].eggs.mass, 0.7)
+            self.assertEqual([egg.genotype for egg in
+                              egg_masses[0].eggs.values()], genotypes[:2])
+            self.assertEqual([egg.genotype for egg in
+                              egg_masses[1].eggs.values()], genotypes[2:])
+
+            self.assertEqual(mkGenotypes.call_args_list,
+                             [mk.call(3, mother, father)])
+            self.assertEqual(batch.call_args_list,
+                             [mk.call(mother, 2),
+                              mk.call(mother, 2)])
+            self.assertEqual(self.simulation.models.
+                             __getitem__.call_args_list,
+                             [mk.call(keyword.init_num),
+                              mk.call(keyword.init_mass)])
+
+    def test_births(self):
+        """test birth several new egg_masses"""
+
+        unique_ids = [mk.MagicMock(spec=str) for _ in range(3)]
+        locations  = [mk.create_autospec(location.Location, spec_set=True)
+                      for _ in range(3)]
+
+        adult = mk.MagicMock(spec=AdultTest)
+        adult.simulation = self.simulation
+
+        adult.new_unique_id.   side_effect = unique_ids
+        adult.new_egg_location.side_effect = locations
+
+        with mk.patch.object(egg_mass.EggMass, 'batch_initialize',
+                             autospec=True) as mkInitialize:
+            self.assertEqual(egg_mass.EggMass.births(adult, 3),
+                             mkInitialize.return_value)
+            self.assertEqual(mkInitialize.call_args_list,
+                             [mk.call(unique_ids, self.simulation, locations,
+                                      adult.genotype, adult.mate)])
+            self.assertEqual(adult.new_unique_id.call_args_list,
+                             [mk.call() for _ in range(3)])
+            self.assertEqual(adult.new_egg_location.call_args_list,
+                             [mk.call() for _ in range(3)])
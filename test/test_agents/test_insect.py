@@ -3,6 +3,7 @@ import unittest.mock as mk
 
 import dataclasses as dclass
 import itertools   as i_tools
+import numpy       as np
 
 import source.keyword as keyword
 
@@ -22,19 +23,6 @@ class SimulationTest(simulation.Simulation):
     agents = mk.create_autospec(agents.Agents, spec_set=True)
 
 
-class EnvironmentTest(environment.Environment):
-    """Class to add dynamic values for tests"""
-
-    bt    = mk.MagicMock(spec=str)
-    plant = mk.MagicMock(spec=float)
-
-
-class AgentsBinTest(agents.AgentsBin):
-    """Class to add dynamic values for tests"""
-
-    environment = mk.create_autospec(EnvironmentTest, spec_set=True)
-
-
 class TestInsect(ut.TestCase):
     """test base Insect class"""
 
@@ -86,50 +74,86 @@ class TestInsect(ut.TestCase):
         # noinspection PyTypeChecker
         self.assertEqual(next(self.Insect._age_count),
                          next(i_tools.count(self.age + 1)))
+        self.assertIsNone(self.Insect._plant_id)
 
         self.assertTrue(dclass.is_dataclass(self.Insect))
 
+    def test_plant_id(self):
+        """test get the id of the plant"""
+
+        self.simulation.agents = mk.MagicMock(spec=agents.Agents)
+        self.simulation.agents.environment = \
+            mk.create_autospec(environment.Environment, spec_set=True)
+        environ = self.simulation.agents.environment
+
+        self.assertIsNone(self.Insect._plant_id)
+
+        # Test not cached
+        self.assertEqual(self.Insect.plant_id,
+                         environ.plant_id.return_value)
+        self.assertEqual(self.Insect._plant_id,
+                         environ.plant_id.return_value)
+        self.assertEqual(environ.plant_id.call_args_list,
+                         [mk.call(self.location)])
+
+        # Test cached
+        self.assertEqual(self.Insect.plant_id,
+                         environ.plant_id.return_value)
+        self.assertEqual(environ.plant_id.call_args_list,
+                         [mk.call(self.location)])
+
     def test_bt(self):
         """test get the bt state of the plant"""
 
-        self.simulation.agents = mk.create_autospec(agents.Agents,
-                                                    spec_set=True)
-        self.simulation.agents.__getitem__.return_value = \
-            mk.create_autospec(AgentsBinTest, spec_set=True)
-        self.simulation.agents.__getitem__.return_value.environment = \
-            mk.create_autospec(EnvironmentTest, spec_set=True)
-        self.location.__getitem__.return_value = \
-            mk.create_autospec(location.Location, spec_set=True)
-
-        self.assertEqual(self.Insect.bt,
-                         self.simulation.agents.__getitem__.return_value.
-                            environment.bt)
-        self.assertEqual(self.simulation.agents.__getitem__.call_args_list,
-                         [mk.call(self.location.__getitem__.return_value.
-                                    location_key)])
-        self.assertEqual(self.location.__getitem__.call_args_list,
-                         [mk.call(slice(None, keyword.bt_depth, None))])
+        self.simulation.agents = mk.MagicMock(spec=agents.Agents)
+        self.simulation.agents.environment = \
+            mk.create_autospec(environment.Environment, spec_set=True)
+        environ = self.simulation.agents.environment
+
+        self.Insect._plant_id = mk.MagicMock(spec=int)
+
+        self.assertEqual(self.Insect.bt, environ.bt_state.return_value)
+        self.assertEqual(environ.bt_state.call_args_list,
+                         [mk.call(self.Insect._plant_id)])
+        self.assertEqual(environ.plant_id.call_args_list, [])
 
     def test_plant(self):
         """test get the plant mass"""
 
-        self.simulation.agents = mk.create_autospec(agents.Agents,
-                                                    spec_set=True)
-        self.simulation.agents.__getitem__.return_value = \
-            mk.create_autospec(AgentsBinTest, spec_set=True)
-        self.simulation.agents.__getitem__.return_value.environment = \
-            mk.create_autospec(EnvironmentTest, spec_set=True)
-        self.location.__getitem__.return_value = \
-            mk.create_autospec(location.Location, spec_set=True)
-
-        self.assertEqual(self.Insect.plant,
-                         self.simulation.agents.__getitem__.return_value.
-                         environment.plant)
-        self.assertEqual(self.simulation.agents.__getitem__.call_args_list,
-                         [mk.call(self.location.__getitem__.return_value.
-                                  location_key)])
-        self.assertEqual(self.location.__getitem__.call_args_list,
-                         [mk.call(slice(None, keyword.plant_depth, None))])
+        self.simulation.agents = mk.MagicMock(spec=agents.Agents)
+        self.simulation.agents.environment = \
+            mk.MagicMock(spec=environment.Environment)
+        self.simulation.agents.environment.plant = np.array([1.0, 2.5])
+
+        self.Insect._plant_id = 1
+
+        self.assertEqual(self.Insect.plant, 2.5)
+        self.assertIsInstance(self.Insect.plant, float)
+
+    def test_transfer(self):
+        """test transfer the insect to a new vertex"""
+
+        vertex = mk.MagicMock(spec=int)
+
+        with mk.patch.object(agent.Agent, 'transfer',
+                             autospec=True) as mkTransfer:
+            # Test move within plant
+            self.Insect._plant_id = 3
+            self.assertIsNone(self.Insect.transfer(vertex,
+                                                   keyword.leaf_level))
+            self.assertEqual(self.Insect._plant_id, 3)
+            self.assertEqual(mkTransfer.call_args_list,
+                             [mk.call(self.Insect, vertex,
+                                      keyword.leaf_level)])
+
+            mkTransfer.reset_mock()
+            # Test move between plants
+            self.assertIsNone(self.Insect.transfer(vertex,
+                                                   keyword.plant_level))
+            self.assertIsNone(self.Insect._plant_id)
+            self.assertEqual(mkTransfer.call_args_list,
+                             [mk.call(self.Insect, vertex,
+                                      keyword.plant_level)])
 
     def test_advance_age(self):
         """test age the agent"""
@@ -150,7 +174,38 @@ class TestInsect(ut.TestCase):
                          next(counter))
         self.assertEqual(self.Insect.age,
                          self.age.__add__.return_value.__add__.return_value)
-        
+
+    def test_batch_advance_age(self):
+        """test age a population of agents"""
+
+        insects = [insect.Insect(self.agent_key,
+                                 self.unique_id,
+                                 self.simulation,
+                                 self.location,
+                                 alive,
+                                 self.mass,
+                                 self.genotype,
+                                 3,
+                                 self.death)
+                   for alive in [True, False, True]]
+        sink = []
+
+        self.assertEqual(insect.Insect.batch_advance_age(insects, sink),
+                         None)
+        self.assertEqual([agent.age for agent in insects], [4, 4, 4])
+        self.assertEqual(sink, [])
+
+        insect.Insect.batch_advance_age(insects, sink)
+        self.assertEqual([agent.age for agent in insects], [5, 5, 5])
+        self.assertEqual(sink, [])
+
+        # Test same as advancing each agent
+        for agent in insects:
+            agent.advance_age()
+        self.assertEqual([agent.age for agent in insects], [6, 6, 6])
+        insect.Insect.batch_advance_age(insects, sink)
+        self.assertEqual([agent.age for agent in insects], [7, 7, 7])
+
     def test_die(self):
         """test have agent die"""
 
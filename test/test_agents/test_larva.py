@@ -419,7 +419,20 @@ class TestLarva(ut.TestCase):
                 # Can consume and does not have target
                 self.assertEqual(self.Larva.move(), [])
                 self.assertEqual(self.movement.move.call_args_list,
-                                 [mk.call(self.Larva)])
+                                 [mk.call(self.Larva, 1)])
+
+        with mk.patch.object(larva.Larva, '_can_consume',
+                             autospec=True) as mkCan:
+            with mk.patch.object(larva.Larva, '_has_target',
+                                 autospec=True) as mkHas:
+                mkCan.__get__ = mk.MagicMock(return_value=True)
+                mkHas.__get__ = mk.MagicMock(return_value=False)
+                self.movement.move.reset_mock()
+
+                # Move a number of times
+                self.assertEqual(self.Larva.move(3), [])
+                self.assertEqual(self.movement.move.call_args_list,
+                                 [mk.call(self.Larva, 3)])
 
     def test__consume_plant(self):
         """test consume the plant"""
@@ -435,7 +448,17 @@ class TestLarva(ut.TestCase):
             # Can consume
             self.Larva._consume_plant()
             self.assertEqual(self.forage_plant.consume.call_args_list,
-                             [mk.call(self.Larva)])
+                             [mk.call(self.Larva, 1)])
+
+        with mk.patch.object(larva.Larva, '_can_consume',
+                             autospec=True) as mkCan:
+            mkCan.__get__ = mk.MagicMock(return_value=True)
+            self.forage_plant.consume.reset_mock()
+
+            # Consume a number of bites
+            self.Larva._consume_plant(3)
+            self.assertEqual(self.forage_plant.consume.call_args_list,
+                             [mk.call(self.Larva, 3)])
 
     def test_consume_egg(self):
         """test consume the egg"""
@@ -509,6 +532,46 @@ class TestLarva(ut.TestCase):
                                  [mk.call()])
             self.assertEqual(len(self.location.copy.call_args_list), 3)
 
+    def test_target_bins(self):
+        """test get the bins of targets"""
+
+        kwargs = {'test': mk.MagicMock()}
+
+        self.simulation.agents = mk.create_autospec(agents.Agents,
+                                                    spec_set=True)
+
+        location_keys = []
+        agents_bins   = []
+        bins          = []
+        for index in range(3):
+            location_key = mk.MagicMock(spec=tuple)
+            agents_bin   = mk.create_autospec(agents.AgentsBin, spec_set=True)
+            egg_bin      = mk.create_autospec(agents.AgentBin, spec_set=True)
+            larva_bin    = mk.create_autospec(agents.AgentBin, spec_set=True)
+
+            bins.extend([egg_bin, larva_bin])
+            agents_bin.__getitem__.side_effect = [egg_bin, larva_bin]
+
+            location_keys.append(location_key)
+            agents_bins.  append(agents_bin)
+
+        self.simulation.agents.__getitem__.side_effect = agents_bins
+
+        with mk.patch.object(larva.Larva, '_location_keys',
+                             autospec=True) as mkKeys:
+            mkKeys.return_value = location_keys
+
+            self.assertEqual(self.Larva.target_bins(**kwargs), bins)
+            self.assertEqual(mkKeys.call_args_list,
+                             [mk.call(self.Larva, **kwargs)])
+            self.assertEqual(self.simulation.agents.__getitem__.call_args_list,
+                             [mk.call(location_key)
+                              for location_key in location_keys])
+            for agents_bin in agents_bins:
+                self.assertEqual(agents_bin.__getitem__.call_args_list,
+                                 [mk.call(keyword.egg_mass),
+                                  mk.call(keyword.larva)])
+
     def test_targets(self):
         """test get the targets"""
 
@@ -582,7 +645,55 @@ class TestLarva(ut.TestCase):
                 self.assertEqual(master.mock_calls,
                                  [mk.call.target(),
                                   mk.call.cannibalism.cannibalism(self.Larva),
-                                  mk.call.plant()])
+                                  mk.call.plant(1)])
+
+                master.reset_mock()
+                self.assertEqual(self.Larva.consume(3), [])
+                self.assertEqual(master.mock_calls,
+                                 [mk.call.target(),
+                                  mk.call.cannibalism.cannibalism(self.Larva),
+                                  mk.call.plant(3)])
+
+    def test_fusible(self):
+        """test determine if actions can be fused"""
+
+        # Cannibalism interacts
+        self.cannibalism.interacts = True
+        for action in [keyword.move, keyword.consume, keyword.grow,
+                       keyword.survive, keyword.develop, keyword.reset]:
+            self.assertFalse(self.Larva.fusible(action))
+
+        # Cannibalism does not interact
+        self.cannibalism.interacts = False
+        self.forage_plant.deplete  = False
+        self.assertTrue(self.Larva.fusible(keyword.move))
+        self.assertTrue(self.Larva.fusible(keyword.consume))
+        for action in [keyword.grow, keyword.survive, keyword.develop,
+                       keyword.reset, keyword.advance_age]:
+            self.assertFalse(self.Larva.fusible(action))
+
+        # Plants are depleted
+        self.forage_plant.deplete = True
+        for action in [keyword.move, keyword.consume, keyword.grow,
+                       keyword.survive, keyword.develop, keyword.reset]:
+            self.assertFalse(self.Larva.fusible(action))
+
+    def test_reads(self):
+        """test get the agent types an action reads"""
+
+        # Cannibalism interacts
+        self.cannibalism.interacts = True
+        self.assertEqual(self.Larva.reads(keyword.consume),
+                         [keyword.egg_mass, keyword.larva])
+        for action in [keyword.move, keyword.grow, keyword.survive,
+                       keyword.develop, keyword.reset]:
+            self.assertEqual(self.Larva.reads(action), [])
+
+        # Cannibalism does not interact
+        self.cannibalism.interacts = False
+        for action in [keyword.move, keyword.consume, keyword.grow,
+                       keyword.survive, keyword.develop, keyword.reset]:
+            self.assertEqual(self.Larva.reads(action), [])
 
     def test_reset(self):
         """test empty the gut system"""
@@ -593,6 +704,93 @@ class TestLarva(ut.TestCase):
         self.assertEqual(self.Larva.larva_gut, 0)
         self.assertEqual(self.Larva.full,      False)
 
+    def test_batch_reset(self):
+        """test empty the gut system of a population"""
+
+        larvae = [mk.MagicMock(spec=larva.Larva)
+                  for _ in range(3)]
+        sink   = []
+
+        self.assertEqual(larva.Larva.batch_reset(larvae, sink), None)
+        for agent in larvae:
+            self.assertEqual(agent.plant_gut, 0)
+            self.assertEqual(agent.egg_gut,   0)
+            self.assertEqual(agent.larva_gut, 0)
+            self.assertEqual(agent.full,      False)
+        self.assertEqual(sink, [])
+
+    def test_batch_move(self):
+        """test move a population"""
+
+        movement_larva = mk.create_autospec(movement.Larva, spec_set=True)
+
+        larvae = [mk.MagicMock(spec=larva.Larva) for _ in range(4)]
+        sink   = []
+        for agent in larvae:
+            agent._can_consume = True
+            agent._has_target  = False
+            agent.movement     = movement_larva
+        larvae[1]._can_consume = False
+        larvae[2]._has_target  = True
+
+        self.assertEqual(larva.Larva.batch_move(larvae, sink), None)
+        self.assertEqual(movement_larva.batch_move.call_args_list,
+                         [mk.call([larvae[0], larvae[3]])])
+        for agent in larvae:
+            self.assertEqual(agent.move.call_args_list, [])
+        self.assertEqual(sink, [])
+
+        # No larvae to move
+        movement_larva.reset_mock()
+        self.assertEqual(larva.Larva.batch_move(larvae[1:3], sink), None)
+        self.assertEqual(movement_larva.batch_move.call_args_list, [])
+
+    def test_batch_consume(self):
+        """test consume for a population"""
+
+        loss     = mk.create_autospec(target_loss.Target,     spec_set=True)
+        cannibal = mk.create_autospec(cannibalism.Cannibalism, spec_set=True)
+        forage   = mk.create_autospec(forage_plant.Plant,      spec_set=True)
+
+        larvae = [mk.MagicMock(spec=larva.Larva) for _ in range(3)]
+        sink   = []
+        for agent in larvae:
+            agent.alive        = True
+            agent._can_consume = True
+            agent.loss         = loss
+            agent.cannibalism  = cannibal
+            agent.forage_plant = forage
+        larvae[0]._has_target = False
+        larvae[1]._has_target = True
+        larvae[2]._has_target = True
+
+        self.assertEqual(larva.Larva.batch_consume(larvae, sink), None)
+        self.assertEqual(loss.batch_consume.call_args_list,
+                         [mk.call(larvae[1:])])
+        self.assertEqual(cannibal.batch_cannibalism.call_args_list,
+                         [mk.call(larvae)])
+        self.assertEqual(forage.batch_consume.call_args_list,
+                         [mk.call(larvae)])
+        self.assertEqual(sink, [])
+
+        # No larvae with targets
+        larvae[1].alive = False
+        larvae[1]._can_consume = False
+        larvae[2]._has_target = False
+        loss.reset_mock()
+        forage.reset_mock()
+        self.assertEqual(larva.Larva.batch_consume(larvae, sink), None)
+        self.assertEqual(loss.batch_consume.call_args_list, [])
+        self.assertEqual(forage.batch_consume.call_args_list,
+                         [mk.call([larvae[0], larvae[2]])])
+
+        # No larvae can consume
+        forage.reset_mock()
+        for agent in larvae:
+            agent._can_consume = False
+        self.assertEqual(larva.Larva.batch_consume(larvae, sink), None)
+        self.assertEqual(forage.batch_consume.call_args_list, [])
+
     def test_initialize(self):
         """test initialize a larva"""
 
@@ -735,6 +933,49 @@ class TestLarva(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Larva))
 
+    def test_batch_setup(self):
+        """test setup several initial larvae"""
+
+        self.simulation.space  = mk.create_autospec(space.Space, spec_set=True)
+        self.simulation.models = mk.create_autospec(models.Models,
+                                                    spec_set=True)
+        locations = [mk.create_autospec(location.Location, spec_set=True)
+                     for _ in range(3)]
+        masses    = [mk.MagicMock(spec=float) for _ in range(3)]
+        self.simulation.space.new_locations.return_value = locations
+        batch = self.simulation.models.__getitem__.return_value.batch
+        batch.return_value = masses
+
+        unique_id_nums = [1, 2, 3]
+        initial_key    = 'initial'
+
+        with mk.patch.object(larva.Larva, 'initialize',
+                             autospec=True) as mkInitialize:
+            with mk.patch.object(larva, 'float') as mkFloat:
+                mkInitialize.side_effect = [mk.MagicMock(spec=larva.Larva)
+                                            for _ in range(3)]
+                mkFloat.side_effect = masses
+
+                new = larva.Larva.batch_setup(unique_id_nums,
+                                             initial_key,
+                                             self.simulation,
+                                             self.genotype)
+                self.assertEqual(len(new), 3)
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call('initial{}{}'.format(num,
+                                                               keyword.larva),
+                                          self.simulation, locations[index],
+                                          masses[index], self.genotype)
+                                  for index, num in enumerate(unique_id_nums)])
+                self.assertEqual(mkFloat.call_args_list,
+                                 [mk.call(mass) for mass in masses])
+
+        self.assertEqual(self.simulation.space.new_locations.call_args_list,
+                         [mk.call(keyword.larva_depth, 3)])
+        self.assertEqual(batch.call_args_list, [mk.call(self.genotype, 3)])
+        self.assertEqual(self.simulation.models.__getitem__.call_args_list,
+                         [mk.call(keyword.init_juvenile)])
+
     def test_advance(self):
         """test advance a egg into a larva"""
 
@@ -11,6 +11,8 @@ import source.agents.larva  as agent_larva
 import source.agents.pupa   as pupa
 import source.agents.insect as insect
 
+import source.schedule.schedule as schedule
+
 import source.simulation.behaviors  as behaviors
 import source.simulation.models     as models
 import source.simulation.simulation as simulation
@@ -33,10 +35,11 @@ class BehaviorsTest(behaviors.Behaviors):
 class SimulationTest(simulation.Simulation):
     """Class to add dynamic values for tests"""
 
-    agents    = mk.create_autospec(agents.Agents, spec_set=True)
-    behaviors = mk.create_autospec(BehaviorsTest, spec_set=True)
-    space     = mk.create_autospec(space.Space,   spec_set=True)
-    models    = mk.create_autospec(models.Models, spec_set=True)
+    agents    = mk.create_autospec(agents.Agents,     spec_set=True)
+    behaviors = mk.create_autospec(BehaviorsTest,     spec_set=True)
+    space     = mk.create_autospec(space.Space,       spec_set=True)
+    models    = mk.create_autospec(models.Models,     spec_set=True)
+    schedule  = mk.create_autospec(schedule.Schedule, spec_set=True)
 
 
 class LarvaTest(agent_larva.Larva):
@@ -110,6 +113,44 @@ class TestPupa(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Pupa))
 
+    def test_activate(self):
+        """test activate the agent"""
+
+        self.simulation.agents   = mk.create_autospec(agents.Agents,
+                                                      spec_set=True)
+        self.simulation.schedule = mk.create_autospec(schedule.Schedule,
+                                                      spec_set=True)
+
+        master = mk.MagicMock()
+        master.attach_mock(self.simulation.agents.activate,    'activate')
+        master.attach_mock(self.simulation.schedule.register, 'register')
+
+        self.assertEqual(self.Pupa.activate(), None)
+        self.assertEqual(master.mock_calls,
+                         [mk.call.activate(self.Pupa),
+                          mk.call.register(self.Pupa)])
+
+    def test_batch_activate(self):
+        """test activate a collection of agents"""
+
+        self.simulation.agents   = mk.create_autospec(agents.Agents,
+                                                      spec_set=True)
+        self.simulation.schedule = mk.create_autospec(schedule.Schedule,
+                                                      spec_set=True)
+        new = [self.Pupa, mk.MagicMock(spec=pupa.Pupa)]
+        new[1].simulation = self.simulation
+
+        master = mk.MagicMock()
+        master.attach_mock(self.simulation.agents.batch_activate,
+                           'batch_activate')
+        master.attach_mock(self.simulation.schedule.register, 'register')
+
+        self.assertIsNone(pupa.Pupa.batch_activate(new))
+        self.assertEqual(master.mock_calls,
+                         [mk.call.batch_activate(new),
+                          mk.call.register(new[0]),
+                          mk.call.register(new[1])])
+
     def test_survive(self):
         """test run survive behavior"""
 
@@ -138,6 +179,66 @@ class TestPupa(ut.TestCase):
         self.assertEqual(self.development.develop.call_args_list,
                          [mk.call(self.Pupa)])
         
+    def test_event(self):
+        """test sample the next event"""
+
+        lifetime = mk.MagicMock(spec=float)
+        duration = mk.MagicMock(spec=float)
+        self.survival.lifetime.return_value    = lifetime
+        self.development.duration.return_value = duration
+
+        # Test dies first
+        lifetime.__le__.return_value = True
+        self.assertEqual(self.Pupa.event(), (lifetime, keyword.survive))
+        self.assertEqual(lifetime.__le__.call_args_list, [mk.call(duration)])
+        self.assertEqual(self.survival.lifetime.call_args_list,
+                         [mk.call(self.Pupa)])
+        self.assertEqual(self.development.duration.call_args_list,
+                         [mk.call(self.Pupa)])
+
+        # Test develops first
+        lifetime.__le__.return_value = False
+        self.assertEqual(self.Pupa.event(), (duration, keyword.develop))
+
+        # Test with real values
+        self.survival.lifetime.return_value    = 3
+        self.development.duration.return_value = 3
+        self.assertEqual(self.Pupa.event(), (3, keyword.survive))
+        self.development.duration.return_value = 2
+        self.assertEqual(self.Pupa.event(), (2, keyword.develop))
+
+    def test_fire(self):
+        """test have the event happen"""
+
+        self.simulation.agents = mk.create_autospec(agents.Agents,
+                                                    spec_set=True)
+
+        # Test not alive
+        self.Pupa.alive = False
+        self.Pupa.age   = 2
+        self.assertEqual(self.Pupa.fire(3, keyword.survive), None)
+        self.assertEqual(self.Pupa.age,   2)
+        self.assertEqual(self.Pupa.death, self.death)
+        self.assertEqual(self.development.transform.call_args_list, [])
+
+        # Test develop
+        self.Pupa.alive = True
+        self.assertEqual(self.Pupa.fire(3, keyword.develop), None)
+        self.assertEqual(self.Pupa.age,   5)
+        self.assertEqual(self.Pupa.alive, True)
+        self.assertEqual(self.development.transform.call_args_list,
+                         [mk.call(self.Pupa)])
+
+        # Test survive
+        self.development.transform.reset_mock()
+        self.assertEqual(self.Pupa.fire(1, keyword.survive), None)
+        self.assertEqual(self.Pupa.age,   6)
+        self.assertEqual(self.Pupa.alive, False)
+        self.assertEqual(self.Pupa.death, keyword.survival)
+        self.assertEqual(self.simulation.agents.deactivate.call_args_list,
+                         [mk.call(self.Pupa)])
+        self.assertEqual(self.development.transform.call_args_list, [])
+
     def test_initialize(self):
         """test initialize a pupa"""
 
@@ -238,6 +339,49 @@ class TestPupa(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Pupa))
 
+    def test_batch_setup(self):
+        """test setup several initial pupae"""
+
+        self.simulation.space  = mk.create_autospec(space.Space, spec_set=True)
+        self.simulation.models = mk.create_autospec(models.Models,
+                                                    spec_set=True)
+        locations = [mk.create_autospec(location.Location, spec_set=True)
+                     for _ in range(3)]
+        masses    = [mk.MagicMock(spec=float) for _ in range(3)]
+        self.simulation.space.new_locations.return_value = locations
+        batch = self.simulation.models.__getitem__.return_value.batch
+        batch.return_value = masses
+
+        unique_id_nums = [1, 2, 3]
+        initial_key    = 'initial'
+
+        with mk.patch.object(pupa.Pupa, 'initialize',
+                             autospec=True) as mkInitialize:
+            with mk.patch.object(pupa, 'float') as mkFloat:
+                mkInitialize.side_effect = [mk.MagicMock(spec=pupa.Pupa)
+                                            for _ in range(3)]
+                mkFloat.side_effect = masses
+
+                new = pupa.Pupa.batch_setup(unique_id_nums,
+                                             initial_key,
+                                             self.simulation,
+                                             self.genotype)
+                self.assertEqual(len(new), 3)
+                self.assertEqual(mkInitialize.call_args_list,
+                                 [mk.call('initial{}{}'.format(num,
+                                                               keyword.pupa),
+                                          self.simulation, locations[index],
+                                          masses[index], self.genotype)
+                                  for index, num in enumerate(unique_id_nums)])
+                self.assertEqual(mkFloat.call_args_list,
+                                 [mk.call(mass) for mass in masses])
+
+        self.assertEqual(self.simulation.space.new_locations.call_args_list,
+                         [mk.call(keyword.pupa_depth, 3)])
+        self.assertEqual(batch.call_args_list, [mk.call(self.genotype, 3)])
+        self.assertEqual(self.simulation.models.__getitem__.call_args_list,
+                         [mk.call(keyword.init_mature)])
+
     def test_advance(self):
         """test advance a larva into a pupa"""
 
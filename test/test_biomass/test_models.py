@@ -128,6 +128,26 @@ class TestInitNum(ut.TestCase):
                 self.assertEqual(mkRVS.call_args_list,
                                  [mk.call(self.lam)])
 
+    def test_batch(self):
+        """test call the model for several egg_masses"""
+
+        genotype = mk.MagicMock(spec=str)
+        number   = mk.MagicMock(spec=int)
+
+        with mk.patch.object(stats.poisson, 'rvs', autospec=True) as mkRVS:
+            self.assertEqual(self.InitNum.batch(genotype, number),
+                             mkRVS.return_value.astype.return_value)
+            self.assertEqual(mkRVS.return_value.astype.call_args_list,
+                             [mk.call(int)])
+            self.assertEqual(mkRVS.call_args_list,
+                             [mk.call(self.lam, size=number)])
+
+        # Test practical
+        self.InitNum = model.InitNum(3.0)
+        nums = self.InitNum.batch(genotype, 5)
+        self.assertEqual(nums.shape, (5,))
+        self.assertTrue(np.issubdtype(nums.dtype, np.integer))
+
 
 class TestInitMass(ut.TestCase):
     """test the InitMass mathematical model"""
@@ -178,6 +198,28 @@ class TestInitMass(ut.TestCase):
                 self.assertEqual(self.sigma.__getitem__.call_args_list,
                                  [mk.call(genotype)])
 
+    def test_batch(self):
+        """test call the model for several egg_masses"""
+
+        genotype = mk.MagicMock(spec=str)
+        number   = mk.MagicMock(spec=int)
+
+        with mk.patch.object(stats.truncnorm, 'rvs',
+                             autospec=True) as mkRVS:
+            self.assertEqual(self.InitMass.batch(genotype, number),
+                             mkRVS.return_value)
+            self.assertEqual(mkRVS.call_args_list,
+                             [mk.call(0,
+                                      np.inf,
+                                      loc=self.mu.__getitem__.return_value,
+                                      scale=self.sigma.
+                                        __getitem__.return_value,
+                                      size=number)])
+            self.assertEqual(self.mu.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+            self.assertEqual(self.sigma.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+
 
 class TestInitJuvenile(ut.TestCase):
     """test InitJuvenile mathematical models"""
@@ -228,6 +270,28 @@ class TestInitJuvenile(ut.TestCase):
                 self.assertEqual(self.sigma.__getitem__.call_args_list,
                                  [mk.call(genotype)])
 
+    def test_batch(self):
+        """test call the model for several larvae"""
+
+        genotype = mk.MagicMock(spec=str)
+        number   = mk.MagicMock(spec=int)
+
+        with mk.patch.object(stats.truncnorm, 'rvs',
+                             autospec=True) as mkRVS:
+            self.assertEqual(self.InitJuvenile.batch(genotype, number),
+                             mkRVS.return_value)
+            self.assertEqual(mkRVS.call_args_list,
+                             [mk.call(0,
+                                      np.inf,
+                                      loc=self.mu.__getitem__.return_value,
+                                      scale=self.sigma.
+                                        __getitem__.return_value,
+                                      size=number)])
+            self.assertEqual(self.mu.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+            self.assertEqual(self.sigma.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+
 
 class TestInitMature(ut.TestCase):
     """test the InitMature mathematical model"""
@@ -278,6 +342,28 @@ class TestInitMature(ut.TestCase):
                 self.assertEqual(self.sigma.__getitem__.call_args_list,
                                  [mk.call(genotype)])
 
+    def test_batch(self):
+        """test call the model for several insects"""
+
+        genotype = mk.MagicMock(spec=str)
+        number   = mk.MagicMock(spec=int)
+
+        with mk.patch.object(stats.truncnorm, 'rvs',
+                             autospec=True) as mkRVS:
+            self.assertEqual(self.InitMature.batch(genotype, number),
+                             mkRVS.return_value)
+            self.assertEqual(mkRVS.call_args_list,
+                             [mk.call(0,
+                                      np.inf,
+                                      loc=self.mu.__getitem__.return_value,
+                                      scale=self.sigma.
+                                        __getitem__.return_value,
+                                      size=number)])
+            self.assertEqual(self.mu.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+            self.assertEqual(self.sigma.__getitem__.call_args_list,
+                             [mk.call(genotype)])
+
 
 class TestInitPlant(ut.TestCase):
     """test the InitPlant mathematical model"""
@@ -0,0 +1,280 @@
+import unittest as ut
+
+import dataclasses as dclass
+import numpy       as np
+import os
+import pandas      as pd
+import sqlalchemy  as sql
+import tempfile
+
+import source.keyword as keyword
+
+import source.data.convergence as convergence
+import source.data.database    as database
+import source.data.metrics     as metrics
+import source.data.statistics  as statistics
+
+
+def write_run(directory: str,
+              run_num:   int,
+              counts:    dict) -> None:
+    """Write a run's genotype counts to a columnar store"""
+
+    store  = database.ColumnStore(1, 'sim_{}'.format(run_num), directory)
+    window = {((0,), agent, keyword.genotype, genotype):
+              np.array(values)
+              for (agent, genotype), values in counts.items()}
+    store._write((window, 0))
+
+
+def write_window(directory: str,
+                 run_num:   int,
+                 counts:    dict) -> None:
+    """Write a run's genotype counts to a window file"""
+
+    os.makedirs(os.path.join(directory, 'sim'), exist_ok=True)
+    steps     = len(next(iter(counts.values())))
+    file_name = '0_to_{}_sim_{}.sqlite'.format(steps - 1, run_num)
+    engine    = sql.create_engine('sqlite:///{}'.
+                                  format(os.path.join(directory, 'sim',
+                                                      file_name)))
+
+    for table_name, values in counts.items():
+        pd.DataFrame(values, columns=metrics.genotype_columns).\
+            to_sql(table_name, engine, if_exists='replace')
+    engine.dispose()
+
+
+class TestConvergence(ut.TestCase):
+    """test the Convergence class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.Convergence = convergence.Convergence.setup(5)
+
+        self.runs = [{'table0': pd.DataFrame(np.random.rand(6, 2),
+                                             columns=['a', 'b']),
+                      'table1': pd.DataFrame(np.random.rand(4, 1),
+                                             columns=['c'])}
+                     for _ in range(5)]
+        self.runs[1]['table0'].loc[2, 'b'] = np.nan
+
+    def reference(self) -> dict:
+        """Compute the errors by concatenating the runs"""
+
+        def mean(number: int) -> dict:
+            return {table_name: pd.concat([run[table_name]
+                                           for run in self.runs[:number]]).
+                    groupby(level=0).mean()
+                    for table_name in self.runs[0]}
+
+        points = [1, 2, 4, 5]
+        total  = mean(5)
+
+        integral = {}
+        for point, after in zip(points[:-1], points[1:]):
+            mean_0 = mean(point)
+            mean_1 = mean(after)
+            integral[point] = {table_name: (mean_0[table_name] -
+                                            mean_1[table_name]).abs().sum() /
+                               total[table_name].sum()
+                               for table_name in total}
+
+        return integral
+
+    def test_checkpoints(self):
+        """test get the numbers of runs to compare at"""
+
+        self.assertEqual(convergence.checkpoints(1), [1])
+        self.assertEqual(convergence.checkpoints(2), [1, 2])
+        self.assertEqual(convergence.checkpoints(5), [1, 2, 4, 5])
+        self.assertEqual(convergence.checkpoints(8), [1, 2, 4, 8])
+        self.assertEqual(convergence.checkpoints(200),
+                         [1, 2, 4, 8, 16, 32, 64, 128, 200])
+        self.assertEqual(convergence.checkpoints(1000),
+                         [1, 2, 4, 8, 16, 32, 64, 128, 1000])
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Convergence, convergence.Convergence)
+
+        self.assertEqual(self.Convergence.checkpoints, [1, 2, 4, 5])
+        self.assertEqual(self.Convergence.moments,  {})
+        self.assertEqual(self.Convergence.columns,  {})
+        self.assertEqual(self.Convergence.previous, {})
+        self.assertEqual(self.Convergence.errors,   {})
+        self.assertEqual(self.Convergence.runs,     0)
+
+        self.assertTrue(dclass.is_dataclass(self.Convergence))
+
+    def test_add(self):
+        """test add a run's tables"""
+
+        self.Convergence.add(self.runs[0])
+        self.assertEqual(self.Convergence.runs, 1)
+        self.assertEqual(self.Convergence.columns,
+                         {'table0': ['a', 'b'], 'table1': ['c']})
+        for moments in self.Convergence.moments.values():
+            self.assertIsInstance(moments, statistics.Moments)
+        np.testing.assert_allclose(self.Convergence.previous['table0'],
+                                   self.runs[0]['table0'])
+        self.assertEqual(self.Convergence.errors, {})
+
+        # Test a run between checkpoints is only added to the means
+        for run in self.runs[1:3]:
+            self.Convergence.add(run)
+        self.assertEqual(list(self.Convergence.errors.keys()), [1])
+        mean = pd.concat([run['table0'] for run in self.runs[:2]]).\
+            groupby(level=0).mean()
+        np.testing.assert_allclose(self.Convergence.previous['table0'],
+                                   mean)
+
+        # Test mismatched tables
+        with self.assertRaises(ValueError):
+            self.Convergence.add({'table1': self.runs[0]['table1'].iloc[1:]})
+        with self.assertRaises(ValueError):
+            self.Convergence.add(
+                {'table0': self.runs[0]['table0'][['b', 'a']]})
+
+    def test_mean(self):
+        """test get the current mean of a table"""
+
+        for run in self.runs[:3]:
+            self.Convergence.add(run)
+
+        for table_name in ['table0', 'table1']:
+            pd.testing.assert_frame_equal(
+                self.Convergence.mean(table_name),
+                pd.concat([run[table_name] for run in self.runs[:3]]).
+                groupby(level=0).mean())
+
+    def test_integral(self):
+        """test get the relative error integral"""
+
+        for run in self.runs:
+            self.Convergence.add(run)
+
+        integral = self.Convergence.integral()
+        expected = self.reference()
+
+        self.assertEqual(list(integral.keys()), [1, 2, 4])
+        for point, tables in expected.items():
+            for table_name, values in tables.items():
+                pd.testing.assert_series_equal(integral[point][table_name],
+                                               values)
+
+
+class TestStoreRuns(ut.TestCase):
+    """test reading runs from the columnar store"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        write_run(self.directory.name, 1,
+                  {('egg',   keyword.homo_r): [1, 0, 2, 3],
+                   ('egg',   keyword.homo_s): [1, 1, 0, 0],
+                   ('larva', keyword.hetero): [0, 4, 0, 0]})
+        write_run(self.directory.name, 0,
+                  {('egg',   keyword.homo_s): [2, 0, 0, 0],
+                   ('larva', keyword.homo_r): [1, 1, 1, 0]})
+
+    def test_store_runs(self):
+        """test read the runs' tables"""
+
+        runs = convergence.store_runs(self.directory.name, 'sim',
+                                      ['(0,)_egg', '(0,)_larva'])
+
+        run_num, dataframes = next(runs)
+        self.assertEqual(run_num, 0)
+        self.assertEqual(list(dataframes.keys()), ['(0,)_egg', '(0,)_larva'])
+        egg = dataframes['(0,)_egg']
+        np.testing.assert_array_equal(egg['genotype_susceptible'],
+                                      [2, 0, 0])
+        np.testing.assert_array_equal(egg['genotype_resistant'], [0, 0, 0])
+        np.testing.assert_array_equal(egg['percent'], [0, np.nan, np.nan])
+        np.testing.assert_array_equal(
+            dataframes['(0,)_larva']['genotype_resistant'], [1, 1, 1])
+
+        run_num, dataframes = next(runs)
+        self.assertEqual(run_num, 1)
+        np.testing.assert_array_equal(
+            dataframes['(0,)_egg']['genotype_resistant'], [1, 0, 2, 3])
+        np.testing.assert_array_equal(
+            dataframes['(0,)_larva']['genotype_heterozygous'], [0, 4, 0, 0])
+
+        with self.assertRaises(StopIteration):
+            next(runs)
+
+        # Test cut and fixed steps
+        runs = dict(convergence.store_runs(self.directory.name, 'sim',
+                                           ['(0,)_egg'], 1, 4))
+        self.assertEqual(list(runs.keys()), [0, 1])
+        for dataframes in runs.values():
+            self.assertEqual(len(dataframes['(0,)_egg'].index), 3)
+            self.assertEqual(list(dataframes['(0,)_egg'].index), [0, 1, 2])
+        np.testing.assert_array_equal(
+            runs[1]['(0,)_egg']['genotype_resistant'], [0, 2, 3])
+
+
+class TestWindowRuns(ut.TestCase):
+    """test reading runs from the window files"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.counts = {run_num: {'(0,)_egg':   np.random.randint(0, 5,
+                                                                 (4, 3)),
+                                 '(0,)_larva': np.random.randint(0, 5,
+                                                                 (4, 3))}
+                       for run_num in range(2)}
+        for run_num, counts in self.counts.items():
+            write_window(self.directory.name, run_num, counts)
+
+    def test_window_runs(self):
+        """test read the runs' tables"""
+
+        runs = dict(convergence.window_runs(self.directory.name, 'sim',
+                                            ['(0,)_egg', '(0,)_larva'], 1))
+
+        self.assertEqual(list(runs.keys()), [0, 1])
+        for run_num, dataframes in runs.items():
+            self.assertEqual(list(dataframes.keys()),
+                             ['(0,)_egg', '(0,)_larva'])
+            for table_name, dataframe in dataframes.items():
+                expected = pd.DataFrame(self.counts[run_num][table_name][1:],
+                                        columns=metrics.genotype_columns)
+                metrics.add_metrics(expected)
+                pd.testing.assert_frame_equal(dataframe, expected,
+                                              check_dtype=False)
+
+    def test_simulation_runs(self):
+        """test get the runs from wherever they were written"""
+
+        # Test window files by default
+        number, runs = convergence.simulation_runs(self.directory.name,
+                                                   'sim', ['(0,)_egg'])
+        self.assertEqual(number, 2)
+        runs = dict(runs)
+        self.assertEqual(list(runs.keys()), [0, 1])
+        np.testing.assert_array_equal(
+            runs[1]['(0,)_egg'][metrics.genotype_columns],
+            self.counts[1]['(0,)_egg'])
+
+        # Test the columnar store when written
+        write_run(self.directory.name, 0,
+                  {('egg', keyword.homo_s): [2, 1, 3]})
+        number, runs = convergence.simulation_runs(self.directory.name,
+                                                   'sim', ['(0,)_egg'])
+        self.assertEqual(number, 1)
+        run_num, dataframes = next(runs)
+        self.assertEqual(run_num, 0)
+        np.testing.assert_array_equal(
+            dataframes['(0,)_egg']['genotype_susceptible'], [2, 1, 3])
@@ -70,6 +70,23 @@ class TestDataColumn(ut.TestCase):
         self.assertEqual(self.DataColumn[-1], count.__getitem__.return_value)
         self.assertNotEqual(self.data, self.DataColumn)
 
+
+    def test_merge(self):
+        """test merge another column"""
+
+        self.DataColumn = counter.DataColumn([1, 2, 3], self.attr_value)
+        other           = counter.DataColumn([4, 5, 6], self.attr_value)
+
+        # Test merge all
+        self.assertIsNone(self.DataColumn.merge(other))
+        self.assertEqual(self.DataColumn, [5, 7, 9])
+        self.assertEqual(other,           [4, 5, 6])
+
+        # Test merge from start
+        self.DataColumn = counter.DataColumn([1, 2, 3], self.attr_value)
+        self.assertIsNone(self.DataColumn.merge(other, 1))
+        self.assertEqual(self.DataColumn, [1, 7, 9])
+
     def test_empty(self):
         """test create an empty data column"""
 
@@ -123,6 +140,28 @@ class TestDataColumns(ut.TestCase):
             self.assertEqual(column.clear.call_args_list,
                              [mk.call()])
 
+
+    def test_merge(self):
+        """test merge other data columns"""
+
+        other = {attr_value: mk.create_autospec(counter.DataColumn,
+                                                spec_set=True)
+                 for attr_value in self.data}
+        start = mk.MagicMock(spec=int)
+
+        # Test default start
+        self.assertIsNone(self.DataColumns.merge(other))
+        for attr_value, column in self.data.items():
+            self.assertEqual(column.merge.call_args_list,
+                             [mk.call(other[attr_value], 0)])
+            column.reset_mock()
+
+        # Test given start
+        self.assertIsNone(self.DataColumns.merge(other, start))
+        for attr_value, column in self.data.items():
+            self.assertEqual(column.merge.call_args_list,
+                             [mk.call(other[attr_value], start)])
+
     def test_columns(self):
         """test generate all the columns of data"""
 
@@ -136,6 +175,16 @@ class TestDataColumns(ut.TestCase):
             self.assertEqual(columns[column_key], value)
         self.assertEqual(len(columns), len(self.data))
 
+    def test_long_columns(self):
+        """test generate all the columns of data by attribute and value"""
+
+        columns = self.DataColumns.long_columns()
+
+        self.assertIsInstance(columns, dict)
+        self.assertEqual(columns,
+                         {(self.attr, key): value
+                          for key, value in self.data.items()})
+
     def test_empty(self):
         """test create an empty set of data columns"""
 
@@ -199,6 +248,14 @@ class TestBaseCount(ut.TestCase):
 
         self.assertIsNone(self.Count.sub(agent))
 
+
+    def test_release(self):
+        """test release count"""
+
+        agent = mk.create_autospec(main_agent.Agent, spec_set=True)
+
+        self.assertIsNone(self.Count.release(agent))
+
     def test_record(self):
         """test record counts"""
 
@@ -209,11 +266,24 @@ class TestBaseCount(ut.TestCase):
 
         self.assertIsNone(self.Count.refresh())
 
+
+    def test_merge(self):
+        """test merge counts"""
+
+        other = counter.BaseCount(self.counts, self.attr)
+
+        self.assertIsNone(self.Count.merge(other))
+
     def test_get_data_columns(self):
         """test get the data columns"""
 
         self.assertIsNone(self.Count.get_data_columns())
 
+    def test_get_long_columns(self):
+        """test get the data columns by attribute and value"""
+
+        self.assertIsNone(self.Count.get_long_columns())
+
 
 class TestCount(ut.TestCase):
     """test Count class"""
@@ -387,6 +457,37 @@ class TestCount(ut.TestCase):
         count.sub(agent)
         self.assertEqual(count[False], 1)
 
+
+    def test_release(self):
+        """test release agent from counter"""
+
+        agent = mk.create_autospec(main_agent.Agent, spec_set=True)
+
+        with mk.patch.object(counter, 'getattr') as mkGet:
+            # Removal is True
+            self.Count.removal = True
+            self.Count.release(agent)
+            self.assertEqual(mkGet.call_args_list, [])
+            self.assertEqual(self.Count, self.counts)
+
+        # Practical test
+        # noinspection PyTypeChecker
+        agent = main_agent.Agent('test', 'test0', None, [0], True)
+        #   Removal is True
+        # noinspection PyTypeChecker
+        count = counter.Count.empty('alive', [True, False], True)
+        count.release(agent)
+        self.assertEqual(count[True],  0)
+        self.assertEqual(count[False], 0)
+        #   Removal is False
+        # noinspection PyTypeChecker
+        count = counter.Count.empty('alive', [True, False], False)
+        count.add(agent)
+        self.assertEqual(count[True],  1)
+        count.release(agent)
+        self.assertEqual(count[True],  0)
+        self.assertEqual(count[False], 0)
+
     def test__reset(self):
         """test reset the count"""
 
@@ -429,6 +530,26 @@ class TestCount(ut.TestCase):
                          [mk.call.columns.refresh(),
                           mk.call.columns.record(self.Count)])
 
+
+    def test_merge(self):
+        """test merge another counter"""
+
+        other = counter.Count({key: 3 for key in self.counts},
+                              self.attr,
+                              self.removal,
+                              mk.create_autospec(counter.DataColumns,
+                                                 spec_set=True))
+        start = mk.MagicMock(spec=int)
+
+        self.Count = counter.Count({key: 2 for key in self.counts},
+                                   self.attr,
+                                   self.removal,
+                                   self.data_columns)
+        self.assertIsNone(self.Count.merge(other, start))
+        self.assertEqual(self.Count, {key: 5 for key in self.counts})
+        self.assertEqual(self.data_columns.merge.call_args_list,
+                         [mk.call(other.data_columns, start)])
+
     def test_get_data_columns(self):
         """test get the data columns"""
 
@@ -437,6 +558,14 @@ class TestCount(ut.TestCase):
         self.assertEqual(self.data_columns.columns.call_args_list,
                          [mk.call()])
 
+    def test_get_long_columns(self):
+        """test get the data columns by attribute and value"""
+
+        self.assertEqual(self.Count.get_long_columns(),
+                         self.data_columns.long_columns.return_value)
+        self.assertEqual(self.data_columns.long_columns.call_args_list,
+                         [mk.call()])
+
     def test_empty(self):
         """test create empty class"""
 
@@ -640,6 +769,24 @@ class TestCountFilter(ut.TestCase):
                 self.assertIn(key, count_data)
                 self.assertEqual(count_data[key], [0])
 
+
+    def test_release(self):
+        """test release agent from counter"""
+
+        agent = mk.create_autospec(main_agent.Agent, spec_set=True)
+
+        with mk.patch.object(counter, 'getattr') as mkGet:
+            for value in self.counts.keys():
+                mkGet.return_value = value
+                self.Count.release(agent)
+                self.assertEqual(mkGet.call_args_list,
+                                 [mk.call(agent, self.attr)])
+                mkGet.reset_mock()
+
+                self.assertEqual(self.Count[value].release.call_args_list,
+                                 [mk.call(agent)])
+                self.Count[value].reset_mock()
+
     def test_record(self):
         """test record data"""
 
@@ -656,6 +803,18 @@ class TestCountFilter(ut.TestCase):
             self.assertEqual(count.refresh.call_args_list,
                              [mk.call()])
 
+
+    def test_merge(self):
+        """test merge another counter"""
+
+        other = {value: mk.MagicMock() for value in self.counts}
+        start = mk.MagicMock(spec=int)
+
+        self.Count.merge(other, start)
+        for value, count in self.counts.items():
+            self.assertEqual(count.merge.call_args_list,
+                             [mk.call(other[value], start)])
+
     def test_get_data_columns(self):
         """test get the data columns"""
 
@@ -675,6 +834,26 @@ class TestCountFilter(ut.TestCase):
         for count in self.Count.values():
             self.assertEqual(count.get_data_columns.call_args_list,
                              [mk.call()])
+
+    def test_get_long_columns(self):
+        """test get the data columns by attribute and value"""
+
+        long_columns = {}
+        for attr_value, count in self.counts.items():
+            long_column = {('attr{}'.format(index), 'value{}'.format(index)):
+                               mk.create_autospec(counter.DataColumn,
+                                                  spec_set=True)
+                           for index in range(3)}
+            count.get_long_columns.return_value = long_column
+
+            for (attr, value), column in long_column.items():
+                key = ('{}_{}_{}'.format(self.attr, attr_value, attr), value)
+                long_columns[key] = column
+
+        self.assertEqual(self.Count.get_long_columns(), long_columns)
+        for count in self.Count.values():
+            self.assertEqual(count.get_long_columns.call_args_list,
+                             [mk.call()])
             
     def test_empty(self):
         """test build an empty class"""
@@ -881,6 +1060,17 @@ class TestCounts(ut.TestCase):
             self.assertEqual(count.sub.call_args_list,
                              [mk.call(agent)])
 
+
+    def test_release(self):
+        """test release from counts of all things"""
+
+        agent = mk.create_autospec(main_agent.Agent, spec_set=True)
+
+        self.Counts.release(agent)
+        for count in self.counts.values():
+            self.assertEqual(count.release.call_args_list,
+                             [mk.call(agent)])
+
     def test_record(self):
         """test record the counts"""
 
@@ -897,6 +1087,18 @@ class TestCounts(ut.TestCase):
             self.assertEqual(count.refresh.call_args_list,
                              [mk.call()])
 
+
+    def test_merge(self):
+        """test merge other counts"""
+
+        other = {attr_key: mk.MagicMock() for attr_key in self.counts}
+        start = mk.MagicMock(spec=int)
+
+        self.Counts.merge(other, start)
+        for attr_key, count in self.counts.items():
+            self.assertEqual(count.merge.call_args_list,
+                             [mk.call(other[attr_key], start)])
+
     def test_columns(self):
         """test create all the columns of data"""
 
@@ -917,6 +1119,44 @@ class TestCounts(ut.TestCase):
             self.assertEqual(count.get_data_columns.call_args_list,
                              [mk.call()])
 
+    def test_long_columns(self):
+        """test create all the columns of data by attribute and value"""
+
+        columns = {}
+        for count in self.counts.values():
+            column = {}
+            for _ in range(3):
+                key   = (mk.MagicMock(spec=str), mk.MagicMock(spec=str))
+                value = mk.create_autospec(counter.DataColumn, spec_set=True)
+
+                column[ key] = value
+                columns[key] = value
+
+            count.get_long_columns.return_value = column
+
+        self.assertEqual(self.Counts.long_columns(), columns)
+        for count in self.Counts.values():
+            self.assertEqual(count.get_long_columns.call_args_list,
+                             [mk.call()])
+
+    def test_snapshot(self):
+        """test copy the recorded data"""
+
+        columns = {'a': counter.DataColumn([1, 2], mk.MagicMock(spec=str)),
+                   'b': counter.DataColumn([3, 4], mk.MagicMock(spec=str))}
+
+        with mk.patch.object(counter.Counts, 'columns', autospec=True,
+                             return_value=columns) as mkColumns:
+            snapshot = self.Counts.snapshot()
+            self.assertEqual(snapshot, {'a': [1, 2], 'b': [3, 4]})
+            self.assertEqual(mkColumns.call_args_list,
+                             [mk.call(self.Counts)])
+
+        # Test the snapshot is a copy
+        for column in columns.values():
+            column.clear()
+        self.assertEqual(snapshot, {'a': [1, 2], 'b': [3, 4]})
+
     def test_dataframe(self):
         """test create a dataframe of the data"""
 
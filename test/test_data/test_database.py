@@ -2,9 +2,18 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
+import os
+import pickle      as pk
 import sqlalchemy  as sql
+import sqlite3
 import pandas      as pd
+import tempfile
+import threading
 
+import source.keyword as keyword
+
+import source.data.counter  as counter
 import source.data.database as database
 
 import source.simulation.simulation as main_simulation
@@ -19,6 +28,91 @@ class SimulationTest(main_simulation.Simulation):
     timestep = mk.MagicMock(spec=int)
 
 
+class TestWriter(ut.TestCase):
+    """test the Writer class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.database = mk.create_autospec(database.Database, spec_set=True,
+                                           instance=True)
+        self.size     = 2
+
+        self.Writer = database.Writer(self.database, self.size)
+        self.addCleanup(self.Writer.close)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Writer, database.Writer)
+
+        self.assertEqual(self.Writer.database, self.database)
+        self.assertEqual(self.Writer.queue.maxsize, self.size)
+        self.assertEqual(self.Writer.errors, [])
+        self.assertIsInstance(self.Writer.thread, threading.Thread)
+        self.assertTrue(self.Writer.thread.daemon)
+        self.assertTrue(self.Writer.thread.is_alive())
+
+    def test_put(self):
+        """test hand windows to the writer"""
+
+        windows = [mk.MagicMock() for _ in range(5)]
+
+        for window in windows:
+            self.Writer.put(window)
+        self.Writer.flush()
+        self.assertEqual(self.database._write.call_args_list,
+                         [mk.call(window) for window in windows])
+
+    def test_put_back_pressure(self):
+        """test the writer holds back the simulation"""
+
+        release = threading.Event()
+        self.database._write.side_effect = lambda window: release.wait()
+
+        for _ in range(self.size + 1):
+            self.Writer.put(mk.MagicMock())
+        self.assertTrue(self.Writer.queue.full())
+
+        putter = threading.Thread(target=self.Writer.put,
+                                  args=(mk.MagicMock(),))
+        putter.start()
+        putter.join(0.1)
+        self.assertTrue(putter.is_alive())
+
+        release.set()
+        putter.join()
+        self.Writer.flush()
+        self.assertEqual(len(self.database._write.call_args_list),
+                         self.size + 2)
+
+    def test_errors(self):
+        """test the errors of the writes are raised"""
+
+        self.database._write.side_effect = [RuntimeError('test'), None]
+
+        self.Writer.put(mk.MagicMock())
+        with self.assertRaises(RuntimeError):
+            self.Writer.flush()
+        with self.assertRaises(RuntimeError):
+            self.Writer.put(mk.MagicMock())
+
+        self.Writer.errors.clear()
+
+    def test_close(self):
+        """test stop the writer"""
+
+        window = mk.MagicMock()
+
+        self.Writer.put(window)
+        self.Writer.close()
+        self.assertFalse(self.Writer.thread.is_alive())
+        self.assertEqual(self.database._write.call_args_list,
+                         [mk.call(window)])
+
+        self.Writer = database.Writer(self.database, self.size)
+
+
 class TestDatabase(ut.TestCase):
     """test the Database system class"""
 
@@ -49,6 +143,8 @@ class TestDatabase(ut.TestCase):
                          self.prev_dump.__add__.return_value)
         self.assertEqual(self.prev_dump.__add__.call_args_list,
                          [mk.call(self.spacing)])
+        self.assertEqual(self.Database.queue_size, 0)
+        self.assertEqual(self.Database._writer,    None)
 
         self.assertTrue(dclass.is_dataclass(self.Database))
 
@@ -82,30 +178,125 @@ class TestDatabase(ut.TestCase):
         self.assertEqual(self.Database.sql_file_name(simulation),
                          dialect + time + str(self.file_name))
 
-    def test__save(self):
-        """test save data to file"""
+    def test___getstate__(self):
+        """test pickle the database without the writer"""
+
+        self.Database = database.Database(2, queue_size=3)
+        self.Database._writer = database.Writer(self.Database, 3)
+        self.addCleanup(self.Database.flush)
+
+        new = pk.loads(pk.dumps(self.Database))
+        self.assertEqual(new.spacing,    2)
+        self.assertEqual(new.queue_size, 3)
+        self.assertEqual(new._writer,    None)
+        self.assertIsInstance(self.Database._writer, database.Writer)
+
+    def test__window(self):
+        """test take the data of the current window"""
 
         simulation = mk.create_autospec(SimulationTest, spec_set=True)
         simulation.agents = mk.create_autospec(main_agents.Agents,
                                                spec_set=True)
+
+        with mk.patch.object(database.Database, 'sql_file_name',
+                             autospec=True) as mkName:
+            self.assertEqual(self.Database._window(simulation),
+                             (simulation.agents.snapshot.return_value,
+                              mkName.return_value))
+            self.assertEqual(mkName.call_args_list,
+                             [mk.call(self.Database, simulation)])
+            self.assertEqual(simulation.agents.snapshot.call_args_list,
+                             [mk.call()])
+            self.assertEqual(simulation.agents.dataframes.call_args_list,
+                             [])
+
+    def test_dataframes(self):
+        """test create the dataframes of a window"""
+
+        snapshot = {'(0,)_male':  {'a': [1, 2], 'b': [3, 4]},
+                    '(0,)_egg':   {'a': []},
+                    '(0,)_larva': {}}
+
+        dataframes = database.Database.dataframes(snapshot)
+        self.assertEqual(list(dataframes.keys()), ['(0,)_male'])
+        pd.testing.assert_frame_equal(dataframes['(0,)_male'],
+                                      pd.DataFrame({'a': [1, 2],
+                                                    'b': [3, 4]}))
+
+    def test__write(self):
+        """test write a window to a file"""
+
+        file_name  = mk.MagicMock(spec=str)
+        snapshot   = mk.MagicMock(spec=dict)
         dataframes = {mk.MagicMock(spec=str): mk.create_autospec(pd.DataFrame,
                                                                  spec_set=True)
                       for _ in range(3)}
-        simulation.agents.dataframes.return_value = dataframes
 
-        with mk.patch.object(database.Database, 'sql_file_name',
-                             autospec=True) as mkName:
-            with mk.patch.object(sql, 'create_engine') as mkSQL:
-                self.Database._save(simulation)
+        with mk.patch.object(sql, 'create_engine') as mkSQL:
+            with mk.patch.object(database.Database, 'dataframes',
+                                 autospec=True,
+                                 return_value=dataframes) as mkDataframes:
+                self.Database._write((snapshot, file_name))
+                self.assertEqual(mkDataframes.call_args_list,
+                                 [mk.call(snapshot)])
                 for table_name, dataframe in dataframes.items():
                     self.assertEqual(dataframe.to_sql.call_args_list,
-                                     [mk.call(table_name, mkSQL.return_value)])
-                self.assertEqual(mkSQL.call_args_list,
-                                 [mk.call(mkName.return_value)])
-                self.assertEqual(mkName.call_args_list,
-                                 [mk.call(self.Database, simulation)])
-                self.assertEqual(simulation.agents.dataframes.call_args_list,
-                                 [mk.call()])
+                                     [mk.call(table_name,
+                                              mkSQL.return_value)])
+                self.assertEqual(mkSQL.call_args_list, [mk.call(file_name)])
+
+    def test__save(self):
+        """test save data to file"""
+
+        simulation = mk.create_autospec(SimulationTest, spec_set=True)
+
+        with mk.patch.object(database.Database, '_window',
+                             autospec=True) as mkWindow:
+            with mk.patch.object(database.Database, '_write',
+                                 autospec=True) as mkWrite:
+                with mk.patch.object(database, 'Writer',
+                                     autospec=True) as mkWriter:
+                    # Test write inline
+                    self.Database._save(simulation)
+                    self.assertEqual(mkWrite.call_args_list,
+                                     [mk.call(self.Database,
+                                              mkWindow.return_value)])
+                    self.assertEqual(mkWindow.call_args_list,
+                                     [mk.call(self.Database, simulation)])
+                    self.assertEqual(mkWriter.call_args_list, [])
+
+                    # Test hand to the writer
+                    mkWrite.reset_mock()
+                    mkWindow.reset_mock()
+                    self.Database.queue_size = 3
+                    self.Database._save(simulation)
+                    self.assertEqual(mkWriter.call_args_list,
+                                     [mk.call(self.Database, 3)])
+                    self.assertEqual(self.Database._writer,
+                                     mkWriter.return_value)
+                    self.assertEqual(mkWriter.return_value.put.call_args_list,
+                                     [mk.call(mkWindow.return_value)])
+                    self.assertEqual(mkWrite.call_args_list, [])
+
+                    # Test writer is reused
+                    self.Database._save(simulation)
+                    self.assertEqual(len(mkWriter.call_args_list), 1)
+                    self.assertEqual(
+                        len(mkWriter.return_value.put.call_args_list), 2)
+
+    def test_flush(self):
+        """test write all the windows held by the writer"""
+
+        # Test no writer
+        self.Database.flush()
+        self.assertEqual(self.Database._writer, None)
+
+        writer = mk.create_autospec(database.Writer, spec_set=True,
+                                    instance=True)
+        self.Database._writer = writer
+        self.Database.flush()
+        self.assertEqual(self.Database._writer, None)
+        self.assertEqual(writer.close.call_args_list, [mk.call()])
 
     def test_dump(self):
         """test dump the data"""
@@ -182,3 +373,481 @@ class TestDatabase(ut.TestCase):
                          self.spacing.__radd__.return_value)
         self.assertEqual(self.spacing.__radd__.call_args_list,
                          [mk.call(0)])
+
+        self.spacing.reset_mock()
+        # Spacing, file name, and backend
+        data_tuple = (self.spacing, self.file_name, self.file_path,
+                      keyword.database_window)
+        self.Database = database.Database.setup(data_tuple)
+        self.assertIsInstance(self.Database, database.Database)
+        self.assertNotIsInstance(self.Database, database.Store)
+        self.assertEqual(self.Database.file_path, self.file_path)
+        self.assertEqual(self.Database.file_name, self.file_name)
+        self.assertEqual(self.Database.prev_dump, 0)
+
+        data_tuple = (self.spacing, self.file_name, self.file_path,
+                      keyword.database_store)
+        self.Database = database.Database.setup(data_tuple)
+        self.assertIsInstance(self.Database, database.Store)
+        self.assertEqual(self.Database.file_path, self.file_path)
+        self.assertEqual(self.Database.file_name, self.file_name)
+        self.assertEqual(self.Database.prev_dump, 0)
+
+        self.assertEqual(self.Database.queue_size, 0)
+
+        # Test the background writer
+        data_tuple = (self.spacing, self.file_name, self.file_path,
+                      keyword.database_store, 4)
+        self.Database = database.Database.setup(data_tuple)
+        self.assertIsInstance(self.Database, database.Store)
+        self.assertEqual(self.Database.queue_size, 4)
+
+        data_tuple = (self.spacing, self.file_name, self.file_path,
+                      keyword.database_long)
+        self.Database = database.Database.setup(data_tuple)
+        self.assertIsInstance(self.Database, database.LongStore)
+        self.assertEqual(self.Database.queue_size, 0)
+        self.assertEqual(self.Database.codes,      {})
+
+        data_tuple = (self.spacing, self.file_name, self.file_path,
+                      keyword.database_columnar, 2)
+        self.Database = database.Database.setup(data_tuple)
+        self.assertIsInstance(self.Database, database.ColumnStore)
+        self.assertEqual(self.Database.queue_size, 2)
+
+        data_tuple = (self.spacing, self.file_name, self.file_path, 'test')
+        with self.assertRaises(TypeError):
+            database.Database.setup(data_tuple)
+
+
+class TestStore(ut.TestCase):
+    """test the Store class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.Store = database.Store(2, 'test.sqlite', self.directory.name)
+
+        self.simulation = mk.create_autospec(SimulationTest, spec_set=True)
+        self.simulation.agents = mk.create_autospec(main_agents.Agents,
+                                                    spec_set=True)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Store, database.Store)
+        self.assertIsInstance(self.Store, database.Database)
+
+        self.assertEqual(self.Store.spacing,   2)
+        self.assertEqual(self.Store.file_name, 'test.sqlite')
+        self.assertEqual(self.Store.file_path, self.directory.name)
+        self.assertEqual(self.Store.prev_dump, 0)
+        self.assertEqual(self.Store.next_dump, 2)
+
+        self.assertTrue(dclass.is_dataclass(self.Store))
+
+    def test_store_name(self):
+        """test get the name of the store file"""
+
+        self.assertEqual(self.Store.store_name(),
+                         os.path.join(self.directory.name, 'test.sqlite'))
+
+        self.Store.file_path = ''
+        self.assertEqual(self.Store.store_name(), 'test.sqlite')
+
+    def test__connect(self):
+        """test connect to the store"""
+
+        connection = self.Store._connect()
+        self.assertIsInstance(connection, sqlite3.Connection)
+        self.assertEqual(
+            connection.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        connection.close()
+
+    def test_dump(self):
+        """test dump windows into the store"""
+
+        windows = [{'(0,)_male': {'a': [1, 2, 3],
+                                  'b': [4, 5, 6]}},
+                   {'(0,)_male': {'a': [3, 7, 8],
+                                  'b': [6, 9, 10]},
+                    '(0,)_egg':  {'a': [0, 1, 2]}},
+                   {'(0,)_male': {'a': [8],
+                                  'b': [10]}}]
+        timesteps = [2, 4, 4]
+
+        for snapshot, timestep in zip(windows, timesteps):
+            self.simulation.agents.snapshot.return_value = snapshot
+            self.simulation.timestep = timestep
+            self.Store.dump(self.simulation)
+
+        self.assertEqual(self.Store.prev_dump, 4)
+        self.assertEqual(self.Store.next_dump, 6)
+        self.assertEqual(self.simulation.agents.refresh.call_args_list,
+                         [mk.call() for _ in range(3)])
+
+        male = self.Store.read('(0,)_male')
+        self.assertEqual(male.index.name, keyword.database_step)
+        self.assertEqual(list(male.index),   [0, 1, 2, 3, 4])
+        self.assertEqual(list(male.columns), ['a', 'b'])
+        self.assertEqual(list(male['a']),    [1, 2, 3, 7, 8])
+        self.assertEqual(list(male['b']),    [4, 5, 6, 9, 10])
+
+        # Test table which starts later
+        egg = self.Store.read('(0,)_egg')
+        self.assertEqual(list(egg.index), [3, 4])
+        self.assertEqual(list(egg['a']),  [1, 2])
+
+        # Test a single file holds the run
+        self.assertEqual(os.listdir(self.directory.name).count('test.sqlite'),
+                         1)
+
+        # Test the background writer
+        self.Store = database.Store(2, 'background.sqlite',
+                                    self.directory.name, queue_size=1)
+        for snapshot, timestep in zip(windows, timesteps):
+            self.simulation.agents.snapshot.return_value = snapshot
+            self.simulation.timestep = timestep
+            self.Store.dump(self.simulation)
+        self.Store.flush()
+
+        self.assertEqual(self.Store.read('(0,)_male').values.tolist(),
+                         male.values.tolist())
+        self.assertEqual(self.Store.read('(0,)_egg').values.tolist(),
+                         egg.values.tolist())
+
+
+def make_column(values: list) -> counter.DataColumn:
+    """Create a data column holding values"""
+
+    column = counter.DataColumn([], mk.MagicMock(spec=str))
+    column.extend(values)
+
+    return column
+
+
+class TestLongStore(ut.TestCase):
+    """test the LongStore class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.LongStore = database.LongStore(2, 'test.sqlite',
+                                            self.directory.name)
+
+        self.simulation = mk.create_autospec(SimulationTest, spec_set=True)
+        self.simulation.agents = mk.create_autospec(main_agents.Agents,
+                                                    spec_set=True)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.LongStore, database.LongStore)
+        self.assertIsInstance(self.LongStore, database.Store)
+
+        self.assertEqual(self.LongStore.spacing,    2)
+        self.assertEqual(self.LongStore.file_name,  'test.sqlite')
+        self.assertEqual(self.LongStore.file_path,  self.directory.name)
+        self.assertEqual(self.LongStore.prev_dump,  0)
+        self.assertEqual(self.LongStore.next_dump,  2)
+        self.assertEqual(self.LongStore.queue_size, 0)
+        self.assertEqual(self.LongStore.codes,      {})
+
+        self.assertTrue(dclass.is_dataclass(self.LongStore))
+
+    def test__code(self):
+        """test get the code of a name"""
+
+        new = []
+        self.assertEqual(self.LongStore._code('a', 'x', new), 0)
+        self.assertEqual(self.LongStore._code('a', 'y', new), 1)
+        self.assertEqual(self.LongStore._code('a', 'x', new), 0)
+        self.assertEqual(self.LongStore._code('b', (0, 1), new), 0)
+        self.assertEqual(new, [('a', 0, 'x'), ('a', 1, 'y'),
+                               ('b', 0, '(0, 1)')])
+        self.assertEqual(self.LongStore.codes,
+                         {'a': {'x': 0, 'y': 1}, 'b': {'(0, 1)': 0}})
+
+    def test__window(self):
+        """test take the data of the current window"""
+
+        columns = {((0,), 'egg', 'genotype', 'RR'): make_column([1, 2]),
+                   ((0,), 'egg', 'genotype', 'SS'): make_column([0, 3])}
+        self.simulation.agents.long_columns.return_value = columns
+        self.LongStore.prev_dump = 4
+
+        arrays, prev_dump = self.LongStore._window(self.simulation)
+        self.assertEqual(prev_dump, 4)
+        self.assertEqual(list(arrays.keys()), list(columns.keys()))
+        for key, array in arrays.items():
+            self.assertIsInstance(array, list)
+            self.assertEqual(array, list(columns[key]))
+
+        # Test the window is a copy
+        for column in columns.values():
+            column.clear()
+        self.assertEqual(list(arrays.values()), [[1, 2], [0, 3]])
+
+    def test__rows(self):
+        """test create the rows of a window"""
+
+        arrays = {((0,), 'egg', 'genotype', 'RR'): np.array([1, 0, 2]),
+                  ((0, 1), 'larva', 'genotype', 'RR'): np.array([0, 0, 0]),
+                  ((0, 1), 'larva', 'genotype', 'SS'): np.array([5, 6, 0])}
+
+        # Test the first window
+        new  = []
+        rows = self.LongStore._rows((arrays, 0), new)
+        self.assertEqual(rows.tolist(),
+                         [[0, 0, 0, 0, 0, 1],
+                          [2, 0, 0, 0, 0, 2],
+                          [0, 1, 1, 0, 1, 5],
+                          [1, 1, 1, 0, 1, 6]])
+        self.assertEqual(new,
+                         [(keyword.database_location,  0, '(0,)'),
+                          (keyword.database_agent,     0, 'egg'),
+                          (keyword.database_attribute, 0, 'genotype'),
+                          (keyword.database_value,     0, 'RR'),
+                          (keyword.database_location,  1, '(0, 1)'),
+                          (keyword.database_agent,     1, 'larva'),
+                          (keyword.database_value,     1, 'SS')])
+
+        # Test a later window skips the row already written
+        new  = []
+        rows = self.LongStore._rows((arrays, 4), new)
+        self.assertEqual(rows.tolist(),
+                         [[6, 0, 0, 0, 0, 2],
+                          [5, 1, 1, 0, 1, 6]])
+        self.assertEqual(new, [])
+
+        # Test nothing to write
+        rows = self.LongStore._rows(({}, 4), new)
+        self.assertEqual(rows.shape, (0, 6))
+
+    def test_dump(self):
+        """test dump windows into the store"""
+
+        windows = [{((0,), 'egg', 'genotype', 'RR'): [1, 0, 2],
+                    ((0, 1), 'larva', 'genotype', 'SS'): [5, 6, 0]},
+                   {((0,), 'egg', 'genotype', 'RR'): [2, 3, 4],
+                    ((0, 1), 'larva', 'genotype', 'SS'): [0, 0, 7],
+                    ((0, 1), 'larva', 'death', 'old'): [0, 1, 0]}]
+
+        for timestep, window in zip([2, 4], windows):
+            self.simulation.agents.long_columns.return_value = \
+                {key: make_column(values) for key, values in window.items()}
+            self.simulation.timestep = timestep
+            self.LongStore.dump(self.simulation)
+
+        codes = self.LongStore.read_codes()
+        self.assertEqual(codes, self.LongStore.codes)
+        self.assertEqual(codes[keyword.database_attribute],
+                         {'genotype': 0, 'death': 1})
+
+        counts = self.LongStore.read_long()
+        self.assertEqual(list(counts.columns), list(database.long_dtypes))
+        for name, dtype in database.long_dtypes.items():
+            self.assertEqual(counts[name].dtype, dtype)
+        counts = counts.sort_values([keyword.database_location,
+                                     keyword.database_attribute,
+                                     keyword.database_step])
+        self.assertEqual(counts.values.tolist(),
+                         [[0, 0, 0, 0, 0, 1],
+                          [2, 0, 0, 0, 0, 2],
+                          [3, 0, 0, 0, 0, 3],
+                          [4, 0, 0, 0, 0, 4],
+                          [0, 1, 1, 0, 1, 5],
+                          [1, 1, 1, 0, 1, 6],
+                          [4, 1, 1, 0, 1, 7],
+                          [3, 1, 1, 1, 2, 1]])
+
+        # Test filters
+        counts = self.LongStore.read_long(location=(0, 1),
+                                          attribute='genotype')
+        self.assertEqual(sorted(counts[keyword.database_count]), [5, 6, 7])
+        counts = self.LongStore.read_long(agent='egg')
+        self.assertEqual(sorted(counts[keyword.database_count]),
+                         [1, 2, 3, 4])
+        counts = self.LongStore.read_long(agent='pupa')
+        self.assertTrue(counts.empty)
+        for name, dtype in database.long_dtypes.items():
+            self.assertEqual(counts[name].dtype, dtype)
+
+
+class TestColumnStore(ut.TestCase):
+    """test the ColumnStore class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.ColumnStore = database.ColumnStore(2, 'test_sim_3.sqlite',
+                                                self.directory.name)
+
+        self.simulation = mk.create_autospec(SimulationTest, spec_set=True)
+        self.simulation.agents = mk.create_autospec(main_agents.Agents,
+                                                    spec_set=True)
+
+        self.windows = [{((0,), 'egg', 'genotype', 'RR'): [1, 0, 2],
+                         ((0, 1), 'larva', 'genotype', 'SS'): [5, 6, 0]},
+                        {((0,), 'egg', 'genotype', 'RR'): [2, 3, 4],
+                         ((0, 1), 'larva', 'genotype', 'SS'): [0, 0, 7],
+                         ((0, 1), 'larva', 'death', 'old'): [0, 1, 0]},
+                        {((0,), 'egg', 'genotype', 'RR'): [4],
+                         ((0, 1), 'larva', 'genotype', 'SS'): [7],
+                         ((0, 1), 'larva', 'death', 'old'): [0]}]
+
+    def dump(self):
+        """Dump all the windows"""
+
+        for timestep, window in zip([2, 4, 4], self.windows):
+            self.simulation.agents.long_columns.return_value = \
+                {key: make_column(values) for key, values in window.items()}
+            self.simulation.timestep = timestep
+            self.ColumnStore.dump(self.simulation)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.ColumnStore, database.ColumnStore)
+        self.assertIsInstance(self.ColumnStore, database.LongStore)
+
+        self.assertEqual(self.ColumnStore.file_name, 'test_sim_3.sqlite')
+        self.assertEqual(self.ColumnStore.file_path, self.directory.name)
+        self.assertEqual(self.ColumnStore.codes,     {})
+
+        self.assertTrue(dclass.is_dataclass(self.ColumnStore))
+
+    def test_partition(self):
+        """test get the simulation name and run number"""
+
+        self.assertEqual(self.ColumnStore.partition(), ('test_sim', 3))
+
+        self.ColumnStore.file_name = 'test_sim_10'
+        self.assertEqual(self.ColumnStore.partition(), ('test_sim', 10))
+
+        self.ColumnStore.file_name = 'test_sim.sqlite'
+        self.assertEqual(self.ColumnStore.partition(), ('test_sim', 0))
+
+        self.ColumnStore.file_name = 'test'
+        self.assertEqual(self.ColumnStore.partition(), ('test', 0))
+
+    def test_store_name(self):
+        """test get the directory of the run"""
+
+        self.assertEqual(self.ColumnStore.store_name(),
+                         os.path.join(self.directory.name, 'test_sim', '3'))
+
+    def test_dump(self):
+        """test dump the windows as columnar chunks"""
+
+        self.dump()
+
+        directory = self.ColumnStore.store_name()
+        self.assertEqual(sorted(os.listdir(directory)),
+                         sorted(['{}.json'.format(keyword.database_codes)] +
+                                list(database.long_dtypes)))
+        for column in database.long_dtypes:
+            self.assertEqual(sorted(os.listdir(os.path.join(directory,
+                                                            column))),
+                             ['0.npy', '2.npy'])
+
+        self.assertEqual(self.ColumnStore.read_codes(),
+                         self.ColumnStore.codes)
+
+        counts = self.ColumnStore.read_long()
+        self.assertEqual(list(counts.columns), list(database.long_dtypes))
+        for name, dtype in database.long_dtypes.items():
+            self.assertEqual(counts[name].dtype, dtype)
+        counts = counts.sort_values([keyword.database_location,
+                                     keyword.database_attribute,
+                                     keyword.database_step])
+        self.assertEqual(counts.values.tolist(),
+                         [[0, 0, 0, 0, 0, 1],
+                          [2, 0, 0, 0, 0, 2],
+                          [3, 0, 0, 0, 0, 3],
+                          [4, 0, 0, 0, 0, 4],
+                          [0, 1, 1, 0, 1, 5],
+                          [1, 1, 1, 0, 1, 6],
+                          [4, 1, 1, 0, 1, 7],
+                          [3, 1, 1, 1, 2, 1]])
+
+        # Test filters
+        counts = self.ColumnStore.read_long(location=(0, 1),
+                                            attribute='genotype')
+        self.assertEqual(sorted(counts[keyword.database_count]), [5, 6, 7])
+        counts = self.ColumnStore.read_long(agent='egg')
+        self.assertEqual(sorted(counts[keyword.database_count]),
+                         [1, 2, 3, 4])
+        counts = self.ColumnStore.read_long(agent='pupa')
+        self.assertTrue(counts.empty)
+        for name, dtype in database.long_dtypes.items():
+            self.assertEqual(counts[name].dtype, dtype)
+
+        # Test an unknown name reads no chunks
+        with mk.patch.object(database.ColumnStore, '_read_chunks',
+                             autospec=True) as mkChunks:
+            self.assertTrue(self.ColumnStore.read_long(agent='pupa').empty)
+            self.assertEqual(mkChunks.call_args_list, [])
+
+    def test_read_empty(self):
+        """test read a run with nothing written"""
+
+        self.assertEqual(self.ColumnStore.read_codes(), {})
+
+        counts = self.ColumnStore.read_long()
+        self.assertTrue(counts.empty)
+        for name, dtype in database.long_dtypes.items():
+            self.assertEqual(counts[name].dtype, dtype)
+
+    def test_steps(self):
+        """test get the number of steps stored"""
+
+        self.assertEqual(self.ColumnStore.steps(), 0)
+
+        self.dump()
+        self.assertEqual(self.ColumnStore.steps(), 5)
+
+    def test_runs(self):
+        """test get the run numbers stored"""
+
+        self.dump()
+        self.ColumnStore = database.ColumnStore(2, 'test_sim_12',
+                                                self.directory.name)
+        self.dump()
+        os.makedirs(os.path.join(self.directory.name, 'test_sim', 'other'))
+
+        self.assertEqual(database.ColumnStore.runs(self.directory.name,
+                                                   'test_sim'),
+                         [3, 12])
+
+    def test_read_runs(self):
+        """test read a column across the runs"""
+
+        self.dump()
+        counts = self.ColumnStore.read_long()
+
+        self.ColumnStore = database.ColumnStore(2, 'test_sim_12',
+                                                self.directory.name)
+        self.dump()
+
+        runs = database.ColumnStore.read_runs(self.directory.name,
+                                              'test_sim',
+                                              keyword.database_count)
+        self.assertEqual(list(runs.keys()), [3, 12])
+        for run in runs.values():
+            self.assertEqual(len(run), 2)
+            for chunk in run:
+                self.assertIsInstance(chunk, np.memmap)
+                self.assertEqual(chunk.dtype,
+                                 database.long_dtypes[keyword.database_count])
+            self.assertEqual(np.concatenate(run).tolist(),
+                             counts[keyword.database_count].tolist())
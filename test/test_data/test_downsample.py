@@ -0,0 +1,126 @@
+import unittest as ut
+
+import numpy  as np
+import pandas as pd
+
+import source.keyword as keyword
+
+import source.data.downsample as downsample
+
+
+class TestDownsample(ut.TestCase):
+    """test the downsample functions"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.x = np.arange(1000, dtype=float)
+        self.y = np.sin(self.x / 50) + np.random.rand(1000)
+
+    def test_min_max(self):
+        """test choose the extremes of each bucket"""
+
+        kept = downsample.min_max(self.x, self.y, 100)
+        self.assertLessEqual(len(kept), 100)
+        self.assertEqual(kept[0],  0)
+        self.assertEqual(kept[-1], 999)
+        self.assertTrue((np.diff(kept) > 0).all())
+        self.assertIn(np.argmin(self.y), kept)
+        self.assertIn(np.argmax(self.y), kept)
+
+        # Test every bucket keeps its extremes
+        size = -(-1000 // 49)
+        for start in range(0, 1000, size):
+            bucket = self.y[start:start + size]
+            self.assertIn(start + np.argmin(bucket), kept)
+            self.assertIn(start + np.argmax(bucket), kept)
+
+        # Test within budget
+        np.testing.assert_array_equal(
+            downsample.min_max(self.x, self.y, 1000), np.arange(1000))
+
+        # Test nan values are never chosen as extremes
+        y = self.y.copy()
+        y[10:500] = np.nan
+        kept = downsample.min_max(self.x, y, 100)
+        self.assertLessEqual(len(kept), 100)
+        self.assertIn(np.nanargmin(y), kept)
+        self.assertIn(np.nanargmax(y), kept)
+
+    def test_lttb(self):
+        """test choose the points by largest triangle three buckets"""
+
+        kept = downsample.lttb(self.x, self.y, 100)
+        self.assertEqual(len(kept), 100)
+        self.assertEqual(kept[0],  0)
+        self.assertEqual(kept[-1], 999)
+        self.assertTrue((np.diff(kept) > 0).all())
+
+        # Test a spike is kept
+        y = np.zeros(1000)
+        y[437] = 10
+        self.assertIn(437, downsample.lttb(self.x, y, 50))
+
+        # Test within budget
+        np.testing.assert_array_equal(
+            downsample.lttb(self.x, self.y, 1000), np.arange(1000))
+        np.testing.assert_array_equal(
+            downsample.lttb(self.x, self.y, 2), np.arange(1000))
+
+    def test_methods(self):
+        """test the downsample methods"""
+
+        self.assertEqual(downsample.methods,
+                         {keyword.downsample_min_max: downsample.min_max,
+                          keyword.downsample_lttb:    downsample.lttb})
+
+    def test_decimate(self):
+        """test reduce a table to the points needed to draw it"""
+
+        dataframe = pd.DataFrame({'x': self.x,
+                                  'a': self.y,
+                                  'b': np.cos(self.x / 30),
+                                  'c': ['label'] * 1000},
+                                 index=np.arange(1000) + 5)
+
+        # Test x column and given columns
+        table = downsample.decimate(dataframe, 'x', ['a', 'b'], 100)
+        kept  = np.union1d(downsample.min_max(self.x, self.y, 50),
+                           downsample.min_max(self.x,
+                                              dataframe['b'].to_numpy(),
+                                              50))
+        pd.testing.assert_frame_equal(table, dataframe.iloc[kept])
+        self.assertLessEqual(len(table.index), 100)
+
+        # Test index and numeric columns
+        table = downsample.decimate(dataframe, budget=100,
+                                    method=keyword.downsample_lttb)
+        index = dataframe.index.to_numpy(dtype=float)
+        kept  = np.unique(np.concatenate(
+            [downsample.lttb(index, dataframe[column].to_numpy(), 33)
+             for column in ['x', 'a', 'b']]))
+        pd.testing.assert_frame_equal(table, dataframe.iloc[kept])
+        self.assertLessEqual(len(table.index), 100)
+
+        # Test the budget holds for many columns
+        many = pd.DataFrame(np.random.rand(10000, 12))
+        for method in downsample.methods:
+            for number in [1, 3, 6, 12]:
+                table = downsample.decimate(many, columns=list(range(number)),
+                                            budget=2000, method=method)
+                self.assertLessEqual(len(table.index), 2000)
+
+        # Test each column keeps its end points and extremes
+        table = downsample.decimate(many, budget=8)
+        self.assertLessEqual(len(table.index), 12 * 4)
+        for column in many.columns:
+            self.assertIn(many[column].idxmin(), table.index)
+            self.assertIn(many[column].idxmax(), table.index)
+
+        # Test within budget
+        pd.testing.assert_frame_equal(
+            downsample.decimate(dataframe, 'x'), dataframe)
+
+        # Test bad method
+        with self.assertRaises(TypeError):
+            downsample.decimate(dataframe, method='bad')
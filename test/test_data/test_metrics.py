@@ -0,0 +1,190 @@
+import unittest as ut
+
+import numpy  as np
+import pandas as pd
+
+import source.keyword as keyword
+
+import source.data.metrics as metrics
+
+
+class TestMetrics(ut.TestCase):
+    """test the derived genotype metric functions"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.rr = np.array([1, 0, 4, 0])
+        self.sr = np.array([2, 0, 0, 3])
+        self.ss = np.array([1, 0, 0, 1])
+
+        self.dataframe = pd.DataFrame({'genotype_resistant':    self.rr,
+                                       'genotype_heterozygous': self.sr,
+                                       'genotype_susceptible':  self.ss,
+                                       'other':                 5})
+
+    @staticmethod
+    def resist(rr, sr, ss) -> float:
+        """The row-wise allele frequency the metrics replace"""
+
+        total = 2*(ss + sr + rr)
+
+        if total == 0:
+            return np.nan
+        else:
+            return (2*rr + sr) / total
+
+    def test_genotype_columns(self):
+        """test the genotype column names"""
+
+        self.assertEqual(metrics.genotype_columns,
+                         ['genotype_resistant',
+                          'genotype_heterozygous',
+                          'genotype_susceptible'])
+
+    def test__fraction(self):
+        """test divide with nan for empty totals"""
+
+        np.testing.assert_array_equal(
+            metrics._fraction(np.array([1, 0, 3]), np.array([2, 0, 3])),
+            [0.5, np.nan, 1.0])
+        self.assertTrue(np.isnan(metrics._fraction(0, 0)))
+
+    def test_total_population(self):
+        """test get the total population"""
+
+        np.testing.assert_array_equal(
+            metrics.total_population(self.rr, self.sr, self.ss),
+            [4.0, 0.0, 4.0, 4.0])
+
+    def test_allele_frequency(self):
+        """test get the resistance allele frequency"""
+
+        expected = [self.resist(rr, sr, ss)
+                    for rr, sr, ss in zip(self.rr, self.sr, self.ss)]
+        np.testing.assert_array_equal(
+            metrics.allele_frequency(self.rr, self.sr, self.ss), expected)
+
+        # Test against random counts
+        counts = np.random.randint(0, 5, (3, 100))
+        expected = [self.resist(*row) for row in counts.T]
+        np.testing.assert_allclose(metrics.allele_frequency(*counts),
+                                   expected)
+
+    def test_heterozygote_fraction(self):
+        """test get the fraction of heterozygotes"""
+
+        np.testing.assert_array_equal(
+            metrics.heterozygote_fraction(self.rr, self.sr, self.ss),
+            [0.5, np.nan, 0.0, 0.75])
+
+    def test_genotype_proportions(self):
+        """test get the proportion of each genotype"""
+
+        rr, sr, ss = metrics.genotype_proportions(self.rr, self.sr, self.ss)
+        np.testing.assert_array_equal(rr, [0.25, np.nan, 1.0, 0.0])
+        np.testing.assert_array_equal(sr, [0.5,  np.nan, 0.0, 0.75])
+        np.testing.assert_array_equal(ss, [0.25, np.nan, 0.0, 0.25])
+
+    def test_genotypes(self):
+        """test get the genotype count columns"""
+
+        rr, sr, ss = metrics.genotypes(self.dataframe)
+        np.testing.assert_array_equal(rr, self.rr)
+        np.testing.assert_array_equal(sr, self.sr)
+        np.testing.assert_array_equal(ss, self.ss)
+        self.assertEqual(rr.dtype, float)
+
+        # Test given column names
+        rr, sr, ss = metrics.genotypes(self.dataframe,
+                                       ['other',
+                                        'genotype_resistant',
+                                        'genotype_heterozygous'])
+        np.testing.assert_array_equal(rr, [5, 5, 5, 5])
+        np.testing.assert_array_equal(sr, self.rr)
+        np.testing.assert_array_equal(ss, self.sr)
+
+    def test_add_percent(self):
+        """test add the allele frequency column"""
+
+        metrics.add_percent(self.dataframe)
+        np.testing.assert_array_equal(self.dataframe[keyword.metric_percent],
+                                      [0.5, np.nan, 1.0, 0.375])
+
+        # Test given column names
+        metrics.add_percent(self.dataframe, 'new',
+                            ['genotype_susceptible',
+                             'genotype_heterozygous',
+                             'genotype_resistant'])
+        np.testing.assert_array_equal(self.dataframe['new'],
+                                      [0.5, np.nan, 0.0, 0.625])
+
+    def test_add_metrics(self):
+        """test add all the derived metric columns"""
+
+        metrics.add_metrics(self.dataframe)
+
+        self.assertEqual(list(self.dataframe.columns),
+                         ['genotype_resistant',
+                          'genotype_heterozygous',
+                          'genotype_susceptible',
+                          'other',
+                          'total',
+                          'percent',
+                          'hetero',
+                          'proportion_resistant',
+                          'proportion_heterozygous',
+                          'proportion_susceptible'])
+        np.testing.assert_array_equal(self.dataframe['total'],
+                                      [4.0, 0.0, 4.0, 4.0])
+        np.testing.assert_array_equal(self.dataframe['percent'],
+                                      [0.5, np.nan, 1.0, 0.375])
+        np.testing.assert_array_equal(self.dataframe['hetero'],
+                                      [0.5, np.nan, 0.0, 0.75])
+        np.testing.assert_array_equal(
+            self.dataframe['proportion_resistant'], [0.25, np.nan, 1.0, 0.0])
+
+    def test_long_genotypes(self):
+        """test get genotype counts from long-format counts"""
+
+        codes = {keyword.database_value: {'susceptible':  0,
+                                          'resistant':    1,
+                                          'heterozygous': 2}}
+        long = pd.DataFrame({keyword.database_step:  [0, 0, 1, 3, 3],
+                             keyword.database_value: [0, 1, 2, 1, 0],
+                             keyword.database_count: [4, 2, 3, 1, 6]})
+
+        rr, sr, ss = metrics.long_genotypes(long, codes)
+        np.testing.assert_array_equal(rr, [2, 0, 0, 1])
+        np.testing.assert_array_equal(sr, [0, 3, 0, 0])
+        np.testing.assert_array_equal(ss, [4, 0, 0, 6])
+
+        # Test given steps
+        rr, sr, ss = metrics.long_genotypes(long, codes, 6)
+        np.testing.assert_array_equal(rr, [2, 0, 0, 1, 0, 0])
+
+        # Test genotype never stored
+        del codes[keyword.database_value]['heterozygous']
+        rr, sr, ss = metrics.long_genotypes(long.iloc[[0, 1, 3, 4]], codes)
+        np.testing.assert_array_equal(sr, [0, 0, 0, 0])
+
+        # Test no counts
+        rr, sr, ss = metrics.long_genotypes(long.iloc[:0], {})
+        self.assertEqual(len(rr), 0)
+
+    def test_long_metrics(self):
+        """test get the metrics from long-format counts"""
+
+        codes = {keyword.database_value: {'resistant':    0,
+                                          'heterozygous': 1,
+                                          'susceptible':  2}}
+        long = pd.DataFrame({keyword.database_step:  [0, 0, 0, 2],
+                             keyword.database_value: [0, 1, 2, 2],
+                             keyword.database_count: [1, 2, 1, 3]})
+
+        dataframe = metrics.long_metrics(long, codes)
+        np.testing.assert_array_equal(dataframe['genotype_resistant'],
+                                      [1, 0, 0])
+        np.testing.assert_array_equal(dataframe['total'], [4, 0, 3])
+        np.testing.assert_array_equal(dataframe['percent'],
+                                      [0.5, np.nan, 0.0])
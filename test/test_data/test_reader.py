@@ -0,0 +1,229 @@
+import unittest      as ut
+import unittest.mock as mk
+
+import collections as collect
+import dataclasses as dclass
+import os
+import pandas      as pd
+import sqlalchemy  as sql
+import tempfile
+
+import source.data.reader as reader
+
+
+def write_window(directory: str,
+                 base_name: str,
+                 run_num:   int,
+                 start:     int,
+                 end:       int) -> str:
+    """Write a window file the way the database does"""
+
+    file_name = '{}_to_{}_{}_{}.sqlite'.format(start, end, base_name, run_num)
+    engine    = sql.create_engine('sqlite:///{}'.
+                                  format(os.path.join(directory, file_name)))
+
+    steps = list(range(start, end + 1))
+    pd.DataFrame({'a': [step * 10 + run_num for step in steps]}).\
+        to_sql('table0', engine, if_exists='replace')
+    pd.DataFrame({'b': [step for step in steps]}).\
+        to_sql('table1', engine, if_exists='replace')
+    engine.dispose()
+
+    return file_name
+
+
+class TestManifest(ut.TestCase):
+    """test the Manifest class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        runs = {1: [('a', 1, 2)]}
+
+        self.Manifest = reader.Manifest(runs)
+        self.assertIsInstance(self.Manifest, reader.Manifest)
+        self.assertIsInstance(self.Manifest, collect.UserDict)
+        self.assertEqual(self.Manifest.data, runs)
+
+    def test_complete(self):
+        """test get the runs with every window"""
+
+        self.Manifest = reader.Manifest({0: [1, 2], 1: [1], 2: [3, 4]})
+        complete = self.Manifest.complete()
+        self.assertIsInstance(complete, reader.Manifest)
+        self.assertEqual(complete.data, {0: [1, 2], 2: [3, 4]})
+
+        self.assertEqual(reader.Manifest({}).complete().data, {})
+
+    def test_setup(self):
+        """test build the manifest"""
+
+        directory = self.directory.name
+        names = [write_window(directory, 'sim', 2, 2, 4),
+                 write_window(directory, 'sim', 2, 0, 2),
+                 write_window(directory, 'sim', 0, 0, 2),
+                 write_window(directory, 'sim_1', 0, 0, 2)]
+        open(os.path.join(directory, 'sim.data'), 'w').close()
+
+        self.Manifest = reader.Manifest.setup(directory, 'sim')
+        self.assertIsInstance(self.Manifest, reader.Manifest)
+        self.assertEqual(list(self.Manifest.keys()), [0, 2])
+        self.assertEqual([entry[0] for entry in self.Manifest[0]],
+                         [names[2]])
+        self.assertEqual([entry[0] for entry in self.Manifest[2]],
+                         [names[1], names[0]])
+        for entries in self.Manifest.values():
+            for file_name, size, mtime in entries:
+                stat = os.stat(os.path.join(directory, file_name))
+                self.assertEqual(size,  stat.st_size)
+                self.assertEqual(mtime, stat.st_mtime_ns)
+
+        # Test repeated window
+        write_window(directory, 'sim', 2, 0, 3)
+        with self.assertRaises(RuntimeError):
+            reader.Manifest.setup(directory, 'sim')
+
+
+class TestReader(ut.TestCase):
+    """test the Reader class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.tables = ['table0', 'table1']
+        self.Reader = reader.Reader(self.directory.name, 'sim', self.tables)
+
+    def write_runs(self, first: int,
+                         end:   int) -> None:
+        """Write windows of two runs from first up to end"""
+
+        for run_num in [0, 1]:
+            for start in range(first, end, 2):
+                write_window(self.directory.name, 'sim', run_num,
+                             start, start + 2)
+
+    def assert_runs(self, data: dict,
+                          end:  int) -> None:
+        """Check the read data of the runs"""
+
+        self.assertEqual(list(data.keys()), [0, 1])
+        for run_num, dataframes in data.items():
+            self.assertEqual(list(dataframes.keys()), self.tables)
+            self.assertEqual(list(dataframes['table0']['a']),
+                             [step * 10 + run_num
+                              for step in range(end + 1)])
+            self.assertEqual(list(dataframes['table1']['b']),
+                             list(range(end + 1)))
+            for dataframe in dataframes.values():
+                self.assertEqual(list(dataframe['index']),
+                                 list(range(end + 1)))
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Reader, reader.Reader)
+
+        self.assertEqual(self.Reader.directory, self.directory.name)
+        self.assertEqual(self.Reader.base_name, 'sim')
+        self.assertEqual(self.Reader.tables,    self.tables)
+        self.assertEqual(self.Reader.cache_dir,
+                         os.path.join(self.directory.name, 'cache'))
+        self.assertEqual(self.Reader.workers,   1)
+
+        self.assertTrue(dclass.is_dataclass(self.Reader))
+
+    def test_manifest(self):
+        """test build the manifest"""
+
+        with mk.patch.object(reader.Manifest, 'setup',
+                             autospec=True) as mkSetup:
+            self.assertEqual(self.Reader.manifest(), mkSetup.return_value)
+            self.assertEqual(mkSetup.call_args_list,
+                             [mk.call(self.directory.name, 'sim')])
+
+    def test_read(self):
+        """test read the runs"""
+
+        self.write_runs(0, 4)
+        # Test an incomplete run is skipped
+        write_window(self.directory.name, 'sim', 2, 0, 2)
+
+        self.assert_runs(self.Reader.read(), 4)
+        self.assertEqual(sorted(os.listdir(self.Reader.cache_dir)),
+                         ['sim_0.cache', 'sim_1.cache'])
+
+        # Test the cache is used
+        with mk.patch.object(reader.Reader, '_read_files',
+                             autospec=True) as mkRead:
+            self.assert_runs(self.Reader.read(), 4)
+            self.assertEqual(mkRead.call_args_list, [])
+
+        # Test only the new windows are read
+        self.write_runs(4, 6)
+        with mk.patch.object(reader.Reader, '_read_files',
+                             wraps=reader.Reader._read_files) as mkRead:
+            self.assert_runs(self.Reader.read(), 6)
+            self.assertEqual(mkRead.call_args_list,
+                             [mk.call(self.directory.name,
+                                      ['4_to_6_sim_{}.sqlite'.format(run)],
+                                      self.tables, True)
+                              for run in [0, 1]])
+
+        # Test a changed window reads the whole run
+        os.utime(os.path.join(self.directory.name, '2_to_4_sim_0.sqlite'),
+                 ns=(0, 0))
+        with mk.patch.object(reader.Reader, '_read_files',
+                             wraps=reader.Reader._read_files) as mkRead:
+            self.assert_runs(self.Reader.read(), 6)
+            self.assertEqual(mkRead.call_args_list,
+                             [mk.call(self.directory.name,
+                                      ['0_to_2_sim_0.sqlite',
+                                       '2_to_4_sim_0.sqlite',
+                                       '4_to_6_sim_0.sqlite'],
+                                      self.tables, False)])
+
+        # Test the cache is missing a table
+        for cache_name in os.listdir(self.Reader.cache_dir):
+            os.remove(os.path.join(self.Reader.cache_dir, cache_name))
+        self.Reader.tables = ['table0']
+        self.Reader.read()
+        self.Reader.tables = self.tables
+        with mk.patch.object(reader.Reader, '_read_files',
+                             wraps=reader.Reader._read_files) as mkRead:
+            self.assert_runs(self.Reader.read(), 6)
+            self.assertEqual(len(mkRead.call_args_list), 2)
+
+    def test_runs(self):
+        """test read the runs one at a time"""
+
+        self.write_runs(0, 4)
+
+        runs = self.Reader.runs()
+        self.assertNotIsInstance(runs, dict)
+        run_num, dataframes = next(runs)
+        self.assertEqual(run_num, 0)
+        self.assertEqual(list(dataframes.keys()), self.tables)
+        self.assert_runs(dict([(run_num, dataframes)] + list(runs)), 4)
+
+        # Test with a process pool
+        self.Reader.workers = 2
+        self.assert_runs(dict(self.Reader.runs()), 4)
+
+    def test_read_workers(self):
+        """test read the runs in a process pool"""
+
+        self.write_runs(0, 4)
+        self.Reader.workers = 2
+
+        self.assert_runs(self.Reader.read(), 4)
+        self.assertEqual(sorted(os.listdir(self.Reader.cache_dir)),
+                         ['sim_0.cache', 'sim_1.cache'])
@@ -0,0 +1,123 @@
+import unittest as ut
+
+import dataclasses              as dclass
+import numpy                    as np
+import pandas                   as pd
+import scipy.signal             as signal
+import statsmodels.tsa.seasonal as seasonal
+
+import source.data.series as series
+
+
+class TestSeries(ut.TestCase):
+    """test the series functions"""
+
+    def test_stack(self):
+        """test stack a column of several tables"""
+
+        dataframes = [pd.DataFrame({'a': [1, 2, 3], 'b': [4, 5, 6]}),
+                      pd.DataFrame({'a': [7, 8],    'b': [9, 10]})]
+
+        stack = series.stack(dataframes, 'a')
+        np.testing.assert_array_equal(stack, [[1, 2], [7, 8]])
+        self.assertEqual(stack.dtype, float)
+
+
+class TestPeriodogram(ut.TestCase):
+    """test the Periodogram class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        steps  = np.arange(200)
+        self.series = np.stack([np.sin(2*np.pi*steps/period)
+                                for period in [10, 25, 40]])
+
+        self.Periodogram = series.Periodogram.setup(self.series)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Periodogram, series.Periodogram)
+
+        self.assertTrue(dclass.is_dataclass(self.Periodogram))
+
+    def test_setup(self):
+        """test compute the periodograms"""
+
+        for row, values in enumerate(self.series):
+            frequency, power = signal.periodogram(values)
+            np.testing.assert_allclose(self.Periodogram.frequency, frequency)
+            np.testing.assert_allclose(self.Periodogram.power[row], power)
+
+        self.assertEqual(self.Periodogram.period[0], np.inf)
+        np.testing.assert_allclose(self.Periodogram.period[1:],
+                                   1 / self.Periodogram.frequency[1:])
+        np.testing.assert_allclose(self.Periodogram.primary, [10, 25, 40])
+
+    def test_dataframe(self):
+        """test get one periodogram as a table"""
+
+        dataframe = self.Periodogram.dataframe(1, ['f', 'p', 't', 'm'])
+        self.assertEqual(list(dataframe.columns), ['f', 'p', 't', 'm'])
+        np.testing.assert_array_equal(dataframe['f'],
+                                      self.Periodogram.frequency)
+        np.testing.assert_array_equal(dataframe['p'],
+                                      self.Periodogram.power[1])
+        np.testing.assert_array_equal(dataframe['t'],
+                                      self.Periodogram.period)
+        np.testing.assert_allclose(dataframe['m'], 25)
+
+
+class TestDecomposition(ut.TestCase):
+    """test the Decomposition class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.series = np.random.rand(5, 30)
+
+        self.Decomposition = series.Decomposition.setup(self.series, 6)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Decomposition, series.Decomposition)
+
+        self.assertTrue(dclass.is_dataclass(self.Decomposition))
+
+    def test_setup(self):
+        """test compute the decompositions"""
+
+        np.testing.assert_array_equal(self.Decomposition.observed,
+                                      self.series)
+
+        # Test the stack matches decomposing each series on its own
+        for row, values in enumerate(self.series):
+            decomp = seasonal.seasonal_decompose(values,
+                                                 model='additive',
+                                                 period=6)
+            np.testing.assert_allclose(self.Decomposition.trend[row],
+                                       decomp.trend)
+            np.testing.assert_allclose(self.Decomposition.seasonal[row],
+                                       decomp.seasonal)
+            np.testing.assert_allclose(self.Decomposition.resid[row],
+                                       decomp.resid)
+
+    def test_dataframes(self):
+        """test get the decompositions as tables"""
+
+        names  = ['o', 't', 's', 'r']
+        tables = self.Decomposition.dataframes([3, 1], ['x', 'y'], names,
+                                               range(10, 40))
+
+        self.assertEqual(list(tables.keys()), names)
+        parts = [self.Decomposition.observed,
+                 self.Decomposition.trend,
+                 self.Decomposition.seasonal,
+                 self.Decomposition.resid]
+        for name, part in zip(names, parts):
+            self.assertEqual(list(tables[name].columns), ['x', 'y'])
+            self.assertEqual(list(tables[name].index), list(range(10, 40)))
+            np.testing.assert_array_equal(tables[name]['x'], part[3])
+            np.testing.assert_array_equal(tables[name]['y'], part[1])
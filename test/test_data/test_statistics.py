@@ -0,0 +1,291 @@
+import unittest      as ut
+
+import collections as collect
+import dataclasses as dclass
+import numpy       as np
+import pandas      as pd
+import warnings
+
+import source.data.statistics as statistics
+
+
+class TestMoments(ut.TestCase):
+    """test the Moments class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.Moments = statistics.Moments.setup((2, 3))
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Moments, statistics.Moments)
+
+        self.assertTrue(dclass.is_dataclass(self.Moments))
+
+    def test_add(self):
+        """test add an array to the moments"""
+
+        data = np.random.rand(20, 2, 3)
+        data[3, 0, 0] = np.nan
+        data[:, 1, 2] = np.nan
+        for values in data:
+            self.Moments.add(values)
+
+        count = np.full((2, 3), 20)
+        count[0, 0] = 19
+        count[1, 2] = 0
+        np.testing.assert_array_equal(self.Moments.count, count)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(data, axis=0)
+            std  = np.nanstd(data, axis=0, ddof=1)
+        np.testing.assert_allclose(self.Moments.mean[count > 0],
+                                   mean[count > 0])
+        np.testing.assert_allclose(self.Moments.std(), std)
+        np.testing.assert_allclose(self.Moments.minimum,
+                                   np.fmin.reduce(data))
+        np.testing.assert_allclose(self.Moments.maximum,
+                                   np.fmax.reduce(data))
+
+    def test_variance(self):
+        """test get the sample variance"""
+
+        self.Moments.add(np.ones((2, 3)))
+        self.assertTrue(np.isnan(self.Moments.variance()).all())
+
+        self.Moments.add(np.full((2, 3), 3.0))
+        np.testing.assert_allclose(self.Moments.variance(), 2.0)
+        np.testing.assert_allclose(self.Moments.std(), np.sqrt(2.0))
+
+    def test_setup(self):
+        """test setup the class"""
+
+        np.testing.assert_array_equal(self.Moments.count, 0)
+        np.testing.assert_array_equal(self.Moments.mean,  0.0)
+        np.testing.assert_array_equal(self.Moments.m2,    0.0)
+        self.assertTrue(np.isnan(self.Moments.minimum).all())
+        self.assertTrue(np.isnan(self.Moments.maximum).all())
+        self.assertEqual(self.Moments.count.shape, (2, 3))
+
+
+class TestSketch(ut.TestCase):
+    """test the Sketch class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.size   = 4
+        self.Sketch = statistics.Sketch(self.size)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Sketch, statistics.Sketch)
+
+        self.assertEqual(self.Sketch.size,   self.size)
+        self.assertEqual(self.Sketch.shape,  ())
+        self.assertEqual(self.Sketch.buffer, [])
+        self.assertEqual(self.Sketch.levels, [])
+        self.assertEqual(self.Sketch.flip,   0)
+
+        self.assertTrue(dclass.is_dataclass(self.Sketch))
+
+    def test_add(self):
+        """test add an array to the sketch"""
+
+        for value in range(7):
+            self.Sketch.add(np.array([value]))
+        self.assertEqual(len(self.Sketch.buffer), 7)
+        self.assertEqual(self.Sketch.levels, [])
+
+        # Test the full buffer is compacted
+        self.Sketch.add(np.array([7]))
+        self.assertEqual(self.Sketch.buffer, [])
+        self.assertEqual(len(self.Sketch.levels), 1)
+        np.testing.assert_array_equal(self.Sketch.levels[0][:, 0],
+                                      [0, 2, 4, 6])
+        self.assertEqual(self.Sketch.flip, 1)
+
+        # Test full levels are merged upwards
+        for value in range(8, 16):
+            self.Sketch.add(np.array([value]))
+        self.assertEqual(len(self.Sketch.levels), 2)
+        self.assertIsNone(self.Sketch.levels[0])
+        self.assertEqual(self.Sketch.levels[1].shape, (4, 1))
+
+        # Test memory stays small
+        for value in range(16, 1024):
+            self.Sketch.add(np.array([value]))
+        kept = len(self.Sketch.buffer) + \
+            sum(len(level) for level in self.Sketch.levels
+                if level is not None)
+        self.assertLessEqual(kept, 2*self.size*len(self.Sketch.levels))
+
+    def test_quantile(self):
+        """test get a quantile of each element"""
+
+        # Test exact before compaction
+        data = np.random.rand(7, 3, 2)
+        data[0, 0, 0] = np.nan
+        for values in data:
+            self.Sketch.add(values)
+        np.testing.assert_allclose(self.Sketch.quantile(0.5),
+                                   np.nanmedian(data, axis=0))
+        np.testing.assert_allclose(self.Sketch.quantile(0.25),
+                                   np.nanquantile(data, 0.25, axis=0))
+
+        # Test the same estimator after compaction, each value repeated by
+        # its weight
+        self.Sketch = statistics.Sketch(self.size)
+        for values in np.random.rand(27, 3):
+            self.Sketch.add(values)
+        expanded = np.concatenate(
+            [np.stack(self.Sketch.buffer)] +
+            [np.repeat(values, 2**level, axis=0)
+             for level, values in enumerate(self.Sketch.levels)
+             if values is not None])
+        for q in [0.0, 0.1, 0.5, 0.9, 1.0]:
+            np.testing.assert_allclose(self.Sketch.quantile(q),
+                                       np.quantile(expanded, q, axis=0))
+
+        # Test empty
+        self.Sketch = statistics.Sketch(self.size, (3, 2))
+        quantile    = self.Sketch.quantile(0.5)
+        self.assertEqual(quantile.shape, (3, 2))
+        self.assertTrue(np.isnan(quantile).all())
+        self.assertTrue(np.isnan(statistics.Sketch(self.size).
+                                 quantile(0.5)))
+
+        # Test approximate after compaction
+        self.Sketch = statistics.Sketch(32)
+        data = np.random.rand(2000, 3, 2)
+        data[:, 2, 1] = np.nan
+        for values in data:
+            self.Sketch.add(values)
+        for q in [0.025, 0.5, 0.975]:
+            quantile = self.Sketch.quantile(q)
+            self.assertTrue(np.isnan(quantile[2, 1]))
+            quantile[2, 1] = 0.0
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                expected = np.nanquantile(data, q, axis=0)
+            expected[2, 1] = 0.0
+            np.testing.assert_allclose(quantile, expected, atol=0.05)
+
+
+class TestStatistics(ut.TestCase):
+    """test the Statistics class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.runs = [pd.DataFrame({'a': np.random.rand(5),
+                                   'b': np.random.rand(5)})
+                     for _ in range(9)]
+        self.runs[2].loc[1, 'b'] = np.nan
+
+        self.Statistics = statistics.Statistics.setup(self.runs[0], 4)
+        for dataframe in self.runs:
+            self.Statistics.add(dataframe)
+
+        self.concat = pd.concat(self.runs).groupby(level=0)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Statistics, statistics.Statistics)
+
+        self.assertEqual(self.Statistics.columns, ['a', 'b'])
+        self.assertEqual(self.Statistics.steps,   5)
+        self.assertIsInstance(self.Statistics.moments, statistics.Moments)
+        self.assertIsInstance(self.Statistics.sketch,  statistics.Sketch)
+        self.assertEqual(self.Statistics.sketch.size,  4)
+        self.assertEqual(self.Statistics.sketch.shape, (5, 2))
+
+        self.assertTrue(dclass.is_dataclass(self.Statistics))
+
+    def test_add(self):
+        """test add a run's table"""
+
+        with self.assertRaises(ValueError):
+            self.Statistics.add(self.runs[0][['b', 'a']])
+        with self.assertRaises(ValueError):
+            self.Statistics.add(self.runs[0].iloc[1:])
+
+    def test_summaries(self):
+        """test get the summary tables"""
+
+        pd.testing.assert_frame_equal(self.Statistics.mean(),
+                                      self.concat.mean())
+        pd.testing.assert_frame_equal(self.Statistics.std(),
+                                      self.concat.std())
+        pd.testing.assert_frame_equal(self.Statistics.min(),
+                                      self.concat.min())
+        pd.testing.assert_frame_equal(self.Statistics.max(),
+                                      self.concat.max())
+
+        # Test quantiles are exact for few runs
+        statistic = statistics.Statistics.setup(self.runs[0], 64)
+        for dataframe in self.runs:
+            statistic.add(dataframe)
+        pd.testing.assert_frame_equal(statistic.median(),
+                                      self.concat.median())
+        pd.testing.assert_frame_equal(statistic.quantile(0.1),
+                                      self.concat.quantile(0.1))
+
+
+class TestAggregator(ut.TestCase):
+    """test the Aggregator class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.Aggregator = statistics.Aggregator()
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Aggregator, statistics.Aggregator)
+        self.assertIsInstance(self.Aggregator, collect.UserDict)
+
+        self.assertEqual(self.Aggregator.data, {})
+        self.assertEqual(self.Aggregator.size, 64)
+        self.assertEqual(self.Aggregator.runs, 0)
+
+        self.assertEqual(statistics.Aggregator(3).size, 3)
+
+    def test_summaries(self):
+        """test add runs and get the summary tables"""
+
+        runs = [{'table0': pd.DataFrame({'a': np.random.rand(4)}),
+                 'table1': pd.DataFrame({'b': np.random.rand(3),
+                                         'c': np.random.rand(3)})}
+                for _ in range(5)]
+        for dataframes in runs:
+            self.Aggregator.add(dataframes)
+
+        self.assertEqual(self.Aggregator.runs, 5)
+        self.assertEqual(list(self.Aggregator.keys()), ['table0', 'table1'])
+        for value in self.Aggregator.values():
+            self.assertIsInstance(value, statistics.Statistics)
+
+        for table_name in ['table0', 'table1']:
+            concat = pd.concat([dataframes[table_name]
+                                for dataframes in runs]).groupby(level=0)
+
+            pd.testing.assert_frame_equal(
+                self.Aggregator.mean()[table_name], concat.mean())
+            pd.testing.assert_frame_equal(
+                self.Aggregator.std()[table_name], concat.std())
+            pd.testing.assert_frame_equal(
+                self.Aggregator.min()[table_name], concat.min())
+            pd.testing.assert_frame_equal(
+                self.Aggregator.max()[table_name], concat.max())
+            pd.testing.assert_frame_equal(
+                self.Aggregator.median()[table_name], concat.median())
+            pd.testing.assert_frame_equal(
+                self.Aggregator.quantile(0.9)[table_name],
+                concat.quantile(0.9))
@@ -2,13 +2,15 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.egg   as agent_egg
 import source.agents.larva as agent_larva
 
-import source.development.egg as development
+import source.development.egg    as development
+import source.development.models as development_models
 
 
 class EggTest(agent_egg.Egg):
@@ -81,6 +83,45 @@ class TestEgg(ut.TestCase):
             self.assertEqual(mkAdvance.call_args_list,
                              [mk.call(egg)])
 
+    def test_duration(self):
+        """test sample the days until the egg develops"""
+
+        egg = mk.MagicMock(spec=EggTest)
+        self.Egg.development = \
+            mk.create_autospec(development_models.Egg,
+                               spec_set=True, instance=True)
+
+        with mk.patch.object(development.Egg, '_use_development',
+                             autospec=True) as mkUse:
+            mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+
+            # Test when we don't have a model
+            self.assertEqual(self.Egg.duration(egg), np.inf)
+            self.assertEqual(self.Egg.development.duration.call_args_list,
+                             [])
+
+            # Test when have a model
+            self.assertEqual(self.Egg.duration(egg),
+                             self.Egg.development.duration.return_value)
+            self.assertEqual(self.Egg.development.duration.call_args_list,
+                             [mk.call(egg.mass, egg.age, egg.genotype)])
+
+    def test_transform(self):
+        """test replace the egg with the next stage"""
+
+        egg = mk.create_autospec(EggTest, spec_set=True)
+
+        with mk.patch.object(development.Egg, '_make_larva',
+                             autospec=True) as mkMake:
+            master = mk.MagicMock()
+            master.attach_mock(egg,    'agent')
+            master.attach_mock(mkMake, 'make')
+
+            self.assertEqual(self.Egg.transform(egg), None)
+            self.assertEqual(master.mock_calls,
+                             [mk.call.agent.deactivate(),
+                              mk.call.make(egg)])
+
     def test_develop(self):
         """test run development system"""
 
@@ -2,6 +2,7 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses  as dclass
+import numpy        as np
 import numpy.random as rnd
 import scipy.stats  as stats
 
@@ -70,6 +71,47 @@ class TestBaseTime(ut.TestCase):
                                  [mk.call(age,
                                           loc=self.mu, scale=self.sigma)])
 
+    def test_duration(self):
+        """test sample the number of days until development"""
+
+        mass     = mk.MagicMock(spec=float)
+        genotype = mk.MagicMock(spec=str)
+
+        with mk.patch.object(stats.norm, 'cdf', autospec=True) as mkCDF:
+            with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+                mkCDF.side_effect = [0.5, 0.5, 0.5]
+                mkRND.return_value = 0.2
+
+                # Test develops on third day
+                self.assertEqual(self.BaseTime.duration(mass, 4, genotype), 2)
+                self.assertEqual(mkRND.call_args_list, [mk.call()])
+                self.assertEqual(mkCDF.call_args_list,
+                                 [mk.call(4,
+                                          loc=self.mu, scale=self.sigma),
+                                  mk.call(5,
+                                          loc=self.mu, scale=self.sigma),
+                                  mk.call(6,
+                                          loc=self.mu, scale=self.sigma)])
+
+                mkCDF.reset_mock()
+                mkCDF.side_effect = [1.0]
+                # Test develops on first day
+                self.assertEqual(self.BaseTime.duration(mass, 4, genotype), 0)
+                self.assertEqual(len(mkCDF.call_args_list), 1)
+
+        # Test duration matches repeated calls
+        self.BaseTime.mu    = 3.0
+        self.BaseTime.sigma = 1.0
+        durations = [self.BaseTime.duration(mass, 0, genotype)
+                     for _ in range(5000)]
+        ages = []
+        for _ in range(5000):
+            age = 0
+            while not self.BaseTime(mass, age, genotype):
+                age += 1
+            ages.append(age)
+        self.assertAlmostEqual(np.mean(durations), np.mean(ages), delta=0.1)
+
 
 class TestEgg(ut.TestCase):
     """test the Egg development mathematical model"""
@@ -2,13 +2,15 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.pupa   as agent_pupa
 import source.agents.adult as agent_adult
 
-import source.development.pupa as development
+import source.development.pupa   as development
+import source.development.models as development_models
 
 
 class PupaTest(agent_pupa.Pupa):
@@ -81,6 +83,45 @@ class TestPupa(ut.TestCase):
             self.assertEqual(mkAdvance.call_args_list,
                              [mk.call(pupa)])
 
+    def test_duration(self):
+        """test sample the days until the pupa develops"""
+
+        pupa = mk.MagicMock(spec=PupaTest)
+        self.Pupa.development = \
+            mk.create_autospec(development_models.Pupa,
+                               spec_set=True, instance=True)
+
+        with mk.patch.object(development.Pupa, '_use_development',
+                             autospec=True) as mkUse:
+            mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+
+            # Test when we don't have a model
+            self.assertEqual(self.Pupa.duration(pupa), np.inf)
+            self.assertEqual(self.Pupa.development.duration.call_args_list,
+                             [])
+
+            # Test when have a model
+            self.assertEqual(self.Pupa.duration(pupa),
+                             self.Pupa.development.duration.return_value)
+            self.assertEqual(self.Pupa.development.duration.call_args_list,
+                             [mk.call(pupa.mass, pupa.age, pupa.genotype)])
+
+    def test_transform(self):
+        """test replace the pupa with the next stage"""
+
+        pupa = mk.create_autospec(PupaTest, spec_set=True)
+
+        with mk.patch.object(development.Pupa, '_make_adult',
+                             autospec=True) as mkMake:
+            master = mk.MagicMock()
+            master.attach_mock(pupa,    'agent')
+            master.attach_mock(mkMake, 'make')
+
+            self.assertEqual(self.Pupa.transform(pupa), None)
+            self.assertEqual(master.mock_calls,
+                             [mk.call.agent.deactivate(),
+                              mk.call.make(pupa)])
+
     def test_develop(self):
         """test run development system"""
 
@@ -2,6 +2,7 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses  as dclass
+import numpy        as np
 import numpy.random as rnd
 
 import source.keyword as keyword
@@ -10,6 +11,7 @@ import source.agents.egg_mass as agent_egg_mass
 import source.agents.larva    as agent_larva
 
 import source.forage.cannibalism as cannibalism
+import source.forage.models      as models
 
 
 class LarvaTest(agent_larva.Larva):
@@ -26,8 +28,159 @@ class EggMassTest(agent_egg_mass.EggMass):
     """Class to add dynamic values for tests"""
 
     agent_key = keyword.egg_mass
+
+
+@dclass.dataclass
+class PlantAgent(object):
+    """Class for a minimal agent on a plant, to compare the paths"""
+
+    agent_key: str
+    unique_id: int
+    mass:      float
+    location:  mk.MagicMock
+    plant:     dict
+    genotype:  str  = 'genotype'
+    alive:     bool = True
+    full:      bool = False
+
+    def _die(self) -> None:
+        self.alive = False
+        del self.plant[self.agent_key][self.unique_id]
+
+    def target_bins(self, **kwargs) -> list:
+        return [self.plant[keyword.egg_mass], self.plant[keyword.larva]]
+
+    def consume_egg(self, egg_mass: 'PlantAgent') -> None:
+        egg_mass._die()
+
+    def consume_larva(self, target: 'PlantAgent') -> None:
+        target._die()
+
+
+class Always(object):
+    """Class for an encounter which happens whenever there are targets"""
+
+    def __call__(self, number, mass, genotype):
+        return number > 0
+
+    def batch(self, number, mass, genotype):
+        return number > 0
+
+
+class Heavier(object):
+    """Class for a fight which the heavier larva wins"""
+
+    def __call__(self, mass0, mass1):
+        return mass0 > mass1
+
+    def batch(self, mass0, mass1):
+        return mass0 > mass1
     
     
+class TestCandidates(ut.TestCase):
+    """test the Candidates class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.larva = mk.MagicMock(spec=LarvaTest)
+        self.bins  = [mk.MagicMock(spec=list) for _ in range(3)]
+        self.count = mk.MagicMock(spec=int)
+
+        self.Candidates = cannibalism.Candidates(self.larva,
+                                                 self.bins,
+                                                 self.count)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertEqual(self.Candidates.larva,   self.larva)
+        self.assertEqual(self.Candidates.bins,    self.bins)
+        self.assertEqual(self.Candidates.count,   self.count)
+        self.assertEqual(self.Candidates.targets, None)
+
+        self.assertTrue(dclass.is_dataclass(self.Candidates))
+
+    def test___len__(self):
+        """test number of potential targets"""
+
+        self.Candidates.count = 4
+        self.assertEqual(len(self.Candidates), 4)
+
+    def test__materialize(self):
+        """test build the list of potential targets"""
+
+        eggs   = {index: mk.MagicMock(spec=EggMassTest) for index in range(2)}
+        larvae = {index: mk.MagicMock(spec=LarvaTest)   for index in range(2)}
+        larvae[2] = self.larva
+        self.Candidates.bins = [eggs, larvae]
+
+        # Build targets
+        self.assertIsNone(self.Candidates._materialize())
+        self.assertEqual(self.Candidates.targets,
+                         list(eggs.values()) + [larvae[0], larvae[1]])
+        self.assertEqual(self.Candidates.count, 4)
+
+        # Targets already built
+        targets = self.Candidates.targets
+        self.Candidates.bins = []
+        self.assertIsNone(self.Candidates._materialize())
+        self.assertIs(self.Candidates.targets, targets)
+        self.assertEqual(self.Candidates.count, 4)
+
+    def test_draw(self):
+        """test draw a target without replacement"""
+
+        targets = [mk.MagicMock(spec=LarvaTest) for _ in range(4)]
+        self.Candidates.targets = targets.copy()
+        self.Candidates.count   = 4
+
+        with mk.patch.object(cannibalism.Candidates, '_materialize',
+                             autospec=True) as mkMaterialize:
+            with mk.patch.object(rnd, 'randint', autospec=True) as mkRandint:
+                mkRandint.return_value = 1
+
+                self.assertEqual(self.Candidates.draw(), targets[1])
+                self.assertEqual(self.Candidates.targets,
+                                 [targets[0], targets[3], targets[2]])
+                self.assertEqual(self.Candidates.count, 3)
+                self.assertEqual(mkRandint.call_args_list, [mk.call(4)])
+                self.assertEqual(mkMaterialize.call_args_list,
+                                 [mk.call(self.Candidates)])
+
+                # Draw last target
+                mkRandint.return_value = 2
+
+                self.assertEqual(self.Candidates.draw(), targets[2])
+                self.assertEqual(self.Candidates.targets,
+                                 [targets[0], targets[3]])
+                self.assertEqual(self.Candidates.count, 2)
+
+        # Draw all targets
+        self.Candidates.targets = None
+        self.Candidates.bins    = [{index: target for index, target
+                                    in enumerate(targets)},
+                                   {0: self.larva}]
+        drawn = [self.Candidates.draw() for _ in range(4)]
+        self.assertEqual(len(self.Candidates), 0)
+        self.assertEqual(self.Candidates.targets, [])
+        self.assertCountEqual(drawn, targets)
+
+    def test_setup(self):
+        """test setup the class"""
+
+        bins = [{index: mk.MagicMock() for index in range(size)}
+                for size in (2, 0, 3)]
+
+        self.Candidates = cannibalism.Candidates.setup(self.larva, bins)
+        self.assertIsInstance(self.Candidates, cannibalism.Candidates)
+
+        self.assertEqual(self.Candidates.larva,   self.larva)
+        self.assertEqual(self.Candidates.bins,    bins)
+        self.assertEqual(self.Candidates.count,   4)
+        self.assertEqual(self.Candidates.targets, None)
+
+
 class TestCannibalism(ut.TestCase):
     """test the Cannibalism behavior class"""
 
@@ -53,6 +206,14 @@ class TestCannibalism(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Cannibalism))
 
+    def test_interacts(self):
+        """test if cannibalism couples larvae"""
+
+        self.assertTrue(self.Cannibalism.interacts)
+
+        self.Cannibalism.encounter = None
+        self.assertFalse(self.Cannibalism.interacts)
+
     def test__use_fight(self):
         """test if we use the fight system"""
 
@@ -152,7 +313,7 @@ class TestCannibalism(ut.TestCase):
                              [mk.call(larva.mass, larva.genotype)])
             
     def test__targets(self):
-        """test get list of targets for cannibalism"""
+        """test get potential targets for cannibalism"""
 
         larva = mk.create_autospec(LarvaTest, spec_set=True)
 
@@ -160,29 +321,29 @@ class TestCannibalism(ut.TestCase):
 
         with mk.patch.object(cannibalism.Cannibalism, '_bounds',
                              autospec=True) as mkBounds:
-            mkBounds.return_value = bounds
-
-            self.assertEqual(self.Cannibalism._targets(larva),
-                             larva.targets.return_value)
-            self.assertEqual(larva.targets.call_args_list,
-                             [mk.call(**bounds)])
-            self.assertEqual(mkBounds.call_args_list,
-                             [mk.call(self.Cannibalism, larva)])
+            with mk.patch.object(cannibalism.Candidates, 'setup',
+                                 autospec=True) as mkSetup:
+                mkBounds.return_value = bounds
+
+                self.assertEqual(self.Cannibalism._targets(larva),
+                                 mkSetup.return_value)
+                self.assertEqual(mkSetup.call_args_list,
+                                 [mk.call(larva,
+                                          larva.target_bins.return_value)])
+                self.assertEqual(larva.target_bins.call_args_list,
+                                 [mk.call(**bounds)])
+                self.assertEqual(larva.targets.call_args_list, [])
+                self.assertEqual(mkBounds.call_args_list,
+                                 [mk.call(self.Cannibalism, larva)])
 
     def test__get_target(self):
         """test get insect to encounter"""
 
-        target  = mk.create_autospec(LarvaTest, spec_set=True)
-        targets = mk.MagicMock(spec=list)
-
-        with mk.patch.object(rnd, 'choice') as mkRND:
-            mkRND.return_value = target
+        targets = mk.create_autospec(cannibalism.Candidates, spec_set=True)
 
-            self.assertEqual(self.Cannibalism._get_target(targets), target)
-            self.assertEqual(targets.remove.call_args_list,
-                             [mk.call(target)])
-            self.assertEqual(mkRND.call_args_list,
-                             [mk.call(targets)])
+        self.assertEqual(self.Cannibalism._get_target(targets),
+                         targets.draw.return_value)
+        self.assertEqual(targets.draw.call_args_list, [mk.call()])
 
     def test__can_encounter(self):
         """test if larva can encounter"""
@@ -383,6 +544,428 @@ class TestCannibalism(ut.TestCase):
                 self.assertEqual(mkRun.call_args_list,
                                  [mk.call(self.Cannibalism, larva)])
 
+    def test__local(self):
+        """test if larvae only encounter on their own plant"""
+
+        larvae = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+
+        with mk.patch.object(cannibalism.Cannibalism, '_bounds',
+                             autospec=True) as mkBounds:
+            # All zero radius
+            mkBounds.side_effect = [{keyword.upper: 0} for _ in range(3)]
+            self.assertTrue(self.Cannibalism._local(larvae))
+            self.assertEqual(mkBounds.call_args_list,
+                             [mk.call(self.Cannibalism, larva)
+                              for larva in larvae])
+
+            mkBounds.reset_mock()
+            # Some larva has a radius
+            mkBounds.side_effect = [{keyword.upper: 0},
+                                    {keyword.upper: 1},
+                                    {keyword.upper: 0}]
+            self.assertFalse(self.Cannibalism._local(larvae))
+            self.assertEqual(mkBounds.call_args_list,
+                             [mk.call(self.Cannibalism, larvae[0]),
+                              mk.call(self.Cannibalism, larvae[1])])
+
+            mkBounds.reset_mock()
+            # No radius model
+            self.Cannibalism.radius = None
+            self.assertTrue(self.Cannibalism._local(larvae))
+            self.assertEqual(mkBounds.call_args_list, [])
+
+    def test__plants(self):
+        """test group larvae by plant"""
+
+        larvae = [mk.MagicMock() for _ in range(4)]
+        keys   = [(0, 1, 2), (0, 1, 3), (0, 1, 2), (0, 2, 2)]
+        for larva, key in zip(larvae, keys):
+            larva.location.location_key = key
+
+        self.assertEqual(self.Cannibalism._plants(larvae),
+                         {(0, 1, 2): [larvae[0], larvae[2]],
+                          (0, 1, 3): [larvae[1]],
+                          (0, 2, 2): [larvae[3]]})
+        self.assertEqual(self.Cannibalism._plants([]), {})
+
+    def test__excluded(self):
+        """test get the targets each larva cannot draw"""
+
+        targets = [mk.MagicMock(spec=LarvaTest) for _ in range(5)]
+        gone    =  mk.MagicMock(spec=LarvaTest)
+        order   = [targets[0], targets[2], targets[4]]
+        drawn   = [{id(targets[1])},
+                   {id(gone), id(targets[3])},
+                   set()]
+
+        self.assertEqual(self.Cannibalism._excluded(order, drawn, [0, 1, 2],
+                                                    targets),
+                         [{0, 1}, {2, 3}, {4}])
+        self.assertEqual(self.Cannibalism._excluded(order, drawn, [1],
+                                                    targets),
+                         [{2, 3}])
+
+    def test__batch_targets(self):
+        """test draw a target for each larva"""
+
+        excluded = [{0}, {1, 2}, {3}]
+
+        with mk.patch.object(rnd, 'randint', autospec=True) as mkRandint:
+            mkRandint.side_effect = [np.array([0, 2, 3]), 0, 1, 0, 1]
+
+            self.assertEqual(list(self.Cannibalism._batch_targets(excluded,
+                                                                  4)),
+                             [1, 0, 1])
+            self.assertEqual(mkRandint.call_args_list,
+                             [mk.call(4, size=3),
+                              mk.call(4), mk.call(4), mk.call(4), mk.call(4)])
+
+    def test__redraw(self):
+        """test draw a new target"""
+
+        larva   = mk.MagicMock(spec=LarvaTest)
+        targets = [mk.MagicMock(spec=LarvaTest) for _ in range(4)]
+        targets[0].alive = False
+        targets[1].alive = True
+        targets[2].alive = True
+        targets[3].alive = True
+        larva.alive      = True
+        targets.append(larva)
+        drawn = {id(targets[2])}
+
+        with mk.patch.object(rnd, 'randint', autospec=True) as mkRandint:
+            mkRandint.return_value = 1
+
+            self.assertEqual(self.Cannibalism._redraw(larva, drawn, targets),
+                             targets[3])
+            self.assertEqual(mkRandint.call_args_list, [mk.call(2)])
+
+            mkRandint.reset_mock()
+            # No targets left
+            drawn = {id(targets[1]), id(targets[2]), id(targets[3])}
+            self.assertIsNone(self.Cannibalism._redraw(larva, drawn, targets))
+            self.assertEqual(mkRandint.call_args_list, [])
+
+    def test__batch_winners(self):
+        """test determine the fight winners"""
+
+        self.fight = mk.create_autospec(models.Fight, spec_set=True)
+        self.Cannibalism.fight = self.fight
+
+        pairs = [(mk.MagicMock(spec=LarvaTest), mk.MagicMock(spec=LarvaTest))
+                 for _ in range(3)]
+        for index, (larva, target) in enumerate(pairs):
+            larva. mass = float(index)
+            target.mass = float(index + 1)
+
+        self.assertEqual(self.Cannibalism._batch_winners(pairs),
+                         self.fight.batch.return_value)
+        self.assertEqual(len(self.fight.batch.call_args_list), 1)
+        mass0, mass1 = self.fight.batch.call_args_list[0][0]
+        self.assertEqual(list(mass0), [0.0, 1.0, 2.0])
+        self.assertEqual(list(mass1), [1.0, 2.0, 3.0])
+
+        # No fight model
+        self.Cannibalism.fight = None
+        self.assertEqual(list(self.Cannibalism._batch_winners(pairs)),
+                         [False]*3)
+
+    def test__batch_cannibalize(self):
+        """test perform cannibalism with a drawn outcome"""
+
+        larva    = mk.MagicMock(spec=LarvaTest)
+        egg_mass = mk.MagicMock(spec=EggMassTest)
+        target   = mk.MagicMock(spec=LarvaTest)
+        egg_mass.agent_key = keyword.egg_mass
+        target.  agent_key = keyword.larva
+
+        # Egg mass target
+        self.Cannibalism._batch_cannibalize(larva, egg_mass, False)
+        self.assertEqual(larva.consume_egg.call_args_list,
+                         [mk.call(egg_mass)])
+        self.assertEqual(larva. consume_larva.call_args_list, [])
+        self.assertEqual(target.consume_larva.call_args_list, [])
+
+        larva.reset_mock()
+        # Larva wins
+        self.Cannibalism._batch_cannibalize(larva, target, True)
+        self.assertEqual(larva. consume_larva.call_args_list,
+                         [mk.call(target)])
+        self.assertEqual(target.consume_larva.call_args_list, [])
+
+        larva.reset_mock()
+        # Target wins
+        self.Cannibalism._batch_cannibalize(larva, target, False)
+        self.assertEqual(larva. consume_larva.call_args_list, [])
+        self.assertEqual(target.consume_larva.call_args_list,
+                         [mk.call(larva)])
+
+        target.reset_mock()
+        # No fight model
+        self.Cannibalism.fight = None
+        self.Cannibalism._batch_cannibalize(larva, target, True)
+        self.assertEqual(larva. consume_larva.call_args_list, [])
+        self.assertEqual(target.consume_larva.call_args_list, [])
+        self.assertEqual(larva.consume_egg.call_args_list, [])
+
+    def test__batch_round(self):
+        """test run a round of cannibalism on a plant"""
+
+        self.encounter = mk.create_autospec(models.Encounter, spec_set=True)
+        self.Cannibalism.encounter = self.encounter
+
+        order   = [mk.MagicMock(spec=LarvaTest) for _ in range(4)]
+        targets = [mk.MagicMock(spec=LarvaTest) for _ in range(3)] + order
+        for index, larva in enumerate(order):
+            larva.mass     = float(index)
+            larva.genotype = keyword.homo_s
+        for target in targets:
+            target.alive = True
+        drawn   = [set(), {id(targets[0])}, set(), set()]
+        redrawn = mk.MagicMock(spec=LarvaTest)
+
+        with mk.patch.object(cannibalism.Cannibalism, '_can_encounter',
+                             autospec=True) as mkCan:
+            with mk.patch.object(cannibalism.Cannibalism, '_batch_targets',
+                                 autospec=True) as mkTargets:
+                with mk.patch.object(cannibalism.Cannibalism,
+                                     '_batch_winners',
+                                     autospec=True) as mkWinners:
+                    with mk.patch.object(cannibalism.Cannibalism,
+                                         '_batch_cannibalize',
+                                         autospec=True) as mkCannibalize:
+                        with mk.patch.object(cannibalism.Cannibalism,
+                                             '_redraw',
+                                             autospec=True) as mkRedraw:
+                            with mk.patch.object(cannibalism.Cannibalism,
+                                                 '_winner',
+                                                 autospec=True) as mkWinner:
+                                mkCan.side_effect = [True, True, False, True,
+                                                     True, True]
+                                self.encounter.batch.return_value = \
+                                    np.array([True, False, True])
+                                mkTargets.return_value = np.array([1, 2])
+                                mkWinners.return_value = \
+                                    np.array([True, False])
+                                mkRedraw.return_value = redrawn
+                                targets[2].alive = False
+
+                                self.assertEqual(
+                                    self.Cannibalism._batch_round(order,
+                                                                  drawn,
+                                                                  [0, 1, 2, 3],
+                                                                  targets),
+                                    [0, 3])
+
+                                self.assertEqual(
+                                    mkCan.call_args_list,
+                                    [mk.call(self.Cannibalism, larva)
+                                     for larva in order] +
+                                    [mk.call(self.Cannibalism, order[0]),
+                                     mk.call(self.Cannibalism, order[3])])
+                                number, mass, genotype = \
+                                    self.encounter.batch.call_args_list[0][0]
+                                self.assertEqual(list(number), [6, 5, 6])
+                                self.assertEqual(list(mass), [0.0, 1.0, 3.0])
+                                self.assertEqual(list(genotype),
+                                                 [keyword.homo_s]*3)
+                                self.assertEqual(
+                                    mkTargets.call_args_list,
+                                    [mk.call([{3}, {6}], 7)])
+                                self.assertEqual(
+                                    mkWinners.call_args_list,
+                                    [mk.call(self.Cannibalism,
+                                             [(order[0], targets[1]),
+                                              (order[3], targets[2])])])
+                                self.assertEqual(
+                                    mkRedraw.call_args_list,
+                                    [mk.call(order[3], drawn[3], targets)])
+                                self.assertEqual(
+                                    mkWinner.call_args_list,
+                                    [mk.call(self.Cannibalism,
+                                             order[3], redrawn)])
+                                self.assertEqual(
+                                    mkCannibalize.call_args_list,
+                                    [mk.call(self.Cannibalism, order[0],
+                                             targets[1], True),
+                                     mk.call(self.Cannibalism, order[3],
+                                             redrawn,
+                                             mkWinner.return_value)])
+                                self.assertEqual(drawn,
+                                                 [{id(targets[1])},
+                                                  {id(targets[0])},
+                                                  set(),
+                                                  {id(redrawn)}])
+
+                                # No larvae can encounter
+                                mkCan.side_effect = [False, False]
+                                mkCannibalize.reset_mock()
+                                self.assertEqual(
+                                    self.Cannibalism._batch_round(order,
+                                                                  drawn,
+                                                                  [0, 3],
+                                                                  targets),
+                                    [])
+                                self.assertEqual(
+                                    mkCannibalize.call_args_list, [])
+
+    def test__living(self):
+        """test get the living targets on a plant"""
+
+        larva   = mk.MagicMock(spec=LarvaTest)
+        targets = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+        larva.target_bins.return_value = [{0: targets[0]},
+                                          {},
+                                          {1: targets[1], 2: targets[2]}]
+
+        self.assertEqual(self.Cannibalism._living(larva), targets)
+        self.assertEqual(larva.target_bins.call_args_list,
+                         [mk.call(**{keyword.upper: 0,
+                                     keyword.lower: 0})])
+
+    def test__batch_plant(self):
+        """test run cannibalism on a plant"""
+
+        larvae = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+
+        with mk.patch.object(cannibalism.Cannibalism, '_living',
+                             autospec=True) as mkLiving:
+            with mk.patch.object(cannibalism.Cannibalism, '_batch_round',
+                                 autospec=True) as mkRound:
+                with mk.patch.object(rnd, 'permutation',
+                                     autospec=True) as mkPermutation:
+                    mkPermutation.return_value = np.array([2, 0, 1])
+                    targets = [mk.MagicMock(spec=list) for _ in range(3)]
+                    mkLiving.side_effect = targets
+                    mkRound.side_effect = [[0, 2], [2], []]
+                    order = [larvae[2], larvae[0], larvae[1]]
+
+                    self.assertIsNone(self.Cannibalism._batch_plant(larvae))
+                    self.assertEqual(mkPermutation.call_args_list,
+                                     [mk.call(3)])
+                    self.assertEqual(mkLiving.call_args_list,
+                                     [mk.call(order[0])]*3)
+                    self.assertEqual(mkRound.call_args_list,
+                                     [mk.call(self.Cannibalism, order,
+                                              [set(), set(), set()],
+                                              [0, 1, 2], targets[0]),
+                                      mk.call(self.Cannibalism, order,
+                                              [set(), set(), set()],
+                                              [0, 2], targets[1]),
+                                      mk.call(self.Cannibalism, order,
+                                              [set(), set(), set()],
+                                              [2], targets[2])])
+
+    def test_batch_cannibalism(self):
+        """test run cannibalism for a population"""
+
+        larvae = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+        plants = {(0, 1, 2): [larvae[0]],
+                  (0, 2, 2): [larvae[2]]}
+
+        with mk.patch.object(cannibalism.Cannibalism, '_can_encounter',
+                             autospec=True) as mkCan:
+            with mk.patch.object(cannibalism.Cannibalism, '_local',
+                                 autospec=True) as mkLocal:
+                with mk.patch.object(cannibalism.Cannibalism, '_plants',
+                                     autospec=True) as mkPlants:
+                    with mk.patch.object(cannibalism.Cannibalism,
+                                         '_batch_plant',
+                                         autospec=True) as mkPlant:
+                        with mk.patch.object(cannibalism.Cannibalism,
+                                             'cannibalism',
+                                             autospec=True) as mkCannibalism:
+                            mkCan.side_effect    = [True, False, True]
+                            mkLocal.return_value  = True
+                            mkPlants.return_value = plants
+
+                            # Local cannibalism
+                            self.assertIsNone(
+                                self.Cannibalism.batch_cannibalism(larvae))
+                            self.assertEqual(mkLocal.call_args_list,
+                                             [mk.call(self.Cannibalism,
+                                                      [larvae[0],
+                                                       larvae[2]])])
+                            self.assertEqual(mkPlants.call_args_list,
+                                             [mk.call([larvae[0],
+                                                       larvae[2]])])
+                            self.assertEqual(mkPlant.call_args_list,
+                                             [mk.call(self.Cannibalism,
+                                                      [larvae[0]]),
+                                              mk.call(self.Cannibalism,
+                                                      [larvae[2]])])
+                            self.assertEqual(mkCannibalism.call_args_list,
+                                             [])
+
+                            mkPlant.reset_mock()
+                            mkPlants.reset_mock()
+                            # Wider cannibalism
+                            mkCan.side_effect    = [True, False, True]
+                            mkLocal.return_value = False
+                            self.assertIsNone(
+                                self.Cannibalism.batch_cannibalism(larvae))
+                            self.assertEqual(mkPlants.call_args_list, [])
+                            self.assertEqual(mkPlant.call_args_list, [])
+                            self.assertEqual(mkCannibalism.call_args_list,
+                                             [mk.call(self.Cannibalism,
+                                                      larvae[0]),
+                                              mk.call(self.Cannibalism,
+                                                      larvae[2])])
+
+    @staticmethod
+    def _plant_agents(seed: int) -> tuple:
+        """Create the agents on a few plants"""
+
+        gen = np.random.RandomState(seed)
+        larvae = []
+        agents = []
+        for plant_key in range(3):
+            location = mk.MagicMock()
+            location.location_key = (0, plant_key)
+            plant = {keyword.egg_mass: {}, keyword.larva: {}}
+
+            for agent_key, number in [(keyword.egg_mass, 4),
+                                      (keyword.larva,    5)]:
+                for _ in range(number):
+                    agent = PlantAgent(agent_key, len(agents),
+                                       gen.rand(), location, plant)
+                    plant[agent_key][agent.unique_id] = agent
+                    agents.append(agent)
+                    if agent_key == keyword.larva:
+                        larvae.append(agent)
+
+        return larvae, agents
+
+    def test_batch_cannibalism_parity(self):
+        """test batched and unbatched paths agree on order free outcomes"""
+
+        self.Cannibalism = cannibalism.Cannibalism(Heavier(), Always())
+
+        for seed in range(5):
+            rnd.seed(seed)
+            larvae, agents = self._plant_agents(seed)
+            for larva in larvae:
+                self.Cannibalism.cannibalism(larva)
+            unbatched = [agent.alive for agent in agents]
+
+            rnd.seed(seed + 100)
+            larvae, agents = self._plant_agents(seed)
+            self.Cannibalism.batch_cannibalism(larvae)
+            batched = [agent.alive for agent in agents]
+
+            self.assertEqual(batched, unbatched)
+
+            # Test only the heaviest larva on each plant survives
+            for plant_key in range(3):
+                plant    = [larva for larva in larvae
+                            if larva.location.location_key == (0, plant_key)]
+                heaviest = max(plant, key=lambda larva: larva.mass)
+                self.assertEqual([larva for larva in plant if larva.alive],
+                                 [heaviest])
+            for agent in agents:
+                if agent.agent_key == keyword.egg_mass:
+                    self.assertFalse(agent.alive)
+
     def test_setup(self):
         """test setup the class"""
 
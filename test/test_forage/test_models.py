@@ -48,6 +48,26 @@ class TestPlantBase(ut.TestCase):
 
         self.assertIsNone(self.PlantBase(mass, plant, genotype, bt))
 
+    def test_total(self):
+        """test call the model for a number of bites"""
+
+        mass     = mk.MagicMock(spec=float)
+        plant    = mk.MagicMock(spec=float)
+        genotype = mk.MagicMock(spec=str)
+        bt       = mk.MagicMock(spec=str)
+
+        with mk.patch.object(model.PlantBase, '__call__',
+                             autospec=True) as mkCall:
+            mkCall.side_effect = [1.0, 2.0, 4.0]
+
+            self.assertEqual(self.PlantBase.total(mass, plant,
+                                                  genotype, bt, 3),
+                             7.0)
+            self.assertEqual(mkCall.call_args_list,
+                             [mk.call(self.PlantBase,
+                                      mass, plant, genotype, bt)
+                              for _ in range(3)])
+
 
 class TestPlantAdLibitum(ut.TestCase):
     """test the PlantAdLibitum mathematical model"""
@@ -89,6 +109,33 @@ class TestPlantAdLibitum(ut.TestCase):
                          [mk.call(self.steps)])
         self.assertEqual(self.max_gut.call_args_list,
                          [mk.call(mass)])
+
+    def test_total(self):
+        """test call the model for a number of bites"""
+
+        mass     = mk.MagicMock(spec=float)
+        plant    = mk.MagicMock(spec=float)
+        genotype = mk.MagicMock(spec=str)
+        bt       = mk.MagicMock(spec=str)
+
+        with mk.patch.object(model.PlantAdLibitum, '__call__',
+                             autospec=True) as mkCall:
+            mkCall.return_value = 1.5
+
+            self.assertEqual(self.PlantAdLibitum.total(mass, plant,
+                                                       genotype, bt, 3),
+                             4.5)
+            self.assertEqual(mkCall.call_args_list,
+                             [mk.call(self.PlantAdLibitum,
+                                      mass, plant, genotype, bt)])
+
+        # Test matches sequential bites
+        self.PlantAdLibitum = model.PlantAdLibitum(24, lambda x: 2*x)
+        self.assertAlmostEqual(self.PlantAdLibitum.total(3.0, plant,
+                                                         genotype, bt, 24),
+                               sum(self.PlantAdLibitum(3.0, plant,
+                                                       genotype, bt)
+                                   for _ in range(24)))
         
         
 class TestPlantStarve(ut.TestCase):
@@ -163,6 +210,30 @@ class TestPlantStarve(ut.TestCase):
                     self.assertEqual(mkMu.call_args_list,
                                      [mk.call(self.PlantStarve, mass)])
 
+    def test_total(self):
+        """test call the model for a number of bites"""
+
+        mass     = mk.MagicMock(spec=float)
+        plant    = mk.MagicMock(spec=float)
+        genotype = mk.MagicMock(spec=str)
+        bt       = mk.MagicMock(spec=str)
+
+        with mk.patch.object(model.PlantStarve, '_mu', autospec=True) as mkMu:
+            with mk.patch.object(stats.truncnorm, 'rvs',
+                                 autospec=True) as mkRVS:
+                mkRVS.return_value = np.array([1.0, 2.0, 4.0])
+
+                self.assertEqual(self.PlantStarve.total(mass, plant,
+                                                        genotype, bt, 3),
+                                 7.0)
+                self.assertEqual(mkRVS.call_args_list,
+                                 [mk.call(0, np.inf,
+                                          loc=mkMu.return_value,
+                                          scale=self.sigma,
+                                          size=3)])
+                self.assertEqual(mkMu.call_args_list,
+                                 [mk.call(self.PlantStarve, mass)])
+
 
 class TestEgg(ut.TestCase):
     """test Egg forage mathematical model"""
@@ -379,6 +450,43 @@ class TestLoss(ut.TestCase):
                                  [mk.call(self.Loss, mass, target_mass,
                                           genotype, target_key)])
 
+    def test_batch(self):
+        """test call the model for a population"""
+
+        self.Loss = model.Loss(2.0, {keyword.egg_mass: 3.0,
+                                     keyword.larva:    5.0},
+                               biomass.MaxGut(),
+                               model.Egg(0.5),
+                               model.Larva(0.25))
+
+        mass        = np.array([1.0, 16.0, 81.0])
+        target_mass = np.array([4.0, 8.0, 16.0])
+        genotype    = np.array([keyword.homo_s]*3)
+        target_key  = np.array([keyword.egg_mass,
+                                keyword.larva,
+                                keyword.larva])
+        random      = np.array([0.1, 0.5, 0.9])
+
+        with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+            mkRND.return_value = random
+
+            leave = self.Loss.batch(mass, target_mass, genotype, target_key)
+            self.assertEqual(mkRND.call_args_list, [mk.call(3)])
+
+        probs = [self.Loss._prob(mass[index], target_mass[index],
+                                 genotype[index], target_key[index])
+                 for index in range(3)]
+        self.assertEqual(list(leave), list(random <= np.array(probs)))
+
+        # Compare with individual decisions
+        for index in range(3):
+            with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+                mkRND.return_value = random[index]
+
+                self.assertEqual(self.Loss(mass[index], target_mass[index],
+                                           genotype[index], target_key[index]),
+                                 leave[index])
+
 
 class TestFight(ut.TestCase):
     """test Fight mathematical model"""
@@ -448,6 +556,22 @@ class TestFight(ut.TestCase):
                 self.assertEqual(mkProb.call_args_list,
                                  [mk.call(self.Fight, mass0, mass1)])
 
+    def test_batch(self):
+        """test call the model for a population"""
+
+        self.Fight = model.Fight(0.5)
+
+        mass0  = np.array([1.0, 2.0, 3.0])
+        mass1  = np.array([3.0, 2.0, 1.0])
+        random = np.array([0.3, 0.5, 0.9])
+
+        with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+            mkRND.return_value = random
+
+            self.assertEqual(list(self.Fight.batch(mass0, mass1)),
+                             [False, True, False])
+            self.assertEqual(mkRND.call_args_list, [mk.call(3)])
+
 
 class TestEncounter(ut.TestCase):
     """test Encounter mathematical model"""
@@ -521,6 +645,24 @@ class TestEncounter(ut.TestCase):
                 self.assertEqual(mkProb.call_args_list,
                                  [mk.call(self.Encounter, number)])
 
+    def test_batch(self):
+        """test call the model for a population"""
+
+        self.Encounter = model.Encounter(0.5)
+
+        number   = np.array([0, 1, 4])
+        mass     = np.array([1.0, 2.0, 3.0])
+        genotype = np.array([keyword.homo_s]*3)
+        random   = np.array([0.1, 0.3, 0.9])
+
+        with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+            mkRND.return_value = random
+
+            self.assertEqual(list(self.Encounter.batch(number, mass,
+                                                       genotype)),
+                             [False, True, False])
+            self.assertEqual(mkRND.call_args_list, [mk.call(3)])
+
 
 class TestRadius(ut.TestCase):
     """test Radius mathematical model"""
@@ -2,12 +2,16 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.larva as agent_larva
 
-import source.forage.plant as forage
+import source.forage.models as forage_models
+import source.forage.plant  as forage
+
+import source.space.environment as environment
 
 
 class LarvaTest(agent_larva.Larva):
@@ -32,7 +36,8 @@ class TestPlant(ut.TestCase):
 
         self.assertIsInstance(self.Plant, forage.Plant)
 
-        self.assertEqual(self.Plant.forage, self.forage)
+        self.assertEqual(self.Plant.forage,  self.forage)
+        self.assertEqual(self.Plant.deplete, False)
 
         self.assertTrue(dclass.is_dataclass(self.Plant))
 
@@ -54,7 +59,17 @@ class TestPlant(ut.TestCase):
         self.assertEqual(self.forage.call_args_list,
                          [mk.call(larva.mass, larva.plant,
                                   larva.genotype, larva.bt)])
-        
+
+        # Test a number of bites
+        self.Plant.forage = mk.create_autospec(forage_models.PlantBase,
+                                               spec_set=True, instance=True)
+        self.assertEqual(self.Plant._available(larva, 3),
+                         self.Plant.forage.total.return_value)
+        self.assertEqual(self.Plant.forage.total.call_args_list,
+                         [mk.call(larva.mass, larva.plant,
+                                  larva.genotype, larva.bt, 3)])
+        self.assertEqual(self.Plant.forage.call_args_list, [])
+
     def test__consume(self):
         """test run consume """
 
@@ -66,7 +81,54 @@ class TestPlant(ut.TestCase):
             self.assertEqual(larva.add_plant.call_args_list,
                              [mk.call(mkAvailable.return_value)])
             self.assertEqual(mkAvailable.call_args_list,
-                             [mk.call(self.Plant, larva)])
+                             [mk.call(self.Plant, larva, 1)])
+
+            larva.add_plant.reset_mock()
+            mkAvailable.reset_mock()
+            self.Plant._consume(larva, 3)
+            self.assertEqual(larva.add_plant.call_args_list,
+                             [mk.call(mkAvailable.return_value)])
+            self.assertEqual(mkAvailable.call_args_list,
+                             [mk.call(self.Plant, larva, 3)])
+
+            # Test deplete the plant
+            self.Plant.deplete = True
+            with mk.patch.object(forage.Plant, '_deplete',
+                                 autospec=True) as mkDeplete:
+                mkDeplete.return_value = np.array([0.5])
+
+                larva.add_plant.reset_mock()
+                mkAvailable.reset_mock()
+                self.Plant._consume(larva, 3)
+                self.assertEqual(larva.add_plant.call_args_list,
+                                 [mk.call(0.5)])
+                self.assertIsInstance(larva.add_plant.call_args[0][0],
+                                      float)
+                self.assertEqual(mkDeplete.call_args_list,
+                                 [mk.call([larva],
+                                          [mkAvailable.return_value])])
+                self.assertEqual(mkAvailable.call_args_list,
+                                 [mk.call(self.Plant, larva, 3)])
+
+    def test__deplete(self):
+        """test take the eaten food out of the plants"""
+
+        environ = environment.Environment({}, np.array([False, False]),
+                                          np.array([1.0, 10.0]))
+
+        larvae = [mk.MagicMock() for _ in range(3)]
+        for agent, plant_id in zip(larvae, [0, 0, 1]):
+            agent.plant_id = plant_id
+            agent.gut.amount.side_effect = \
+                lambda larva, amount: (min(amount, 2.0), amount >= 2.0)
+        larvae[0].simulation.agents.environment = environ
+
+        eaten = forage.Plant._deplete(larvae, [1.5, 3.0, 4.0])
+        np.testing.assert_allclose(eaten, [1.5/3.5, 2.0/3.5, 2.0])
+        np.testing.assert_allclose(environ.plant, [0.0, 8.0])
+        for agent, amount in zip(larvae, [1.5, 3.0, 4.0]):
+            self.assertEqual(agent.gut.amount.call_args_list,
+                             [mk.call(agent, amount)])
 
     def test_consume(self):
         """test consume the larva"""
@@ -76,7 +138,7 @@ class TestPlant(ut.TestCase):
         with mk.patch.object(forage.Plant, '_use_forage', autospec=True) as mkUse:
             with mk.patch.object(forage.Plant, '_consume',
                                  autospec=True) as mkConsume:
-                mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+                mkUse.__get__ = mk.MagicMock(side_effect=[False, True, True])
 
                 # No forage model is given
                 self.Plant.consume(larva)
@@ -85,7 +147,13 @@ class TestPlant(ut.TestCase):
                 # Forage model is given
                 self.Plant.consume(larva)
                 self.assertEqual(mkConsume.call_args_list,
-                                 [mk.call(self.Plant, larva)])
+                                 [mk.call(self.Plant, larva, 1)])
+
+                # Forage a number of bites
+                mkConsume.reset_mock()
+                self.Plant.consume(larva, 3)
+                self.assertEqual(mkConsume.call_args_list,
+                                 [mk.call(self.Plant, larva, 3)])
 
     def test_setup(self):
         """test setup the class"""
@@ -101,3 +169,63 @@ class TestPlant(ut.TestCase):
         self.Plant = forage.Plant.setup(**kwargs)
         self.assertIsInstance(self.Plant, forage.Plant)
         self.assertEqual(self.Plant.forage, None)
+        self.assertEqual(self.Plant.deplete, False)
+
+        # Test depleting the plants
+        kwargs = {keyword.plant_forage: self.forage,
+                  keyword.plant_deplete: True}
+        self.Plant = forage.Plant.setup(**kwargs)
+        self.assertEqual(self.Plant.forage,  self.forage)
+        self.assertEqual(self.Plant.deplete, True)
+
+        kwargs = {keyword.plant_deplete: False}
+        self.Plant = forage.Plant.setup(**kwargs)
+        self.assertEqual(self.Plant.forage,  None)
+        self.assertEqual(self.Plant.deplete, False)
+
+    def test_batch_consume(self):
+        """test consume for a population of larvae"""
+
+        larvae = [mk.create_autospec(LarvaTest, spec_set=True)
+                  for _ in range(3)]
+
+        with mk.patch.object(forage.Plant, '_use_forage', autospec=True) as mkUse:
+            with mk.patch.object(forage.Plant, '_consume',
+                                 autospec=True) as mkConsume:
+                with mk.patch.object(forage.Plant, '_available',
+                                     autospec=True) as mkAvailable:
+                    with mk.patch.object(forage.Plant, '_deplete',
+                                         autospec=True) as mkDeplete:
+                        mkUse.__get__ = mk.MagicMock(side_effect=[False,
+                                                                  True,
+                                                                  True])
+                        mkAvailable.side_effect = [1.0, 2.0, 3.0]
+                        mkDeplete.return_value  = np.array([0.1, 0.2, 0.3])
+
+                        # No forage model is given
+                        self.Plant.batch_consume(larvae)
+                        self.assertEqual(mkConsume.call_args_list, [])
+                        for larva in larvae:
+                            self.assertEqual(larva.add_plant.call_args_list,
+                                             [])
+
+                        # Forage model is given
+                        self.Plant.batch_consume(larvae)
+                        self.assertEqual(mkConsume.call_args_list,
+                                         [mk.call(self.Plant, larva)
+                                          for larva in larvae])
+                        self.assertEqual(mkDeplete.call_args_list, [])
+
+                        # Deplete the plants
+                        mkConsume.reset_mock()
+                        self.Plant.deplete = True
+                        self.Plant.batch_consume(larvae)
+                        self.assertEqual(mkConsume.call_args_list, [])
+                        self.assertEqual(mkAvailable.call_args_list,
+                                         [mk.call(self.Plant, larva)
+                                          for larva in larvae])
+                        self.assertEqual(mkDeplete.call_args_list,
+                                         [mk.call(larvae, [1.0, 2.0, 3.0])])
+                        for larva, amount in zip(larvae, [0.1, 0.2, 0.3]):
+                            self.assertEqual(larva.add_plant.call_args_list,
+                                             [mk.call(amount)])
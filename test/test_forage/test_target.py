@@ -2,12 +2,14 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.egg_mass as agent_egg_mass
 import source.agents.larva    as agent_larva
 
+import source.forage.models as models
 import source.forage.target as forage
 
 
@@ -137,6 +139,106 @@ class TestTarget(ut.TestCase):
                                  [mk.call(self.Target, larva, target)])
                 self.assertEqual(mkConsume.call_args_list, [])
 
+    def test__batch_keep(self):
+        """test if each larva keeps its target"""
+
+        larvae = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+        for index, larva in enumerate(larvae):
+            larva.mass             = float(index)
+            larva.genotype         = keyword.homo_s
+            larva.target.mass      = float(index + 3)
+            larva.target.agent_key = keyword.larva
+        larvae[0].target.agent_key = keyword.egg_mass
+
+        self.loss        = mk.create_autospec(models.Loss, spec_set=True)
+        self.Target.loss = self.loss
+
+        keep = self.Target._batch_keep(larvae)
+        self.assertEqual(keep, self.loss.batch.return_value)
+        self.assertEqual(len(self.loss.batch.call_args_list), 1)
+        args = self.loss.batch.call_args_list[0][0]
+        self.assertEqual(list(args[0]), [0.0, 1.0, 2.0])
+        self.assertEqual(list(args[1]), [3.0, 4.0, 5.0])
+        self.assertEqual(list(args[2]), [keyword.homo_s]*3)
+        self.assertEqual(list(args[3]), [keyword.egg_mass,
+                                         keyword.larva,
+                                         keyword.larva])
+
+        # No loss model
+        self.Target.loss = None
+        keep = self.Target._batch_keep(larvae)
+        self.assertEqual(list(keep), [False]*3)
+
+    def test_batch_consume(self):
+        """test run the target consume on a population"""
+
+        larvae  = [mk.MagicMock(spec=LarvaTest) for _ in range(3)]
+        targets = [larva.target for larva in larvae]
+        for larva in larvae:
+            larva.alive = True
+
+        with mk.patch.object(forage.Target, '_batch_keep',
+                             autospec=True) as mkKeep:
+            with mk.patch.object(forage.Target, '_consume_target',
+                                 autospec=True) as mkConsume:
+                mkKeep.return_value = np.array([True, False, True])
+
+                self.assertIsNone(self.Target.batch_consume(larvae))
+                self.assertEqual(mkKeep.call_args_list,
+                                 [mk.call(self.Target, larvae)])
+                self.assertEqual(mkConsume.call_args_list,
+                                 [mk.call(larvae[0], targets[0]),
+                                  mk.call(larvae[2], targets[2])])
+                self.assertEqual(larvae[0].target, targets[0])
+                self.assertEqual(larvae[1].target, None)
+                self.assertEqual(larvae[2].target, targets[2])
+
+    def test_batch_consume_chain(self):
+        """test a larva eaten earlier in the pass does not eat"""
+
+        egg_mass = mk.MagicMock(spec=EggMassTest)
+        egg_mass.alive = True
+        z = mk.MagicMock(spec=LarvaTest)
+        y = mk.MagicMock(spec=LarvaTest)
+        x = mk.MagicMock(spec=LarvaTest)
+        w = mk.MagicMock(spec=LarvaTest)
+        for larva, target in [(x, y), (y, z), (z, egg_mass), (w, x)]:
+            larva.alive       = True
+            larva._has_target = True
+            larva.target      = target
+
+        def consume(larva, target):
+            if target is not egg_mass:
+                target.alive = False
+
+        with mk.patch.object(forage.Target, '_batch_keep',
+                             autospec=True) as mkKeep:
+            with mk.patch.object(forage.Target, '_keep_target',
+                                 autospec=True) as mkKeepTarget:
+                with mk.patch.object(forage.Target, '_consume_target',
+                                     autospec=True,
+                                     side_effect=consume) as mkConsume:
+                    # Test X eats Y, so Y does not eat Z
+                    mkKeep.return_value = np.array([True, True, True])
+                    self.Target.batch_consume([x, y, z])
+                    self.assertEqual(mkConsume.call_args_list,
+                                     [mk.call(x, y), mk.call(z, egg_mass)])
+                    self.assertEqual(mkKeepTarget.call_args_list, [])
+                    self.assertFalse(y.alive)
+                    self.assertTrue(z.alive)
+
+                    mkConsume.reset_mock()
+                    # Test a target which has eaten is decided again
+                    x.alive = True
+                    y.alive = True
+                    mkKeep.return_value       = np.array([True, False])
+                    mkKeepTarget.return_value = True
+                    self.Target.batch_consume([x, w])
+                    self.assertEqual(mkKeepTarget.call_args_list,
+                                     [mk.call(self.Target, w, x)])
+                    self.assertEqual(mkConsume.call_args_list,
+                                     [mk.call(x, y), mk.call(w, x)])
+
     def test_setup(self):
         """test setup the class"""
 
@@ -3,6 +3,7 @@ import unittest.mock as mk
 
 import dataclasses  as dclass
 import collections  as collect
+import numpy        as np
 import numpy.random as rnd
 import scipy.stats  as stats
 
@@ -43,65 +44,36 @@ class TestEmigration(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Emigration))
         
-    def test_remove(self):
-        """test get the probability of agent emigrating"""
-
-        population = mk.MagicMock(spec=float)
-
-        with mk.patch.object(stats.norm, 'cdf') as mkCDF:
-            with mk.patch.object(rnd, 'random') as mkRND:
-                mkRND.return_value.__le__.side_effect = [True, False]
-
-                # Test if True
-                self.assertTrue(self.Emigration._remove(population))
-                self.assertEqual(mkRND.return_value.__le__.call_args_list,
-                                 [mk.call(mkCDF.return_value)])
-                self.assertEqual(mkRND.call_args_list,
-                                 [mk.call()])
-                self.assertEqual(mkCDF.call_args_list,
-                                 [mk.call(population,
-                                          loc=self.mu, scale=self.sigma)])
-
-                mkRND.reset_mock()
-                mkCDF.reset_mock()
-                # Test if False
-                self.assertFalse(self.Emigration._remove(population))
-                self.assertEqual(mkRND.return_value.__le__.call_args_list,
-                                 [mk.call(mkCDF.return_value)])
-                self.assertEqual(mkRND.call_args_list,
-                                 [mk.call()])
-                self.assertEqual(mkCDF.call_args_list,
-                                 [mk.call(population,
-                                          loc=self.mu, scale=self.sigma)])
-
-    def test__emigrate(self):
-        """test run emigrate on agent"""
-
-        agent      = mk.create_autospec(main_agent.Agent, spec_set=True)
-        population = mk.MagicMock(spec=float)
-
-        with mk.patch.object(emigration.Emigration, '_remove',
-                             autospec=True) as mkRemove:
-            mkRemove.side_effect = [False, True]
-
-            # Test not remove
-            self.assertEqual(self.Emigration._emigrate(agent, population),
-                             population)
-            self.assertEqual(population.__sub__.call_args_list, [])
-            self.assertEqual(mkRemove.call_args_list,
-                             [mk.call(self.Emigration, population)])
-            self.assertEqual(agent.die.call_args_list, [])
-
-            mkRemove.reset_mock()
-            # Test not remove
-            self.assertEqual(self.Emigration._emigrate(agent, population),
-                             population.__sub__.return_value)
-            self.assertEqual(population.__sub__.call_args_list,
-                             [mk.call(1)])
-            self.assertEqual(mkRemove.call_args_list,
-                             [mk.call(self.Emigration, population)])
-            self.assertEqual(agent.die.call_args_list,
-                             [mk.call(keyword.emigrate)])
+    def test__probabilities(self):
+        """test get the probability of emigrating at each population level"""
+
+        with mk.patch.object(stats.norm, 'cdf', autospec=True) as mkCDF:
+            self.assertEqual(self.Emigration._probabilities(3),
+                             mkCDF.return_value)
+            self.assertEqual(len(mkCDF.call_args_list), 1)
+            args, kwargs = mkCDF.call_args_list[0]
+            np.testing.assert_array_equal(args[0], [0, 1, 2, 3])
+            self.assertEqual(kwargs, {'loc': self.mu, 'scale': self.sigma})
+
+        # Test practical
+        self.Emigration = emigration.Emigration(2.0, 1.0, self.agent_keys)
+        np.testing.assert_allclose(self.Emigration._probabilities(4),
+                                   stats.norm.cdf([0, 1, 2, 3, 4],
+                                                  loc=2.0, scale=1.0))
+
+    def test__die(self):
+        """test emigrate the agents decided on"""
+
+        population = [mk.create_autospec(main_agent.Agent, spec_set=True)
+                      for _ in range(3)]
+
+        self.assertEqual(self.Emigration._die(population,
+                                              [True, False, True]), None)
+        self.assertEqual(population[0].die.call_args_list,
+                         [mk.call(keyword.emigrate)])
+        self.assertEqual(population[1].die.call_args_list, [])
+        self.assertEqual(population[2].die.call_args_list,
+                         [mk.call(keyword.emigrate)])
 
     def test__agents(self):
         """test create the agents"""
@@ -133,41 +105,109 @@ class TestEmigration(ut.TestCase):
                                 __getitem__.call_args_list), 3)
         self.assertEqual(len(agents.__getitem__.call_args_list), 3)
         
-    def test_emigration(self):
-        """test run emigration"""
+    def test_population(self):
+        """test get the size of the population"""
 
         agents = mk.create_autospec(main_agents.Agents, spec_set=True)
+        agents.__getitem__.return_value = \
+            mk.create_autospec(main_agents.AgentsBin, spec_set=True)
+
+        agent_bins = []
+        for size in range(3):
+            pop = {mk.MagicMock(spec=str):
+                       mk.create_autospec(main_agent.Agent, spec_set=True)
+                   for _ in range(size + 1)}
+            agent_bins.append(main_agents.AgentBin(pop, mk.MagicMock(),
+                                                   self.agent_keys[size]))
+        agents.__getitem__.return_value.__getitem__.side_effect = agent_bins
+
+        self.assertEqual(self.Emigration.population(agents), 6)
+        self.assertEqual(agents.__getitem__.return_value.
+                            __getitem__.call_args_list,
+                         [mk.call(agent_key)
+                          for agent_key in self.agent_keys])
+        self.assertEqual(agents.__getitem__.call_args_list,
+                         [mk.call(self.Emigration.location)])
+
+    def test_decisions(self):
+        """test decide if each agent emigrates"""
+
+        with mk.patch.object(emigration.Emigration, '_probabilities',
+                             autospec=True) as mkProbabilities:
+            with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+                mkProbabilities.return_value = \
+                    np.array([0.0, 0.1, 0.2, 0.3, 0.4, 0.5])
+                mkRND.return_value = np.array([0.6, 0.5, 0.35, 0.35, 0.2])
+
+                self.assertEqual(self.Emigration.decisions(5),
+                                 [False, True, True, False, True])
+                self.assertEqual(mkRND.call_args_list, [mk.call(5)])
+                self.assertEqual(mkProbabilities.call_args_list,
+                                 [mk.call(self.Emigration, 5)])
+
+                # Test empty population
+                mkProbabilities.reset_mock()
+                mkRND.return_value = np.array([])
+                self.assertEqual(self.Emigration.decisions(0), [])
+
+        # Test sequential semantics
+        self.Emigration = emigration.Emigration(100.0, 10.0, self.agent_keys)
+        rnd.seed(3)
+        decisions = self.Emigration.decisions(120)
+        rnd.seed(3)
+        draws      = rnd.random(120)
+        population = 120
+        expected   = []
+        for draw in draws:
+            remove = draw <= stats.norm.cdf(population, loc=100.0, scale=10.0)
+            expected.append(bool(remove))
+            population -= int(remove)
+        self.assertEqual(decisions, expected)
 
+    def test_remove(self):
+        """test emigrate agents using decisions"""
+
+        agents     = mk.create_autospec(main_agents.Agents, spec_set=True)
         population = [mk.create_autospec(main_agent.Agent, spec_set=True)
                       for _ in range(3)]
-        pop        = [mk.MagicMock(spec=int) for _ in range(3)]
+        decisions  = [True, False, True]
 
         with mk.patch.object(emigration.Emigration, '_agents',
                              autospec=True) as mkAgents:
-            with mk.patch.object(emigration.Emigration, '_emigrate',
-                                 autospec=True) as mkEmigrate:
-                with mk.patch.object(emigration, 'len') as mkLen:
-                    mkAgents.return_value  = population
-                    mkEmigrate.side_effect = pop
+            with mk.patch.object(emigration.Emigration, '_die',
+                                 autospec=True) as mkDie:
+                mkAgents.return_value = population
+
+                self.Emigration.remove(agents, decisions)
+                self.assertEqual(mkDie.call_args_list,
+                                 [mk.call(population, decisions)])
+                self.assertEqual(mkAgents.call_args_list,
+                                 [mk.call(self.Emigration, agents)])
+
+    def test_emigration(self):
+        """test run emigration"""
+
+        agents     = mk.create_autospec(main_agents.Agents, spec_set=True)
+        population = [mk.create_autospec(main_agent.Agent, spec_set=True)
+                      for _ in range(3)]
+
+        with mk.patch.object(emigration.Emigration, '_agents',
+                             autospec=True) as mkAgents:
+            with mk.patch.object(emigration.Emigration, 'decisions',
+                                 autospec=True) as mkDecisions:
+                with mk.patch.object(emigration.Emigration, '_die',
+                                     autospec=True) as mkDie:
+                    mkAgents.return_value = population
 
                     self.Emigration.emigration(agents)
-                    self.assertEqual(len(mkEmigrate.call_args_list), 3)
-                    call = mkEmigrate.call_args_list.pop(0)
-                    self.assertEqual(call,
-                                     mk.call(self.Emigration,
-                                             population[0], mkLen.return_value))
-                    self.assertEqual(mkLen.call_args_list,
-                                     [mk.call(population)])
+                    self.assertEqual(mkDie.call_args_list,
+                                     [mk.call(population,
+                                              mkDecisions.return_value)])
+                    self.assertEqual(mkDecisions.call_args_list,
+                                     [mk.call(self.Emigration, 3)])
                     self.assertEqual(mkAgents.call_args_list,
                                      [mk.call(self.Emigration, agents)])
 
-                    for index, call in enumerate(mkEmigrate.call_args_list):
-                        self.assertEqual(call,
-                                         mk.call(self.Emigration,
-                                                 population[index + 1],
-                                                 pop[index]))
-                    self.assertEqual(len(mkEmigrate.call_args_list), 2)
-
 
 class TestEmigrations(ut.TestCase):
     """test Emigrations class"""
@@ -3,7 +3,6 @@ import unittest.mock as mk
 
 import dataclasses  as dclass
 import collections  as collect
-import numpy.random as rnd
 import scipy.stats  as stats
 
 import source.keyword as keyword
@@ -58,254 +57,147 @@ class TestImmigration(ut.TestCase):
     def test__immigrate_egg_masses(self):
         """test immigrate egg_masses into simulation"""
 
-        simulation = mk.create_autospec(main_simulation.Simulation,
-                                        spec_set=True)
-        new = [mk.create_autospec(egg_mass.EggMass, spec_set=True)
-               for _ in range(3)]
+        simulation     = mk.create_autospec(main_simulation.Simulation,
+                                            spec_set=True)
+        unique_id_nums = [mk.MagicMock(spec=int) for _ in range(3)]
 
         with mk.patch.object(immigration.Immigration, '_number',
                              autospec=True) as mkNumber:
-            with mk.patch.object(egg_mass.EggMass, 'setup',
+            with mk.patch.object(egg_mass.EggMass, 'batch_setup',
                                  autospec=True) as mkSetup:
-                mkNumber.return_value = 3
-                mkSetup.side_effect = new
-
-                self.Immigration._immigrate_egg_masses(simulation)
-                self.assertEqual(mkNumber.call_args_list,
-                                 [mk.call(self.Immigration)])
-                for index, agent in enumerate(new):
-                    self.assertEqual(mkSetup.call_args_list[index],
-                                     mk.call(simulation.
-                                                new_unique_id.return_value,
-                                             keyword.immigrant,
-                                             simulation,
-                                             self.genotype))
-                    self.assertEqual(simulation.
-                                     new_unique_id.call_args_list[index],
-                                     mk.call())
-                    self.assertEqual(agent.activate.call_args_list,
-                                     [mk.call()])
-                self.assertEqual(len(mkSetup.call_args_list), 3)
-                self.assertEqual(len(simulation.
-                                        new_unique_id.call_args_list), 3)
+                with mk.patch.object(egg_mass.EggMass, 'batch_activate',
+                                     autospec=True) as mkActivate:
+                    simulation.new_unique_ids.return_value = unique_id_nums
+
+                    self.Immigration._immigrate_egg_masses(simulation)
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(mkSetup.return_value)])
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums,
+                                              keyword.immigrant,
+                                              simulation,
+                                              self.genotype)])
+                    self.assertEqual(simulation.new_unique_ids.
+                                         call_args_list,
+                                     [mk.call(mkNumber.return_value)])
+                    self.assertEqual(mkNumber.call_args_list,
+                                     [mk.call(self.Immigration)])
 
     def test__immigrate_larvae(self):
         """test immigrate larvae into simulation"""
 
-        simulation = mk.create_autospec(main_simulation.Simulation,
-                                        spec_set=True)
-        new = [mk.create_autospec(larva.Larva, spec_set=True)
-               for _ in range(3)]
+        simulation     = mk.create_autospec(main_simulation.Simulation,
+                                            spec_set=True)
+        unique_id_nums = [mk.MagicMock(spec=int) for _ in range(3)]
 
         with mk.patch.object(immigration.Immigration, '_number',
                              autospec=True) as mkNumber:
-            with mk.patch.object(larva.Larva, 'setup',
+            with mk.patch.object(larva.Larva, 'batch_setup',
                                  autospec=True) as mkSetup:
-                mkNumber.return_value = 3
-                mkSetup.side_effect = new
-
-                self.Immigration._immigrate_larvae(simulation)
-                self.assertEqual(mkNumber.call_args_list,
-                                 [mk.call(self.Immigration)])
-                for index, agent in enumerate(new):
-                    self.assertEqual(mkSetup.call_args_list[index],
-                                     mk.call(simulation.
-                                             new_unique_id.return_value,
-                                             keyword.immigrant,
-                                             simulation,
-                                             self.genotype))
-                    self.assertEqual(simulation.
-                                     new_unique_id.call_args_list[index],
-                                     mk.call())
-                    self.assertEqual(agent.activate.call_args_list,
-                                     [mk.call()])
-                self.assertEqual(len(mkSetup.call_args_list), 3)
-                self.assertEqual(len(simulation.
-                                     new_unique_id.call_args_list), 3)
+                with mk.patch.object(larva.Larva, 'batch_activate',
+                                     autospec=True) as mkActivate:
+                    simulation.new_unique_ids.return_value = unique_id_nums
+
+                    self.Immigration._immigrate_larvae(simulation)
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(mkSetup.return_value)])
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums,
+                                              keyword.immigrant,
+                                              simulation,
+                                              self.genotype)])
+                    self.assertEqual(simulation.new_unique_ids.
+                                         call_args_list,
+                                     [mk.call(mkNumber.return_value)])
+                    self.assertEqual(mkNumber.call_args_list,
+                                     [mk.call(self.Immigration)])
 
     def test__immigrate_pupae(self):
         """test immigrate pupae into simulation"""
 
-        simulation = mk.create_autospec(main_simulation.Simulation,
-                                        spec_set=True)
-        new = [mk.create_autospec(pupa.Pupa, spec_set=True)
-               for _ in range(3)]
+        simulation     = mk.create_autospec(main_simulation.Simulation,
+                                            spec_set=True)
+        unique_id_nums = [mk.MagicMock(spec=int) for _ in range(3)]
 
         with mk.patch.object(immigration.Immigration, '_number',
                              autospec=True) as mkNumber:
-            with mk.patch.object(pupa.Pupa, 'setup',
+            with mk.patch.object(pupa.Pupa, 'batch_setup',
                                  autospec=True) as mkSetup:
-                mkNumber.return_value = 3
-                mkSetup.side_effect = new
-
-                self.Immigration._immigrate_pupae(simulation)
-                self.assertEqual(mkNumber.call_args_list,
-                                 [mk.call(self.Immigration)])
-                for index, agent in enumerate(new):
-                    self.assertEqual(mkSetup.call_args_list[index],
-                                     mk.call(simulation.
-                                             new_unique_id.return_value,
-                                             keyword.immigrant,
-                                             simulation,
-                                             self.genotype))
-                    self.assertEqual(simulation.
-                                     new_unique_id.call_args_list[index],
-                                     mk.call())
-                    self.assertEqual(agent.activate.call_args_list,
-                                     [mk.call()])
-                self.assertEqual(len(mkSetup.call_args_list), 3)
-                self.assertEqual(len(simulation.
-                                     new_unique_id.call_args_list), 3)
+                with mk.patch.object(pupa.Pupa, 'batch_activate',
+                                     autospec=True) as mkActivate:
+                    simulation.new_unique_ids.return_value = unique_id_nums
+
+                    self.Immigration._immigrate_pupae(simulation)
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(mkSetup.return_value)])
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums,
+                                              keyword.immigrant,
+                                              simulation,
+                                              self.genotype)])
+                    self.assertEqual(simulation.new_unique_ids.
+                                         call_args_list,
+                                     [mk.call(mkNumber.return_value)])
+                    self.assertEqual(mkNumber.call_args_list,
+                                     [mk.call(self.Immigration)])
 
     def test__immigrate_adults(self):
         """test immigrate adults into simulation"""
 
-        simulation = mk.create_autospec(main_simulation.Simulation,
-                                        spec_set=True)
-        new = [mk.create_autospec(adult.Adult, spec_set=True)
-               for _ in range(3)]
+        simulation     = mk.create_autospec(main_simulation.Simulation,
+                                            spec_set=True)
+        unique_id_nums = [mk.MagicMock(spec=int) for _ in range(3)]
 
         with mk.patch.object(immigration.Immigration, '_number',
                              autospec=True) as mkNumber:
-            with mk.patch.object(adult.Adult, 'setup',
+            with mk.patch.object(adult.Adult, 'batch_setup',
                                  autospec=True) as mkSetup:
-                mkNumber.return_value = 3
-                mkSetup.side_effect = new
-
-                self.Immigration._immigrate_adults(simulation)
-                self.assertEqual(mkNumber.call_args_list,
-                                 [mk.call(self.Immigration)])
-                for index, agent in enumerate(new):
-                    self.assertEqual(mkSetup.call_args_list[index],
-                                     mk.call(simulation.
-                                             new_unique_id.return_value,
-                                             keyword.immigrant,
-                                             simulation,
-                                             self.genotype))
-                    self.assertEqual(simulation.
-                                     new_unique_id.call_args_list[index],
-                                     mk.call())
-                    self.assertEqual(agent.activate.call_args_list,
-                                     [mk.call()])
-                self.assertEqual(len(mkSetup.call_args_list), 3)
-                self.assertEqual(len(simulation.
-                                     new_unique_id.call_args_list), 3)
+                with mk.patch.object(adult.Adult, 'batch_activate',
+                                     autospec=True) as mkActivate:
+                    simulation.new_unique_ids.return_value = unique_id_nums
+
+                    self.Immigration._immigrate_adults(simulation)
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(mkSetup.return_value)])
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums,
+                                              keyword.immigrant,
+                                              simulation,
+                                              self.genotype)])
+                    self.assertEqual(simulation.new_unique_ids.
+                                         call_args_list,
+                                     [mk.call(mkNumber.return_value)])
+                    self.assertEqual(mkNumber.call_args_list,
+                                     [mk.call(self.Immigration)])
 
     def test__immigrate_pregnant(self):
         """test immigrate pregnant into simulation"""
 
-        simulation = mk.create_autospec(main_simulation.Simulation,
-                                        spec_set=True)
-        new = [mk.create_autospec(adult.Adult, spec_set=True)
-               for _ in range(3)]
-
-        # Homo_r
-        self.Immigration.genotype = keyword.homo_r
-        with mk.patch.object(immigration.Immigration, '_number',
-                             autospec=True) as mkNumber:
-            with mk.patch.object(adult.Adult, 'setup',
-                                 autospec=True) as mkSetup:
-                with mk.patch.object(rnd, 'shuffle') as mkRND:
-                    mkNumber.return_value = 3
-                    mkSetup.side_effect = new
-
-                    self.Immigration._immigrate_pregnant(simulation)
-                    self.assertEqual(mkNumber.call_args_list,
-                                     [mk.call(self.Immigration)])
-                    for index, agent in enumerate(new):
-                        self.assertEqual(mkSetup.call_args_list[index],
-                                         mk.call(simulation.
-                                                 new_unique_id.return_value,
-                                                 keyword.immigrant,
-                                                 simulation,
-                                                 keyword.homo_r,
-                                                 keyword.homo_r))
-                        self.assertEqual(simulation.
-                                         new_unique_id.call_args_list[index],
-                                         mk.call())
-                        self.assertEqual(mkRND.call_args_list[index],
-                                         mk.call([keyword.homo_r,
-                                                  keyword.homo_r]))
-                        self.assertEqual(agent.activate.call_args_list,
-                                         [mk.call()])
-                        agent.reset_mock()
-                    self.assertEqual(len(mkSetup.call_args_list), 3)
-                    self.assertEqual(len(simulation.
-                                         new_unique_id.call_args_list), 3)
-                    self.assertEqual(len(mkRND.call_args_list), 3)
-                    simulation.reset_mock()
-
-        # Hetero
-        self.Immigration.genotype = keyword.hetero
-        with mk.patch.object(immigration.Immigration, '_number',
-                             autospec=True) as mkNumber:
-            with mk.patch.object(adult.Adult, 'setup',
-                                 autospec=True) as mkSetup:
-                with mk.patch.object(rnd, 'shuffle') as mkRND:
-                    mkNumber.return_value = 3
-                    mkSetup.side_effect = new
+        simulation     = mk.create_autospec(main_simulation.Simulation,
+                                            spec_set=True)
+        unique_id_nums = [mk.MagicMock(spec=int) for _ in range(3)]
 
-                    self.Immigration._immigrate_pregnant(simulation)
-                    self.assertEqual(mkNumber.call_args_list,
-                                     [mk.call(self.Immigration)])
-                    for index, agent in enumerate(new):
-                        self.assertEqual(mkSetup.call_args_list[index],
-                                         mk.call(simulation.
-                                                 new_unique_id.return_value,
-                                                 keyword.immigrant,
-                                                 simulation,
-                                                 keyword.homo_r,
-                                                 keyword.homo_s))
-                        self.assertEqual(simulation.
-                                         new_unique_id.call_args_list[index],
-                                         mk.call())
-                        self.assertEqual(mkRND.call_args_list[index],
-                                         mk.call([keyword.homo_r,
-                                                  keyword.homo_s]))
-                        self.assertEqual(agent.activate.call_args_list,
-                                         [mk.call()])
-                        agent.reset_mock()
-                    self.assertEqual(len(mkSetup.call_args_list), 3)
-                    self.assertEqual(len(simulation.
-                                         new_unique_id.call_args_list), 3)
-                    self.assertEqual(len(mkRND.call_args_list), 3)
-                    simulation.reset_mock()
-
-        # Homo_s
-        self.Immigration.genotype = keyword.homo_s
         with mk.patch.object(immigration.Immigration, '_number',
                              autospec=True) as mkNumber:
-            with mk.patch.object(adult.Adult, 'setup',
-                                 autospec=True) as mkSetup:
-                with mk.patch.object(rnd, 'shuffle') as mkRND:
-                    mkNumber.return_value = 3
-                    mkSetup.side_effect = new
+            with mk.patch.object(adult.Adult, 'batch_pregnant',
+                                 autospec=True) as mkPregnant:
+                with mk.patch.object(adult.Adult, 'batch_activate',
+                                     autospec=True) as mkActivate:
+                    simulation.new_unique_ids.return_value = unique_id_nums
 
                     self.Immigration._immigrate_pregnant(simulation)
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(mkPregnant.return_value)])
+                    self.assertEqual(mkPregnant.call_args_list,
+                                     [mk.call(unique_id_nums,
+                                              keyword.immigrant,
+                                              simulation,
+                                              self.genotype)])
+                    self.assertEqual(simulation.new_unique_ids.
+                                         call_args_list,
+                                     [mk.call(mkNumber.return_value)])
                     self.assertEqual(mkNumber.call_args_list,
                                      [mk.call(self.Immigration)])
-                    for index, agent in enumerate(new):
-                        self.assertEqual(mkSetup.call_args_list[index],
-                                         mk.call(simulation.
-                                                 new_unique_id.return_value,
-                                                 keyword.immigrant,
-                                                 simulation,
-                                                 keyword.homo_s,
-                                                 keyword.homo_s))
-                        self.assertEqual(simulation.
-                                         new_unique_id.call_args_list[index],
-                                         mk.call())
-                        self.assertEqual(mkRND.call_args_list[index],
-                                         mk.call([keyword.homo_s,
-                                                  keyword.homo_s]))
-                        self.assertEqual(agent.activate.call_args_list,
-                                         [mk.call()])
-                        agent.reset_mock()
-                    self.assertEqual(len(mkSetup.call_args_list), 3)
-                    self.assertEqual(len(simulation.
-                                         new_unique_id.call_args_list), 3)
-                    self.assertEqual(len(mkRND.call_args_list), 3)
-                    simulation.reset_mock()
 
     def test_immigration(self):
         """test run the immigration"""
@@ -2,13 +2,14 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses  as dclass
-import numpy.random as rnd
+import numpy        as np
 
 import source.keyword as keyword
 
 import source.agents.adult as agent_adult
 
 import source.movement.adult as movement
+import source.movement.rings as rings
 
 
 class AdultTest(agent_adult.Adult):
@@ -45,38 +46,74 @@ class TestAdult(ut.TestCase):
         self.Adult.movement = None
         self.assertFalse(self.Adult._use_movement)
 
-    def test__distance(self):
-        """test determine if adult distances"""
-
-        adult = mk.create_autospec(AdultTest, spec_set=True)
-
-        self.assertEqual(self.Adult._distance(adult),
-                         self.movement.return_value)
-        self.assertEqual(self.movement.call_args_list,
-                         [mk.call(adult.mass, adult.genotype)])
+    def test__sampler(self):
+        """test get the ring sampler for a vertex"""
+
+        adult = mk.MagicMock()
+        graph = adult.simulation.space.__getitem__.return_value
+        self.Adult.movement = mk.MagicMock()
+
+        self.assertEqual(self.Adult._samplers, {})
+        with mk.patch.object(rings.RingSampler, 'setup',
+                             autospec=True) as mkSetup:
+            # Test compute new sampler
+            self.assertEqual(self.Adult._sampler(adult, 4),
+                             mkSetup.return_value)
+            self.assertEqual(self.Adult._samplers, {4: mkSetup.return_value})
+            self.assertEqual(mkSetup.call_args_list,
+                             [mk.call(graph.neighborhood.
+                                        __getitem__.return_value,
+                                      self.Adult.movement.cdf)])
+            self.assertEqual(graph.neighborhood.__getitem__.call_args_list,
+                             [mk.call(4)])
+            self.assertEqual(adult.simulation.space.__getitem__.
+                                call_args_list,
+                             [mk.call(keyword.adult_level)])
+
+            # Test use cached sampler
+            self.assertEqual(self.Adult._sampler(adult, 4),
+                             mkSetup.return_value)
+            self.assertEqual(len(mkSetup.call_args_list), 1)
 
     def test__vertex(self):
         """test get the vertex to move to"""
 
-        adult = mk.create_autospec(AdultTest, spec_set=True)
-
-        with mk.patch.object(movement.Adult, '_distance',
-                             autospec=True) as mkDistance:
-            with mk.patch.object(movement, 'list') as mkList:
-                with mk.patch.object(rnd, 'choice') as mkRND:
-                    kwargs = {keyword.upper: mkDistance.return_value,
-                              keyword.lower: mkDistance.return_value}
-
-                    self.assertEqual(self.Adult._vertex(adult),
-                                     mkRND.return_value)
-                    self.assertEqual(mkRND.call_args_list,
-                                     [mk.call(mkList.return_value)])
-                    self.assertEqual(mkList.call_args_list,
-                                     [mk.call(adult.vertices.return_value)])
-                    self.assertEqual(adult.vertices.call_args_list,
-                                     [mk.call(**kwargs)])
-                    self.assertEqual(mkDistance.call_args_list,
-                                     [mk.call(self.Adult, adult)])
+        adult = mk.MagicMock()
+        adult.location.__getitem__.return_value = 7
+
+        with mk.patch.object(movement.Adult, '_sampler',
+                             autospec=True) as mkSampler:
+            mkSampler.return_value.draw.return_value = np.array([3])
+
+            self.assertEqual(self.Adult._vertex(adult), 3)
+            self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                             [mk.call(1)])
+            self.assertEqual(mkSampler.call_args_list,
+                             [mk.call(self.Adult, adult, 7)])
+            self.assertEqual(adult.location.__getitem__.call_args_list,
+                             [mk.call(keyword.adult_level)])
+
+    def test__composite_vertex(self):
+        """test get the vertex after a number of moves"""
+
+        adult = mk.MagicMock()
+        adult.location.__getitem__.return_value = 7
+
+        with mk.patch.object(movement.Adult, '_sampler',
+                             autospec=True) as mkSampler:
+            mkSampler.return_value.draw.side_effect = [np.array([3]),
+                                                       np.array([5]),
+                                                       np.array([2])]
+
+            self.assertEqual(self.Adult._composite_vertex(adult, 3), 2)
+            self.assertEqual(mkSampler.call_args_list,
+                             [mk.call(self.Adult, adult, 7),
+                              mk.call(self.Adult, adult, 3),
+                              mk.call(self.Adult, adult, 5)])
+            self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                             [mk.call(1) for _ in range(3)])
+            self.assertEqual(adult.location.__getitem__.call_args_list,
+                             [mk.call(keyword.adult_level)])
 
     def test_move(self):
         """test move the adult"""
@@ -87,20 +124,67 @@ class TestAdult(ut.TestCase):
                              autospec=True) as mkUse:
             with mk.patch.object(movement.Adult, '_vertex',
                                  autospec=True) as mkVertex:
+                with mk.patch.object(movement.Adult, '_composite_vertex',
+                                     autospec=True) as mkComposite:
+                    mkUse.__get__ = mk.MagicMock(side_effect=[False, True,
+                                                              True])
+
+                    # Test if no movement
+                    self.Adult.move(adult)
+                    self.assertEqual(adult.transfer.call_args_list, [])
+                    self.assertEqual(mkVertex.call_args_list, [])
+
+                    # Test if movement
+                    self.Adult.move(adult)
+                    self.assertEqual(adult.transfer.call_args_list,
+                                     [mk.call(mkVertex.return_value,
+                                              keyword.adult_level)])
+                    self.assertEqual(mkVertex.call_args_list,
+                                     [mk.call(self.Adult, adult)])
+                    self.assertEqual(mkComposite.call_args_list, [])
+
+                    adult.transfer.reset_mock()
+                    mkVertex.reset_mock()
+                    # Test if a number of movements
+                    self.Adult.move(adult, 3)
+                    self.assertEqual(adult.transfer.call_args_list,
+                                     [mk.call(mkComposite.return_value,
+                                              keyword.adult_level)])
+                    self.assertEqual(mkComposite.call_args_list,
+                                     [mk.call(self.Adult, adult, 3)])
+                    self.assertEqual(mkVertex.call_args_list, [])
+
+    def test_batch_move(self):
+        """test move a population of adults"""
+
+        adults = [mk.MagicMock() for _ in range(3)]
+        for adult, vertex in zip(adults, [4, 5, 4]):
+            adult.location.__getitem__.return_value = vertex
+
+        with mk.patch.object(movement.Adult, '_use_movement',
+                             autospec=True) as mkUse:
+            with mk.patch.object(movement.Adult, '_sampler',
+                                 autospec=True) as mkSampler:
                 mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+                draws = [np.array([1, 2]), np.array([3])]
+                mkSampler.return_value.draw.side_effect = draws
 
                 # Test if no movement
-                self.Adult.move(adult)
-                self.assertEqual(adult.transfer.call_args_list, [])
-                self.assertEqual(mkVertex.call_args_list, [])
+                self.assertEqual(self.Adult.batch_move(adults), None)
+                self.assertEqual(mkSampler.call_args_list, [])
+                for adult in adults:
+                    self.assertEqual(adult.transfer.call_args_list, [])
 
                 # Test if movement
-                self.Adult.move(adult)
-                self.assertEqual(adult.transfer.call_args_list,
-                                 [mk.call(mkVertex.return_value,
-                                          keyword.adult_level)])
-                self.assertEqual(mkVertex.call_args_list,
-                                 [mk.call(self.Adult, adult)])
+                self.assertEqual(self.Adult.batch_move(adults), None)
+                self.assertEqual(mkSampler.call_args_list,
+                                 [mk.call(self.Adult, adults[0], 4),
+                                  mk.call(self.Adult, adults[1], 5)])
+                self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                                 [mk.call(2), mk.call(1)])
+                for adult, vertex in zip(adults, [1, 3, 2]):
+                    self.assertEqual(adult.transfer.call_args_list,
+                                     [mk.call(vertex, keyword.adult_level)])
 
     def test_setup(self):
         """test setup the class"""
@@ -2,13 +2,14 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses  as dclass
-import numpy.random as rnd
+import numpy        as np
 
 import source.keyword as keyword
 
 import source.agents.larva as agent_larva
 
 import source.movement.larva as movement
+import source.movement.rings as rings
 
 
 class LarvaTest(agent_larva.Larva):
@@ -45,38 +46,74 @@ class TestLarva(ut.TestCase):
         self.Larva.movement = None
         self.assertFalse(self.Larva._use_movement)
 
-    def test__distance(self):
-        """test determine if larva distances"""
-
-        larva = mk.create_autospec(LarvaTest, spec_set=True)
-
-        self.assertEqual(self.Larva._distance(larva),
-                         self.movement.return_value)
-        self.assertEqual(self.movement.call_args_list,
-                         [mk.call(larva.mass, larva.genotype)])
+    def test__sampler(self):
+        """test get the ring sampler for a vertex"""
+
+        larva = mk.MagicMock()
+        graph = larva.simulation.space.__getitem__.return_value
+        self.Larva.movement = mk.MagicMock()
+
+        self.assertEqual(self.Larva._samplers, {})
+        with mk.patch.object(rings.RingSampler, 'setup',
+                             autospec=True) as mkSetup:
+            # Test compute new sampler
+            self.assertEqual(self.Larva._sampler(larva, 4),
+                             mkSetup.return_value)
+            self.assertEqual(self.Larva._samplers, {4: mkSetup.return_value})
+            self.assertEqual(mkSetup.call_args_list,
+                             [mk.call(graph.neighborhood.
+                                        __getitem__.return_value,
+                                      self.Larva.movement.cdf)])
+            self.assertEqual(graph.neighborhood.__getitem__.call_args_list,
+                             [mk.call(4)])
+            self.assertEqual(larva.simulation.space.__getitem__.
+                                call_args_list,
+                             [mk.call(keyword.larva_level)])
+
+            # Test use cached sampler
+            self.assertEqual(self.Larva._sampler(larva, 4),
+                             mkSetup.return_value)
+            self.assertEqual(len(mkSetup.call_args_list), 1)
 
     def test__vertex(self):
         """test get the vertex to move to"""
 
-        larva = mk.create_autospec(LarvaTest, spec_set=True)
-
-        with mk.patch.object(movement.Larva, '_distance',
-                             autospec=True) as mkDistance:
-            with mk.patch.object(movement, 'list') as mkList:
-                with mk.patch.object(rnd, 'choice') as mkRND:
-                    kwargs = {keyword.upper: mkDistance.return_value,
-                              keyword.lower: mkDistance.return_value}
-
-                    self.assertEqual(self.Larva._vertex(larva),
-                                     mkRND.return_value)
-                    self.assertEqual(mkRND.call_args_list,
-                                     [mk.call(mkList.return_value)])
-                    self.assertEqual(mkList.call_args_list,
-                                     [mk.call(larva.vertices.return_value)])
-                    self.assertEqual(larva.vertices.call_args_list,
-                                     [mk.call(**kwargs)])
-                    self.assertEqual(mkDistance.call_args_list,
-                                     [mk.call(self.Larva, larva)])
+        larva = mk.MagicMock()
+        larva.location.__getitem__.return_value = 7
+
+        with mk.patch.object(movement.Larva, '_sampler',
+                             autospec=True) as mkSampler:
+            mkSampler.return_value.draw.return_value = np.array([3])
+
+            self.assertEqual(self.Larva._vertex(larva), 3)
+            self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                             [mk.call(1)])
+            self.assertEqual(mkSampler.call_args_list,
+                             [mk.call(self.Larva, larva, 7)])
+            self.assertEqual(larva.location.__getitem__.call_args_list,
+                             [mk.call(keyword.larva_level)])
+
+    def test__composite_vertex(self):
+        """test get the vertex after a number of moves"""
+
+        larva = mk.MagicMock()
+        larva.location.__getitem__.return_value = 7
+
+        with mk.patch.object(movement.Larva, '_sampler',
+                             autospec=True) as mkSampler:
+            mkSampler.return_value.draw.side_effect = [np.array([3]),
+                                                       np.array([5]),
+                                                       np.array([2])]
+
+            self.assertEqual(self.Larva._composite_vertex(larva, 3), 2)
+            self.assertEqual(mkSampler.call_args_list,
+                             [mk.call(self.Larva, larva, 7),
+                              mk.call(self.Larva, larva, 3),
+                              mk.call(self.Larva, larva, 5)])
+            self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                             [mk.call(1) for _ in range(3)])
+            self.assertEqual(larva.location.__getitem__.call_args_list,
+                             [mk.call(keyword.larva_level)])
 
     def test_move(self):
         """test move the larva"""
@@ -87,20 +124,67 @@ class TestLarva(ut.TestCase):
                              autospec=True) as mkUse:
             with mk.patch.object(movement.Larva, '_vertex',
                                  autospec=True) as mkVertex:
+                with mk.patch.object(movement.Larva, '_composite_vertex',
+                                     autospec=True) as mkComposite:
+                    mkUse.__get__ = mk.MagicMock(side_effect=[False, True,
+                                                              True])
+
+                    # Test if no movement
+                    self.Larva.move(larva)
+                    self.assertEqual(larva.transfer.call_args_list, [])
+                    self.assertEqual(mkVertex.call_args_list, [])
+
+                    # Test if movement
+                    self.Larva.move(larva)
+                    self.assertEqual(larva.transfer.call_args_list,
+                                     [mk.call(mkVertex.return_value,
+                                              keyword.larva_level)])
+                    self.assertEqual(mkVertex.call_args_list,
+                                     [mk.call(self.Larva, larva)])
+                    self.assertEqual(mkComposite.call_args_list, [])
+
+                    larva.transfer.reset_mock()
+                    mkVertex.reset_mock()
+                    # Test if a number of movements
+                    self.Larva.move(larva, 3)
+                    self.assertEqual(larva.transfer.call_args_list,
+                                     [mk.call(mkComposite.return_value,
+                                              keyword.larva_level)])
+                    self.assertEqual(mkComposite.call_args_list,
+                                     [mk.call(self.Larva, larva, 3)])
+                    self.assertEqual(mkVertex.call_args_list, [])
+
+    def test_batch_move(self):
+        """test move a population of larvae"""
+
+        larvae = [mk.MagicMock() for _ in range(3)]
+        for larva, vertex in zip(larvae, [4, 5, 4]):
+            larva.location.__getitem__.return_value = vertex
+
+        with mk.patch.object(movement.Larva, '_use_movement',
+                             autospec=True) as mkUse:
+            with mk.patch.object(movement.Larva, '_sampler',
+                                 autospec=True) as mkSampler:
                 mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+                draws = [np.array([1, 2]), np.array([3])]
+                mkSampler.return_value.draw.side_effect = draws
 
                 # Test if no movement
-                self.Larva.move(larva)
-                self.assertEqual(larva.transfer.call_args_list, [])
-                self.assertEqual(mkVertex.call_args_list, [])
+                self.assertEqual(self.Larva.batch_move(larvae), None)
+                self.assertEqual(mkSampler.call_args_list, [])
+                for larva in larvae:
+                    self.assertEqual(larva.transfer.call_args_list, [])
 
                 # Test if movement
-                self.Larva.move(larva)
-                self.assertEqual(larva.transfer.call_args_list,
-                                 [mk.call(mkVertex.return_value,
-                                          keyword.larva_level)])
-                self.assertEqual(mkVertex.call_args_list,
-                                 [mk.call(self.Larva, larva)])
+                self.assertEqual(self.Larva.batch_move(larvae), None)
+                self.assertEqual(mkSampler.call_args_list,
+                                 [mk.call(self.Larva, larvae[0], 4),
+                                  mk.call(self.Larva, larvae[1], 5)])
+                self.assertEqual(mkSampler.return_value.draw.call_args_list,
+                                 [mk.call(2), mk.call(1)])
+                for larva, vertex in zip(larvae, [1, 3, 2]):
+                    self.assertEqual(larva.transfer.call_args_list,
+                                     [mk.call(vertex, keyword.larva_level)])
 
     def test_setup(self):
         """test setup the class"""
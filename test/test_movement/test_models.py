@@ -2,6 +2,7 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 import scipy.stats as stats
 
 import source.keyword as keyword
@@ -49,6 +50,28 @@ class TestLevy(ut.TestCase):
                 self.assertEqual(mkRVS.call_args_list,
                                  [mk.call(self.shape, self.scale)])
 
+    def test_cdf(self):
+        """test get the cumulative distribution"""
+
+        distance = mk.MagicMock(spec=np.ndarray)
+
+        with mk.patch.object(stats.pareto, 'cdf', autospec=True) as mkCDF:
+            self.assertEqual(self.Levy.cdf(distance),
+                             mkCDF.return_value)
+            self.assertEqual(mkCDF.call_args_list,
+                             [mk.call(distance, self.shape, self.scale)])
+
+        # Test consistent with the draws
+        self.Levy = model.Levy(0.5, 1.5)
+        distance  = np.array([1.5, 2.0, 3.0, 4.0, 10.0])
+        cdf       = self.Levy.cdf(distance)
+        self.assertEqual(cdf[0], 0.0)
+        self.assertTrue((np.diff(cdf) > 0).all())
+        draws = np.array([self.Levy(0.0, 'a') for _ in range(2000)])
+        self.assertTrue((draws >= 1.5).all())
+        self.assertAlmostEqual(float(np.mean(draws <= 4.0)), cdf[3],
+                               delta=0.05)
+
 
 class TestLarva(ut.TestCase):
     """test the Larva movement mathematical model"""
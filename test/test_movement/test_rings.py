@@ -0,0 +1,147 @@
+import unittest      as ut
+import unittest.mock as mk
+
+import dataclasses  as dclass
+import numpy        as np
+import numpy.random as rnd
+
+import source.space.graph as graph
+
+import source.movement.rings as rings
+
+
+class TestAliasTable(ut.TestCase):
+    """test the AliasTable class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.accept = np.array([0.5, 1.0, 0.25])
+        self.alias  = np.array([1, 1, 0])
+
+        self.AliasTable = rings.AliasTable(self.accept, self.alias)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.AliasTable, rings.AliasTable)
+
+        self.assertIs(self.AliasTable.accept, self.accept)
+        self.assertIs(self.AliasTable.alias,  self.alias)
+
+        self.assertTrue(dclass.is_dataclass(self.AliasTable))
+
+    def test___len__(self):
+        """test get the number of outcomes"""
+
+        self.assertEqual(len(self.AliasTable), 3)
+
+    def test_draw(self):
+        """test draw samples"""
+
+        with mk.patch.object(rnd, 'randint', autospec=True) as mkInt:
+            with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+                mkInt.return_value = np.array([0, 0, 1, 2, 2])
+                mkRND.return_value = np.array([0.4, 0.6, 0.9, 0.2, 0.3])
+
+                np.testing.assert_array_equal(self.AliasTable.draw(5),
+                                              [0, 1, 1, 2, 0])
+                self.assertEqual(mkInt.call_args_list, [mk.call(3, size=5)])
+                self.assertEqual(mkRND.call_args_list, [mk.call(5)])
+
+    def test_setup(self):
+        """test setup the class"""
+
+        weights = np.array([0.1, 0.6, 0.3])
+
+        self.AliasTable = rings.AliasTable.setup(weights)
+        self.assertIsInstance(self.AliasTable, rings.AliasTable)
+        self.assertEqual(len(self.AliasTable), 3)
+
+        # Probability of each outcome is rebuilt from the table
+        probabilities = self.AliasTable.accept.copy()
+        for column, alias in enumerate(self.AliasTable.alias):
+            probabilities[alias] += 1 - self.AliasTable.accept[column]
+        np.testing.assert_allclose(probabilities/3, weights)
+
+        # Test unnormalized and zero weights
+        self.AliasTable = rings.AliasTable.setup(np.array([0.0, 2.0, 2.0]))
+        self.assertEqual(self.AliasTable.accept[0], 0.0)
+        samples = self.AliasTable.draw(1000)
+        self.assertEqual(set(samples), {1, 2})
+
+
+class TestRingSampler(ut.TestCase):
+    """test the RingSampler class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.table   = rings.AliasTable.setup(np.array([0.2, 0.5, 0.3]))
+        self.members = np.array([4, 1, 2, 3, 5, 6])
+        self.starts  = np.array([0, 1, 3])
+        self.sizes   = np.array([1, 2, 3])
+
+        self.RingSampler = rings.RingSampler(self.table,
+                                             self.members,
+                                             self.starts,
+                                             self.sizes)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.RingSampler, rings.RingSampler)
+
+        self.assertEqual(self.RingSampler.table, self.table)
+        self.assertIs(self.RingSampler.members, self.members)
+        self.assertIs(self.RingSampler.starts,  self.starts)
+        self.assertIs(self.RingSampler.sizes,   self.sizes)
+
+        self.assertTrue(dclass.is_dataclass(self.RingSampler))
+
+    def test_draw(self):
+        """test draw the vertices moved to"""
+
+        with mk.patch.object(rings.AliasTable, 'draw',
+                             autospec=True) as mkDraw:
+            with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+                mkDraw.return_value = np.array([0, 1, 1, 2, 2])
+                mkRND.return_value  = np.array([0.9, 0.4, 0.6, 0.1, 0.99])
+
+                np.testing.assert_array_equal(self.RingSampler.draw(5),
+                                              [4, 1, 2, 3, 6])
+                self.assertEqual(mkDraw.call_args_list,
+                                 [mk.call(self.table, 5)])
+                self.assertEqual(mkRND.call_args_list, [mk.call(5)])
+
+        # Test practical
+        vertices = self.RingSampler.draw(10000)
+        self.assertEqual(set(vertices), {1, 2, 3, 4, 5, 6})
+        self.assertAlmostEqual(np.mean(vertices == 4), 0.2, delta=0.03)
+
+    def test_setup(self):
+        """test setup the class"""
+
+        neighborhood = mk.create_autospec(graph.VertexNeighborhood,
+                                          spec_set=True)
+        cdf          = mk.MagicMock(spec=callable)
+        weights      = np.array([0.2, 0.5, 0.3])
+
+        neighborhood.rings.return_value = ([[4], [1, 2], [3, 5, 6]], weights)
+
+        with mk.patch.object(rings.AliasTable, 'setup',
+                             autospec=True) as mkSetup:
+            self.RingSampler = rings.RingSampler.setup(neighborhood, cdf)
+            self.assertIsInstance(self.RingSampler, rings.RingSampler)
+
+            self.assertEqual(self.RingSampler.table, mkSetup.return_value)
+            np.testing.assert_array_equal(self.RingSampler.members,
+                                          [4, 1, 2, 3, 5, 6])
+            np.testing.assert_array_equal(self.RingSampler.starts,
+                                          [0, 1, 3])
+            np.testing.assert_array_equal(self.RingSampler.sizes,
+                                          [1, 2, 3])
+
+            self.assertEqual(mkSetup.call_args_list, [mk.call(weights)])
+            self.assertEqual(neighborhood.rings.call_args_list,
+                             [mk.call(cdf)])
@@ -2,6 +2,7 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses  as dclass
+import numpy        as np
 import numpy.random as rnd
 
 import source.keyword as keyword
@@ -20,6 +21,74 @@ class AdultTest(agent_adult.Adult):
     num_eggs = mk.MagicMock(spec=int)
 
 
+class TestMates(ut.TestCase):
+    """test Mates class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.bins   = [mk.MagicMock(spec=list) for _ in range(3)]
+        self.counts = mk.MagicMock(spec=np.ndarray)
+        self.total  = mk.MagicMock(spec=int)
+
+        self.Mates = mating.Mates(self.bins,
+                                  self.counts,
+                                  self.total)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertEqual(self.Mates.bins,   self.bins)
+        self.assertEqual(self.Mates.counts, self.counts)
+        self.assertEqual(self.Mates.total,  self.total)
+
+        self.assertTrue(dclass.is_dataclass(self.Mates))
+
+    def test___len__(self):
+        """test number of possible mates"""
+
+        self.Mates.total = 5
+        self.assertEqual(len(self.Mates), 5)
+
+    def test_draw(self):
+        """test draw a mate"""
+
+        males = [[mk.MagicMock(spec=AdultTest) for _ in range(size)]
+                 for size in (2, 0, 3)]
+        self.Mates.bins = [mk.MagicMock() for _ in males]
+        for agent_bin, members in zip(self.Mates.bins, males):
+            agent_bin.agents = members
+        self.Mates.counts = np.array([2, 0, 3])
+        self.Mates.total  = 5
+
+        expected = [males[0][0], males[0][1],
+                    males[2][0], males[2][1], males[2][2]]
+        with mk.patch.object(rnd, 'randint', autospec=True) as mkRandint:
+            for pick in range(5):
+                mkRandint.return_value = pick
+
+                self.assertEqual(self.Mates.draw(), expected[pick])
+                self.assertEqual(mkRandint.call_args_list[-1], mk.call(5))
+
+    def test_setup(self):
+        """test setup the class"""
+
+        bins = [{index: mk.MagicMock() for index in range(size)}
+                for size in (2, 0, 3)]
+
+        self.Mates = mating.Mates.setup(bins)
+        self.assertIsInstance(self.Mates, mating.Mates)
+
+        self.assertEqual(self.Mates.bins,         bins)
+        self.assertEqual(list(self.Mates.counts), [2, 0, 3])
+        self.assertEqual(self.Mates.total,        5)
+
+        # No bins
+        self.Mates = mating.Mates.setup([])
+        self.assertEqual(list(self.Mates.counts), [])
+        self.assertEqual(self.Mates.total,        0)
+
+
 class TestMate(ut.TestCase):
     """test Mate behavior class"""
 
@@ -42,6 +111,14 @@ class TestMate(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Mate))
 
+    def test_interacts(self):
+        """test if mating couples adults"""
+
+        self.assertTrue(self.Mate.interacts)
+
+        self.Mate.mating = None
+        self.assertFalse(self.Mate.interacts)
+
     def test__use_mating(self):
         """test if we use the mating system"""
 
@@ -101,14 +178,19 @@ class TestMate(ut.TestCase):
 
         with mk.patch.object(mating.Mate, '_bounds',
                              autospec=True) as mkBounds:
-            mkBounds.return_value = bounds
-
-            self.assertEqual(self.Mate._mates(adult),
-                             adult.mates.return_value)
-            self.assertEqual(adult.mates.call_args_list,
-                             [mk.call(**bounds)])
-            self.assertEqual(mkBounds.call_args_list,
-                             [mk.call(self.Mate, adult)])
+            with mk.patch.object(mating.Mates, 'setup',
+                                 autospec=True) as mkSetup:
+                mkBounds.return_value = bounds
+
+                self.assertEqual(self.Mate._mates(adult),
+                                 mkSetup.return_value)
+                self.assertEqual(mkSetup.call_args_list,
+                                 [mk.call(adult.mate_bins.return_value)])
+                self.assertEqual(adult.mate_bins.call_args_list,
+                                 [mk.call(**bounds)])
+                self.assertEqual(adult.mates.call_args_list, [])
+                self.assertEqual(mkBounds.call_args_list,
+                                 [mk.call(self.Mate, adult)])
 
     def test__encounter(self):
         """test determine if we encounter a mate"""
@@ -135,32 +217,30 @@ class TestMate(ut.TestCase):
                                  autospec=True) as mkEncounter:
                 with mk.patch.object(mating.Mate, '_mate_with',
                                      autospec=True) as mkMate:
-                    with mk.patch.object(rnd, 'choice') as mkRND:
-                        mkEncounter.side_effect = [False, True]
-
-                        # No encounter
-                        self.Mate._perform(adult)
-                        self.assertEqual(mkMate.call_args_list, [])
-                        self.assertEqual(mkRND.call_args_list, [])
-                        self.assertEqual(mkEncounter.call_args_list,
-                                         [mk.call(self.Mate,
-                                                  adult, mkMates.return_value)])
-                        self.assertEqual(mkMates.call_args_list,
-                                         [mk.call(self.Mate, adult)])
-
-                        mkEncounter.reset_mock()
-                        mkMates.reset_mock()
-                        # Has encounter
-                        self.Mate._perform(adult)
-                        self.assertEqual(mkMate.call_args_list,
-                                         [mk.call(adult, mkRND.return_value)])
-                        self.assertEqual(mkRND.call_args_list,
-                                         [mk.call(mkMates.return_value)])
-                        self.assertEqual(mkEncounter.call_args_list,
-                                         [mk.call(self.Mate,
-                                                  adult, mkMates.return_value)])
-                        self.assertEqual(mkMates.call_args_list,
-                                         [mk.call(self.Mate, adult)])
+                    mkEncounter.side_effect = [False, True]
+                    mates = mkMates.return_value
+
+                    # No encounter
+                    self.Mate._perform(adult)
+                    self.assertEqual(mkMate.call_args_list, [])
+                    self.assertEqual(mates.draw.call_args_list, [])
+                    self.assertEqual(mkEncounter.call_args_list,
+                                     [mk.call(self.Mate, adult, mates)])
+                    self.assertEqual(mkMates.call_args_list,
+                                     [mk.call(self.Mate, adult)])
+
+                    mkEncounter.reset_mock()
+                    mkMates.reset_mock()
+                    # Has encounter
+                    self.Mate._perform(adult)
+                    self.assertEqual(mkMate.call_args_list,
+                                     [mk.call(adult,
+                                              mates.draw.return_value)])
+                    self.assertEqual(mates.draw.call_args_list, [mk.call()])
+                    self.assertEqual(mkEncounter.call_args_list,
+                                     [mk.call(self.Mate, adult, mates)])
+                    self.assertEqual(mkMates.call_args_list,
+                                     [mk.call(self.Mate, adult)])
 
     def test_mate(self):
         """test run mate behavior"""
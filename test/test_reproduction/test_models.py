@@ -58,6 +58,19 @@ class TestInitSex(ut.TestCase):
             self.assertEqual(mkRND.call_args_list,
                              [mk.call()])
 
+    def test_batch(self):
+        """test call the model for several adults"""
+
+        genotype = mk.MagicMock(spec=str)
+
+        with mk.patch.object(rnd, 'random', autospec=True) as mkRND:
+            mkRND.return_value = np.array([0.1, 0.9, 0.5])
+            self.InitSex.prob = 0.5
+
+            np.testing.assert_array_equal(self.InitSex.batch(genotype, 3),
+                                          [True, False, True])
+            self.assertEqual(mkRND.call_args_list, [mk.call(3)])
+
 
 class TestMating(ut.TestCase):
     """test Mating mathematical model class"""
@@ -305,3 +318,25 @@ class TestDensity(ut.TestCase):
                                  [mk.call()])
                 self.assertEqual(mkProb.call_args_list,
                                  [mk.call(self.Density, number)])
+
+    def test_chain(self):
+        """test call the model for a sequence of lays"""
+
+        mass     = mk.MagicMock(spec=float)
+        genotype = mk.MagicMock(spec=str)
+
+        probs = np.array([0.9, 0.5, 0.4])
+
+        with mk.patch.object(model.Density, '_prob', autospec=True) as mkProb:
+            with mk.patch.object(rnd, 'random') as mkRND:
+                mkProb.return_value = probs
+                mkRND.side_effect = [0.95, 0.9, 0.3, 0.1, 0.0]
+
+                for laid in range(4):
+                    self.assertEqual(self.Density.chain(4, 3, mass, genotype),
+                                     laid)
+                self.assertEqual(self.Density.chain(4, 3, mass, genotype), 3)
+                self.assertEqual(mkRND.call_args_list, [mk.call()]*5)
+                for call in mkProb.call_args_list:
+                    self.assertEqual(call[0][0], self.Density)
+                    np.testing.assert_array_equal(call[0][1], [4, 5, 6])
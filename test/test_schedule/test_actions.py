@@ -4,6 +4,7 @@ import unittest.mock as mk
 import collections as collect
 import dataclasses as dclass
 
+import source.keyword      as keyword
 import source.agents.agent as main_agent
 
 import source.schedule.actions as actions
@@ -41,6 +42,35 @@ class TestAction(ut.TestCase):
             self.assertEqual(mkGet.call_args_list,
                              [mk.call(agent, self.action)])
 
+    def test_compile(self):
+        """test compile the action for type of agent"""
+
+        agent_type = mk.MagicMock(spec=type)
+
+        with mk.patch.object(actions, 'getattr') as mkGet:
+            self.assertEqual(self.Action.compile(agent_type),
+                             mkGet.return_value)
+            self.assertEqual(mkGet.call_args_list,
+                             [mk.call(agent_type, self.action)])
+
+    def test_compile_batch(self):
+        """test compile the population action for type of agent"""
+
+        agent_type = mk.MagicMock(spec=type)
+
+        with mk.patch.object(actions, 'getattr') as mkGet:
+            self.assertEqual(self.Action.compile_batch(agent_type),
+                             mkGet.return_value)
+            self.assertEqual(mkGet.call_args_list,
+                             [mk.call(agent_type,
+                                      '{}{}'.format(keyword.batch,
+                                                    self.action),
+                                      None)])
+
+        # Test real agent types
+        self.Action = actions.Action(keyword.advance_age)
+        self.assertIsNone(self.Action.compile_batch(main_agent.Agent))
+
 
 class TestActions(ut.TestCase):
     """test the Actions class"""
@@ -66,6 +96,188 @@ class TestActions(ut.TestCase):
         self.assertEqual(self.Actions,      self.actions)
         self.assertEqual(self.Actions.data, self.actions)
 
+        self.assertEqual(self.Actions.plans,       {})
+        self.assertEqual(self.Actions.batch_plans, {})
+
+    def test_plan(self):
+        """test get the compiled behaviors"""
+
+        agent_type = mk.MagicMock(spec=type)
+
+        # Test compile new plan
+        plan = self.Actions.plan(agent_type)
+        self.assertEqual(plan,
+                         tuple(action.compile.return_value
+                               for action in self.actions))
+        self.assertEqual(self.Actions.plans, {agent_type: plan})
+        for action in self.actions:
+            self.assertEqual(action.compile.call_args_list,
+                             [mk.call(agent_type)])
+
+        # Test use cached plan
+        self.assertEqual(self.Actions.plan(agent_type), plan)
+        for action in self.actions:
+            self.assertEqual(action.compile.call_args_list,
+                             [mk.call(agent_type)])
+
+    def test_batch_plan(self):
+        """test get the compiled population behaviors"""
+
+        agent_type = mk.MagicMock(spec=type)
+
+        # Test compile new plan
+        plan = self.Actions.batch_plan(agent_type)
+        self.assertEqual(plan,
+                         tuple(action.compile_batch.return_value
+                               for action in self.actions))
+        self.assertEqual(self.Actions.batch_plans, {agent_type: plan})
+        for action in self.actions:
+            self.assertEqual(action.compile_batch.call_args_list,
+                             [mk.call(agent_type)])
+
+        # Test use cached plan
+        self.assertEqual(self.Actions.batch_plan(agent_type), plan)
+        for action in self.actions:
+            self.assertEqual(action.compile_batch.call_args_list,
+                             [mk.call(agent_type)])
+
+        # Test an action is not supported
+        self.Actions.batch_plans = {}
+        self.actions[1].compile_batch.return_value = None
+        self.assertIsNone(self.Actions.batch_plan(agent_type))
+        self.assertEqual(self.Actions.batch_plans, {agent_type: None})
+
+    def test_run(self):
+        """test run the actions on agents"""
+
+        agents = [mk.create_autospec(main_agent.Agent, spec_set=True)
+                  for _ in range(3)]
+        sink   = []
+
+        # Test no agents
+        with mk.patch.object(actions.Actions, 'plan',
+                             autospec=True) as mkPlan:
+            with mk.patch.object(actions.Actions, 'batch_plan',
+                                 autospec=True) as mkBatch:
+                self.Actions.run([], sink, True)
+                self.assertEqual(sink, [])
+                self.assertEqual(mkPlan.call_args_list, [])
+                self.assertEqual(mkBatch.call_args_list, [])
+
+        behaviors = [mk.MagicMock() for _ in range(2)]
+        results   = {}
+        for behavior in behaviors:
+            for agent in agents:
+                results[(behavior, agent)] = \
+                    [mk.create_autospec(main_agent.Agent, spec_set=True)]
+            behavior.side_effect = \
+                lambda agent, b=behavior: results[(b, agent)]
+
+        # Test regular run
+        with mk.patch.object(actions.Actions, 'plan',
+                             autospec=True) as mkPlan:
+            mkPlan.return_value = tuple(behaviors)
+            with mk.patch.object(actions.Actions, 'batch_plan',
+                                 autospec=True) as mkBatch:
+                self.Actions.run(agents, sink)
+                self.assertEqual(sink,
+                                 [results[(behavior, agent)][0]
+                                  for agent in agents
+                                  for behavior in behaviors])
+                self.assertEqual(mkPlan.call_args_list,
+                                 [mk.call(self.Actions, type(agents[0]))])
+                self.assertEqual(mkBatch.call_args_list, [])
+
+        # Test batch run unsupported
+        sink = []
+        with mk.patch.object(actions.Actions, 'plan',
+                             autospec=True) as mkPlan:
+            mkPlan.return_value = tuple(behaviors)
+            with mk.patch.object(actions.Actions, 'batch_plan',
+                                 autospec=True) as mkBatch:
+                mkBatch.return_value = None
+                self.Actions.run(agents, sink, True)
+                self.assertEqual(len(sink), 6)
+                self.assertEqual(mkPlan.call_args_list,
+                                 [mk.call(self.Actions, type(agents[0]))])
+                self.assertEqual(mkBatch.call_args_list,
+                                 [mk.call(self.Actions, type(agents[0]))])
+
+        # Test fused run
+        sink = []
+        for behavior in behaviors:
+            behavior.reset_mock()
+            behavior.side_effect = \
+                lambda agent, number, b=behavior: results[(b, agent)]
+        with mk.patch.object(actions.Actions, 'plan',
+                             autospec=True) as mkPlan:
+            mkPlan.return_value = tuple(behaviors)
+            with mk.patch.object(actions.Actions, 'batch_plan',
+                                 autospec=True) as mkBatch:
+                self.Actions.run(agents, sink, True, 3)
+                self.assertEqual(sink,
+                                 [results[(behavior, agent)][0]
+                                  for agent in agents
+                                  for behavior in behaviors])
+                for behavior in behaviors:
+                    self.assertEqual(behavior.call_args_list,
+                                     [mk.call(agent, 3) for agent in agents])
+                self.assertEqual(mkPlan.call_args_list,
+                                 [mk.call(self.Actions, type(agents[0]))])
+                self.assertEqual(mkBatch.call_args_list, [])
+
+        # Test batch run supported
+        sink    = []
+        batches = [mk.MagicMock() for _ in range(2)]
+        with mk.patch.object(actions.Actions, 'plan',
+                             autospec=True) as mkPlan:
+            with mk.patch.object(actions.Actions, 'batch_plan',
+                                 autospec=True) as mkBatch:
+                mkBatch.return_value = tuple(batches)
+                self.Actions.run(agents, sink, True)
+                self.assertEqual(sink, [])
+                for batch in batches:
+                    self.assertEqual(batch.call_args_list,
+                                     [mk.call(agents, sink)])
+                self.assertEqual(mkPlan.call_args_list, [])
+                self.assertEqual(mkBatch.call_args_list,
+                                 [mk.call(self.Actions, type(agents[0]))])
+
+    def test_fusible(self):
+        """test determine if the actions can be fused"""
+
+        agent       = mk.create_autospec(main_agent.Agent, spec_set=True)
+        action_keys = [mk.MagicMock(spec=str) for _ in range(3)]
+
+        self.Actions = actions.Actions.setup(self.agent_key, action_keys)
+
+        # Test all fusible
+        agent.fusible.return_value = True
+        self.assertTrue(self.Actions.fusible(agent))
+        self.assertEqual(agent.fusible.call_args_list,
+                         [mk.call(action_key) for action_key in action_keys])
+
+        # Test one not fusible
+        agent.fusible.reset_mock()
+        agent.fusible.side_effect = [True, False, True]
+        self.assertFalse(self.Actions.fusible(agent))
+        self.assertEqual(agent.fusible.call_args_list,
+                         [mk.call(action_key)
+                          for action_key in action_keys[:2]])
+
+    def test_reads(self):
+        """test get the agent types whose locations the actions read"""
+
+        agent       = mk.create_autospec(main_agent.Agent, spec_set=True)
+        action_keys = [mk.MagicMock(spec=str) for _ in range(3)]
+
+        self.Actions = actions.Actions.setup(self.agent_key, action_keys)
+
+        agent.reads.side_effect = [['egg_mass'], [], ['larva', 'egg_mass']]
+        self.assertEqual(self.Actions.reads(agent), {'egg_mass', 'larva'})
+        self.assertEqual(agent.reads.call_args_list,
+                         [mk.call(action_key) for action_key in action_keys])
+
     def test_perform(self):
         """test perform actions on agent"""
 
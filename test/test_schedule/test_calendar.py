@@ -0,0 +1,111 @@
+import unittest      as ut
+import unittest.mock as mk
+
+import collections as collect
+import numpy       as np
+
+import source.keyword as keyword
+
+import source.agents.egg as main_egg
+
+import source.schedule.calendar as calendar
+
+
+class TestCalendar(ut.TestCase):
+    """test the Calendar class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.events = {mk.MagicMock(spec=int): mk.MagicMock(spec=list)
+                       for _ in range(3)}
+        self.day    = mk.MagicMock(spec=int)
+
+        self.Calendar = calendar.Calendar(self.events, self.day)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertIsInstance(self.Calendar, collect.UserDict)
+        self.assertIsInstance(self.Calendar, calendar.Calendar)
+
+        self.assertEqual(self.Calendar.data, self.events)
+        self.assertEqual(self.Calendar.day,  self.day)
+
+        # Test default day
+        self.Calendar = calendar.Calendar(self.events)
+        self.assertEqual(self.Calendar.data, self.events)
+        self.assertEqual(self.Calendar.day,  0)
+
+    def test_schedule(self):
+        """test schedule the next event for an agent"""
+
+        self.Calendar = calendar.Calendar({}, 3)
+
+        agents = [mk.create_autospec(main_egg.Egg, spec_set=True)
+                  for _ in range(4)]
+        agents[0].event.return_value = (2,      keyword.develop)
+        agents[1].event.return_value = (0,      keyword.survive)
+        agents[2].event.return_value = (2.0,    keyword.survive)
+        agents[3].event.return_value = (np.inf, keyword.survive)
+
+        for agent in agents:
+            self.assertEqual(self.Calendar.schedule(agent), None)
+            self.assertEqual(agent.event.call_args_list, [mk.call()])
+
+        self.assertEqual(self.Calendar.data,
+                         {5: [(agents[0], 2, keyword.develop),
+                              (agents[2], 2, keyword.survive)],
+                          3: [(agents[1], 0, keyword.survive)]})
+        self.assertIsInstance(self.Calendar[5][1][1], int)
+        self.assertEqual(self.Calendar.day, 3)
+
+    def test_perform(self):
+        """test perform the events for the current day"""
+
+        agents = [mk.create_autospec(main_egg.Egg, spec_set=True)
+                  for _ in range(3)]
+        later  =  mk.create_autospec(main_egg.Egg, spec_set=True)
+        events = [(agent, mk.MagicMock(spec=int), mk.MagicMock(spec=str))
+                  for agent in agents]
+
+        self.Calendar = calendar.Calendar({3: events,
+                                           4: [(later, 1, keyword.develop)]},
+                                          3)
+
+        self.assertEqual(self.Calendar.perform(), None)
+        for index, agent in enumerate(agents):
+            self.assertEqual(agent.fire.call_args_list,
+                             [mk.call(*events[index][1:])])
+        self.assertEqual(later.fire.call_args_list, [])
+        self.assertEqual(self.Calendar.data,
+                         {4: [(later, 1, keyword.develop)]})
+        self.assertEqual(self.Calendar.day, 4)
+
+        # Test day without events
+        self.Calendar = calendar.Calendar({}, 3)
+        self.assertEqual(self.Calendar.perform(), None)
+        self.assertEqual(self.Calendar.data, {})
+        self.assertEqual(self.Calendar.day,  4)
+
+    def test_merge(self):
+        """test merge the events of another calendar"""
+
+        events = [(mk.MagicMock(), 1, keyword.develop) for _ in range(3)]
+
+        self.Calendar = calendar.Calendar({3: [events[0]]}, 3)
+        self.assertIsNone(self.Calendar.merge({3: [events[1]],
+                                               5: [events[2]]}))
+        self.assertEqual(self.Calendar.data,
+                         {3: [events[0], events[1]],
+                          5: [events[2]]})
+        self.assertEqual(self.Calendar.day, 3)
+
+    def test_empty(self):
+        """test create an empty calendar"""
+
+        self.Calendar = calendar.Calendar.empty()
+        self.assertIsInstance(self.Calendar, calendar.Calendar)
+
+        self.assertEqual(self.Calendar.data, {})
+        self.assertEqual(self.Calendar.day,  0)
@@ -3,9 +3,12 @@ import unittest.mock as mk
 
 import collections as collect
 
+import source.keyword as keyword
+
 import source.agents.agent as main_agent
 
 import source.schedule.actions  as agent_actions
+import source.schedule.calendar as agent_calendar
 import source.schedule.schedule as schedule
 import source.schedule.step     as agent_step
 
@@ -22,6 +25,9 @@ class TestSchedule(ut.TestCase):
         self.steps = [mk.create_autospec(agent_step.Step, spec_set=True)
                       for _ in range(3)]
 
+        self.calendar = mk.create_autospec(agent_calendar.Calendar,
+                                           spec_set=True)
+
         self.Schedule = schedule.Schedule(self.steps)
 
     def test___init__(self):
@@ -32,6 +38,37 @@ class TestSchedule(ut.TestCase):
 
         self.assertEqual(self.Schedule,      self.steps)
         self.assertEqual(self.Schedule.data, self.steps)
+        self.assertEqual(self.Schedule.calendar, None)
+
+        # Test with calendar
+        self.Schedule = schedule.Schedule(self.steps, self.calendar)
+        self.assertIsInstance(self.Schedule, collect.UserList)
+        self.assertIsInstance(self.Schedule, schedule.Schedule)
+
+        self.assertEqual(self.Schedule,      self.steps)
+        self.assertEqual(self.Schedule.data, self.steps)
+        self.assertEqual(self.Schedule.calendar, self.calendar)
+        self.assertEqual(self.Schedule.exchange, None)
+
+        # Test with exchange
+        exchange      = mk.MagicMock()
+        self.Schedule = schedule.Schedule(self.steps, self.calendar, exchange)
+        self.assertEqual(self.Schedule.calendar, self.calendar)
+        self.assertEqual(self.Schedule.exchange, exchange)
+
+    def test_register(self):
+        """test register an agent with the calendar"""
+
+        agent = mk.create_autospec(main_agent.Agent, spec_set=True)
+
+        # Test no calendar
+        self.Schedule.register(agent)
+
+        # Test with calendar
+        self.Schedule.calendar = self.calendar
+        self.Schedule.register(agent)
+        self.assertEqual(self.calendar.schedule.call_args_list,
+                         [mk.call(agent)])
 
     def test__activate(self):
         """test activate the results"""
@@ -53,16 +90,28 @@ class TestSchedule(ut.TestCase):
         results = []
         for step in self.steps:
             result = [mk.MagicMock() for _ in range(3)]
-            step.perform.return_value = result
+            step.perform.side_effect = \
+                lambda space, agents, sink, exchange, r=result: sink.extend(r)
             results.extend(result)
 
         self.assertEqual(self.Schedule._perform(space, agents), results)
 
         for step in self.steps:
-            self.assertEqual(step.perform.call_args_list,
-                             [mk.call(space, agents)])
+            self.assertEqual(len(step.perform.call_args_list), 1)
+            self.assertEqual(step.perform.call_args_list[0][0][:2],
+                             (space, agents))
+            self.assertEqual(step.perform.call_args_list[0][0][3], None)
         self.assertEqual(len(self.steps), 3)
 
+        # Test with exchange
+        exchange = mk.MagicMock()
+        self.Schedule.exchange = exchange
+        for step in self.steps:
+            step.perform.reset_mock()
+        self.assertEqual(self.Schedule._perform(space, agents), results)
+        for step in self.steps:
+            self.assertEqual(step.perform.call_args_list[0][0][3], exchange)
+
     def test_perform(self):
         """test perform the schedule"""
 
@@ -79,6 +128,24 @@ class TestSchedule(ut.TestCase):
                 self.assertEqual(mkPerform.call_args_list,
                                  [mk.call(self.Schedule, space, agents)])
 
+        # Test with calendar
+        self.Schedule.calendar = self.calendar
+        master = mk.MagicMock()
+        with mk.patch.object(schedule.Schedule, '_perform',
+                             autospec=True) as mkPerform:
+            with mk.patch.object(schedule.Schedule, '_activate',
+                                 autospec=True) as mkActivate:
+                master.attach_mock(mkPerform,             'perform')
+                master.attach_mock(self.calendar.perform, 'calendar')
+                master.attach_mock(mkActivate,            'activate')
+
+                self.Schedule.perform(space, agents)
+                self.assertEqual(master.mock_calls,
+                                 [mk.call.perform(self.Schedule,
+                                                  space, agents),
+                                  mk.call.calendar(),
+                                  mk.call.activate(mkPerform.return_value)])
+
     def test_setup(self):
         """test setup an entire schedule"""
 
@@ -130,17 +197,26 @@ class TestSchedule(ut.TestCase):
             loc_actions[agent_key] = action_keys
         tuple_loc = (loc_actions, 10, True, True, False, True, 1)
 
+        batch_actions = {}
+        for _ in range(3):
+            agent_key   = mk.MagicMock(spec=str)
+            action_keys = [mk.MagicMock(spec=str) for _ in range(3)]
+
+            batch_actions[agent_key] = action_keys
+        tuple_batch = (batch_actions, 10, True, True, False, False, 2, True)
+
         step_tuples = [tuple_basic,
                        tuple_repeat,
                        tuple_shuffle_0,
                        tuple_shuffle_1,
                        tuple_reg,
-                       tuple_loc]
+                       tuple_loc,
+                       tuple_batch]
 
         self.Schedule = schedule.Schedule.setup(step_tuples)
         self.assertIsInstance(self.Schedule, schedule.Schedule)
 
-        self.assertEqual(len(self.Schedule), 6)
+        self.assertEqual(len(self.Schedule), 7)
 
         # basic tuple
         self.assertIsInstance(self.Schedule[0], agent_step.Step)
@@ -285,3 +361,43 @@ class TestSchedule(ut.TestCase):
                 self.assertEqual(action.action, action_keys[index_j])
             self.assertEqual(len(self.Schedule[5][index_i]), 3)
         self.assertEqual(len(self.Schedule[5]), 3)
+
+        # batch tuple
+        self.assertIsInstance(self.Schedule[6], agent_step.Step)
+        self.assertEqual(self.Schedule[6].number,          10)
+        self.assertEqual(self.Schedule[6].shuffle_agents,  True)
+        self.assertEqual(self.Schedule[6].shuffle_actions, True)
+        self.assertEqual(self.Schedule[6].parallel_reg,    False)
+        self.assertEqual(self.Schedule[6].parallel_loc,    False)
+        self.assertEqual(self.Schedule[6].level,           2)
+        self.assertEqual(self.Schedule[6].batch,           True)
+        for index_i, thing in enumerate(batch_actions.items()):
+            agent_key, action_keys = thing
+            self.assertIsInstance(self.Schedule[6][index_i],
+                                  agent_actions.Actions)
+            self.assertEqual(self.Schedule[6][index_i].agent_key, agent_key)
+            for index_j, action in enumerate(action_keys):
+                self.assertIsInstance(self.Schedule[6][index_i][index_j],
+                                      agent_actions.Action)
+                self.assertEqual(self.Schedule[6][index_i][index_j].action,
+                                 action)
+            self.assertEqual(len(self.Schedule[6][index_i]), 3)
+        self.assertEqual(len(self.Schedule[6]), 3)
+
+        self.assertEqual(self.Schedule.calendar, None)
+
+        # Test with calendar
+        calendar_actions = {keyword.egg:   [keyword.survive],
+                            keyword.larva: [keyword.grow],
+                            keyword.pupa:  [keyword.develop]}
+        step_tuples = [(calendar_actions,)]
+
+        self.Schedule = schedule.Schedule.setup(step_tuples, True)
+        self.assertIsInstance(self.Schedule, schedule.Schedule)
+        self.assertIsInstance(self.Schedule.calendar, agent_calendar.Calendar)
+        self.assertEqual(self.Schedule.calendar.day, 0)
+        self.assertEqual(self.Schedule.calendar.data, {})
+
+        self.assertEqual(len(self.Schedule), 1)
+        self.assertEqual(len(self.Schedule[0]), 1)
+        self.assertEqual(self.Schedule[0][0].agent_key, keyword.larva)
@@ -77,7 +77,8 @@ class TestStep(ut.TestCase):
         self.shuffle_actions = mk.MagicMock(spec=bool)
         self.parallel_reg    = mk.MagicMock(spec=bool)
         self.parallel_loc    = mk.MagicMock(spec=bool)
-        self.level            = mk.MagicMock(spec=int)
+        self.level           = mk.MagicMock(spec=int)
+        self.batch           = mk.MagicMock(spec=bool)
 
         self.Step = step.Step(self.actions,
                               self.number,
@@ -85,7 +86,8 @@ class TestStep(ut.TestCase):
                               self.shuffle_actions,
                               self.parallel_reg,
                               self.parallel_loc,
-                              self.level)
+                              self.level,
+                              self.batch)
 
     def test___init__(self):
         """test __init__ for class"""
@@ -99,33 +101,51 @@ class TestStep(ut.TestCase):
         self.assertEqual(self.Step.parallel_reg,    self.parallel_reg)
         self.assertEqual(self.Step.parallel_loc,    self.parallel_loc)
         self.assertEqual(self.Step.level,           self.level)
+        self.assertEqual(self.Step.batch,           self.batch)
 
         self.assertEqual(self.Step,      self.actions)
         self.assertEqual(self.Step.data, self.actions)
         
+    def test_exclude(self):
+        """test exclude actions for agent types"""
+
+        agent_keys = [mk.MagicMock(spec=str) for _ in range(3)]
+        for index, action in enumerate(self.actions):
+            action.agent_key = agent_keys[index]
+
+        self.assertEqual(self.Step.exclude(agent_keys[1:]), None)
+        self.assertIsInstance(self.Step, step.Step)
+        self.assertEqual(self.Step.data, self.actions[:1])
+
+        self.assertEqual(self.Step.exclude(agent_keys[1:]), None)
+        self.assertEqual(self.Step.data, self.actions[:1])
+
+        self.assertEqual(self.Step.exclude(agent_keys), None)
+        self.assertEqual(self.Step.data, [])
+
     def test__perform_agent_action_regular(self):
         """test perform an action in regular state"""
 
         action = mk.create_autospec(ActionsTest, spec_set=True)
         agents = [mk.create_autospec(main_agent.Agent, spec_set=True)
                   for _ in range(3)]
+        sink   = mk.MagicMock(spec=list)
 
-        results = []
-        effects = []
-        for _ in agents:
-            result = [mk.MagicMock() for _ in range(3)]
-            effects.append(result)
-            results.extend(result)
-        action.perform.side_effect = effects
+        self.assertEqual(self.Step._perform_agent_action_regular(action,
+                                                                 agents,
+                                                                 sink),
+                         None)
+        self.assertEqual(action.run.call_args_list,
+                         [mk.call(agents, sink, self.batch, 1)])
 
+        action.run.reset_mock()
         self.assertEqual(self.Step._perform_agent_action_regular(action,
-                                                                 agents),
-                         results)
-        for index, call in enumerate(action.perform.call_args_list):
-            self.assertEqual(call,
-                             mk.call(agents[index]))
-        self.assertEqual(len(action.perform.call_args_list), 3)
-        
+                                                                 agents,
+                                                                 sink, 3),
+                         None)
+        self.assertEqual(action.run.call_args_list,
+                         [mk.call(agents, sink, self.batch, 3)])
+
     def test__perform_agent_action_parallel(self):
         """test perform an action in parallel state"""
 
@@ -153,13 +173,91 @@ class TestStep(ut.TestCase):
         self.assertEqual(actions.perform(agent), results)
 
         agents = [AgentParallel('test', index, loc) for index in range(40)]
-        regular_results  = self.Step._perform_agent_action_regular( actions,
-                                                                    agents)
+        regular_results  = []
+        self.Step._perform_agent_action_regular( actions, agents,
+                                                 regular_results)
         self.assertEqual(len(set(regular_results)), 40 * 9)
-        parallel_results = self.Step._perform_agent_action_parallel(actions,
-                                                                    agents)
+        parallel_results = []
+        self.Step._perform_agent_action_parallel(actions, agents,
+                                                 parallel_results)
+        self.assertEqual(len(regular_results), len(parallel_results))
         self.assertEqual(set(regular_results), set(parallel_results))
 
+        action = mk.create_autospec(ActionsTest, spec_set=True)
+        sink   = mk.MagicMock(spec=list)
+        self.Step._perform_agent_action_parallel(action, agents, sink, 3)
+        self.assertEqual(len(action.run.call_args_list), step.num_cpu)
+        for call in action.run.call_args_list:
+            self.assertEqual(call[0][1:], (sink, self.Step.batch, 3))
+
+    def test__reads(self):
+        """test get the agent types whose locations the step reads"""
+
+        larva  = agent_actions.Actions.setup('larva',  ['move'])
+        female = agent_actions.Actions.setup('female', ['reproduce'])
+        self.Step.data = [larva, female]
+
+        agents      = mk.create_autospec(main_agents.Agents, spec_set=True)
+        populations = {'larva':  [mk.create_autospec(main_agent.Agent,
+                                                     spec_set=True)],
+                       'female': [mk.create_autospec(main_agent.Agent,
+                                                     spec_set=True)]}
+        populations['larva'][0].reads.return_value  = []
+        populations['female'][0].reads.return_value = ['egg_mass', 'larva']
+        agents.agents.side_effect = lambda agent_key: populations[agent_key]
+
+        self.assertEqual(self.Step._reads(agents), {'egg_mass', 'larva'})
+        self.assertEqual(populations['larva'][0].reads.call_args_list,
+                         [mk.call('move')])
+        self.assertEqual(populations['female'][0].reads.call_args_list,
+                         [mk.call('reproduce')])
+
+        # Test no agents of a type
+        populations['female'] = []
+        self.assertEqual(self.Step._reads(agents), set())
+
+    def test__fused(self):
+        """test determine if an action is fused"""
+
+        action     = agent_actions.Actions.setup('test', ['test0'])
+        agents     = mk.create_autospec(main_agents.Agents, spec_set=True)
+        population = [mk.create_autospec(main_agent.Agent, spec_set=True)
+                      for _ in range(3)]
+
+        with mk.patch.object(agent_actions.Actions, 'fusible',
+                             autospec=True) as mkFusible:
+            # Test single repeat
+            self.Step.number = 1
+            agents.agents.return_value = population
+            self.assertFalse(self.Step._fused(action, agents, set()))
+            self.assertEqual(mkFusible.call_args_list, [])
+            self.assertEqual(agents.agents.call_args_list, [])
+
+            # Test no agents
+            self.Step.number = 3
+            agents.agents.return_value = []
+            self.assertFalse(self.Step._fused(action, agents, set()))
+            self.assertEqual(mkFusible.call_args_list, [])
+            self.assertEqual(agents.agents.call_args_list, [mk.call('test')])
+
+            # Test check the action
+            agents.agents.return_value = population
+            for fusible in [True, False]:
+                mkFusible.reset_mock()
+                mkFusible.return_value = fusible
+                self.assertEqual(self.Step._fused(action, agents, set()),
+                                 fusible)
+                self.assertEqual(mkFusible.call_args_list,
+                                 [mk.call(action, population[0])])
+
+            # Test another action reads the locations of the type
+            mkFusible.reset_mock()
+            mkFusible.return_value = True
+            self.assertFalse(self.Step._fused(action, agents,
+                                              {'other', 'test'}))
+            self.assertEqual(mkFusible.call_args_list, [])
+            self.assertTrue(self.Step._fused(action, agents, {'other'}))
+
     def test__perform_agent_action(self):
         """test perform action on agent_bin"""
 
@@ -170,8 +268,8 @@ class TestStep(ut.TestCase):
                       for _ in range(3)]
 
         agents_bin.__getitem__.return_value = agent_bin
-        agent_bin.agents                 = mk.MagicMock(spec=list)
-        agent_bin.agents.copy.return_value = agents
+        agent_bin.agents                 = agents
+        sink       = mk.MagicMock(spec=list)
 
         with mk.patch.object(step.Step, '_perform_agent_action_parallel',
                              autospec=True) as mkParallel:
@@ -184,57 +282,52 @@ class TestStep(ut.TestCase):
                     self.Step.parallel_reg   = True
                     self.assertEqual(self.Step.
                                         _perform_agent_action(action,
-                                                              agents_bin),
-                                     mkParallel.return_value)
+                                                              agents_bin,
+                                                              sink),
+                                     None)
                     self.assertEqual(mkParallel.call_args_list,
-                                     [mk.call(self.Step, action, agents)])
+                                     [mk.call(self.Step, action, agents, sink, 1)])
                     self.assertEqual(mkRegular.call_args_list, [])
                     self.assertEqual(agents_bin.__getitem__.call_args_list,
                                      [mk.call(action.agent_key)])
-                    self.assertEqual(agent_bin.agents.copy.call_args_list,
-                                     [mk.call()])
                     self.assertEqual(mkRnd.call_args_list,
                                      [mk.call(agents)])
 
                     mkRnd.reset_mock()
                     mkParallel.reset_mock()
                     agents_bin.reset_mock()
-                    agent_bin.agents.reset_mock()
                     #      Test without shuffle
                     self.Step.shuffle_agents = False
                     self.Step.parallel_reg   = True
                     self.assertEqual(self.Step.
                                         _perform_agent_action(action,
-                                                              agents_bin),
-                                     mkParallel.return_value)
+                                                              agents_bin,
+                                                              sink),
+                                     None)
                     self.assertEqual(mkParallel.call_args_list,
-                                     [mk.call(self.Step, action, agents)])
+                                     [mk.call(self.Step, action, agents, sink, 1)])
                     self.assertEqual(mkRegular.call_args_list, [])
                     self.assertEqual(agents_bin.__getitem__.call_args_list,
                                      [mk.call(action.agent_key)])
-                    self.assertEqual(agent_bin.agents.copy.call_args_list,
-                                     [mk.call()])
                     self.assertEqual(mkRnd.call_args_list, [])
 
                     mkParallel.reset_mock()
                     agent_bin.reset_mock()
                     agents_bin.reset_mock()
-                    agent_bin.agents.reset_mock()
                     # Test run regular
                     #      Test with shuffle
                     self.Step.shuffle_agents = True
                     self.Step.parallel_reg   = False
                     self.assertEqual(self.Step.
                                         _perform_agent_action(action,
-                                                              agents_bin),
-                                     mkRegular.return_value)
+                                                              agents_bin,
+                                                              sink),
+                                     None)
                     self.assertEqual(mkRegular.call_args_list,
-                                     [mk.call(action, agents)])
+                                     [mk.call(action, agents, sink, 1)])
                     self.assertEqual(mkParallel.call_args_list, [])
                     self.assertEqual(agents_bin.__getitem__.call_args_list,
                                      [mk.call(action.agent_key)])
-                    self.assertEqual(agent_bin.agents.copy.call_args_list,
-                                     [mk.call()])
                     self.assertEqual(mkRnd.call_args_list,
                                      [mk.call(agents)])
 
@@ -242,54 +335,44 @@ class TestStep(ut.TestCase):
                     mkRegular.reset_mock()
                     agent_bin.reset_mock()
                     agents_bin.reset_mock()
-                    agent_bin.agents.reset_mock()
                     #      Test with shuffle
                     self.Step.shuffle_agents = False
                     self.Step.parallel_reg   = False
                     self.assertEqual(self.Step.
                                         _perform_agent_action(action,
-                                                              agents_bin),
-                                     mkRegular.return_value)
+                                                              agents_bin,
+                                                              sink),
+                                     None)
                     self.assertEqual(mkRegular.call_args_list,
-                                     [mk.call(action, agents)])
+                                     [mk.call(action, agents, sink, 1)])
                     self.assertEqual(mkParallel.call_args_list, [])
                     self.assertEqual(agents_bin.__getitem__.call_args_list,
                                      [mk.call(action.agent_key)])
-                    self.assertEqual(agent_bin.agents.copy.call_args_list,
-                                     [mk.call()])
                     self.assertEqual(mkRnd.call_args_list, [])
 
     def test__perform_actions_step(self):
         """test perform actions at each location"""
 
         location_key = mk.MagicMock(spec=str)
+        sink         = mk.MagicMock(spec=list)
 
         agents    = mk.create_autospec(main_agents.Agents, spec_set=True)
         agent_bin = mk.create_autospec(main_agents.AgentsBin, spec_set=True)
         agents.__getitem__.return_value = agent_bin
 
-        results = []
-        effects = []
-        for _ in self.actions:
-            result = [mk.MagicMock() for _ in range(3)]
-            effects.append(result)
-            results.extend(result)
-
         with mk.patch.object(step.Step, '_perform_agent_action',
                              autospec=True) as mkPerform:
-            mkPerform.side_effect = effects
-
             self.assertEqual(self.Step._perform_actions_step(location_key,
-                                                             agents),
-                             results)
+                                                             agents,
+                                                             sink,
+                                                             self.actions,
+                                                             2),
+                             None)
 
-            for index, call in enumerate(mkPerform.call_args_list):
-                self.assertEqual(call,
-                                 mk.call(self.Step,
-                                         self.actions[index], agent_bin))
             for index, action in enumerate(self.actions):
                 self.assertEqual(mkPerform.call_args_list[index],
-                                 mk.call(self.Step, action, agent_bin))
+                                 mk.call(self.Step, action, agent_bin,
+                                         sink, 2))
             self.assertEqual(len(mkPerform.call_args_list), 3)
 
             self.assertEqual(agents.__getitem__.call_args_list,
@@ -298,33 +381,92 @@ class TestStep(ut.TestCase):
     def test__perform_regular_step(self):
         """test perform a regular step"""
 
-        location_keys = [mk.MagicMock(spec=str) for _ in range(3)]
+        location_keys = [(0, index) for index in range(3)]
         agents        = mk.create_autospec(main_agents.Agents, spec_set=True)
-
-        results = []
-        effects = []
-        for _ in self.actions:
-            result = [mk.MagicMock() for _ in range(3)]
-            effects.append(result)
-            results.extend(result)
+        sink          = mk.MagicMock(spec=list)
+        actions       = [agent_actions.Actions.setup('test0', ['test0']),
+                         agent_actions.Actions.setup('test1', ['test0'])]
+        agent_keys    = ['test0', 'test1']
 
         with mk.patch.object(step.Step, '_perform_actions_step',
                              autospec=True) as mkPerform:
-            mkPerform.side_effect = effects
-
+            # Test all occupied
+            agents.occupies.return_value = True
             self.assertEqual(self.Step._perform_regular_step(location_keys,
-                                                             agents),
-                             results)
+                                                             agents,
+                                                             sink,
+                                                             actions),
+                             None)
 
-            for index, call in enumerate(mkPerform.call_args_list):
-                self.assertEqual(call,
-                                 mk.call(self.Step,
-                                         location_keys[index], agents))
             for index, location_key in enumerate(location_keys):
                 self.assertEqual(mkPerform.call_args_list[index],
-                                 mk.call(self.Step,
-                                         location_key, agents))
+                                 mk.call(self.Step, location_key, agents,
+                                         sink, actions))
             self.assertEqual(len(mkPerform.call_args_list), 3)
+            self.assertEqual(agents.occupies.call_args_list,
+                             [mk.call(self.level, agent_keys, location_key)
+                              for location_key in location_keys])
+            self.assertEqual(agents.watch.call_args_list,
+                             [mk.call(self.level, agent_keys)])
+            self.assertEqual(agents.unwatch.call_args_list, [mk.call()])
+
+            mkPerform.reset_mock()
+            # Test empty locations are skipped
+            agents.occupies.side_effect = [False, True, False]
+            self.assertEqual(self.Step._perform_regular_step(location_keys,
+                                                             agents,
+                                                             sink,
+                                                             actions),
+                             None)
+            self.assertEqual(mkPerform.call_args_list,
+                             [mk.call(self.Step, location_keys[1], agents,
+                                      sink, actions)])
+
+    def test__perform_regular_step_moved(self):
+        """test a location an agent moves into during the step is visited"""
+
+        bins = {}
+        for location_key in [(0,), (0, 0), (0, 1), (0, 2), (0, 3)]:
+            bins[location_key] = main_agents.AgentsBin(
+                {'test0': main_agents.AgentBin({}, mk.MagicMock(), 'test0')},
+                location_key)
+        agents = main_agents.Agents(bins)
+
+        moves = {(0, 0): (0, 2), (0, 3): (0, 1)}
+        for unique_id, location_key in enumerate([(0, 0), (0, 3)]):
+            agent = main_agent.Agent('test0', unique_id, None,
+                                     location.Location(list(location_key)),
+                                     True)
+            agents.activate(agent)
+
+        visited = []
+
+        def move(ags, sink, batch, number):
+            for ag in list(ags):
+                location_key = ag.location.location_key
+                visited.append(location_key)
+                if location_key in moves:
+                    agents.withdraw(ag)
+                    ag.location = location.Location(list(moves[location_key]))
+                    agents.place(ag)
+
+        action = agent_actions.Actions.setup('test0', ['test0'])
+        self.Step = step.Step([action], level=1)
+        occupies = main_agents.Agents.occupies
+        with mk.patch.object(agent_actions.Actions, 'run',
+                             side_effect=move):
+            with mk.patch.object(main_agents.Agents, 'occupies',
+                                 autospec=True,
+                                 side_effect=occupies) as mkOccupies:
+                self.Step._perform_regular_step(
+                    agents.occupied_keys(1, ['test0']), agents, [], [action])
+
+        # Test moving ahead is visited, moving behind is not
+        self.assertEqual(visited, [(0, 0), (0, 2), (0, 3)])
+        # Test the empty locations are never checked
+        self.assertEqual([call[0][3] for call in mkOccupies.call_args_list],
+                         [(0, 0), (0, 2), (0, 3)])
+        self.assertIsNone(agents.watching)
 
     def test__perform_parallel_step(self):
         """test perform a parallel step"""
@@ -365,13 +507,15 @@ class TestStep(ut.TestCase):
             action = agent_actions.Actions.setup(agent_key, action_keys)
             actions.append(action)
 
-        self.Step = step.Step(actions)
+        self.Step = step.Step(actions, level=1)
 
-        regular_results = self.Step._perform_regular_step(location_keys,
-                                                          agents)
+        regular_results = []
+        self.Step._perform_regular_step(location_keys, agents,
+                                        regular_results, actions)
         self.assertEqual(len(regular_results), 40 * 3 * 3 * 9)
-        parallel_results = self.Step._perform_parallel_step(location_keys,
-                                                            agents)
+        parallel_results = []
+        self.Step._perform_parallel_step(location_keys, agents,
+                                         parallel_results, actions)
         self.assertEqual(len(regular_results), len(parallel_results))
         set_regular = set(regular_results)
         self.assertEqual(len(regular_results), len(set_regular))
@@ -384,9 +528,13 @@ class TestStep(ut.TestCase):
 
         space         = mk.create_autospec(SpaceTest, spec_set=True)
         agents        = mk.create_autospec(main_agents.Agents, spec_set=True)
-        location_keys = [mk.MagicMock(spec=str) for _ in range(3)]
-        
-        space.location_keys.__getitem__.return_value = location_keys
+        location_keys = [(0, index) for index in range(3)]
+        agents.occupied_keys.return_value = location_keys
+        sink          = mk.MagicMock(spec=list)
+        self.actions  = [agent_actions.Actions.setup('test{}'.format(index),
+                                                     ['test0'])
+                         for index in range(3)]
+        agent_keys    = ['test0', 'test1', 'test2']
 
         with mk.patch.object(step.Step, '_perform_parallel_step',
                              autospec=True) as mkParallel:
@@ -396,95 +544,199 @@ class TestStep(ut.TestCase):
                     # Parallel No shuffle
                     self.Step.shuffle_actions = False
                     self.Step.parallel_loc    = True
-                    self.assertEqual(self.Step._perform_step(space, agents),
-                                     mkParallel.return_value)
+                    self.assertEqual(self.Step._perform_step(space, agents,
+                                                             sink,
+                                                             self.actions),
+                                     None)
                     self.assertEqual(mkParallel.call_args_list,
-                                     [mk.call(self.Step,
-                                              location_keys, agents)])
+                                     [mk.call(self.Step, location_keys,
+                                              agents, sink, self.actions)])
                     self.assertEqual(mkRegular.call_args_list, [])
-                    self.assertEqual(space.location_keys.
-                                        __getitem__.call_args_list,
-                                     [mk.call(self.level)])
                     self.assertEqual(mkRnd.call_args_list, [])
 
                     mkParallel.reset_mock()
-                    space.location_keys.__getitem__.reset_mock()
                     # Parallel With  shuffle
                     self.Step.shuffle_actions = True
                     self.Step.parallel_loc    = True
-                    self.assertEqual(self.Step._perform_step(space, agents),
-                                     mkParallel.return_value)
+                    self.assertEqual(self.Step._perform_step(space, agents,
+                                                             sink,
+                                                             self.actions),
+                                     None)
                     self.assertEqual(mkParallel.call_args_list,
-                                     [mk.call(self.Step,
-                                              location_keys, agents)])
+                                     [mk.call(self.Step, location_keys,
+                                              agents, sink, self.actions)])
                     self.assertEqual(mkRegular.call_args_list, [])
-                    self.assertEqual(space.location_keys.
-                                     __getitem__.call_args_list,
-                                     [mk.call(self.level)])
                     self.assertEqual(mkRnd.call_args_list,
-                                     [mk.call(self.Step)])
+                                     [mk.call(self.actions)])
 
                     mkParallel.reset_mock()
-                    space.location_keys.__getitem__.reset_mock()
                     mkRnd.reset_mock()
                     # No Parallel No shuffle
                     self.Step.shuffle_actions = False
                     self.Step.parallel_loc    = False
-                    self.assertEqual(self.Step._perform_step(space, agents),
-                                     mkRegular.return_value)
+                    self.assertEqual(self.Step._perform_step(space, agents,
+                                                             sink,
+                                                             self.actions),
+                                     None)
                     self.assertEqual(mkRegular.call_args_list,
-                                     [mk.call(self.Step,
-                                              location_keys, agents)])
+                                     [mk.call(self.Step, location_keys,
+                                              agents, sink, self.actions)])
                     self.assertEqual(mkParallel.call_args_list, [])
-                    self.assertEqual(space.location_keys.
-                                     __getitem__.call_args_list,
-                                     [mk.call(self.level)])
                     self.assertEqual(mkRnd.call_args_list, [])
 
                     mkRegular.reset_mock()
-                    space.location_keys.__getitem__.reset_mock()
                     # No Parallel With  shuffle
                     self.Step.shuffle_actions = True
                     self.Step.parallel_loc    = False
-                    self.assertEqual(self.Step._perform_step(space, agents),
-                                     mkRegular.return_value)
+                    self.assertEqual(self.Step._perform_step(space, agents,
+                                                             sink,
+                                                             self.actions),
+                                     None)
                     self.assertEqual(mkRegular.call_args_list,
-                                     [mk.call(self.Step,
-                                              location_keys, agents)])
+                                     [mk.call(self.Step, location_keys,
+                                              agents, sink, self.actions)])
                     self.assertEqual(mkParallel.call_args_list, [])
-                    self.assertEqual(space.location_keys.
-                                     __getitem__.call_args_list,
-                                     [mk.call(self.level)])
                     self.assertEqual(mkRnd.call_args_list,
-                                     [mk.call(self.Step)])
+                                     [mk.call(self.actions)])
+                    self.assertEqual(agents.occupied_keys.call_args_list,
+                                     [mk.call(self.level, agent_keys)
+                                      for _ in range(4)])
+
+    def test__perform_fused(self):
+        """test perform all the repeats of the fused actions"""
+
+        agents = mk.create_autospec(main_agents.Agents, spec_set=True)
+        sink   = mk.MagicMock(spec=list)
+
+        self.Step.number = 3
+        with mk.patch.object(step.Step, '_perform_actions_step',
+                             autospec=True) as mkPerform:
+            self.assertEqual(self.Step._perform_fused(agents, sink,
+                                                      self.actions),
+                             None)
+            self.assertEqual(mkPerform.call_args_list,
+                             [mk.call(self.Step, (0,), agents, sink,
+                                      self.actions, 3)])
 
     def test_perform(self):
         """test perform the step"""
 
         space  = mk.create_autospec(SpaceTest, spec_set=True)
         agents = mk.create_autospec(main_agents.Agents, spec_set=True)
-
-        results = []
-        effects = []
-        for _ in self.actions:
-            result = [mk.MagicMock() for _ in range(3)]
-            effects.append(result)
-            results.extend(result)
+        sink   = mk.MagicMock(spec=list)
 
         self.Step.number = 3
-        with mk.patch.object(step.Step, '_perform_step',
-                             autospec=True) as mkPerform:
-            mkPerform.side_effect = effects
+        read = {'test'}
+        with mk.patch.object(step.Step, '_reads', autospec=True,
+                             return_value=read):
+            with mk.patch.object(step.Step, '_fused',
+                                 autospec=True) as mkFused:
+                with mk.patch.object(step.Step, '_perform_fused',
+                                     autospec=True) as mkFusedStep:
+                    with mk.patch.object(step.Step, '_perform_step',
+                                         autospec=True) as mkPerform:
+                        # Test nothing fused
+                        mkFused.return_value = False
+                        self.assertEqual(self.Step.perform(space, agents,
+                                                           sink),
+                                         None)
+                        self.assertEqual(mkFused.call_args_list,
+                                         [mk.call(self.Step, action, agents,
+                                                  read)
+                                          for action in self.actions])
+                        self.assertEqual(mkFusedStep.call_args_list, [])
+                        self.assertEqual(mkPerform.call_args_list,
+                                         [mk.call(self.Step, space, agents,
+                                                  sink, self.actions)
+                                          for _ in range(3)])
+
+                        mkFused.reset_mock()
+                        mkPerform.reset_mock()
+                        # Test some fused
+                        mkFused.side_effect = [True, False, True]
+                        self.assertEqual(self.Step.perform(space, agents,
+                                                           sink),
+                                         None)
+                        fused   = [self.actions[0], self.actions[2]]
+                        unfused = [self.actions[1]]
+                        self.assertEqual(mkFusedStep.call_args_list,
+                                         [mk.call(self.Step, agents, sink,
+                                                  fused)])
+                        self.assertEqual(mkPerform.call_args_list,
+                                         [mk.call(self.Step, space, agents,
+                                                  sink, unfused)
+                                          for _ in range(3)])
+
+            # Test with exchange
+            master   = mk.MagicMock()
+            exchange = mk.MagicMock()
+            with mk.patch.object(step.Step, '_fused', autospec=True,
+                                 return_value=False):
+                with mk.patch.object(step.Step, '_perform_step',
+                                     autospec=True) as mkPerform:
+                    master.attach_mock(mkPerform, 'perform')
+                    master.attach_mock(exchange,  'exchange')
+
+                    self.assertEqual(self.Step.perform(space, agents, sink,
+                                                       exchange),
+                                     None)
+
+                    calls = []
+                    for _ in range(3):
+                        calls.append(mk.call.perform(self.Step, space,
+                                                     agents, sink,
+                                                     self.actions))
+                        calls.append(mk.call.exchange())
+                    self.assertEqual(master.mock_calls, calls)
+
+    def test_perform_mixed(self):
+        """test perform a step where one type reads where another is"""
+
+        space  = mk.create_autospec(SpaceTest, spec_set=True)
+        agents = mk.create_autospec(main_agents.Agents, spec_set=True)
+        sink   = mk.MagicMock(spec=list)
 
-            self.assertEqual(self.Step.perform(space,
-                                               agents),
-                             results)
+        larva  = agent_actions.Actions.setup('larva',  ['move'])
+        female = agent_actions.Actions.setup('female', ['reproduce'])
+        self.Step.data   = [larva, female]
+        self.Step.number = 3
 
-            for index, call in enumerate(mkPerform.call_args_list):
-                self.assertEqual(call,
-                                 mk.call(self.Step,
-                                         space, agents))
-            self.assertEqual(len(mkPerform.call_args_list), 3)
+        populations = {'larva':  [mk.create_autospec(main_agent.Agent,
+                                                     spec_set=True)],
+                       'female': [mk.create_autospec(main_agent.Agent,
+                                                     spec_set=True)]}
+        populations['larva'][0].reads.return_value  = []
+        populations['female'][0].reads.return_value = ['egg_mass', 'larva']
+        agents.agents.side_effect = lambda agent_key: populations[agent_key]
+
+        with mk.patch.object(agent_actions.Actions, 'fusible', autospec=True,
+                             return_value=True):
+            with mk.patch.object(step.Step, '_perform_fused',
+                                 autospec=True) as mkFusedStep:
+                with mk.patch.object(step.Step, '_perform_step',
+                                     autospec=True) as mkPerform:
+                    # Test the larvae move with the females laying
+                    self.Step.perform(space, agents, sink)
+                    self.assertEqual(mkFusedStep.call_args_list,
+                                     [mk.call(self.Step, agents, sink,
+                                              [female])])
+                    self.assertEqual(mkPerform.call_args_list,
+                                     [mk.call(self.Step, space, agents,
+                                              sink, [larva])
+                                      for _ in range(3)])
+
+                    mkFusedStep.reset_mock()
+                    mkPerform.reset_mock()
+                    # Test the larvae move fused without the females
+                    populations['female'] = []
+                    self.Step.perform(space, agents, sink)
+                    self.assertEqual(mkFusedStep.call_args_list,
+                                     [mk.call(self.Step, agents, sink,
+                                              [larva])])
+                    self.assertEqual(mkPerform.call_args_list,
+                                     [mk.call(self.Step, space, agents,
+                                              sink, [female])
+                                      for _ in range(3)])
 
     def test_setup(self):
         """test setup the class"""
@@ -505,6 +757,7 @@ class TestStep(ut.TestCase):
         self.assertEqual(self.Step.parallel_reg,    False)
         self.assertEqual(self.Step.parallel_loc,    False)
         self.assertEqual(self.Step.level,           0)
+        self.assertEqual(self.Step.batch,           False)
 
         for index_i, thing in enumerate(actions.items()):
             agent_key, action_keys = thing
@@ -528,7 +781,8 @@ class TestStep(ut.TestCase):
                                     self.shuffle_actions,
                                     self.parallel_reg,
                                     False,
-                                    self.level)
+                                    self.level,
+                                    self.batch)
         self.assertIsInstance(self.Step, step.Step)
         self.assertEqual(self.Step.number,          self.number)
         self.assertEqual(self.Step.shuffle_agents,  self.shuffle_agents)
@@ -536,6 +790,7 @@ class TestStep(ut.TestCase):
         self.assertEqual(self.Step.parallel_reg,    self.parallel_reg)
         self.assertEqual(self.Step.parallel_loc,    False)
         self.assertEqual(self.Step.level,           self.level)
+        self.assertEqual(self.Step.batch,           self.batch)
 
         for index_i, thing in enumerate(actions.items()):
             agent_key, action_keys = thing
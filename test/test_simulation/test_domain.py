@@ -0,0 +1,909 @@
+import unittest      as ut
+import unittest.mock as mk
+
+import dataclasses     as dclass
+import multiprocessing as multi
+import numpy           as np
+import numpy.random    as rnd
+import os
+import pandas          as pd
+import pickle          as pk
+import queue
+import sqlalchemy      as sql
+import tempfile
+
+import source.keyword as keyword
+
+import source.agents.adult as adult
+
+import source.biomass.models      as biomass
+import source.movement.models     as movement
+import source.reproduction.models as reproduction
+
+import source.data.counter  as counter
+import source.data.database as database
+
+import source.migration.emigration as emigration
+
+import source.schedule.calendar as main_calendar
+
+import source.simulation.behaviors  as behaviors
+import source.simulation.domain     as domain
+import source.simulation.simulation as simulation
+
+import source.space.agents      as agents
+import source.space.environment as environment
+import source.space.graph       as graph
+import source.space.location    as location
+
+
+def make_behaviors() -> behaviors.Behaviors:
+    """Create a set of behaviors standing in for the real ones"""
+
+    return behaviors.Behaviors(**{field.name: mk.MagicMock()
+                                  for field in dclass.fields(
+                                     behaviors.Behaviors)})
+
+
+def make_simulation() -> mk.MagicMock:
+    """Create a simulation standing in for the real one"""
+
+    new = mk.MagicMock()
+    new.behaviors = make_behaviors()
+
+    return new
+
+
+def make_adult(sim, vertex: int, agent_key: str = keyword.male,
+                                 unique_id: str = 'male') -> adult.Adult:
+    """Create an adult at the vertex"""
+
+    return adult.Adult(agent_key, unique_id, sim,
+                       location.Location([0, vertex]), True,
+                       1.0, keyword.homo_s, 0, keyword.alive, 0, None,
+                       sim.behaviors.survive_adult,
+                       sim.behaviors.move_adult,
+                       sim.behaviors.lay,
+                       sim.behaviors.mate)
+
+
+def make_line(number: int) -> graph.Graph:
+    """Create a line graph"""
+
+    matrix = np.zeros((number, number))
+    for vertex in range(number - 1):
+        matrix[vertex, vertex + 1] = 1
+        matrix[vertex + 1, vertex] = 1
+
+    return graph.Graph.setup(matrix)
+
+
+class TestPickler(ut.TestCase):
+    """test the Pickler and Unpickler classes"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.simulation = make_simulation()
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        file = mk.MagicMock()
+
+        self.simulation.behaviors.gut = None
+        pickler = domain.Pickler(file, self.simulation)
+        self.assertIsInstance(pickler, pk.Pickler)
+        self.assertEqual(pickler.simulation, self.simulation)
+
+        names = [field.name for field in dclass.fields(behaviors.Behaviors)
+                 if field.name != 'gut']
+        self.assertEqual(sorted(pickler.links.values()), sorted(names))
+        for behavior_id, name in pickler.links.items():
+            self.assertEqual(id(getattr(self.simulation.behaviors, name)),
+                             behavior_id)
+
+    def test_persistent_id(self):
+        """test get reference of shared objects"""
+
+        pickler = domain.Pickler(mk.MagicMock(), self.simulation)
+
+        self.assertEqual(pickler.persistent_id(self.simulation),
+                         keyword.domain_simulation)
+        self.assertEqual(pickler.persistent_id(self.simulation.behaviors.lay),
+                         'lay')
+        self.assertIsNone(pickler.persistent_id([1, 2]))
+
+    def test_persistent_load(self):
+        """test get shared objects from reference"""
+
+        unpickler = domain.Unpickler(mk.MagicMock(), self.simulation)
+
+        self.assertEqual(unpickler.persistent_load(keyword.domain_simulation),
+                         self.simulation)
+        self.assertEqual(unpickler.persistent_load('lay'),
+                         self.simulation.behaviors.lay)
+
+    def test_dumps_loads(self):
+        """test round trip between simulations"""
+
+        other = make_simulation()
+        obj   = {'simulation': self.simulation,
+                 'lay':        self.simulation.behaviors.lay,
+                 'values':     [1, 2, 3]}
+
+        data = domain.Pickler.dumps(obj, self.simulation)
+        self.assertIsInstance(data, bytes)
+
+        new = domain.Unpickler.loads(data, other)
+        self.assertEqual(new['simulation'], other)
+        self.assertEqual(new['lay'],        other.behaviors.lay)
+        self.assertEqual(new['values'],     [1, 2, 3])
+
+        # Test agent round trip
+        male = make_adult(self.simulation, 3)
+        new  = domain.Unpickler.loads(domain.Pickler.dumps(male,
+                                                           self.simulation),
+                                      other)
+        self.assertEqual(new.simulation, other)
+        self.assertEqual(new.movement,   other.behaviors.move_adult)
+        self.assertEqual(new.location,   male.location)
+        self.assertEqual(new.unique_id,  male.unique_id)
+
+
+class TestGhost(ut.TestCase):
+    """test the Ghost class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.simulation = make_simulation()
+        self.male       = make_adult(self.simulation, 3)
+
+        self.Ghost = domain.Ghost.copy(self.male)
+
+        self.agent_bin = agents.AgentBin({self.Ghost.unique_id: self.Ghost},
+                                         mk.MagicMock(), keyword.male)
+        self.simulation.agents = agents.Agents(
+            {(0, 3): agents.AgentsBin({keyword.male: self.agent_bin},
+                                      (0, 3))})
+
+    def test_copy(self):
+        """test copy a male into a ghost"""
+
+        self.assertIsInstance(self.Ghost, domain.Ghost)
+        self.assertIsInstance(self.Ghost, adult.Adult)
+        self.assertFalse(self.Ghost.mated)
+
+        for field in dclass.fields(adult.Adult):
+            self.assertEqual(getattr(self.Ghost, field.name),
+                             getattr(self.male, field.name))
+        self.assertIsNot(self.Ghost.location, self.male.location)
+
+    def test_withdraw(self):
+        """test remove the ghost from its bin"""
+
+        self.assertIn(self.Ghost.unique_id, self.agent_bin)
+        self.assertEqual(self.simulation.agents.occupants(1, keyword.male),
+                         {(0, 3)})
+        self.Ghost.withdraw()
+        self.assertNotIn(self.Ghost.unique_id, self.agent_bin)
+        self.assertEqual(self.agent_bin.counts.mock_calls, [])
+        self.assertEqual(self.simulation.agents.occupants(1, keyword.male),
+                         set())
+
+        # Test already withdrawn
+        self.Ghost.withdraw()
+        self.assertNotIn(self.Ghost.unique_id, self.agent_bin)
+
+    def test_set_mate(self):
+        """test set the mate of the ghost"""
+
+        mate = make_adult(self.simulation, 3, keyword.female, 'female')
+
+        # Test can mate again
+        self.simulation.models = {keyword.lifetime_male: False,
+                                  keyword.limited:       False}
+        self.Ghost.set_mate(mate)
+        self.assertTrue(self.Ghost.mated)
+        self.assertIn(self.Ghost.unique_id, self.agent_bin)
+
+        # Test limited
+        self.Ghost.mated       = False
+        self.simulation.models = {keyword.lifetime_male: False,
+                                  keyword.limited:       True}
+        self.Ghost.set_mate(mate)
+        self.assertTrue(self.Ghost.mated)
+        self.assertNotIn(self.Ghost.unique_id, self.agent_bin)
+
+        # Test lifetime
+        self.agent_bin[self.Ghost.unique_id] = self.Ghost
+        self.Ghost.mated       = False
+        self.simulation.models = {keyword.lifetime_male: True,
+                                  keyword.limited:       False}
+        self.Ghost.set_mate(mate)
+        self.assertTrue(self.Ghost.mated)
+        self.assertNotIn(self.Ghost.unique_id, self.agent_bin)
+
+
+class TestBlock(ut.TestCase):
+    """test the Block class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.index      = 0
+        self.simulation = make_simulation()
+        self.owner      = [0, 0, 0, 1, 1, 1]
+        self.halos      = {1: {2}}
+        self.inboxes    = [queue.Queue() for _ in range(2)]
+        self.commands   = queue.Queue()
+        self.results    = queue.Queue()
+
+        self.Block = domain.Block(self.index,
+                                  self.simulation,
+                                  self.owner,
+                                  self.halos,
+                                  self.inboxes,
+                                  self.commands,
+                                  self.results)
+
+    def make_agents(self):
+        """Setup a real agents system on the simulation"""
+
+        bins = {}
+        for location_key in [(0,)] + [(0, vertex) for vertex in range(6)]:
+            bins[location_key] = agents.AgentsBin(
+                {agent_key: agents.AgentBin({}, counter.Counts({}), agent_key)
+                 for agent_key in [keyword.male, keyword.female]},
+                location_key)
+        self.simulation.agents = agents.Agents(bins)
+
+        return self.simulation.agents
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertEqual(self.Block.index,      self.index)
+        self.assertEqual(self.Block.simulation, self.simulation)
+        self.assertEqual(self.Block.owner,      self.owner)
+        self.assertEqual(self.Block.halos,      self.halos)
+        self.assertEqual(self.Block.inboxes,    self.inboxes)
+        self.assertEqual(self.Block.commands,   self.commands)
+        self.assertEqual(self.Block.results,    self.results)
+
+        self.assertEqual(self.Block.ghosts,   [])
+        self.assertEqual(self.Block._round,   0)
+        self.assertEqual(self.Block._pending, {})
+
+    def test_owns(self):
+        """test determine if block owns location"""
+
+        self.assertTrue(self.Block.owns((0,)))
+        self.assertTrue(self.Block.owns((0, 2)))
+        self.assertTrue(self.Block.owns((0, 2, 5)))
+        self.assertFalse(self.Block.owns((0, 3)))
+        self.assertFalse(self.Block.owns((0, 3, 0)))
+
+    def test_halo(self):
+        """test find the halos of the block"""
+
+        line = make_line(6)
+
+        self.assertEqual(domain.Block.halo(line, self.owner, 0, 2, 0),
+                         {1: set()})
+        self.assertEqual(domain.Block.halo(line, self.owner, 0, 2, 1),
+                         {1: {2}})
+        self.assertEqual(domain.Block.halo(line, self.owner, 1, 2, 2),
+                         {0: {3, 4}})
+        self.assertEqual(domain.Block.halo(line, self.owner, 0, 3, 1),
+                         {1: {2}, 2: set()})
+
+    def test__localize(self):
+        """test reduce simulation to the block"""
+
+        self.make_agents()
+        inside  = make_adult(self.simulation, 1, unique_id='inside')
+        outside = make_adult(self.simulation, 4, unique_id='outside')
+        self.simulation.agents.activate(inside)
+        self.simulation.agents.activate(outside)
+
+        self.Block._localize()
+        self.assertIn('inside',    self.simulation.agents[(0,)][keyword.male])
+        self.assertNotIn('outside', self.simulation.agents[(0,)][keyword.male])
+        self.assertNotIn('outside',
+                         self.simulation.agents[(0, 4)][keyword.male])
+        self.assertTrue(inside.alive)
+        self.assertFalse(outside.alive)
+
+        self.assertEqual(self.simulation.agents.occupied_keys(
+                             1, [keyword.male]),
+                         [(0, 1)])
+        self.assertEqual(self.simulation.schedule.exchange,
+                         self.Block.exchange)
+
+    def test__clear(self):
+        """test clear out the ghosts"""
+
+        self.make_agents()
+        ghosts = [domain.Ghost.copy(make_adult(self.simulation, 3,
+                                               unique_id=str(index)))
+                  for index in range(3)]
+        for ghost in ghosts:
+            self.simulation.agents[(0, 3)][keyword.male].data[
+                ghost.unique_id] = ghost
+        ghosts[1].mated   = True
+        self.Block.ghosts = ghosts.copy()
+
+        self.assertEqual(self.Block._clear(), {1: ['1']})
+        self.assertEqual(self.Block.ghosts, [])
+        self.assertEqual(len(self.simulation.agents[(0, 3)][keyword.male]), 0)
+
+    def test__parcels(self):
+        """test create parcels for other blocks"""
+
+        self.make_agents()
+        near  = make_adult(self.simulation, 2, unique_id='near')
+        mover = make_adult(self.simulation, 5, unique_id='mover')
+        self.simulation.agents.activate(near)
+        self.simulation.agents.activate(mover)
+
+        parcels = self.Block._parcels({1: ['mated']})
+        self.assertEqual(list(parcels.keys()), [1])
+
+        movers, mated, ghosts = parcels[1]
+        self.assertEqual(movers, [mover])
+        self.assertEqual(mated,  ['mated'])
+        self.assertEqual(len(ghosts), 1)
+        self.assertIsInstance(ghosts[0], domain.Ghost)
+        self.assertEqual(ghosts[0].unique_id, 'near')
+
+        self.assertNotIn('mover', self.simulation.agents[(0,)][keyword.male])
+        self.assertNotIn('mover',
+                         self.simulation.agents[(0, 5)][keyword.male])
+        self.assertIn('near', self.simulation.agents[(0,)][keyword.male])
+
+    def test__receive(self):
+        """test receive transfer for current round"""
+
+        self.inboxes[0].put((1, b'later'))
+        self.inboxes[0].put((0, b'now'))
+
+        self.assertEqual(self.Block._receive(), b'now')
+        self.assertEqual(self.Block._pending, {1: [b'later'], 0: []})
+
+        self.Block._round = 1
+        self.assertEqual(self.Block._receive(), b'later')
+
+    def test__accept(self):
+        """test accept a parcel"""
+
+        self.make_agents()
+        self.simulation.models = {keyword.lifetime_male: True,
+                                  keyword.limited:       False}
+
+        mated = make_adult(self.simulation, 1, unique_id='mated')
+        self.simulation.agents.activate(mated)
+
+        mover = make_adult(self.simulation, 2, unique_id='mover')
+        ghost = domain.Ghost.copy(make_adult(self.simulation, 3,
+                                             unique_id='ghost'))
+
+        self.Block._accept(([mover], ['mated', 'missing'], [ghost]))
+
+        self.assertIn('mover', self.simulation.agents[(0,)][keyword.male])
+        self.assertIn('mover', self.simulation.agents[(0, 2)][keyword.male])
+        self.assertEqual(self.simulation.schedule.register.call_args_list,
+                         [])
+
+        self.assertNotIn('mated', self.simulation.agents[(0,)][keyword.male])
+
+        self.assertNotIn('ghost', self.simulation.agents[(0,)][keyword.male])
+        self.assertIn('ghost', self.simulation.agents[(0, 3)][keyword.male])
+        self.assertIn((0, 3), self.simulation.agents.occupants(1,
+                                                               keyword.male))
+        self.assertEqual(self.Block.ghosts, [ghost])
+
+    def test_exchange(self):
+        """test exchange agents with other blocks"""
+
+        self.make_agents()
+        mover = make_adult(self.simulation, 4, unique_id='mover')
+        self.simulation.agents.activate(mover)
+
+        arrival = make_adult(self.simulation, 1, unique_id='arrival')
+        self.inboxes[0].put((0, domain.Pickler.dumps(([arrival], [], []),
+                                                     self.simulation)))
+
+        self.Block.exchange()
+        self.assertEqual(self.Block._round,   1)
+        self.assertEqual(self.Block._pending, {})
+        self.assertFalse(mover.alive)
+        self.assertIn('arrival', self.simulation.agents[(0,)][keyword.male])
+        self.assertNotIn('mover', self.simulation.agents[(0,)][keyword.male])
+
+        round_num, data = self.inboxes[1].get_nowait()
+        self.assertEqual(round_num, 0)
+        movers, mated, ghosts = domain.Unpickler.loads(data,
+                                                       self.simulation)
+        self.assertEqual([agent.unique_id for agent in movers], ['mover'])
+        self.assertTrue(movers[0].alive)
+        self.assertEqual(mated,  [])
+        self.assertEqual(ghosts, [])
+
+    def test__emigrate(self):
+        """test emigrate using the domain decisions"""
+
+        emigrations = [mk.create_autospec(emigration.Emigration,
+                                          spec_set=True) for _ in range(2)]
+        decisions   = [[True], [False]]
+        self.simulation.emigration = emigrations
+        for emigrate, decision in zip(emigrations, decisions):
+            self.commands.put(decision)
+
+        self.Block._emigrate()
+        for emigrate, decision in zip(emigrations, decisions):
+            self.assertEqual(emigrate.population.call_args_list,
+                             [mk.call(self.simulation.agents)])
+            self.assertEqual(emigrate.remove.call_args_list,
+                             [mk.call(self.simulation.agents, decision)])
+            self.assertEqual(self.results.get_nowait(),
+                             emigrate.population.return_value)
+
+    def test_step(self):
+        """test advance the block one step"""
+
+        master = mk.MagicMock()
+        with mk.patch.object(domain.Block, 'exchange',
+                             autospec=True) as mkExchange:
+            with mk.patch.object(domain.Block, '_clear',
+                                 autospec=True) as mkClear:
+                with mk.patch.object(domain.Block, '_emigrate',
+                                     autospec=True) as mkEmigrate:
+                    master.attach_mock(self.simulation.count_step, 'count')
+                    master.attach_mock(mkExchange,                 'exchange')
+                    master.attach_mock(self.simulation.schedule.perform,
+                                       'perform')
+                    master.attach_mock(self.simulation.immigration.
+                                       immigration,                'immigrate')
+                    master.attach_mock(mkClear,                    'clear')
+                    master.attach_mock(mkEmigrate,                 'emigrate')
+                    master.attach_mock(self.simulation.agents.record,
+                                       'record')
+
+                    calls = [mk.call.count(),
+                             mk.call.exchange(self.Block),
+                             mk.call.perform(self.simulation.space,
+                                             self.simulation.agents),
+                             mk.call.immigrate(self.simulation),
+                             mk.call.exchange(self.Block),
+                             mk.call.clear(self.Block),
+                             mk.call.emigrate(self.Block),
+                             mk.call.record()]
+
+                    # Test first block
+                    self.Block.step()
+                    self.assertEqual(master.mock_calls, calls)
+
+                    # Test other block
+                    self.Block.index = 1
+                    self.Block.step()
+                    del calls[3]
+                    self.assertEqual(master.mock_calls[8:], calls)
+
+    def test_gather(self):
+        """test pickle the block for the domain"""
+
+        self.make_agents()
+        self.simulation.schedule.calendar = None
+
+        bins, events, day, plants = domain.Unpickler.loads(
+            self.Block.gather(), self.simulation)
+        self.assertEqual(sorted(bins.keys()),
+                         [(0,), (0, 0), (0, 1), (0, 2)])
+        self.assertEqual(events, {})
+        self.assertEqual(day,    0)
+        self.assertEqual(plants, {})
+
+        # Test with calendar
+        alive = make_adult(self.simulation, 1, unique_id='alive')
+        dead  = make_adult(self.simulation, 1, unique_id='dead')
+        dead.alive = False
+        self.simulation.schedule.calendar = main_calendar.Calendar(
+            {5: [(alive, 2, keyword.develop), (dead, 2, keyword.develop)]}, 3)
+
+        bins, events, day, plants = domain.Unpickler.loads(
+            self.Block.gather(), self.simulation)
+        self.assertEqual(len(events[5]), 1)
+        self.assertEqual(events[5][0][0].unique_id, 'alive')
+        self.assertEqual(day, 3)
+
+        # Test with plants
+        self.simulation.agents.environment = environment.Environment(
+            {(0, 1): 0, (0, 2): 1, (0, 4): 2},
+            np.array([False, False, False]),
+            np.array([1.0, 2.0, 3.0]))
+        bins, events, day, plants = domain.Unpickler.loads(
+            self.Block.gather(), self.simulation)
+        self.assertEqual(plants, {0: 1.0, 1: 2.0})
+
+    def test_run(self):
+        """test run commands until stop"""
+
+        for command in [keyword.domain_step, keyword.domain_gather,
+                        keyword.domain_refresh, keyword.domain_stop]:
+            self.commands.put(command)
+
+        with mk.patch.object(domain.Block, 'step',
+                             autospec=True) as mkStep:
+            with mk.patch.object(domain.Block, 'gather',
+                                 autospec=True) as mkGather:
+                self.Block.run()
+                self.assertEqual(mkStep.call_args_list,
+                                 [mk.call(self.Block)])
+                self.assertEqual(mkGather.call_args_list,
+                                 [mk.call(self.Block)])
+                self.assertEqual(self.simulation.agents.refresh.
+                                 call_args_list, [mk.call()])
+
+                self.assertEqual(self.results.get_nowait(),
+                                 keyword.domain_step)
+                self.assertEqual(self.results.get_nowait(),
+                                 mkGather.return_value)
+                self.assertTrue(self.results.empty())
+
+    def test_work(self):
+        """test setup and run a block"""
+
+        self.simulation.space.__getitem__.return_value = make_line(6)
+
+        with mk.patch.object(domain.Block, '_localize',
+                             autospec=True) as mkLocalize:
+            with mk.patch.object(domain.Block, 'run',
+                                 autospec=True) as mkRun:
+                with mk.patch.object(rnd, 'seed') as mkSeed:
+                    domain.Block.work(1, self.simulation, self.owner, 1,
+                                      self.inboxes, self.commands,
+                                      self.results, 7)
+                    self.assertEqual(mkSeed.call_args_list, [mk.call(7)])
+                    self.assertEqual(len(mkLocalize.call_args_list), 1)
+                    block = mkLocalize.call_args_list[0][0][0]
+                    self.assertEqual(mkRun.call_args_list,
+                                     [mk.call(block)])
+                    self.assertEqual(block.index, 1)
+                    self.assertEqual(block.halos, {0: {3}})
+
+                    # Test error in worker
+                    mkRun.side_effect = KeyError('bad')
+                    with self.assertRaises(KeyError):
+                        domain.Block.work(1, self.simulation, self.owner, 1,
+                                          self.inboxes, self.commands,
+                                          self.results, 7)
+                    self.assertIsInstance(self.results.get_nowait(),
+                                          domain.DomainError)
+
+
+class TestDomain(ut.TestCase):
+    """test the Domain class"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.simulation = make_simulation()
+        self.workers    = [mk.MagicMock(spec=multi.Process)
+                           for _ in range(2)]
+        self.commands   = [queue.Queue() for _ in range(2)]
+        self.results    = [queue.Queue() for _ in range(2)]
+        self.history    = 3
+
+        self.Domain = domain.Domain(self.simulation,
+                                    self.workers,
+                                    self.commands,
+                                    self.results,
+                                    self.history)
+
+    def test___init__(self):
+        """test __init__ for class"""
+
+        self.assertEqual(self.Domain.simulation, self.simulation)
+        self.assertEqual(self.Domain.workers,    self.workers)
+        self.assertEqual(self.Domain.commands,   self.commands)
+        self.assertEqual(self.Domain.results,    self.results)
+        self.assertEqual(self.Domain.history,    self.history)
+
+    def test__command(self):
+        """test send a command to the workers"""
+
+        self.Domain._command(keyword.domain_step)
+        for commands in self.commands:
+            self.assertEqual(commands.get_nowait(), keyword.domain_step)
+
+    def test__result(self):
+        """test get a result from a worker"""
+
+        self.results[1].put(keyword.domain_step)
+        self.assertEqual(self.Domain._result(1), keyword.domain_step)
+
+        self.results[0].put(domain.DomainError('block 0'))
+        with self.assertRaises(domain.DomainError):
+            self.Domain._result(0)
+
+    def test__emigrate(self):
+        """test decide emigration for the whole population"""
+
+        emigrate = mk.create_autospec(emigration.Emigration, spec_set=True)
+        emigrate.decisions.return_value = [True, False, False, True, True]
+        self.simulation.emigration = [emigrate]
+
+        self.results[0].put(2)
+        self.results[1].put(3)
+
+        self.Domain._emigrate()
+        self.assertEqual(emigrate.decisions.call_args_list, [mk.call(5)])
+        self.assertEqual(self.commands[0].get_nowait(), [True, False])
+        self.assertEqual(self.commands[1].get_nowait(), [False, True, True])
+
+    def test_step(self):
+        """test advance the simulation one step"""
+
+        self.simulation.database = mk.create_autospec(database.Database,
+                                                      spec_set=True)
+        self.simulation.timestep          = 4
+        self.simulation.database.next_dump = 5
+
+        with mk.patch.object(domain.Domain, '_emigrate',
+                             autospec=True) as mkEmigrate:
+            with mk.patch.object(domain.Domain, 'gather',
+                                 autospec=True) as mkGather:
+                for results in self.results:
+                    results.put(keyword.domain_step)
+
+                # Test no save
+                self.Domain.step()
+                self.assertEqual(self.simulation.count_step.call_args_list,
+                                 [mk.call()])
+                self.assertEqual(mkEmigrate.call_args_list,
+                                 [mk.call(self.Domain)])
+                self.assertEqual(mkGather.call_args_list, [])
+                self.assertEqual(self.simulation.database.save.call_args_list,
+                                 [])
+                for commands in self.commands:
+                    self.assertEqual(commands.get_nowait(),
+                                     keyword.domain_step)
+                    self.assertTrue(commands.empty())
+                self.assertEqual(self.Domain.history, self.history)
+
+                # Test save
+                for results in self.results:
+                    results.put(keyword.domain_step)
+                self.simulation.timestep = 5
+                self.Domain.step()
+                self.assertEqual(mkGather.call_args_list,
+                                 [mk.call(self.Domain)])
+                self.assertEqual(self.simulation.database.save.call_args_list,
+                                 [mk.call(self.simulation)])
+                for commands in self.commands:
+                    self.assertEqual(commands.get_nowait(),
+                                     keyword.domain_step)
+                    self.assertEqual(commands.get_nowait(),
+                                     keyword.domain_refresh)
+                self.assertEqual(self.Domain.history, 0)
+
+    def test_gather(self):
+        """test collect the agents from the workers"""
+
+        environ = environment.Environment({}, np.array([False, False]),
+                                          np.array([5.0, 5.0]))
+        self.simulation.agents = agents.Agents({}, environ)
+        self.simulation.schedule.calendar = main_calendar.Calendar({2: ['old']})
+
+        master = [mk.MagicMock() for _ in range(2)]
+        owned  = [mk.MagicMock() for _ in range(2)]
+        parts  = [({(0,): master[0], (0, 0): owned[0]}, {4: ['a']}, 3,
+                   {0: 1.5}),
+                  ({(0,): master[1], (0, 1): owned[1]}, {4: ['b']}, 3,
+                   {1: 2.5})]
+
+        with mk.patch.object(domain.Unpickler, 'loads',
+                             autospec=True) as mkLoads:
+            mkLoads.side_effect = parts
+            for index, results in enumerate(self.results):
+                results.put(index)
+
+            self.Domain.gather()
+            self.assertEqual(mkLoads.call_args_list,
+                             [mk.call(0, self.simulation),
+                              mk.call(1, self.simulation)])
+            for commands in self.commands:
+                self.assertEqual(commands.get_nowait(), keyword.domain_gather)
+
+        self.assertEqual(self.simulation.agents.data,
+                         {(0,): master[0], (0, 0): owned[0],
+                          (0, 1): owned[1]})
+        self.assertEqual(self.simulation.agents.occupied, {})
+        self.assertEqual(master[0].merge.call_args_list,
+                         [mk.call(master[1], self.history)])
+        self.assertEqual(self.simulation.schedule.calendar.data,
+                         {4: ['a', 'b']})
+        self.assertEqual(self.simulation.schedule.calendar.day, 3)
+        np.testing.assert_array_equal(environ.plant, [1.5, 2.5])
+
+    def test_close(self):
+        """test gather and stop the workers"""
+
+        with mk.patch.object(domain.Domain, 'gather',
+                             autospec=True) as mkGather:
+            self.Domain.close()
+            self.assertEqual(mkGather.call_args_list, [mk.call(self.Domain)])
+            for commands in self.commands:
+                self.assertEqual(commands.get_nowait(), keyword.domain_stop)
+            for worker in self.workers:
+                self.assertEqual(worker.join.call_args_list, [mk.call()])
+
+    def test__width(self):
+        """test get the mating range"""
+
+        radius = mk.MagicMock()
+        self.simulation.models = {keyword.mate_radius: radius}
+        self.assertEqual(domain.Domain._width(self.simulation), radius.radius)
+
+        self.simulation.models = {}
+        self.assertEqual(domain.Domain._width(self.simulation), 0)
+
+    def test_setup(self):
+        """test split simulation and start the workers"""
+
+        self.simulation.space.__getitem__.return_value = make_line(6)
+        self.simulation.database = mk.create_autospec(database.Database,
+                                                      spec_set=True)
+        self.simulation.timestep           = 7
+        self.simulation.database.prev_dump = 5
+        self.simulation.models             = {}
+
+        with mk.patch.object(multi, 'get_context') as mkContext:
+            with mk.patch.object(rnd, 'randint') as mkRandint:
+                mkRandint.return_value = [11, 12]
+                self.Domain = domain.Domain.setup(self.simulation, 2)
+                self.assertIsInstance(self.Domain, domain.Domain)
+
+                self.assertEqual(mkContext.call_args_list,
+                                 [mk.call('fork')])
+                context = mkContext.return_value
+                self.assertEqual(len(context.Queue.call_args_list), 6)
+                self.assertEqual(self.Domain.simulation, self.simulation)
+                self.assertEqual(self.Domain.history,    3)
+                self.assertEqual(len(self.Domain.workers), 2)
+                self.assertEqual(len(self.Domain.commands), 2)
+                self.assertEqual(len(self.Domain.results),  2)
+
+                for index, call in enumerate(context.Process.call_args_list):
+                    kwargs = call[1]
+                    self.assertEqual(kwargs['target'], domain.Block.work)
+                    self.assertTrue(kwargs['daemon'])
+                    args = kwargs['args']
+                    self.assertEqual(args[0], index)
+                    self.assertEqual(args[1], self.simulation)
+                    self.assertEqual(args[2], [0, 0, 0, 1, 1, 1])
+                    self.assertEqual(args[3], 0)
+                    self.assertEqual(args[7], [11, 12][index])
+                self.assertEqual(context.Process.return_value.start.
+                                 call_args_list, [mk.call(), mk.call()])
+
+
+class TestRun(ut.TestCase):
+    """test running a simulation end to end through the domain mode"""
+
+    def setUp(self):
+        """Setup the tests"""
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        self.adult_keys = [keyword.female, keyword.male, keyword.mated]
+
+    def make_simulation(self, name:    str,
+                              workers: int) -> simulation.Simulation:
+        """Create a small simulation of moving adults"""
+
+        values = {genotype: 1.0 for genotype in keyword.genotype_keys}
+        models = [biomass.MaxGut(),
+                  biomass.Growth(values, values),
+                  biomass.InitNum(10.0),
+                  biomass.InitMass(values, values),
+                  biomass.InitJuvenile(values, values),
+                  biomass.InitMature(values, values),
+                  biomass.InitPlant(10.0, 1.0),
+                  reproduction.InitSex(0.5),
+                  movement.Adult(1, 1)]
+
+        attr  = {keyword.genotype: (keyword.genotype,
+                                    keyword.genotype_keys,
+                                    False)}
+        attrs = {0: {agent_key: attr for agent_key in keyword.insect_keys}}
+        steps = [({agent_key: [keyword.move]
+                   for agent_key in self.adult_keys}, 3, True),
+                 ({agent_key: [keyword.advance_age]
+                   for agent_key in self.adult_keys},)]
+        nums  = ((0, 0, 0), (0, 0, 0), (0, 0, 0), (10, 0, 10), (0, 0, 0))
+
+        rnd.seed(3)
+        return simulation.Simulation.setup(
+            nums,
+            [(keyword.hexagon, 4, 4, False), (keyword.hexagon, 2, 2, False)],
+            attrs,
+            (2, name, self.directory.name),
+            0.0, steps, [], [],
+            *models,
+            lifetime_female=True,
+            lifetime_male=False,
+            limited=True,
+            domain_workers=workers)
+
+    def run_simulation(self, name:    str,
+                             workers: int) -> simulation.Simulation:
+        """Run a small simulation for four steps"""
+
+        new    = self.make_simulation(name, workers)
+        runner = new.runner()
+        if workers > 1:
+            self.assertIsInstance(runner, domain.Domain)
+        else:
+            self.assertIs(runner, new)
+
+        for _ in range(4):
+            runner.step()
+        runner.close()
+
+        return new
+
+    def read_table(self, file_name: str,
+                         table:     str) -> pd.DataFrame:
+        """Read a table written by a simulation"""
+
+        engine = sql.create_engine('sqlite:///{}/{}'.
+                                   format(self.directory.name, file_name))
+
+        return pd.read_sql_table(table, engine)
+
+    def test_run(self):
+        """test run the domain mode like the serial mode"""
+
+        serial = self.run_simulation('serial.sqlite', 1)
+        split  = self.run_simulation('split.sqlite',  2)
+
+        self.assertEqual(split.timestep, 4)
+        for agent_key in self.adult_keys:
+            agents_serial = serial.agents.agents(agent_key)
+            agents_split  = split.agents.agents(agent_key)
+
+            # Test no agents are lost or copied between blocks
+            self.assertEqual(sorted(agent.unique_id
+                                    for agent in agents_split),
+                             sorted(agent.unique_id
+                                    for agent in agents_serial))
+            for agent in agents_split:
+                self.assertEqual(agent.age, 4)
+                self.assertTrue(agent.alive)
+
+                bins = [location_key
+                        for location_key, agents_bin in split.agents.items()
+                        if len(location_key) == keyword.adult_depth and
+                        agent.unique_id in agents_bin[agent_key]]
+                self.assertEqual(bins, [agent.location.location_key])
+
+            # Test the occupied locations are current
+            self.assertEqual(
+                split.agents.occupied_keys(keyword.adult_level,
+                                           [agent_key]),
+                sorted({agent.location.location_key
+                        for agent in agents_split}))
+
+        # Test the data is saved the same way
+        for window in ['0_to_2_', '2_to_4_']:
+            self.assertIn('{}split.sqlite'.format(window),
+                          os.listdir(self.directory.name))
+            for agent_key in self.adult_keys:
+                table = '(0,)_{}'.format(agent_key)
+                pd.testing.assert_frame_equal(
+                    self.read_table('{}split.sqlite'.format(window), table),
+                    self.read_table('{}serial.sqlite'.format(window), table))
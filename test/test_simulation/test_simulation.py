@@ -1,10 +1,9 @@
 import unittest      as ut
 import unittest.mock as mk
 
-import dataclasses  as dclass
-import itertools    as i_tools
-import numpy.random as rnd
-import pickle       as pk
+import dataclasses as dclass
+import itertools   as i_tools
+import pickle      as pk
 
 import source.keyword as keyword
 
@@ -21,6 +20,7 @@ import source.migration.emigration  as emigration
 import source.migration.immigration as immigration
 
 import source.simulation.behaviors  as behaviors
+import source.simulation.domain     as domain
 import source.simulation.models     as models
 import source.simulation.simulation as simulation
 
@@ -106,150 +106,178 @@ class TestSimulation(ut.TestCase):
 
         self.assertEqual(next(self.Simulation._id_count), 10)
 
+    def test_new_unique_ids(self):
+        """test get a number of new unique_ids"""
+
+        self.assertEqual(self.Simulation.new_unique_ids(3), [0, 1, 2])
+        self.assertEqual(self.Simulation.new_unique_ids(0), [])
+        self.assertEqual(self.Simulation.new_unique_ids(2), [3, 4])
+
     def test_populate_egg_masses(self):
         """test generate all new egg_masses"""
 
-        new = mk.create_autospec(egg_mass.EggMass, spec_set=True)
+        unique_id_nums = [[mk.MagicMock(spec=int) for _ in range(3)]
+                          for _ in range(3)]
+        new            = [[mk.MagicMock(spec=egg_mass.EggMass)
+                           for _ in range(3)] for _ in range(3)]
 
-        with mk.patch.object(egg_mass.EggMass, 'setup',
+        with mk.patch.object(egg_mass.EggMass, 'batch_setup',
                              autospec=True) as mkSetup:
-            with mk.patch.object(simulation.Simulation, 'new_unique_id',
-                                 autospec=True) as mkId:
-                mkSetup.return_value = new
-
-                self.Simulation.populate_egg_masses((3, 3, 3))
-
-                for index, call in enumerate(mkSetup.call_args_list):
-                    self.assertEqual(call,
-                                     mk.call(mkId.return_value,
-                                             keyword.init,
-                                             self.Simulation,
-                                             keyword.genotype_keys[index // 3]))
-                self.assertEqual(len(mkSetup.call_args_list), 9)
-                for call in new.activate.call_args_list:
-                    self.assertEqual(call, mk.call())
-                self.assertEqual(len(new.activate.call_args_list), 9)
-                for call in mkId.call_args_list:
-                    self.assertEqual(call, mk.call(self.Simulation))
-                self.assertEqual(len(mkId.call_args_list), 9)
+            with mk.patch.object(egg_mass.EggMass, 'batch_activate',
+                                 autospec=True) as mkActivate:
+                with mk.patch.object(simulation.Simulation, 'new_unique_ids',
+                                     autospec=True) as mkIds:
+                    mkSetup.side_effect = new
+                    mkIds.side_effect   = unique_id_nums
+
+                    self.Simulation.populate_egg_masses((3, 4, 5))
+
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums[index],
+                                              keyword.init,
+                                              self.Simulation,
+                                              genotype)
+                                      for index, genotype in
+                                      enumerate(keyword.genotype_keys)])
+                    self.assertEqual(mkIds.call_args_list,
+                                     [mk.call(self.Simulation, 3),
+                                      mk.call(self.Simulation, 4),
+                                      mk.call(self.Simulation, 5)])
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(new[0] + new[1] + new[2])])
 
     def test_populate_larvae(self):
         """test generate all new larvae"""
 
-        new = mk.create_autospec(larva.Larva, spec_set=True)
+        unique_id_nums = [[mk.MagicMock(spec=int) for _ in range(3)]
+                          for _ in range(3)]
+        new            = [[mk.MagicMock(spec=larva.Larva)
+                           for _ in range(3)] for _ in range(3)]
 
-        with mk.patch.object(larva.Larva, 'setup',
+        with mk.patch.object(larva.Larva, 'batch_setup',
                              autospec=True) as mkSetup:
-            with mk.patch.object(simulation.Simulation, 'new_unique_id',
-                                 autospec=True) as mkId:
-                mkSetup.return_value = new
-
-                self.Simulation.populate_larvae((3, 3, 3))
-
-                for index, call in enumerate(mkSetup.call_args_list):
-                    self.assertEqual(call,
-                                     mk.call(mkId.return_value,
-                                             keyword.init,
-                                             self.Simulation,
-                                             keyword.genotype_keys[index // 3]))
-                self.assertEqual(len(mkSetup.call_args_list), 9)
-                for call in new.activate.call_args_list:
-                    self.assertEqual(call, mk.call())
-                self.assertEqual(len(new.activate.call_args_list), 9)
-                for call in mkId.call_args_list:
-                    self.assertEqual(call, mk.call(self.Simulation))
-                self.assertEqual(len(mkId.call_args_list), 9)
+            with mk.patch.object(larva.Larva, 'batch_activate',
+                                 autospec=True) as mkActivate:
+                with mk.patch.object(simulation.Simulation, 'new_unique_ids',
+                                     autospec=True) as mkIds:
+                    mkSetup.side_effect = new
+                    mkIds.side_effect   = unique_id_nums
+
+                    self.Simulation.populate_larvae((3, 4, 5))
+
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums[index],
+                                              keyword.init,
+                                              self.Simulation,
+                                              genotype)
+                                      for index, genotype in
+                                      enumerate(keyword.genotype_keys)])
+                    self.assertEqual(mkIds.call_args_list,
+                                     [mk.call(self.Simulation, 3),
+                                      mk.call(self.Simulation, 4),
+                                      mk.call(self.Simulation, 5)])
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(new[0] + new[1] + new[2])])
 
     def test_populate_pupae(self):
         """test generate all new pupae"""
 
-        new = mk.create_autospec(pupa.Pupa, spec_set=True)
+        unique_id_nums = [[mk.MagicMock(spec=int) for _ in range(3)]
+                          for _ in range(3)]
+        new            = [[mk.MagicMock(spec=pupa.Pupa)
+                           for _ in range(3)] for _ in range(3)]
 
-        with mk.patch.object(pupa.Pupa, 'setup',
+        with mk.patch.object(pupa.Pupa, 'batch_setup',
                              autospec=True) as mkSetup:
-            with mk.patch.object(simulation.Simulation, 'new_unique_id',
-                                 autospec=True) as mkId:
-                mkSetup.return_value = new
-
-                self.Simulation.populate_pupae((3, 3, 3))
-
-                for index, call in enumerate(mkSetup.call_args_list):
-                    self.assertEqual(call,
-                                     mk.call(mkId.return_value,
-                                             keyword.init,
-                                             self.Simulation,
-                                             keyword.genotype_keys[index // 3]))
-                self.assertEqual(len(mkSetup.call_args_list), 9)
-                for call in new.activate.call_args_list:
-                    self.assertEqual(call, mk.call())
-                self.assertEqual(len(new.activate.call_args_list), 9)
-                for call in mkId.call_args_list:
-                    self.assertEqual(call, mk.call(self.Simulation))
-                self.assertEqual(len(mkId.call_args_list), 9)
+            with mk.patch.object(pupa.Pupa, 'batch_activate',
+                                 autospec=True) as mkActivate:
+                with mk.patch.object(simulation.Simulation, 'new_unique_ids',
+                                     autospec=True) as mkIds:
+                    mkSetup.side_effect = new
+                    mkIds.side_effect   = unique_id_nums
+
+                    self.Simulation.populate_pupae((3, 4, 5))
+
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums[index],
+                                              keyword.init,
+                                              self.Simulation,
+                                              genotype)
+                                      for index, genotype in
+                                      enumerate(keyword.genotype_keys)])
+                    self.assertEqual(mkIds.call_args_list,
+                                     [mk.call(self.Simulation, 3),
+                                      mk.call(self.Simulation, 4),
+                                      mk.call(self.Simulation, 5)])
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(new[0] + new[1] + new[2])])
 
     def test_populate_adults(self):
         """test generate all new adults"""
 
-        new = mk.create_autospec(adult.Adult, spec_set=True)
+        unique_id_nums = [[mk.MagicMock(spec=int) for _ in range(3)]
+                          for _ in range(3)]
+        new            = [[mk.MagicMock(spec=adult.Adult)
+                           for _ in range(3)] for _ in range(3)]
 
-        with mk.patch.object(adult.Adult, 'setup',
+        with mk.patch.object(adult.Adult, 'batch_setup',
                              autospec=True) as mkSetup:
-            with mk.patch.object(simulation.Simulation, 'new_unique_id',
-                                 autospec=True) as mkId:
-                mkSetup.return_value = new
-
-                self.Simulation.populate_adults((3, 3, 3))
-
-                for index, call in enumerate(mkSetup.call_args_list):
-                    self.assertEqual(call,
-                                     mk.call(mkId.return_value,
-                                             keyword.init,
-                                             self.Simulation,
-                                             keyword.genotype_keys[index // 3]))
-                self.assertEqual(len(mkSetup.call_args_list), 9)
-                for call in new.activate.call_args_list:
-                    self.assertEqual(call, mk.call())
-                self.assertEqual(len(new.activate.call_args_list), 9)
-                for call in mkId.call_args_list:
-                    self.assertEqual(call, mk.call(self.Simulation))
-                self.assertEqual(len(mkId.call_args_list), 9)
-                
+            with mk.patch.object(adult.Adult, 'batch_activate',
+                                 autospec=True) as mkActivate:
+                with mk.patch.object(simulation.Simulation, 'new_unique_ids',
+                                     autospec=True) as mkIds:
+                    mkSetup.side_effect = new
+                    mkIds.side_effect   = unique_id_nums
+
+                    self.Simulation.populate_adults((3, 4, 5))
+
+                    self.assertEqual(mkSetup.call_args_list,
+                                     [mk.call(unique_id_nums[index],
+                                              keyword.init,
+                                              self.Simulation,
+                                              genotype)
+                                      for index, genotype in
+                                      enumerate(keyword.genotype_keys)])
+                    self.assertEqual(mkIds.call_args_list,
+                                     [mk.call(self.Simulation, 3),
+                                      mk.call(self.Simulation, 4),
+                                      mk.call(self.Simulation, 5)])
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(new[0] + new[1] + new[2])])
+
     def test_populate_pregnant(self):
         """test generate all new pregnant adults"""
 
-        parents = [[keyword.homo_r, keyword.homo_r],
-                   [keyword.homo_r, keyword.homo_s],
-                   [keyword.homo_s, keyword.homo_s]]
-
-        new = mk.create_autospec(adult.Adult, spec_set=True)
-
-        with mk.patch.object(adult.Adult, 'setup',
-                             autospec=True) as mkSetup:
-            with mk.patch.object(simulation.Simulation, 'new_unique_id',
-                                 autospec=True) as mkId:
-                with mk.patch.object(rnd, 'shuffle') as mkRND:
-                    mkSetup.return_value = new
-
-                    self.Simulation.populate_pregnant((3, 3, 3))
-
-                    for index, call in enumerate(mkSetup.call_args_list):
-                        self.assertEqual(call,
-                                         mk.call(mkId.return_value,
-                                                 keyword.init,
-                                                 self.Simulation,
-                                                 parents[index // 3][0],
-                                                 parents[index // 3][1]))
-                    self.assertEqual(len(mkSetup.call_args_list), 9)
-                    for call in new.activate.call_args_list:
-                        self.assertEqual(call, mk.call())
-                    self.assertEqual(len(new.activate.call_args_list), 9)
-                    for call in mkId.call_args_list:
-                        self.assertEqual(call, mk.call(self.Simulation))
-                    self.assertEqual(len(mkId.call_args_list), 9)
-                    for index, call in enumerate(mkRND.call_args_list):
-                        self.assertEqual(call,
-                                         mk.call(parents[index // 3]))
-                    self.assertEqual(len(mkRND.call_args_list), 9)
+        unique_id_nums = [[mk.MagicMock(spec=int) for _ in range(number)]
+                          for number in (3, 4, 5)]
+        new            = [[mk.MagicMock(spec=adult.Adult)
+                           for _ in range(number)]
+                          for number in (3, 4, 5)]
+
+        with mk.patch.object(adult.Adult, 'batch_pregnant',
+                             autospec=True) as mkPregnant:
+            with mk.patch.object(adult.Adult, 'batch_activate',
+                                 autospec=True) as mkActivate:
+                with mk.patch.object(simulation.Simulation, 'new_unique_ids',
+                                     autospec=True) as mkIds:
+                    mkPregnant.side_effect = new
+                    mkIds.side_effect      = unique_id_nums
+
+                    self.Simulation.populate_pregnant((3, 4, 5))
+
+                    self.assertEqual(mkIds.call_args_list,
+                                     [mk.call(self.Simulation, 3),
+                                      mk.call(self.Simulation, 4),
+                                      mk.call(self.Simulation, 5)])
+                    self.assertEqual(mkPregnant.call_args_list,
+                                     [mk.call(unique_id_nums[index],
+                                              keyword.init,
+                                              self.Simulation,
+                                              genotype)
+                                      for index, genotype in
+                                      enumerate(keyword.genotype_keys)])
+                    self.assertEqual(mkActivate.call_args_list,
+                                     [mk.call(new[0] + new[1] + new[2])])
 
     def test_populate(self):
         """test populate the simulation"""
@@ -308,6 +336,48 @@ class TestSimulation(ut.TestCase):
                           mk.call.record(),
                           mk.call.save(self.Simulation)])
 
+    def test_workers(self):
+        """test get the number of domain workers"""
+
+        workers = mk.MagicMock(spec=int)
+
+        # Test not set
+        self.models.__contains__.return_value = False
+        self.assertEqual(self.Simulation.workers, 1)
+        self.assertEqual(self.models.__contains__.call_args_list,
+                         [mk.call(keyword.domain_workers)])
+
+        # Test set
+        self.models.__contains__.return_value = True
+        self.models.__getitem__.return_value  = workers
+        self.assertEqual(self.Simulation.workers, workers)
+        self.assertEqual(self.models.__getitem__.call_args_list,
+                         [mk.call(keyword.domain_workers)])
+
+    def test_runner(self):
+        """test get the system to run the steps with"""
+
+        with mk.patch.object(simulation.Simulation, 'workers',
+                             new_callable=mk.PropertyMock) as mkWorkers:
+            with mk.patch.object(domain.Domain, 'setup',
+                                 autospec=True) as mkSetup:
+                # Test serial
+                mkWorkers.return_value = 1
+                self.assertEqual(self.Simulation.runner(), self.Simulation)
+                self.assertEqual(mkSetup.call_args_list, [])
+
+                # Test domain
+                mkWorkers.return_value = 3
+                self.assertEqual(self.Simulation.runner(),
+                                 mkSetup.return_value)
+                self.assertEqual(mkSetup.call_args_list,
+                                 [mk.call(self.Simulation, 3)])
+
+    def test_close(self):
+        """test finish running the steps"""
+
+        self.assertEqual(self.Simulation.close(), None)
+
     def test_save(self):
         """test save to file"""
 
@@ -398,7 +468,7 @@ class TestSimulation(ut.TestCase):
         self.assertEqual(mkBehaviors.call_args_list,
                          [mk.call(**test_models)])
         self.assertEqual(mkSchedule.call_args_list,
-                         [mk.call(step_tuples)])
+                         [mk.call(step_tuples, False)])
         self.assertEqual(mkDatabase.call_args_list,
                          [mk.call(data_tuple)])
         self.assertEqual(mkEmigration.call_args_list,
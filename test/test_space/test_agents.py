@@ -116,6 +116,44 @@ class TestAgentBin(ut.TestCase):
             self.counts.reset_mock()
         self.assertEqual(len(self.AgentBin), 0)
 
+
+    def test_release(self):
+        """test release"""
+
+        self.assertEqual(len(self.AgentBin), 3)
+        for unique_id, agent in self.agents.items():
+            self.assertIn(unique_id, self.AgentBin)
+            self.AgentBin.release(agent)
+            self.assertNotIn(unique_id, self.AgentBin)
+            self.assertEqual(self.counts.release.call_args_list,
+                             [mk.call(agent)])
+            self.assertEqual(self.counts.sub.call_args_list, [])
+            self.counts.reset_mock()
+        self.assertEqual(len(self.AgentBin), 0)
+
+    def test_merge(self):
+        """test merge another bin"""
+
+        other_agents = {}
+        for _ in range(3):
+            unique_id = mk.MagicMock(spec=str)
+            other_agents[unique_id] = mk.create_autospec(AgentTest,
+                                                         spec_set=True)
+        other = agents.AgentBin(other_agents,
+                                mk.create_autospec(counter.Counts,
+                                                   spec_set=True),
+                                self.agent_key)
+        start = mk.MagicMock(spec=int)
+
+        self.assertIsNone(self.AgentBin.merge(other, start))
+        self.assertEqual(len(self.AgentBin), 6)
+        for unique_id, agent in other_agents.items():
+            self.assertEqual(self.AgentBin[unique_id], agent)
+        for unique_id, agent in self.agents.items():
+            self.assertEqual(self.AgentBin[unique_id], agent)
+        self.assertEqual(self.counts.merge.call_args_list,
+                         [mk.call(other.counts, start)])
+
     def test_empty(self):
         """test create empty class"""
 
@@ -183,12 +221,9 @@ class TestAgentsBin(ut.TestCase):
             self.agent_list.append(agent)
 
         self.location_key = mk.MagicMock(spec=tuple)
-        self.environment  = mk.create_autospec(agent_environment.Environment,
-                                               spec_set=True)
 
         self.AgentsBin = agents.AgentsBin(self.agents,
-                                          self.location_key,
-                                          self.environment)
+                                          self.location_key)
 
     def test___init__(self):
         """test __init__ for class"""
@@ -197,7 +232,6 @@ class TestAgentsBin(ut.TestCase):
         self.assertIsInstance(self.AgentsBin, agents.AgentsBin)
 
         self.assertEqual(self.AgentsBin.location_key, self.location_key)
-        self.assertEqual(self.AgentsBin.environment,  self.environment)
 
         self.assertEqual(self.AgentsBin,      self.agents)
         self.assertEqual(self.AgentsBin.data, self.agents)
@@ -230,6 +264,19 @@ class TestAgentsBin(ut.TestCase):
             self.assertEqual(len(self.agents), 3)
         self.assertEqual(len(self.agent_list), 3)
 
+
+    def test_release(self):
+        """test release an agent"""
+
+        for agent in self.agent_list:
+            self.AgentsBin.release(agent)
+            self.assertEqual(self.agents[agent.agent_key].release.
+                             call_args_list,
+                             [mk.call(agent)])
+            self.agents[agent.agent_key].reset_mock()
+            for agent_bin in self.agents.values():
+                self.assertEqual(agent_bin.release.call_args_list, [])
+
     def test_record(self):
         """test record the counts"""
 
@@ -252,6 +299,33 @@ class TestAgentsBin(ut.TestCase):
             self.assertEqual(agent_bin.counts.refresh.call_args_list,
                              [mk.call()])
 
+
+    def test_merge(self):
+        """test merge another bin"""
+
+        other = {agent_key: mk.MagicMock() for agent_key in self.agents}
+        start = mk.MagicMock(spec=int)
+
+        self.AgentsBin.merge(other, start)
+        for agent_key, agent_bin in self.agents.items():
+            self.assertEqual(agent_bin.merge.call_args_list,
+                             [mk.call(other[agent_key], start)])
+
+    def test_snapshot(self):
+        """test create a dictionary of the recorded data"""
+
+        snapshot = {}
+        for agent_key, agent_bin in self.agents.items():
+            key = '{}_{}'.format(self.location_key, agent_key)
+            agent_bin.counts = mk.create_autospec(counter.Counts, spec_set=True)
+            snapshot[key] = agent_bin.counts.snapshot.return_value
+        self.assertEqual(len(snapshot), 3)
+
+        self.assertEqual(self.AgentsBin.snapshot(), snapshot)
+        for agent_bin in self.AgentsBin.values():
+            self.assertEqual(agent_bin.counts.snapshot.call_args_list,
+                             [mk.call()])
+
     def test_dataframes(self):
         """test create a dictionary of dataframes"""
 
@@ -287,60 +361,25 @@ class TestAgentsBin(ut.TestCase):
             self.assertEqual(agent_bin.counts.dataframe.call_args_list,
                              [mk.call()])
 
-    def test_make_environment(self):
-        """test make the environment"""
+    def test_long_columns(self):
+        """test create a dictionary of data columns"""
 
-        location = mk.create_autospec(agent_location.Location, spec_set=True)
-        location.depth.__eq__.side_effect = [False, True, True]
-
-        location.__getitem__.return_value.__lt__.side_effect = [True, False]
-
-        cutoff      = mk.MagicMock(spec=float)
-        init_plant  = mk.MagicMock(spec=callable)
-        environment = (cutoff, init_plant)
-
-        # Test incorrect depth
-        environ = self.AgentsBin.make_environment(location, environment)
-        self.assertIsInstance(environ, agent_environment.Environment)
-        self.assertEqual(environ.bt,    None)
-        self.assertEqual(environ.plant, None)
-        self.assertEqual(location.depth.__eq__.call_args_list,
-                         [mk.call(keyword.bt_depth)])
-
-        location.reset_mock()
-        # Test correct depth, bt
-        environ = self.AgentsBin.make_environment(location, environment)
-        self.assertIsInstance(environ, agent_environment.Environment)
-        self.assertEqual(environ.bt,    keyword.bt)
-        self.assertEqual(environ.plant,
-                         init_plant.return_value)
-        self.assertEqual(init_plant.call_args_list,
-                         [mk.call(keyword.bt)])
-        self.assertEqual(location.depth.__eq__.call_args_list,
-                         [mk.call(keyword.bt_depth)])
-        self.assertEqual(location.__getitem__.return_value.
-                            __lt__.call_args_list,
-                         [mk.call(cutoff)])
-        self.assertEqual(location.__getitem__.call_args_list,
-                         [mk.call(-1)])
-
-        location.reset_mock()
-        init_plant.reset_mock()
-        # Test correct depth, not_bt
-        environ = self.AgentsBin.make_environment(location, environment)
-        self.assertIsInstance(environ, agent_environment.Environment)
-        self.assertEqual(environ.bt,    keyword.not_bt)
-        self.assertEqual(environ.plant,
-                         init_plant.return_value)
-        self.assertEqual(init_plant.call_args_list,
-                         [mk.call(keyword.not_bt)])
-        self.assertEqual(location.depth.__eq__.call_args_list,
-                         [mk.call(keyword.bt_depth)])
-        self.assertEqual(location.__getitem__.return_value.
-                         __lt__.call_args_list,
-                         [mk.call(cutoff)])
-        self.assertEqual(location.__getitem__.call_args_list,
-                         [mk.call(-1)])
+        columns = {}
+        for agent_key, agent_bin in self.agents.items():
+            agent_bin.counts = mk.create_autospec(counter.Counts, spec_set=True)
+            long_columns     = {(mk.MagicMock(spec=str),
+                                 mk.MagicMock(spec=str)): mk.MagicMock()
+                                for _ in range(2)}
+            agent_bin.counts.long_columns.return_value = long_columns
+            for (attr, attr_value), column in long_columns.items():
+                key = (self.location_key, agent_key, attr, attr_value)
+                columns[key] = column
+        self.assertEqual(len(columns), 6)
+
+        self.assertEqual(self.AgentsBin.long_columns(), columns)
+        for agent_bin in self.AgentsBin.values():
+            self.assertEqual(agent_bin.counts.long_columns.call_args_list,
+                             [mk.call()])
 
     def test_make_bins(self):
         """test make the bins"""
@@ -451,39 +490,30 @@ class TestAgentsBin(ut.TestCase):
     def test_empty(self):
         """test create an empty class"""
 
-        agent_keys  = mk.MagicMock(spec=list)
-        location    = mk.create_autospec(agent_location.Location, spec_set=True)
-        attrs       = mk.MagicMock(spec=dict)
-        environment = mk.MagicMock(spec=tuple)
+        agent_keys = mk.MagicMock(spec=list)
+        location   = mk.create_autospec(agent_location.Location, spec_set=True)
+        attrs      = mk.MagicMock(spec=dict)
 
         with mk.patch.object(agents.AgentsBin, 'get_attrs',
                              autospec=True) as mkAttrs:
             with mk.patch.object(agents.AgentsBin, 'make_bins',
                                  autospec=True) as mkBins:
-                with mk.patch.object(agents.AgentsBin, 'make_environment',
-                                     autospec=True) as mkEnvironment:
-                    mkBins.return_value        = self.agents
-                    mkEnvironment.return_value = self.environment
-
-                    self.AgentsBin = agents.AgentsBin.empty(agent_keys,
-                                                            location,
-                                                            attrs,
-                                                            environment)
-                    self.assertIsInstance(self.AgentsBin, agents.AgentsBin)
-                    self.assertEqual(self.AgentsBin.location_key,
-                                     location.location_key)
-                    self.assertEqual(self.AgentsBin.environment,
-                                     self.environment)
-                    self.assertEqual(self.AgentsBin,      self.agents)
-                    self.assertEqual(self.AgentsBin.data, self.agents)
-
-                    self.assertEqual(mkEnvironment.call_args_list,
-                                     [mk.call(location, environment)])
-                    self.assertEqual(mkBins.call_args_list,
-                                     [mk.call(agent_keys,
-                                              mkAttrs.return_value)])
-                    self.assertEqual(mkAttrs.call_args_list,
-                                     [mk.call(location, attrs)])
+                mkBins.return_value = self.agents
+
+                self.AgentsBin = agents.AgentsBin.empty(agent_keys,
+                                                        location,
+                                                        attrs)
+                self.assertIsInstance(self.AgentsBin, agents.AgentsBin)
+                self.assertEqual(self.AgentsBin.location_key,
+                                 location.location_key)
+                self.assertEqual(self.AgentsBin,      self.agents)
+                self.assertEqual(self.AgentsBin.data, self.agents)
+
+                self.assertEqual(mkBins.call_args_list,
+                                 [mk.call(agent_keys,
+                                          mkAttrs.return_value)])
+                self.assertEqual(mkAttrs.call_args_list,
+                                 [mk.call(location, attrs)])
 
 
 class TestAgents(ut.TestCase):
@@ -498,7 +528,10 @@ class TestAgents(ut.TestCase):
                        for _ in range(3)}
         self.agents[(0,)] = self.master
 
-        self.Agents = agents.Agents(self.agents)
+        self.environment = mk.create_autospec(agent_environment.Environment,
+                                              spec_set=True)
+
+        self.Agents = agents.Agents(self.agents, self.environment)
 
     def test___init__(self):
         """test __init__ for class"""
@@ -510,6 +543,13 @@ class TestAgents(ut.TestCase):
         self.assertEqual(self.Agents.data, self.agents)
 
         self.assertEqual(len(self.Agents), 4)
+        self.assertEqual(self.Agents.environment, self.environment)
+        self.assertEqual(self.Agents.occupied, {})
+        self.assertIsNone(self.Agents.watching)
+
+        # Test default environment
+        self.Agents = agents.Agents(self.agents)
+        self.assertIsNone(self.Agents.environment)
 
     def test_agents(self):
         """test get the master agents location"""
@@ -524,6 +564,56 @@ class TestAgents(ut.TestCase):
         self.assertEqual(self.master.__getitem__.call_args_list,
                          [mk.call(agent_key)])
 
+
+    def test__occupy(self):
+        """test mark a location as occupied"""
+
+        agent_key = mk.MagicMock(spec=str)
+
+        self.Agents._occupy((0, 1), agent_key)
+        self.assertEqual(self.Agents.occupied, {1: {agent_key: {(0, 1)}}})
+        self.Agents._occupy((0, 2), agent_key)
+        self.Agents._occupy((0, 2), agent_key)
+        self.Agents._occupy((0,),   agent_key)
+        self.assertEqual(self.Agents.occupied,
+                         {0: {agent_key: {(0,)}},
+                          1: {agent_key: {(0, 1), (0, 2)}}})
+
+        # Test newly occupied locations are collected when watched
+        other   = mk.MagicMock(spec=str)
+        entered = []
+        self.Agents.watching = (1, {agent_key}, entered)
+        self.Agents._occupy((0, 2), agent_key)
+        self.Agents._occupy((0, 3), agent_key)
+        self.Agents._occupy((0, 4), other)
+        self.Agents._occupy((0,),   other)
+        self.Agents._occupy((0, 3), agent_key)
+        self.assertEqual(entered, [(0, 3)])
+
+    def test__vacate(self):
+        """test unmark a location which is empty"""
+
+        agent_key = mk.MagicMock(spec=str)
+        agent_bin = mk.MagicMock()
+        self.Agents[(0, 1)] = {agent_key: agent_bin}
+        self.Agents.occupied = {1: {agent_key: {(0, 1), (0, 2)}}}
+
+        # Test not empty
+        agent_bin.__len__.return_value = 1
+        self.Agents._vacate((0, 1), agent_key)
+        self.assertEqual(self.Agents.occupied,
+                         {1: {agent_key: {(0, 1), (0, 2)}}})
+
+        # Test empty
+        agent_bin.__len__.return_value = 0
+        self.Agents._vacate((0, 1), agent_key)
+        self.assertEqual(self.Agents.occupied, {1: {agent_key: {(0, 2)}}})
+
+        # Test never occupied
+        self.Agents.occupied = {}
+        self.Agents._vacate((0, 1), agent_key)
+        self.assertEqual(self.Agents.occupied, {})
+
     def test_activate(self):
         """test activate an agent"""
 
@@ -539,7 +629,7 @@ class TestAgents(ut.TestCase):
             location_keys.append(key)
         self.assertEqual(len(self.Agents), 6)
 
-        agent = mk.create_autospec(AgentTest, spec_set=True)
+        agent = mk.MagicMock(spec=AgentTest)
         agent.location = location
 
         self.Agents.activate(agent)
@@ -553,6 +643,39 @@ class TestAgents(ut.TestCase):
                                     activate.call_args_list,
                                  [])
 
+    def test_batch_activate(self):
+        """test activate a collection of agents"""
+
+        bins = {}
+        for location_key in [(0,), (0, 1), (0, 2)]:
+            bins[location_key] = agents.AgentsBin(
+                {keyword.male: agents.AgentBin({}, mk.MagicMock(),
+                                               keyword.male)},
+                location_key)
+        self.Agents = agents.Agents(bins)
+
+        new = [main_agent.Agent(keyword.male, 'male{}'.format(index), None,
+                                agent_location.Location([0, vertex]), True)
+               for index, vertex in enumerate([1, 1, 2])]
+
+        with mk.patch.object(agents.Agents, '_occupy', autospec=True,
+                             side_effect=agents.Agents._occupy) as mkOccupy:
+            self.assertIsNone(self.Agents.batch_activate(new))
+            self.assertEqual(len(mkOccupy.call_args_list), 3)
+
+        self.assertEqual(bins[(0,)][keyword.male].data,
+                         {agent.unique_id: agent for agent in new})
+        self.assertEqual(bins[(0, 1)][keyword.male].data,
+                         {'male0': new[0], 'male1': new[1]})
+        self.assertEqual(bins[(0, 2)][keyword.male].data,
+                         {'male2': new[2]})
+        self.assertEqual(self.Agents.occupants(0, keyword.male), {(0,)})
+        self.assertEqual(self.Agents.occupants(1, keyword.male),
+                         {(0, 1), (0, 2)})
+
+        # Test no agents
+        self.assertIsNone(self.Agents.batch_activate([]))
+
     def test_deactivate(self):
         """test deactivate an agent"""
 
@@ -568,7 +691,7 @@ class TestAgents(ut.TestCase):
             location_keys.append(key)
         self.assertEqual(len(self.Agents), 6)
 
-        agent = mk.create_autospec(AgentTest, spec_set=True)
+        agent = mk.MagicMock(spec=AgentTest)
         agent.location = location
 
         self.Agents.deactivate(agent)
@@ -582,6 +705,39 @@ class TestAgents(ut.TestCase):
                                  deactivate.call_args_list,
                                  [])
 
+
+    def test_release(self):
+        """test release an agent"""
+
+        location = agent_location.Location([0,
+                                            mk.MagicMock(spec=int),
+                                            mk.MagicMock(spec=int)])
+
+        location_keys = [(0,)]
+        for index in range(2, 4):
+            key = location[:index].location_key
+            self.Agents[key] = mk.create_autospec(agents.AgentsBin,
+                                                  spec_set=True)
+            location_keys.append(key)
+        self.assertEqual(len(self.Agents), 6)
+
+        agent = mk.MagicMock(spec=AgentTest)
+        agent.location = location
+
+        self.Agents.release(agent)
+        for location_key in self.Agents.keys():
+            if location_key in location_keys:
+                self.assertEqual(self.Agents[location_key].
+                                 release.call_args_list,
+                                 [mk.call(agent)])
+            else:
+                self.assertEqual(self.Agents[location_key].
+                                 release.call_args_list,
+                                 [])
+            self.assertEqual(self.Agents[location_key].
+                             deactivate.call_args_list,
+                             [])
+
     def test_record(self):
         """test record all the counts"""
 
@@ -598,6 +754,171 @@ class TestAgents(ut.TestCase):
             self.assertEqual(agent_bin.refresh.call_args_list,
                              [mk.call()])
 
+
+    def test_survey(self):
+        """test rebuild the occupied locations"""
+
+        bins = {}
+        for location_key in [(0,), (0, 1), (0, 2)]:
+            bins[location_key] = {
+                agent_key: agents.AgentBin({}, mk.MagicMock(), agent_key)
+                for agent_key in [keyword.male, keyword.female]}
+        for location_key in [(0,), (0, 2)]:
+            bins[location_key][keyword.male]['agent'] = mk.MagicMock()
+
+        self.Agents = agents.Agents(bins)
+        self.assertEqual(self.Agents.occupied,
+                         {0: {keyword.male: {(0,)}},
+                          1: {keyword.male: {(0, 2)}}})
+
+        bins[(0, 1)][keyword.female]['agent'] = mk.MagicMock()
+        self.Agents.survey()
+        self.assertEqual(self.Agents.occupied,
+                         {0: {keyword.male: {(0,)}},
+                          1: {keyword.male:   {(0, 2)},
+                              keyword.female: {(0, 1)}}})
+
+    def test_occupied_keys(self):
+        """test get the occupied locations"""
+
+        self.Agents.occupied = {1: {keyword.male:   {(0, 2), (0, 1)},
+                                    keyword.female: {(0, 3), (0, 1)}}}
+
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.male]),
+                         [(0, 1), (0, 2)])
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.male,
+                                                       keyword.female]),
+                         [(0, 1), (0, 2), (0, 3)])
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.larva]), [])
+        self.assertEqual(self.Agents.occupied_keys(2, [keyword.male]),  [])
+
+    def test_occupies(self):
+        """test check if a location is occupied"""
+
+        self.Agents.occupied = {1: {keyword.male:   {(0, 2), (0, 1)},
+                                    keyword.female: {(0, 3), (0, 1)}}}
+
+        self.assertTrue(self.Agents.occupies(1, [keyword.male], (0, 2)))
+        self.assertFalse(self.Agents.occupies(1, [keyword.male], (0, 3)))
+        self.assertTrue(self.Agents.occupies(1, [keyword.male,
+                                                 keyword.female], (0, 3)))
+        self.assertFalse(self.Agents.occupies(1, [keyword.larva], (0, 1)))
+        self.assertFalse(self.Agents.occupies(2, [keyword.male],  (0, 1)))
+        self.assertFalse(self.Agents.occupies(1, [], (0, 1)))
+
+    def test_watch(self):
+        """test collect the newly occupied locations"""
+
+        entered = self.Agents.watch(1, [keyword.male, keyword.female])
+        self.assertEqual(entered, [])
+        self.assertEqual(self.Agents.watching,
+                         (1, {keyword.male, keyword.female}, entered))
+
+        self.Agents._occupy((0, 1), keyword.male)
+        self.Agents._occupy((0, 2), keyword.larva)
+        self.Agents._occupy((0, 3), keyword.female)
+        self.assertEqual(entered, [(0, 1), (0, 3)])
+
+    def test_unwatch(self):
+        """test stop collecting the newly occupied locations"""
+
+        entered = self.Agents.watch(1, [keyword.male])
+        self.assertIsNone(self.Agents.unwatch())
+        self.assertIsNone(self.Agents.watching)
+
+        self.Agents._occupy((0, 1), keyword.male)
+        self.assertEqual(entered, [])
+
+    def test_occupancy(self):
+        """test occupancy follows agents"""
+
+        bins = {}
+        for location_key in [(0,), (0, 1), (0, 2)]:
+            bins[location_key] = agents.AgentsBin(
+                {agent_key: agents.AgentBin({}, mk.MagicMock(), agent_key)
+                 for agent_key in [keyword.male, keyword.female]},
+                location_key)
+        self.Agents = agents.Agents(bins)
+
+        agent = main_agent.Agent(keyword.male, 'male', None,
+                                 agent_location.Location([0, 1]), True)
+        other = main_agent.Agent(keyword.male, 'other', None,
+                                 agent_location.Location([0, 1]), True)
+
+        self.Agents.activate(agent)
+        self.Agents.activate(other)
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.male]),
+                         [(0, 1)])
+        self.assertEqual(self.Agents.occupied_keys(0, [keyword.male]),
+                         [(0,)])
+
+        self.Agents.deactivate(agent)
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.male]),
+                         [(0, 1)])
+        self.Agents.release(other)
+        self.assertEqual(self.Agents.occupied_keys(1, [keyword.male]), [])
+        self.assertEqual(self.Agents.occupied_keys(0, [keyword.male]), [])
+
+    def test_occupants(self):
+        """test get the occupied locations of a type"""
+
+        males = {(0, 2), (0, 1)}
+        self.Agents.occupied = {1: {keyword.male: males}}
+
+        # Test the occupied set is not copied
+        self.assertIs(self.Agents.occupants(1, keyword.male), males)
+        self.assertEqual(self.Agents.occupants(1, keyword.female), set())
+        self.assertEqual(self.Agents.occupants(2, keyword.male),   set())
+        self.assertIsInstance(self.Agents.occupants(2, keyword.male),
+                              frozenset)
+
+    def test_place_withdraw(self):
+        """test place and withdraw agents from their own bin"""
+
+        bins = {}
+        for location_key in [(0,), (0, 1)]:
+            bins[location_key] = agents.AgentsBin(
+                {keyword.male: agents.AgentBin({}, mk.MagicMock(),
+                                               keyword.male)},
+                location_key)
+        self.Agents = agents.Agents(bins)
+
+        agent = main_agent.Agent(keyword.male, 'male', None,
+                                 agent_location.Location([0, 1]), True)
+
+        self.assertIsNone(self.Agents.place(agent))
+        self.assertEqual(bins[(0, 1)][keyword.male].data, {'male': agent})
+        self.assertEqual(bins[(0,)][keyword.male].data,   {})
+        self.assertEqual(self.Agents.occupants(1, keyword.male), {(0, 1)})
+        self.assertEqual(self.Agents.occupants(0, keyword.male), set())
+        self.assertEqual(bins[(0, 1)][keyword.male].counts.mock_calls, [])
+
+        self.assertIsNone(self.Agents.withdraw(agent))
+        self.assertEqual(bins[(0, 1)][keyword.male].data, {})
+        self.assertEqual(self.Agents.occupants(1, keyword.male), set())
+        self.assertEqual(bins[(0, 1)][keyword.male].counts.mock_calls, [])
+
+        # Test already withdrawn
+        self.assertIsNone(self.Agents.withdraw(agent))
+        self.assertEqual(bins[(0, 1)][keyword.male].data, {})
+
+    def test_snapshot(self):
+        """test generate a dict of all the recorded data"""
+
+        snapshot = {}
+        for agent_bin in self.agents.values():
+            data_dict = {mk.MagicMock(spec=str): mk.MagicMock()
+                         for _ in range(3)}
+            snapshot.update(data_dict)
+            agent_bin.snapshot.return_value = data_dict
+
+        self.assertEqual(len(snapshot), 12)
+
+        self.assertEqual(self.Agents.snapshot(), snapshot)
+        for agent_bin in self.agents.values():
+            self.assertEqual(agent_bin.snapshot.call_args_list,
+                             [mk.call()])
+
     def test_dataframes(self):
         """test generate a dict of all dataframes"""
 
@@ -615,6 +936,25 @@ class TestAgents(ut.TestCase):
             self.assertEqual(agent_bin.dataframes.call_args_list,
                              [mk.call()])
 
+    def test_long_columns(self):
+        """test generate a dict of all data columns"""
+
+        columns = {}
+        for agent_bin in self.agents.values():
+            column_dict = {(mk.MagicMock(), mk.MagicMock(spec=str),
+                            mk.MagicMock(spec=str), mk.MagicMock(spec=str)):
+                               mk.MagicMock()
+                           for _ in range(3)}
+            columns.update(column_dict)
+            agent_bin.long_columns.return_value = column_dict
+
+        self.assertEqual(len(columns), 12)
+
+        self.assertEqual(self.Agents.long_columns(), columns)
+        for agent_bin in self.agents.values():
+            self.assertEqual(agent_bin.long_columns.call_args_list,
+                             [mk.call()])
+
     def test_empty(self):
         """test create an empty agents system"""
 
@@ -632,24 +972,29 @@ class TestAgents(ut.TestCase):
 
         with mk.patch.object(agents.AgentsBin, 'empty',
                              autospec=True) as mkEmpty:
-            mkEmpty.side_effect = agent_bins
-
-            self.Agents = agents.Agents.empty(space, agent_keys,
-                                              attrs, environment)
-            self.assertIsInstance(self.Agents, agents.Agents)
+            with mk.patch.object(agent_environment.Environment, 'setup',
+                                 autospec=True) as mkEnvironment:
+                mkEmpty.side_effect = agent_bins
+
+                self.Agents = agents.Agents.empty(space, agent_keys,
+                                                  attrs, environment)
+                self.assertIsInstance(self.Agents, agents.Agents)
+                self.assertEqual(self.Agents.environment,
+                                 mkEnvironment.return_value)
+                self.assertEqual(mkEnvironment.call_args_list,
+                                 [mk.call(locations, environment)])
 
             for index, location in enumerate(locations):
                 location_key = location.location_key
                 self.assertIn(location_key, self.Agents)
                 self.assertEqual(self.Agents[location_key], agent_bins[index])
                 self.assertEqual(mkEmpty.call_args_list[index],
-                                 mk.call(agent_keys, location,
-                                         attrs, environment))
+                                 mk.call(agent_keys, location, attrs))
             for index, things in enumerate(self.Agents.items()):
                 location_key, agent_bin = things
                 self.assertEqual(location_key, locations[index].location_key)
                 self.assertEqual(agent_bin, agent_bins[index])
                 self.assertEqual(mkEmpty.call_args_list[index],
                                  mk.call(agent_keys, locations[index],
-                                         attrs, environment))
+                                         attrs))
             self.assertEqual(len(self.Agents), 3)
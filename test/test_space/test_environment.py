@@ -2,8 +2,12 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
+
+import source.keyword as keyword
 
 import source.space.environment as environment
+import source.space.location    as location
 
 
 class TestEnvironment(ut.TestCase):
@@ -12,10 +16,12 @@ class TestEnvironment(ut.TestCase):
     def setUp(self):
         """Setup the tests"""
 
-        self.bt    = mk.MagicMock(spec=str)
-        self.plant = mk.MagicMock(spec=str)
+        self.plant_ids = {(0, 1): 0, (0, 2): 1, (0, 3): 2}
+        self.bt        = np.array([True, False, True])
+        self.plant     = np.array([1.0, 2.0, 3.0])
 
-        self.Environment = environment.Environment(self.bt,
+        self.Environment = environment.Environment(self.plant_ids,
+                                                   self.bt,
                                                    self.plant)
 
     def test___init__(self):
@@ -23,21 +29,69 @@ class TestEnvironment(ut.TestCase):
 
         self.assertIsInstance(self.Environment, environment.Environment)
 
-        self.assertEqual(self.Environment.bt,    self.bt)
-        self.assertEqual(self.Environment.plant, self.plant)
+        self.assertEqual(self.Environment.plant_ids, self.plant_ids)
+        self.assertIs(self.Environment.bt,    self.bt)
+        self.assertIs(self.Environment.plant, self.plant)
 
         self.assertTrue(dclass.is_dataclass(self.Environment))
 
+    def test_plant_id(self):
+        """test get the plant id of a location"""
+
+        # Test plant location
+        self.assertEqual(
+            self.Environment.plant_id(location.Location([0, 2])), 1)
+
+        # Test leaf location
+        self.assertEqual(
+            self.Environment.plant_id(location.Location([0, 3, 4])), 2)
+
+    def test_bt_state(self):
+        """test get the bt state of a plant"""
+
+        self.assertEqual(self.Environment.bt_state(0), keyword.bt)
+        self.assertEqual(self.Environment.bt_state(1), keyword.not_bt)
+        self.assertEqual(self.Environment.bt_state(2), keyword.bt)
+
+    def test_consume(self):
+        """test consume plant mass for a collection of bites at once"""
+
+        plant_ids = np.array([0, 0, 1, 2])
+        demands   = np.array([0.5, 1.5, 0.5, 1.0])
+
+        eaten = self.Environment.consume(plant_ids, demands)
+        # Plant 0 is short so its bites share it, others are ample
+        np.testing.assert_allclose(eaten, [0.25, 0.75, 0.5, 1.0])
+        np.testing.assert_allclose(self.Environment.plant, [0.0, 1.5, 2.0])
+
+        # Test empty plants give nothing and never go negative
+        eaten = self.Environment.consume(np.array([0, 1]),
+                                         np.array([1.0, 2.0]))
+        np.testing.assert_allclose(eaten, [0.0, 1.5])
+        np.testing.assert_allclose(self.Environment.plant, [0.0, 0.0, 2.0])
+
     def test_setup(self):
         """test setup the class"""
 
+        locations  = [location.Location([0]),
+                      location.Location([0, 0]),
+                      location.Location([0, 0, 1]),
+                      location.Location([0, 1]),
+                      location.Location([0, 2])]
         init_plant = mk.MagicMock(spec=callable)
-        init_plant.return_value = self.plant
+        init_plant.side_effect = [1.5, 2.5, 3.5]
 
-        self.Environment = environment.Environment.setup(self.bt, init_plant)
+        self.Environment = environment.Environment.setup(locations,
+                                                         (2, init_plant))
         self.assertIsInstance(self.Environment, environment.Environment)
-        self.assertEqual(self.Environment.bt,    self.bt)
-        self.assertEqual(self.Environment.plant, self.plant)
 
+        self.assertEqual(self.Environment.plant_ids,
+                         {(0, 0): 0, (0, 1): 1, (0, 2): 2})
+        np.testing.assert_array_equal(self.Environment.bt,
+                                      [True, True, False])
+        np.testing.assert_array_equal(self.Environment.plant,
+                                      [1.5, 2.5, 3.5])
         self.assertEqual(init_plant.call_args_list,
-                         [mk.call(self.bt)])
+                         [mk.call(keyword.bt),
+                          mk.call(keyword.bt),
+                          mk.call(keyword.not_bt)])
@@ -280,6 +280,28 @@ class TestVertexNeighborhood(ut.TestCase):
                                                    vertices[index]))
                 self.assertEqual(len(mkAppend.call_args_list), 3)
 
+    def test_rings(self):
+        """test get the probability of moving to each ring"""
+
+        self.Neighborhood = graph.VertexNeighborhood(0, {3: {5, 3, 4},
+                                                         0: {0},
+                                                         1: {2, 1}})
+        cdf = mk.MagicMock()
+        cdf.return_value = np.array([0.5, 0.8])
+
+        rings, weights = self.Neighborhood.rings(cdf)
+        self.assertEqual(rings, [[0], [1, 2], [3, 4, 5]])
+        utnp.assert_allclose(weights, [0.5, 0.3, 0.2])
+        self.assertEqual(len(cdf.call_args_list), 1)
+        utnp.assert_array_equal(cdf.call_args_list[0][0][0], [0.5, 2.0])
+
+        # Test single distance
+        self.Neighborhood = graph.VertexNeighborhood(0, {0: {0}})
+        cdf.return_value  = np.array([])
+        rings, weights = self.Neighborhood.rings(cdf)
+        self.assertEqual(rings, [[0]])
+        utnp.assert_array_equal(weights, [1.0])
+
     def test_empty(self):
         """test generate empty Vertex neighborhood"""
 
@@ -1218,6 +1240,22 @@ class TestGraph(ut.TestCase):
 
         self.assertTrue(dclass.is_dataclass(self.Graph))
 
+    def test_partition(self):
+        """test partition the vertices into blocks"""
+
+        matrix = np.zeros((6, 6))
+        for vertex in range(5):
+            matrix[vertex, vertex + 1] = 1
+            matrix[vertex + 1, vertex] = 1
+        self.Graph = graph.Graph.setup(matrix)
+
+        self.assertEqual(self.Graph.partition(1), [[0, 1, 2, 3, 4, 5]])
+        self.assertEqual(self.Graph.partition(3), [[0, 1], [2, 3], [4, 5]])
+        self.assertEqual(self.Graph.partition(4), [[0, 1], [2, 3], [4], [5]])
+        for block in self.Graph.partition(2):
+            for vertex in block:
+                self.assertIsInstance(vertex, int)
+
     def test_setup(self):
         """test setup the class"""
 
@@ -165,6 +165,29 @@ class TestSpace(ut.TestCase):
 
                 self.assertEqual(len(self.graphs), 3)
 
+    def test_new_locations(self):
+        """test generate a number of new locations"""
+
+        vertex_sets = [{0, 1, 2}, {3, 4}, {5, 6, 7, 8}]
+        for index, graph in enumerate(self.graphs):
+            graph.adjacency = mk.MagicMock()
+            graph.adjacency.vertices = vertex_sets[index]
+
+        for depth in range(1, len(self.graphs) + 1):
+            locations = self.Space.new_locations(depth, 50)
+            self.assertEqual(len(locations), 50)
+            for location in locations:
+                self.assertIsInstance(location, agent_location.Location)
+                self.assertEqual(len(location), depth)
+                for level in range(depth):
+                    self.assertIn(location[level], vertex_sets[level])
+                    self.assertIsInstance(location[level], int)
+
+        # Test no locations
+        self.assertEqual(self.Space.new_locations(2, 0), [])
+
+        self.assertEqual(len(self.graphs), 3)
+
     def test__make_locations(self):
         """test generate location data for a specific level"""
 
@@ -668,6 +691,7 @@ class TestSpace(ut.TestCase):
 
         cutoff     = 1
         init_plant = mk.MagicMock(spec=callable)
+        init_plant.return_value = 2.5
         environment = (cutoff, init_plant)
 
         # noinspection PyTypeChecker
@@ -677,6 +701,8 @@ class TestSpace(ut.TestCase):
                                           environment)
         self.assertIsInstance(agents, main_agents.Agents)
 
+        self.assertIsInstance(agents.environment, environ.Environment)
+
         plant_count = 0
         for location in self.Space.locations:
             level        = location.level
@@ -686,25 +712,25 @@ class TestSpace(ut.TestCase):
             self.assertIsInstance(agents_bin, main_agents.AgentsBin)
             self.assertEqual(agents_bin.location_key, location_key)
 
-            self.assertIsInstance(agents_bin.environment,
-                                  environ.Environment)
             if location.depth == keyword.plant_depth:
-                self.assertEqual(agents_bin.environment.plant,
+                plant_id = agents.environment.plant_id(location)
+                self.assertEqual(plant_id, plant_count)
+                self.assertEqual(agents.environment.plant[plant_id],
                                  init_plant.return_value)
                 if location[-1] == 0:
-                    self.assertEqual(agents_bin.environment.bt,
+                    self.assertEqual(agents.environment.bt_state(plant_id),
                                      keyword.bt)
                     self.assertEqual(init_plant.call_args_list[plant_count],
                                      mk.call(keyword.bt))
                 else:
-                    self.assertEqual(agents_bin.environment.bt,
+                    self.assertEqual(agents.environment.bt_state(plant_id),
                                      keyword.not_bt)
                     self.assertEqual(init_plant.call_args_list[plant_count],
                                      mk.call(keyword.not_bt))
                 plant_count += 1
             else:
-                self.assertEqual(agents_bin.environment.bt,    None)
-                self.assertEqual(agents_bin.environment.plant, None)
+                self.assertNotIn(location_key,
+                                 agents.environment.plant_ids)
 
             for agent_key in agent_keys:
                 self.assertIn(agent_key, agents_bin)
@@ -2,12 +2,14 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.egg as agent_egg
 
-import source.survival.egg as survival
+import source.survival.egg    as survival
+import source.survival.models as survival_models
 
 
 class EggTest(agent_egg.Egg):
@@ -63,6 +65,27 @@ class TestEgg(ut.TestCase):
             self.assertEqual(self.survival.call_args_list,
                              [mk.call(egg.mass, egg.genotype, egg.bt)])
 
+    def test_lifetime(self):
+        """test sample the days the egg survives"""
+
+        egg = mk.MagicMock(spec=EggTest)
+        self.Egg.survival = mk.create_autospec(survival_models.Egg,
+                                               spec_set=True, instance=True)
+
+        with mk.patch.object(survival.Egg, '_use_survival',
+                             autospec=True) as mkUse:
+            mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+
+            # Test when we don't have a model
+            self.assertEqual(self.Egg.lifetime(egg), np.inf)
+            self.assertEqual(self.Egg.survival.lifetime.call_args_list, [])
+
+            # Test when have a model
+            self.assertEqual(self.Egg.lifetime(egg),
+                             self.Egg.survival.lifetime.return_value)
+            self.assertEqual(self.Egg.survival.lifetime.call_args_list,
+                             [mk.call(egg.mass, egg.genotype, egg.bt)])
+
     def test_survive(self):
         """test run the behavior"""
 
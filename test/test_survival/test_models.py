@@ -237,6 +237,31 @@ class TestFixed(ut.TestCase):
             self.assertEqual(mkRND.call_args_list,
                              [mk.call()])
 
+    def test_lifetime(self):
+        """test sample the number of days survived"""
+
+        mass = mk.MagicMock(spec=float)
+        args = (mk.MagicMock(), mk.MagicMock())
+
+        with mk.patch.object(rnd, 'geometric', autospec=True) as mkGeo:
+            mkGeo.return_value = 4
+
+            # Test can die
+            self.Fixed.prob = 0.25
+            self.assertEqual(self.Fixed.lifetime(mass, *args), 3)
+            self.assertEqual(mkGeo.call_args_list, [mk.call(0.75)])
+
+            mkGeo.reset_mock()
+            # Test cannot die
+            self.Fixed.prob = 1.0
+            self.assertEqual(self.Fixed.lifetime(mass, *args), np.inf)
+            self.assertEqual(mkGeo.call_args_list, [])
+
+        # Test lifetime matches repeated calls
+        self.Fixed.prob = 0.8
+        lifetimes = [self.Fixed.lifetime(mass, *args) for _ in range(10000)]
+        self.assertAlmostEqual(np.mean(lifetimes), 0.8/0.2, delta=0.2)
+
 
 class TestEgg(ut.TestCase):
     """test the Egg survival mathematical model class"""
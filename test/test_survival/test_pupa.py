@@ -2,12 +2,14 @@ import unittest      as ut
 import unittest.mock as mk
 
 import dataclasses as dclass
+import numpy       as np
 
 import source.keyword as keyword
 
 import source.agents.pupa as agent_pupa
 
-import source.survival.pupa as survival
+import source.survival.pupa   as survival
+import source.survival.models as survival_models
 
 
 class PupaTest(agent_pupa.Pupa):
@@ -63,6 +65,27 @@ class TestPupa(ut.TestCase):
             self.assertEqual(self.survival.call_args_list,
                              [mk.call(pupa.mass, pupa.genotype)])
 
+    def test_lifetime(self):
+        """test sample the days the pupa survives"""
+
+        pupa = mk.MagicMock(spec=PupaTest)
+        self.Pupa.survival = mk.create_autospec(survival_models.Pupa,
+                                                spec_set=True, instance=True)
+
+        with mk.patch.object(survival.Pupa, '_use_survival',
+                             autospec=True) as mkUse:
+            mkUse.__get__ = mk.MagicMock(side_effect=[False, True])
+
+            # Test when we don't have a model
+            self.assertEqual(self.Pupa.lifetime(pupa), np.inf)
+            self.assertEqual(self.Pupa.survival.lifetime.call_args_list, [])
+
+            # Test when have a model
+            self.assertEqual(self.Pupa.lifetime(pupa),
+                             self.Pupa.survival.lifetime.return_value)
+            self.assertEqual(self.Pupa.survival.lifetime.call_args_list,
+                             [mk.call(pupa.mass, pupa.genotype)])
+
     def test_survive(self):
         """test run the behavior"""
 